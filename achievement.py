@@ -0,0 +1,132 @@
+"""
+============================================================================
+ACHIEVEMENT MODEL - SISTEM VISUALISASI IKU
+============================================================================
+
+Model capaian keseluruhan 8 IKU utama yang dipakai bersama oleh keenam
+style overall achievement dashboard (donut 4x2, bullet, cards, bullet
+4x2, thermometer, waffle).
+
+Semua nilai dihitung sekali dari all_stats sebagai array numpy (satu
+elemen per IKU, urutan OVERALL_IKUS):
+
+- actual_pct : capaian dalam persen. IKU number-based (5, 6) dinyatakan
+               sebagai persen dari target angkanya (pembilang / target)
+- target_pct : target pada sumbu persen (100 untuk number-based)
+- ratio, gap : actual / target dan actual - target (poin persen)
+- status     : GAP / ON TRACK (>= ON_TRACK_RATIO x target) / ACHIEVED
+
+Target diambil dari CONFIG['target_values']. Modul ini tidak mengimpor
+matplotlib, sehingga bisa dipakai tanpa render.
+
+Author: Tim IKU FST
+Version: 2.0 (Modular)
+Last Updated: 2026-10-19
+============================================================================
+"""
+
+import numpy as np
+
+from config import CONFIG
+
+
+# IKU utama yang ditampilkan di overall achievement dashboard
+OVERALL_IKUS = ('1', '2', '3', '4', '5', '6', '7', '8')
+
+# IKU yang targetnya berupa angka (bukan persentase)
+NUMBER_BASED = ('5', '6')
+
+# Satuan target IKU number-based (untuk teks "Target: 2/prodi")
+NUMBER_UNITS = {'6': '/prodi'}
+
+# Batas ON TRACK relatif terhadap target
+ON_TRACK_RATIO = 0.8
+
+# Kode status (index ke STATUS_LABELS)
+GAP, ON_TRACK, ACHIEVED = 0, 1, 2
+STATUS_LABELS = ('GAP', 'ON TRACK', 'ACHIEVED')
+
+
+def _fmt(value):
+    """Angka tanpa desimal berlebih (60 -> '60', 20.14 -> '20.14')"""
+    return f'{value:g}'
+
+
+class AchievementModel:
+    """
+    Capaian 8 IKU utama sebagai array (satu elemen per IKU)
+
+    Parameters:
+    -----------
+    all_stats : dict
+        Statistik per IKU {iku_number: {'pembilang', 'penyebut', 'persentase'}}
+    targets : dict, optional
+        Target per IKU (default CONFIG['target_values'])
+    ikus : tuple
+        Urutan IKU (default OVERALL_IKUS)
+    """
+
+    def __init__(self, all_stats, targets=None, ikus=OVERALL_IKUS):
+        targets = CONFIG['target_values'] if targets is None else targets
+        self.ikus = tuple(ikus)
+
+        rows = [all_stats.get(iku) for iku in self.ikus]
+        self.available = np.array([stats is not None for stats in rows])
+        self.number_based = np.isin(self.ikus, NUMBER_BASED)
+
+        def column(key):
+            return np.array([np.nan if stats is None else stats[key] for stats in rows], dtype=float)
+
+        self.pembilang = column('pembilang')
+        self.penyebut = column('penyebut')
+        self.persentase = column('persentase')
+        self.target = np.array([targets.get(iku, np.nan) for iku in self.ikus], dtype=float)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.actual_pct = np.where(self.number_based,
+                                       self.pembilang / self.target * 100, self.persentase)
+            self.target_pct = np.where(self.number_based, 100.0, self.target)
+            self.ratio = self.actual_pct / self.target_pct
+        self.capped_pct = np.minimum(self.actual_pct, 100.0)
+        self.gap = self.actual_pct - self.target_pct
+        self.status = np.select(
+            [self.actual_pct >= self.target_pct,
+             self.actual_pct >= self.target_pct * ON_TRACK_RATIO],
+            [ACHIEVED, ON_TRACK], default=GAP)
+
+        # Teks siap tampil (pembilang/penyebut memakai nilai asli stats,
+        # agar int tetap tampil tanpa ".0")
+        self.status_text = [STATUS_LABELS[code] for code in self.status]
+        self.diff_text = [f'+{gap:.1f}%' if gap >= 0 else f'-{-gap:.1f}%' for gap in self.gap]
+        self.value_text = []
+        self.detail_text = []
+        self.target_text = []
+        for iku, stats, number_based, target, pct in zip(
+                self.ikus, rows, self.number_based, self.target, self.actual_pct):
+            if stats is None:
+                self.value_text.append('')
+                self.detail_text.append('')
+                self.target_text.append('')
+            elif number_based:
+                value = stats['pembilang']
+                self.value_text.append(f'{int(value)}' if float(value).is_integer() else f'{value:.2f}')
+                self.target_text.append(f'Target: {_fmt(target)}{NUMBER_UNITS.get(iku, "")}')
+                self.detail_text.append(self.target_text[-1])
+            else:
+                self.value_text.append(f'{pct:.1f}%')
+                self.target_text.append(f'Target: {_fmt(target)}%')
+                self.detail_text.append(f"{stats['pembilang']}/{stats['penyebut']}")
+
+    def __len__(self):
+        return len(self.ikus)
+
+    def target_label(self, index):
+        """Target pada sumbu persen sebagai teks ('60%', '100%')"""
+        return f'{_fmt(self.target_pct[index])}%'
+
+
+def achievement_model(all_stats):
+    """AchievementModel dari all_stats (dikembalikan apa adanya jika sudah model)"""
+    if isinstance(all_stats, AchievementModel):
+        return all_stats
+    return AchievementModel(all_stats)
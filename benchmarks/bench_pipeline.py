@@ -0,0 +1,427 @@
+"""
+============================================================================
+BENCHMARK - PIPELINE END-TO-END (PER STAGE) + RIWAYAT & REGRESI
+============================================================================
+
+Jalankan seluruh pipeline generate_all pada data sintetis
+(synthetic_data.py) untuk beberapa skala, diukur per stage:
+
+- ingestion         : baca semua file Excel (read_excel_iku; backend
+                      --reader, default openpyxl agar baseline stabil)
+- processing        : setiap entry IKU_PROCESSORS (+ calculate_overall_stats)
+                      dan COMBINED_PROCESSORS
+- render/vertical   : bar chart vertikal per IKU
+- render/donut      : breakdown donut + donut IKU utama
+- render/breakdown  : category breakdown (breakdown/iku_XX_breakdown.py)
+- render/overall    : overall achievement dashboard (6 style)
+- saving            : savefig PNG/SVG (dikurangkan dari stage render;
+                      figure dialihkan lewat exporters.render_to). Termasuk
+                      rasterisasi, karena matplotlib baru menggambar figure
+                      saat savefig - stage render/* hanya membangun figure
+
+Per stage dicatat wall time, CPU time, dan peak RSS (VmHWM di-reset per
+stage lewat /proc/self/clear_refs; di luar Linux memakai ru_maxrss yang
+tidak bisa di-reset). Setiap skala dijalankan di process baru (spawn),
+sehingga memori skala sebelumnya tidak ikut terukur. Detail per IKU
+(processing/XX, render/breakdown/XX) ikut disimpan tetapi tidak dipakai
+untuk deteksi regresi.
+
+Hasil ditambahkan ke file riwayat JSON. Baseline disimpan per kombinasi
+(scale, seed, svg); run pertama menjadi baseline. Stage yang lebih lambat
+/ lebih boros dari baseline melebihi --threshold (dan melebihi batas
+noise absolut) ditandai REGRESI, dan script keluar dengan kode 1.
+
+Summary dashboard tidak diukur (create_summary_dashboard crash pada
+data apa pun, lihat --no-dashboard di main_visualize_iku.py).
+
+Usage:
+    python benchmarks/bench_pipeline.py                    # skala 1 dan 5
+    python benchmarks/bench_pipeline.py --scales 1 5 20 --repeat 3
+    python benchmarks/bench_pipeline.py --set-baseline     # simpan baseline baru
+============================================================================
+"""
+
+import io
+import sys
+import json
+import time
+import platform
+import argparse
+import tempfile
+import subprocess
+import contextlib
+import multiprocessing
+from datetime import datetime
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+ROOT_DIR = BENCH_DIR.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+import numpy as np
+
+from readers import BACKENDS
+
+
+DEFAULT_HISTORY = BENCH_DIR / 'results' / 'pipeline_history.json'
+
+STAGES = ['ingestion', 'processing', 'render/vertical', 'render/donut',
+          'render/breakdown', 'render/overall', 'saving', 'total']
+METRICS = ['wall_s', 'cpu_s', 'peak_rss_mb']
+
+# Selisih absolut minimum agar dianggap regresi (noise timer / allocator)
+NOISE_FLOOR = {'wall_s': 0.05, 'cpu_s': 0.05, 'peak_rss_mb': 5.0}
+
+
+# ============================================================================
+# PENGUKURAN
+# ============================================================================
+
+def _reset_peak_rss():
+    """Reset VmHWM process ini (Linux); return False jika tidak didukung"""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def _peak_rss_mb():
+    """Peak RSS process ini (MB)"""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+
+
+class StageRecorder:
+    """
+    Catat wall/CPU/peak RSS per stage
+
+    Waktu di dalam save callback (stage 'saving') dikurangkan dari stage
+    render yang sedang berjalan, sehingga render dan saving terpisah.
+    """
+
+    def __init__(self):
+        self.stages = {}
+        self.details = {}
+        self.save_wall = 0.0
+        self.save_cpu = 0.0
+
+    @contextlib.contextmanager
+    def stage(self, name, detail=False):
+        # Detail tidak me-reset peak RSS agar peak stage induknya utuh
+        if not detail:
+            _reset_peak_rss()
+        save_wall, save_cpu = self.save_wall, self.save_cpu
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            record = {
+                'wall_s': time.perf_counter() - wall - (self.save_wall - save_wall),
+                'cpu_s': time.process_time() - cpu - (self.save_cpu - save_cpu),
+            }
+            if detail:
+                self.details[name] = record
+            else:
+                record['peak_rss_mb'] = _peak_rss_mb()
+                self.stages[name] = record
+
+    def save_callback(self, target):
+        """Callback render target: simpan lewat target asli, catat waktunya"""
+        def callback(fig, filename_base):
+            wall, cpu = time.perf_counter(), time.process_time()
+            try:
+                return target.save(fig, filename_base)
+            finally:
+                self.save_wall += time.perf_counter() - wall
+                self.save_cpu += time.process_time() - cpu
+        return callback
+
+
+# ============================================================================
+# SATU RUN (DI PROCESS TERPISAH)
+# ============================================================================
+
+def run_pipeline(scale, seed, svg, reader='openpyxl'):
+    """
+    Jalankan pipeline pada data sintetis skala `scale`
+
+    Returns:
+    --------
+    dict : {'rows', 'files', 'stages', 'details'}
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    from config import CONFIG, ALL_IKU
+    from exporters import CallbackTarget, FileTarget, render_to
+    from results_bundle import _MemoryFrameSource
+    from synthetic_data import write_dataset
+    from utils import read_excel_iku, set_frame_source, setup_publication_style, calculate_overall_stats
+    from processors import IKU_PROCESSORS, COMBINED_PROCESSORS
+    from visualizations import (
+        create_vertical_bar_chart,
+        create_breakdown_donut_charts,
+        create_main_iku_donut
+    )
+    from achievement import achievement_model
+    import overall
+    from main_visualize_iku import CATEGORY_BREAKDOWN_FUNCTIONS
+
+    recorder = StageRecorder()
+    quiet = io.StringIO()
+
+    with tempfile.TemporaryDirectory(prefix='iku_bench_') as tmp, contextlib.redirect_stdout(quiet):
+        tmp = Path(tmp)
+        write_dataset(tmp, scale=scale, seed=seed)
+        CONFIG['base_path'] = tmp
+        CONFIG['export_svg'] = svg
+        CONFIG['reader_backend'] = reader
+        target = FileTarget(tmp / 'output', CONFIG)
+        files = []
+
+        total_wall, total_cpu = time.perf_counter(), time.process_time()
+
+        # 1. Ingestion (Excel -> DataFrame)
+        with recorder.stage('ingestion'):
+            frames = {}
+            for path in sorted(tmp.glob('monitoring-iku-*-*.xlsx')):
+                _, _, iku_number, file_type = path.stem.split('-', 3)
+                frames[(iku_number, file_type)] = read_excel_iku(iku_number, file_type)
+        set_frame_source(_MemoryFrameSource(frames))
+
+        # 2. Processing (semua processor, dari DataFrame di memori)
+        results = {}
+        with recorder.stage('processing'):
+            for iku, processor in IKU_PROCESSORS.items():
+                with recorder.stage(f'processing/{iku}', detail=True):
+                    df_pembilang = read_excel_iku(iku, 'pembilang')
+                    df_penyebut = frames.get((iku, 'penyebut'))
+                    data = processor(df_pembilang, df_penyebut)
+                    stats = None
+                    if df_penyebut is not None:
+                        stats = calculate_overall_stats(df_pembilang, df_penyebut.copy())
+                results[iku] = (data, stats)
+            for iku, (process_func, _, _) in COMBINED_PROCESSORS.items():
+                with recorder.stage(f'processing/{iku}', detail=True):
+                    data, stats, _, _ = process_func()
+                results[iku] = (data, stats)
+
+        all_stats = {iku: stats for iku, (_, stats) in results.items()
+                     if iku in ALL_IKU and stats is not None}
+
+        # 3. Render per keluarga chart (saving dicatat terpisah)
+        setup_publication_style()
+        with render_to(CallbackTarget(recorder.save_callback(target))):
+            with recorder.stage('render/vertical'):
+                for iku in ALL_IKU:
+                    data, _ = results[iku]
+                    files.extend(create_vertical_bar_chart(data, iku, CONFIG['target_values'].get(iku)) or [])
+
+            with recorder.stage('render/donut'):
+                iku_groups = {'1': ['11', '12', '13'], '2': ['21', '22', '23'], '3': ['31', '33'],
+                              '4': ['41', '42'], '7': ['71'], '8': ['81']}
+                for main_iku, sub_ikus in iku_groups.items():
+                    files.extend(create_breakdown_donut_charts(
+                        main_iku, {s: all_stats[s] for s in sub_ikus}) or [])
+                    files.extend(create_main_iku_donut(main_iku, all_stats[main_iku]) or [])
+                for main_iku in ('5', '6'):
+                    files.extend(create_main_iku_donut(main_iku, all_stats[main_iku]) or [])
+
+            with recorder.stage('render/breakdown'):
+                for iku, create_breakdown in CATEGORY_BREAKDOWN_FUNCTIONS.items():
+                    with recorder.stage(f'render/breakdown/{iku}', detail=True):
+                        files.extend(create_breakdown() or [])
+
+            with recorder.stage('render/overall'):
+                model = achievement_model(all_stats)
+                for style in overall.available_styles():
+                    files.extend(overall.load_style(style)(model) or [])
+
+        recorder.stages['saving'] = {'wall_s': recorder.save_wall, 'cpu_s': recorder.save_cpu,
+                                     'peak_rss_mb': None}
+        recorder.stages['total'] = {'wall_s': time.perf_counter() - total_wall,
+                                    'cpu_s': time.process_time() - total_cpu,
+                                    'peak_rss_mb': max(s['peak_rss_mb'] or 0
+                                                       for s in recorder.stages.values())}
+        set_frame_source(None)
+        plt.close('all')
+
+    return {
+        'rows': int(sum(len(df) for df in frames.values())),
+        'files': len(files),
+        'stages': recorder.stages,
+        'details': recorder.details,
+    }
+
+
+def _median_runs(runs):
+    """Gabungkan beberapa repeat: median per metrik"""
+    merged = dict(runs[0])
+    for section in ('stages', 'details'):
+        merged[section] = {}
+        for name, record in runs[0][section].items():
+            merged[section][name] = {
+                metric: (None if value is None else
+                         float(np.median([run[section][name][metric] for run in runs])))
+                for metric, value in record.items()
+            }
+    return merged
+
+
+def run_scale(scale, seed, svg, repeat, reader='openpyxl'):
+    """Jalankan satu skala `repeat` kali, masing-masing di process baru"""
+    context = multiprocessing.get_context('spawn')
+    runs = []
+    for _ in range(repeat):
+        with context.Pool(1) as pool:
+            runs.append(pool.apply(run_pipeline, (scale, seed, svg, reader)))
+    return _median_runs(runs)
+
+
+# ============================================================================
+# RIWAYAT & REGRESI
+# ============================================================================
+
+def load_history(path):
+    if path.exists():
+        return json.loads(path.read_text(encoding='utf-8'))
+    return {'baseline': {}, 'runs': []}
+
+
+def save_history(history, path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(history, indent=2), encoding='utf-8')
+
+
+def _git_commit():
+    try:
+        out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT_DIR,
+                             capture_output=True, text=True, timeout=10)
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def baseline_key(scale, seed, svg, reader='openpyxl'):
+    key = f'scale={scale:g},seed={seed},svg={int(svg)}'
+    return key if reader == 'openpyxl' else f'{key},reader={reader}'
+
+
+def compare(run, baseline, threshold):
+    """
+    Bandingkan run dengan baseline per stage & metrik
+
+    Returns:
+    --------
+    list : [(stage, metric, nilai baseline, nilai sekarang, rasio, regresi?)]
+    """
+    rows = []
+    for stage in STAGES:
+        for metric in METRICS:
+            current = run['stages'].get(stage, {}).get(metric)
+            base = baseline['stages'].get(stage, {}).get(metric)
+            if current is None or not base:
+                continue
+            ratio = current / base
+            regressed = ratio > 1 + threshold and current - base > NOISE_FLOOR[metric]
+            rows.append((stage, metric, base, current, ratio, regressed))
+    return rows
+
+
+def print_run(run, comparison):
+    ratios = {(stage, metric): (ratio, regressed)
+              for stage, metric, _, _, ratio, regressed in comparison}
+
+    def cell(stage, metric, fmt):
+        value = run['stages'][stage][metric]
+        if value is None:
+            return f"{'-':>18}"
+        text = fmt.format(value)
+        if (stage, metric) in ratios:
+            ratio, regressed = ratios[(stage, metric)]
+            text += f" ({ratio - 1:+.0%}){'!' if regressed else ' '}"
+        return f"{text:>18}"
+
+    print(f"  {'stage':<18}{'wall':>18}{'cpu':>18}{'peak RSS':>18}")
+    for stage in STAGES:
+        print(f"  {stage:<18}{cell(stage, 'wall_s', '{:.2f}s')}{cell(stage, 'cpu_s', '{:.2f}s')}"
+              f"{cell(stage, 'peak_rss_mb', '{:.0f} MB')}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark pipeline end-to-end per stage')
+    parser.add_argument('--scales', nargs='+', type=float, default=[1, 5],
+                        help='Skala data sintetis (default: 1 5)')
+    parser.add_argument('--seed', type=int, default=0, help='Seed data sintetis (default: 0)')
+    parser.add_argument('--repeat', type=int, default=1,
+                        help='Jumlah run per skala, diambil median (default: 1)')
+    parser.add_argument('--svg', action='store_true', help='Export SVG juga (default: PNG saja)')
+    parser.add_argument('--reader', default='openpyxl', choices=['auto'] + list(BACKENDS),
+                        help='Backend pembaca Excel untuk stage ingestion (default: openpyxl)')
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help='Batas regresi relatif terhadap baseline (default: 0.10 = 10%%)')
+    parser.add_argument('--history', type=Path, default=DEFAULT_HISTORY,
+                        help=f'File riwayat JSON (default: {DEFAULT_HISTORY.relative_to(ROOT_DIR)})')
+    parser.add_argument('--set-baseline', action='store_true',
+                        help='Jadikan run ini baseline baru (tanpa cek regresi)')
+    args = parser.parse_args()
+
+    history = load_history(args.history)
+    regressions = []
+
+    for scale in args.scales:
+        key = baseline_key(scale, args.seed, args.svg, args.reader)
+        print(f"\n[scale {scale:g}x] {args.repeat} run...")
+        result = run_scale(scale, args.seed, args.svg, args.repeat, args.reader)
+
+        run = {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'commit': _git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'scale': scale,
+            'seed': args.seed,
+            'svg': args.svg,
+            'reader': args.reader,
+            'repeat': args.repeat,
+            **result,
+        }
+        history['runs'].append(run)
+
+        baseline = history['baseline'].get(key)
+        comparison = []
+        if baseline is not None and not args.set_baseline:
+            comparison = compare(run, baseline, args.threshold)
+            print(f"  {run['rows']:,} baris, {run['files']} file; baseline {baseline['commit']} "
+                  f"({baseline['timestamp']})")
+        else:
+            history['baseline'][key] = run
+            print(f"  {run['rows']:,} baris, {run['files']} file; disimpan sebagai baseline")
+
+        print_run(run, comparison)
+        regressions.extend((scale, *row) for row in comparison if row[-1])
+
+    save_history(history, args.history)
+    print(f"\nRiwayat: {args.history}")
+
+    if regressions:
+        print(f"\n❌ {len(regressions)} REGRESI (> {args.threshold:.0%} dari baseline):")
+        for scale, stage, metric, base, current, ratio, _ in regressions:
+            print(f"  scale {scale:g}x {stage} {metric}: {base:.2f} -> {current:.2f} ({ratio - 1:+.0%})")
+        sys.exit(1)
+    print("\n✅ Tidak ada regresi")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+============================================================================
+BENCHMARK - SHARED MEMORY VS PICKLE (DATA KE WORKER)
+============================================================================
+
+Bandingkan cara mengirim DataFrame input ke worker process:
+- pickle       : semua DataFrame dikirim lewat initargs (di-pickle per worker)
+- shm-arrow    : SharedFrameStore, worker membaca tabel Arrow dari shared
+                 memory (tanpa copy)
+- shm-pandas   : SharedFrameStore, worker mengonversi ke DataFrame
+                 (kontrak read_excel_iku, satu copy per frame)
+
+Dataset sintetis skala universitas dari synthetic_data.generate_dataset
+(--scale kali ukuran data FST, default 50x; tidak butuh file Excel asli).
+
+Diukur per mode: waktu sampai semua worker siap memegang data, ukuran
+data yang dikirim per worker, dan memori worker (RSS serta memori privat
+dari /proc/self/smaps_rollup, sehingga hanya berjalan di Linux).
+
+Usage:
+    python benchmarks/bench_shared_memory.py
+    python benchmarks/bench_shared_memory.py --scale 100 --workers 4
+============================================================================
+"""
+
+import sys
+import time
+import pickle
+import argparse
+import multiprocessing
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from shared_frames import SharedFrameStore
+from synthetic_data import generate_dataset
+
+
+_WORKER_DATA = {}
+
+
+# ============================================================================
+# SYNTHETIC DATASET
+# ============================================================================
+
+def make_dataset(scale, seed=0):
+    """Semua frame input IKU sintetis, `scale` kali ukuran data FST"""
+    return generate_dataset(scale=scale, seed=seed)
+
+
+# ============================================================================
+# WORKER SIDE
+# ============================================================================
+
+def _memory_kb():
+    """
+    (RSS, memori privat) process ini dalam kB dari /proc/self/smaps_rollup
+
+    ru_maxrss tidak dipakai: nilainya ikut diwarisi dari parent lewat
+    fork+exec (start method spawn), sehingga tidak mencerminkan worker.
+    """
+    with open('/proc/self/smaps_rollup') as f:
+        fields = dict(line.split(':', 1) for line in f if ':' in line)
+    kb = {name: int(value.split()[0]) for name, value in fields.items()
+          if value.strip().endswith('kB')}
+    return kb['Rss'], kb['Private_Clean'] + kb['Private_Dirty']
+
+
+def _init_pickle(frames):
+    _WORKER_DATA['frames'] = frames
+
+
+def _init_shm(source, mode):
+    _WORKER_DATA['source'] = source
+    _WORKER_DATA['mode'] = mode
+
+
+def _touch_all():
+    """Pakai semua frame sekali (hitung baris), lalu laporkan memori worker"""
+    rows = 0
+    if 'frames' in _WORKER_DATA:
+        rows = sum(len(df) for df in _WORKER_DATA['frames'].values())
+    else:
+        source, mode = _WORKER_DATA['source'], _WORKER_DATA['mode']
+        held = []
+        for key in source.keys():
+            data = source.table(*key) if mode == 'arrow' else source(*key)
+            rows += data.num_rows if mode == 'arrow' else len(data)
+            held.append(data)
+        _WORKER_DATA['held'] = held
+
+    time.sleep(0.3)  # agar setiap task jatuh ke worker yang berbeda
+    rss_kb, private_kb = _memory_kb()
+    return multiprocessing.current_process().pid, rows, rss_kb, private_kb
+
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+def _run_touch(_):
+    return _touch_all()
+
+
+def _baseline_worker_memory(context, workers):
+    """Memori worker kosong (import pandas/pyarrow saja) sebagai pembanding"""
+    with ProcessPoolExecutor(workers, mp_context=context,
+                             initializer=_init_pickle, initargs=({},)) as executor:
+        results = list(executor.map(_run_touch, range(workers)))
+    return results
+
+
+def run_mode(mode, frames, workers, context):
+    """Jalankan satu mode; return dict hasil"""
+    start = time.perf_counter()
+    store = None
+    if mode == 'pickle':
+        payload_bytes = len(pickle.dumps(frames, protocol=pickle.HIGHEST_PROTOCOL))
+        initializer, initargs = _init_pickle, (frames,)
+    else:
+        store = SharedFrameStore()
+        for key, df in frames.items():
+            store.publish(*key, df)
+        source = store.source()
+        payload_bytes = len(pickle.dumps(source, protocol=pickle.HIGHEST_PROTOCOL))
+        initializer, initargs = _init_shm, (source, mode.split('-')[1])
+    publish_s = time.perf_counter() - start
+
+    try:
+        with ProcessPoolExecutor(workers, mp_context=context,
+                                 initializer=initializer, initargs=initargs) as executor:
+            results = list(executor.map(_run_touch, range(workers)))
+            ready_s = time.perf_counter() - start
+    finally:
+        if store is not None:
+            store.close()
+
+    per_pid = {pid: (rows, rss, private) for pid, rows, rss, private in results}
+    return {
+        'mode': mode,
+        'publish_s': publish_s,
+        'ready_s': ready_s,
+        'payload_mb': payload_bytes / 1e6,
+        'workers': len(per_pid),
+        'rows': max(rows for rows, _, _ in per_pid.values()),
+        'rss_mb': max(rss for _, rss, _ in per_pid.values()) / 1024,
+        'private_mb': max(private for _, _, private in per_pid.values()) / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark shared memory vs pickle')
+    parser.add_argument('--scale', type=float, default=50, help='Faktor skala dataset (default: 50)')
+    parser.add_argument('--seed', type=int, default=0, help='Seed data sintetis (default: 0)')
+    parser.add_argument('--workers', type=int, default=4, help='Jumlah worker (default: 4)')
+    parser.add_argument('--start-method', default='spawn', choices=['spawn', 'forkserver', 'fork'],
+                        help='Start method multiprocessing (default: spawn)')
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context(args.start_method)
+
+    print(f"Membuat dataset sintetis {args.scale}x...")
+    frames = make_dataset(args.scale, args.seed)
+    total_rows = sum(len(df) for df in frames.values())
+    in_memory_mb = sum(df.memory_usage(deep=True).sum() for df in frames.values()) / 1e6
+    print(f"  {len(frames)} frame, {total_rows:,} baris, {in_memory_mb:.1f} MB (pandas)")
+    print(f"  {args.workers} worker, start method: {args.start_method}\n")
+
+    baseline = _baseline_worker_memory(context, args.workers)
+    base_rss = max(rss for _, _, rss, _ in baseline) / 1024
+    base_private = max(p for _, _, _, p in baseline) / 1024
+
+    header = (f"{'mode':<12}{'publish':>10}{'ready':>10}{'kirim/worker':>14}"
+              f"{'RSS worker':>13}{'privat':>11}")
+    print(header)
+    print('-' * len(header))
+    print(f"{'(kosong)':<12}{'':>10}{'':>10}{'':>14}{base_rss:>10.1f} MB{base_private:>8.1f} MB")
+
+    for mode in ('pickle', 'shm-arrow', 'shm-pandas'):
+        result = run_mode(mode, frames, args.workers, context)
+        assert result['rows'] == total_rows, 'worker tidak melihat semua baris'
+        print(f"{mode:<12}{result['publish_s']:>9.2f}s{result['ready_s']:>9.2f}s"
+              f"{result['payload_mb']:>11.2f} MB{result['rss_mb']:>10.1f} MB"
+              f"{result['private_mb']:>8.1f} MB")
+
+    print("\npublish = pickle / tulis shared memory di parent; ready = sampai semua worker")
+    print("memegang data. RSS worker termasuk halaman shared memory yang dibaca; memori")
+    print("privat tidak (halaman shared memory dipakai bersama semua worker).")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+"""
+============================================================================
+SOAK - PENGUKURAN LIFECYCLE FIGURE (MEMORI PER RUN)
+============================================================================
+
+Jalankan seluruh suite chart (main_visualize_iku.main: chart per IKU,
+donut, category breakdown, overall achievement) berulang kali di satu
+process pada data sintetis (synthetic_data.py), lalu cetak per run:
+jumlah figure yang masih hidup dan RSS, serta kemiringan regresi linear
+RSS per run setelah --warmup run pertama (cache font, import, cache
+frame).
+
+Script ini hanya mengukur. Syarat lulus (tidak ada figure tertinggal,
+RSS tidak terus naik) diuji oleh tests/test_figures.py
+(python -m pytest -m slow tests/test_figures.py).
+
+Figure di-render ke PNG di memori lalu dibuang (exporters.render_to +
+CallbackTarget), sehingga renderer Agg ikut teruji tanpa menulis file.
+Summary dashboard tidak ikut (create_summary_dashboard crash pada data
+apa pun, lihat --no-dashboard di main_visualize_iku.py).
+
+Usage:
+    python benchmarks/soak_figures.py                  # 50 run, DPI 72
+    python benchmarks/soak_figures.py --runs 10 --dpi 300
+============================================================================
+"""
+
+import io
+import gc
+import sys
+import logging
+import time
+import argparse
+import tempfile
+import contextlib
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+
+from config import CONFIG
+from exporters import CallbackTarget, render_png_bytes, render_to
+from figures import figure_stats, live_figures, rss_mb
+from synthetic_data import SyntheticSource
+from utils import set_frame_source
+
+
+# ============================================================================
+# SOAK
+# ============================================================================
+
+def run_suite(dpi):
+    """Satu run suite chart lengkap; return jumlah figure yang dirender"""
+    import main_visualize_iku
+
+    rendered = []
+
+    def discard(fig, filename_base):
+        render_png_bytes(fig, dpi)
+        rendered.append(filename_base)
+        return []
+
+    with render_to(CallbackTarget(discard)), contextlib.redirect_stdout(io.StringIO()):
+        main_visualize_iku.main(skip_dashboard=True, skip_cleanup=True)
+    return len(rendered)
+
+
+def growth_per_run(rss_values):
+    """Kemiringan regresi linear RSS (MB per run)"""
+    if len(rss_values) < 2:
+        return 0.0
+    return float(np.polyfit(np.arange(len(rss_values)), rss_values, 1)[0])
+
+
+def soak(runs, warmup, dpi):
+    """
+    Jalankan suite `runs` kali dan catat figure hidup + RSS per run
+
+    Returns:
+    --------
+    list : [{'run', 'seconds', 'figures', 'live_figures', 'rss_mb'}]
+    """
+    history = []
+    print(f"{'run':>4} {'waktu':>8} {'figure':>7} {'hidup':>6} {'RSS':>10}")
+    for run in range(1, runs + 1):
+        start = time.perf_counter()
+        figures = run_suite(dpi)
+        gc.collect()
+        record = {
+            'run': run,
+            'seconds': time.perf_counter() - start,
+            'figures': figures,
+            'live_figures': live_figures(),
+            'rss_mb': rss_mb(),
+        }
+        history.append(record)
+        marker = '  (warmup)' if run <= warmup else ''
+        print(f"{run:>4} {record['seconds']:>7.1f}s {figures:>7} {record['live_figures']:>6} "
+              f"{record['rss_mb']:>7.1f} MB{marker}")
+    return history
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Pengukuran lifecycle figure (figure hidup + RSS per run)')
+    parser.add_argument('--runs', type=int, default=50, help='Jumlah run suite (default: 50)')
+    parser.add_argument('--warmup', type=int, default=3,
+                        help='Run awal yang tidak dihitung untuk pertumbuhan RSS (default: 3)')
+    parser.add_argument('--dpi', type=int, default=72,
+                        help='DPI render PNG (default: 72; 300 = kualitas publikasi, jauh lebih lambat)')
+    parser.add_argument('--scale', type=float, default=1.0, help='Skala data sintetis (default: 1)')
+    parser.add_argument('--seed', type=int, default=0, help='Seed data sintetis (default: 0)')
+    args = parser.parse_args()
+
+    if args.runs <= args.warmup:
+        parser.error('--runs harus lebih besar dari --warmup')
+
+    # Peringatan fallback font (weight 900 -> 700) muncul di setiap run
+    logging.getLogger('matplotlib.font_manager').setLevel(logging.ERROR)
+    CONFIG['export_svg'] = False
+    set_frame_source(SyntheticSource(scale=args.scale, seed=args.seed))
+
+    with tempfile.TemporaryDirectory(prefix='iku_soak_') as tmp:
+        CONFIG['output_dir'] = Path(tmp)
+        history = soak(args.runs, args.warmup, args.dpi)
+
+    measured = [record['rss_mb'] for record in history[args.warmup:]]
+    growth = growth_per_run(measured)
+    leaked = [record['run'] for record in history if record['live_figures']]
+    stats = figure_stats()
+
+    print()
+    print(f"Figure dilepas      : {stats['charts']} (maks. hidup setelah chart: {stats['max_live_figures']})")
+    print(f"RSS setelah warmup  : {measured[0]:.1f} MB -> {measured[-1]:.1f} MB")
+    print(f"Pertumbuhan RSS     : {growth:+.2f} MB/run")
+    print(f"Figure tertinggal   : run {', '.join(map(str, leaked))}" if leaked
+          else "Figure tertinggal   : -")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+============================================================================
+ANNOTATION LAYER
+Label teks batched untuk bar chart breakdown
+============================================================================
+Bar chart annotated (nama dosen, nama mata kuliah, count) sebelumnya
+membuat 2 artist ax.text per bar dan menjalankan textwrap.wrap setiap
+kali. Untuk data universitas (ratusan prodi, ribuan nama) hal ini
+membuat ribuan artist per figure.
+
+Modul ini menyediakan:
+- wrap_label()     : textwrap yang di-memoize (label yang sama cukup
+                     di-wrap sekali)
+- BarAnnotations   : SATU artist untuk semua label satu layer; memakai
+                     satu objek Text yang digambar ulang di setiap posisi
+- annotate_bars()  : shortcut menambahkan layer label di ujung bar
+============================================================================
+"""
+
+import textwrap
+from functools import lru_cache
+
+import numpy as np
+from matplotlib.artist import Artist
+from matplotlib.text import Text
+from matplotlib.transforms import Bbox
+
+
+@lru_cache(maxsize=16384)
+def wrap_label(text, width):
+    """
+    Wrap text menjadi multi-line (memoized)
+
+    Parameters:
+    -----------
+    text : str
+    width : int
+        Lebar maksimum per baris
+
+    Returns:
+    --------
+    str : Text dengan newline
+    """
+    return '\n'.join(textwrap.wrap(text, width=width))
+
+
+class BarAnnotations(Artist):
+    """
+    Satu artist yang menggambar banyak label teks
+
+    Semua label dalam satu layer berbagi properti font yang sama;
+    hanya posisi, isi teks, dan (opsional) warna yang berbeda per label.
+    Layout teks di-cache oleh matplotlib per isi teks, sehingga biaya
+    per label hanya set posisi + draw.
+
+    Parameters:
+    -----------
+    x, y : array-like
+        Posisi label (koordinat data)
+    texts : sequence of str
+    colors : sequence, optional
+        Warna per label (default: warna dari text_props)
+    **text_props :
+        Properti matplotlib.text.Text (fontsize, ha, va, color, ...)
+    """
+
+    def __init__(self, x, y, texts, colors=None, **text_props):
+        super().__init__()
+        self._x = np.asarray(x, dtype=float)
+        self._y = np.asarray(y, dtype=float)
+        self._texts = list(texts)
+        self._colors = list(colors) if colors is not None else None
+        self._template = Text(0, 0, '', **text_props)
+        self._default_color = self._template.get_color()
+        self.set_zorder(self._template.get_zorder())
+        self.set_clip_on(False)
+
+    def __len__(self):
+        return len(self._texts)
+
+    def _iter_texts(self):
+        """Posisikan template Text ke setiap label secara bergantian"""
+        template = self._template
+        template.set_figure(self.figure)
+        template.set_transform(self.get_transform())
+
+        for i, label in enumerate(self._texts):
+            template.set_position((self._x[i], self._y[i]))
+            template.set_text(label)
+            template.set_color(self._colors[i] if self._colors is not None
+                               else self._default_color)
+            yield template
+
+    def draw(self, renderer):
+        if not self.get_visible():
+            return
+        for text in self._iter_texts():
+            text.draw(renderer)
+        self.stale = False
+
+    def get_window_extent(self, renderer=None):
+        extents = [text.get_window_extent(renderer) for text in self._iter_texts()]
+        extents = [bbox for bbox in extents if bbox.width or bbox.height]
+        if not extents:
+            return Bbox.null()
+        return Bbox.union(extents)
+
+
+def annotate_bars(ax, values, positions, texts, offset=0.0, colors=None, **text_props):
+    """
+    Tambahkan satu layer label di ujung horizontal bar
+
+    Parameters:
+    -----------
+    ax : matplotlib.axes.Axes
+    values : array-like
+        Panjang bar (posisi x ujung bar)
+    positions : array-like
+        Posisi y tengah bar
+    texts : sequence of str
+    offset : float
+        Offset horizontal dari ujung bar
+    colors : sequence, optional
+        Warna per label
+    **text_props :
+        Properti Text (fontsize, ha, va, fontweight, ...)
+
+    Returns:
+    --------
+    BarAnnotations
+    """
+    layer = BarAnnotations(np.asarray(values, dtype=float) + offset, positions,
+                           texts, colors=colors, **text_props)
+    ax.add_artist(layer)
+
+    return layer
@@ -12,12 +12,16 @@ sys.path.append(str(Path(__file__).parent.parent))
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
-import textwrap
 import numpy as np
 from visualization_config import (
-    BREAKDOWN_STYLE, JURUSAN_COLORS, JURUSAN_ORDER,
+    CONFIG, BREAKDOWN_STYLE, JURUSAN_COLORS, JURUSAN_ORDER,
     save_figure, setup_publication_style, get_prodi_color
 )
+from figures import managed_subplots
+from breakdown.annotation_layer import annotate_bars, wrap_label
+
+# Lebar figure annotated bar chart (inch)
+ANNOTATED_FIG_WIDTH = 18
 
 def create_annotated_bar_chart(df_data,
                                  groupby_col='Program Studi',
@@ -49,6 +53,11 @@ def create_annotated_bar_chart(df_data,
     max_names_full : int
         Maksimal jumlah untuk menampilkan semua nama
 
+    Jika tinggi figure melebihi BREAKDOWN_STYLE['max_figure_pixels'],
+    chart dipecah menjadi beberapa halaman ({filename_base}_p1,
+    {filename_base}_p2, ...) tanpa memecah group jurusan, dengan skala
+    x-axis yang sama di semua halaman.
+
     Returns:
     --------
     list : List of saved file paths
@@ -73,15 +82,10 @@ def create_annotated_bar_chart(df_data,
     # Sort: jurusan ascending (untuk grouping), count ascending within jurusan (bottom to top)
     grouped = grouped.sort_values(['jurusan_order', 'Count'], ascending=[True, True])
 
-    # Create figure dengan height yang cukup
     style = BREAKDOWN_STYLE
-    fig_height = max(style['min_fig_height'],
-                     len(grouped) * style['fig_height_per_item'])
-    fig, ax = plt.subplots(figsize=(18, fig_height))
-
-    y_pos = np.arange(len(grouped))
 
     # Warna berdasarkan jurusan dengan gradient (match dengan main charts)
+    # Dihitung dari SEMUA data agar gradient konsisten antar halaman
     # Hitung jumlah prodi per jurusan
     jurusan_counts = grouped[jurusan_col].value_counts().to_dict()
 
@@ -106,27 +110,11 @@ def create_annotated_bar_chart(df_data,
         # Increment index for this jurusan
         jurusan_idx[jurusan] += 1
 
-    # Buat bars (styling match dengan main charts)
-    bars = ax.barh(y_pos, grouped['Count'].values,
-                   color=colors, edgecolor='#1a1a1a',
-                   linewidth=1.5, alpha=0.88, height=0.75)
-
-    # Tambahkan separator lines antar jurusan (match dengan main charts)
-    jurusan_list = grouped[jurusan_col].tolist()
-    current_jurusan = None
-    for i, jurusan in enumerate(jurusan_list):
-        if current_jurusan is not None and jurusan != current_jurusan:
-            # Garis separator tegas
-            ax.axhline(y=i-0.5, color='#333333', linestyle='-',
-                      linewidth=1.5, alpha=0.6, zorder=2)
-        current_jurusan = jurusan
-
-    # Tambahkan nama-nama di samping bar
-    for idx, (bar, row) in enumerate(zip(bars, grouped.itertuples())):
-        count = row.Count
-        nama_list = getattr(row, name_col.replace(' ', '_'))
-
-        # Format nama
+    grouped['Color'] = colors
+
+    # Format nama untuk annotation
+    name_texts = []
+    for count, nama_list in zip(grouped['Count'], grouped[name_col]):
         if count <= max_names_full:
             # Tampilkan semua nama
             all_names = [n.split(',')[0].strip() for n in nama_list]
@@ -136,50 +124,173 @@ def create_annotated_bar_chart(df_data,
             first_names = [n.split(',')[0].strip() for n in nama_list[:8]]
             nama_text = ', '.join(first_names) + f'.. dan {count-8} lainnya'
 
-        # Wrap text
-        wrapped_text = '\n'.join(textwrap.wrap(nama_text, width=style['text_wrap_width']))
+        name_texts.append(wrap_label(nama_text, style['text_wrap_width']))
 
-        # Tampilkan text di samping bar
-        ax.text(bar.get_width() + style['annotation_offset_x'],
-                bar.get_y() + bar.get_height()/2,
-                wrapped_text,
-                ha='left', va='center',
-                fontsize=style['faculty_name_size'],
-                color=style['annotation_color'])
+    grouped['Annotation'] = name_texts
 
-        # Tampilkan count di dalam bar
-        count_color = (style['count_color_dark'] if count > style['count_threshold']
-                      else style['count_color_light'])
-        ax.text(bar.get_width() + style['count_offset_x'],
-                bar.get_y() + bar.get_height()/2,
-                f'{count}',
-                ha='right', va='center',
-                fontsize=style['count_label_size'],
-                fontweight='900',
-                color=count_color)
-
-    # Styling (match dengan main charts)
-    ax.set_yticks(y_pos)
-    labels = [label.replace('Program Studi ', '') for label in grouped[groupby_col]]
-    ax.set_yticklabels(labels, fontsize=10, fontweight='600')
-    ax.set_xlabel(xlabel, fontsize=12, fontweight='700')
-    ax.set_title(chart_title, fontsize=13, fontweight='900', pad=20)
-    ax.grid(axis='x', linestyle=':', alpha=0.6, zorder=0, linewidth=0.8)
-    ax.set_axisbelow(True)
-    ax.spines['top'].set_visible(False)
-    ax.spines['right'].set_visible(False)
-    ax.spines['left'].set_linewidth(1.5)
-    ax.spines['bottom'].set_linewidth(1.5)
+    # Pagination: batasi luas figure (pixel budget), jurusan tidak dipecah
+    max_items = max_items_per_page(ANNOTATED_FIG_WIDTH, style)
+    pages = paginate_by_group(grouped[jurusan_col].tolist(), max_items)
 
+    # Skala x-axis sama untuk semua halaman
     # Expand x-axis untuk memberi ruang text annotations
-    max_count = max(grouped['Count'])
-    ax.set_xlim(0, max_count * style['x_axis_multiplier'])
+    xlim = (0, max(grouped['Count']) * style['x_axis_multiplier'])
+
+    saved_files = []
+    for page_num, (start, stop) in enumerate(pages, start=1):
+        page_title = chart_title
+        page_filename = filename_base
+        if len(pages) > 1:
+            page_title = f'{chart_title} (Hal. {page_num}/{len(pages)})'
+            page_filename = f'{filename_base}_p{page_num}'
+
+        saved_files.extend(_draw_annotated_page(
+            grouped.iloc[start:stop], groupby_col, jurusan_col,
+            page_title, xlabel, page_filename, xlim
+        ))
+
+    return saved_files
+
+
+def max_items_per_page(fig_width, style=BREAKDOWN_STYLE, dpi=None):
+    """
+    Hitung jumlah bar maksimum per halaman sesuai pixel budget
+
+    Tinggi figure = jumlah bar * fig_height_per_item, sehingga luas
+    canvas Agg (width * height * dpi^2) dibatasi oleh
+    style['max_figure_pixels'].
+
+    Parameters:
+    -----------
+    fig_width : float
+        Lebar figure (inch)
+    style : dict
+        BREAKDOWN_STYLE
+    dpi : int, optional
+        Default CONFIG['dpi']
+
+    Returns:
+    --------
+    int : Jumlah bar per halaman (minimal 1)
+    """
+    dpi = dpi or CONFIG['dpi']
+    max_height = style['max_figure_pixels'] / (fig_width * dpi * dpi)
+
+    return max(1, int(max_height // style['fig_height_per_item']))
 
-    plt.tight_layout()
 
-    # Save
-    saved_files = save_figure(fig, filename_base)
-    plt.close()
+def paginate_by_group(group_labels, max_items):
+    """
+    Bagi baris (sudah terurut per group) menjadi halaman
+
+    Group (jurusan) yang berurutan dimasukkan ke halaman yang sama selama
+    muat; group tidak pernah dipecah kecuali satu group sendiri melebihi
+    max_items.
+
+    Parameters:
+    -----------
+    group_labels : list
+        Label group per baris, dalam urutan tampil
+    max_items : int
+        Jumlah baris maksimum per halaman
+
+    Returns:
+    --------
+    list : List of (start, stop) index per halaman
+    """
+    # Rentang (start, stop) setiap group berurutan
+    runs = []
+    for i, label in enumerate(group_labels):
+        if runs and group_labels[runs[-1][0]] == label:
+            runs[-1][1] = i + 1
+        else:
+            runs.append([i, i + 1])
+
+    pages = []
+    page_start, page_stop = 0, 0
+    for run_start, run_stop in runs:
+        if run_stop - page_start <= max_items:
+            page_stop = run_stop
+            continue
+
+        if page_stop > page_start:
+            pages.append((page_start, page_stop))
+        page_start = run_start
+
+        # Group lebih besar dari satu halaman: terpaksa dipecah
+        while run_stop - page_start > max_items:
+            pages.append((page_start, page_start + max_items))
+            page_start += max_items
+        page_stop = run_stop
+
+    if page_stop > page_start:
+        pages.append((page_start, page_stop))
+
+    return pages
+
+
+def _draw_annotated_page(grouped, groupby_col, jurusan_col, chart_title,
+                         xlabel, filename_base, xlim):
+    """Gambar dan simpan satu halaman annotated bar chart"""
+    style = BREAKDOWN_STYLE
+
+    # Create figure dengan height yang cukup
+    fig_height = max(style['min_fig_height'],
+                     len(grouped) * style['fig_height_per_item'])
+    with managed_subplots(figsize=(ANNOTATED_FIG_WIDTH, fig_height)) as (fig, ax):
+        y_pos = np.arange(len(grouped))
+
+        # Buat bars (styling match dengan main charts)
+        ax.barh(y_pos, grouped['Count'].values,
+                color=grouped['Color'].tolist(), edgecolor='#1a1a1a',
+                linewidth=1.5, alpha=0.88, height=0.75)
+
+        # Tambahkan separator lines antar jurusan (match dengan main charts)
+        jurusan_list = grouped[jurusan_col].tolist()
+        current_jurusan = None
+        for i, jurusan in enumerate(jurusan_list):
+            if current_jurusan is not None and jurusan != current_jurusan:
+                # Garis separator tegas
+                ax.axhline(y=i-0.5, color='#333333', linestyle='-',
+                          linewidth=1.5, alpha=0.6, zorder=2)
+            current_jurusan = jurusan
+
+        # Tambahkan nama-nama di samping bar (satu layer artist untuk semua bar)
+        counts = grouped['Count'].to_numpy()
+        annotate_bars(ax, counts, y_pos, grouped['Annotation'].tolist(),
+                      offset=style['annotation_offset_x'],
+                      ha='left', va='center',
+                      fontsize=style['faculty_name_size'],
+                      color=style['annotation_color'])
+
+        # Tampilkan count di dalam bar
+        count_colors = np.where(counts > style['count_threshold'],
+                                style['count_color_dark'], style['count_color_light'])
+        annotate_bars(ax, counts, y_pos, [f'{count}' for count in counts],
+                      offset=style['count_offset_x'], colors=count_colors,
+                      ha='right', va='center',
+                      fontsize=style['count_label_size'],
+                      fontweight='900')
+
+        # Styling (match dengan main charts)
+        ax.set_yticks(y_pos)
+        labels = [label.replace('Program Studi ', '') for label in grouped[groupby_col]]
+        ax.set_yticklabels(labels, fontsize=10, fontweight='600')
+        ax.set_xlabel(xlabel, fontsize=12, fontweight='700')
+        ax.set_title(chart_title, fontsize=13, fontweight='900', pad=20)
+        ax.grid(axis='x', linestyle=':', alpha=0.6, zorder=0, linewidth=0.8)
+        ax.set_axisbelow(True)
+        ax.spines['top'].set_visible(False)
+        ax.spines['right'].set_visible(False)
+        ax.spines['left'].set_linewidth(1.5)
+        ax.spines['bottom'].set_linewidth(1.5)
+
+        ax.set_xlim(*xlim)
+
+        plt.tight_layout()
+
+        # Save
+        saved_files = save_figure(fig, filename_base)
 
     return saved_files
 
@@ -228,106 +339,100 @@ def create_dual_bar_chart(left_data, right_data,
     max_items = max(len(left_data), len(right_data))
     fig_height = max(style['min_fig_height'], max_items * 0.7)
 
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(18, fig_height))
-
-    # LEFT CHART
-    y_pos1 = np.arange(len(left_data))
-    if left_colors is None:
-        # Use colorblind-friendly palette untuk variasi visual
-        palette = sns.color_palette("colorblind", n_colors=len(left_data))
-        left_colors = palette
-
-    bars1 = ax1.barh(y_pos1, left_data.values,
-                     color=left_colors, edgecolor='#1a1a1a',
-                     linewidth=1.5, alpha=0.88, height=0.75)
-
-    # Labels pada bars
-    for bar, count in zip(bars1, left_data.values):
-        width = bar.get_width()
-        ax1.text(width + 0.3, bar.get_y() + bar.get_height()/2,
-                f'{int(count)}',
-                ha='left', va='center', fontsize=10, fontweight='900')
-
-    # Styling ax1 (match dengan main charts)
-    ax1.set_yticks(y_pos1)
-    left_labels = ['\n'.join(textwrap.wrap(name, width=left_wrap_width))
-                   for name in left_data.index]
-    ax1.set_yticklabels(left_labels, fontsize=left_ylabel_fontsize, fontweight='600')
-    ax1.set_xlabel(left_xlabel, fontsize=12, fontweight='700')
-    ax1.set_title(left_title, fontsize=13, fontweight='900', pad=15)
-    ax1.xaxis.grid(True, linestyle=':', alpha=0.6, zorder=0, linewidth=0.8)
-    ax1.set_axisbelow(True)
-    ax1.spines['top'].set_visible(False)
-    ax1.spines['right'].set_visible(False)
-    ax1.spines['left'].set_linewidth(1.5)
-    ax1.spines['bottom'].set_linewidth(1.5)
-    ax1.invert_yaxis()
-
-    # RIGHT CHART
-    y_pos2 = np.arange(len(right_data))
-    if right_colors is None:
-        # Use warm palette untuk right chart (berbeda dari left)
-        palette = sns.color_palette("Set2", n_colors=len(right_data))
-        right_colors = palette
-
-    bars2 = ax2.barh(y_pos2, right_data.values,
-                     color=right_colors, edgecolor='#1a1a1a',
-                     linewidth=1.5, alpha=0.88, height=0.75)
-
-    # Labels pada bars
-    for bar, count in zip(bars2, right_data.values):
-        width = bar.get_width()
-        ax2.text(width + 0.3, bar.get_y() + bar.get_height()/2,
-                f'{int(count)}',
-                ha='left', va='center', fontsize=10, fontweight='900')
-
-    # Styling ax2 (match dengan main charts)
-    ax2.set_yticks(y_pos2)
-    right_labels = ['\n'.join(textwrap.wrap(name, width=right_wrap_width))
-                    for name in right_data.index]
-    ax2.set_yticklabels(right_labels, fontsize=right_ylabel_fontsize, fontweight='600')
-    ax2.set_xlabel(right_xlabel, fontsize=12, fontweight='700')
-    ax2.set_title(right_title, fontsize=13, fontweight='900', pad=15)
-    ax2.xaxis.grid(True, linestyle=':', alpha=0.6, zorder=0, linewidth=0.8)
-    ax2.set_axisbelow(True)
-    ax2.spines['top'].set_visible(False)
-    ax2.spines['right'].set_visible(False)
-    ax2.spines['left'].set_linewidth(1.5)
-    ax2.spines['bottom'].set_linewidth(1.5)
-    ax2.invert_yaxis()
-
-    # Add legend if requested
-    if add_legend and legend_labels:
-        import matplotlib.patches as mpatches
-
-        # Create legend elements
-        legend_elements = []
-        for label, color in legend_labels.items():
-            legend_elements.append(
-                mpatches.Patch(facecolor=color, edgecolor='#1a1a1a',
-                             linewidth=1.5, label=label)
-            )
-
-        # Add legend (vertical, upper right)
-        fig.legend(handles=legend_elements,
-                  loc='upper right',
-                  bbox_to_anchor=(0.98, 0.96),
-                  ncol=1,  # Vertical layout
-                  frameon=True,
-                  framealpha=0.95,
-                  edgecolor='0.2',
-                  fontsize=10,
-                  title=legend_title,
-                  title_fontsize=11)
-
-    # Main title (match dengan main charts)
-    if main_title:
-        fig.suptitle(main_title, fontsize=13, fontweight='900', y=0.96)
-
-    plt.tight_layout(rect=[0, 0.02, 1, 0.92] if main_title else None)
-
-    # Save
-    saved_files = save_figure(fig, filename_base)
-    plt.close()
+    with managed_subplots(1, 2, figsize=(18, fig_height)) as (fig, (ax1, ax2)):
+        # LEFT CHART
+        y_pos1 = np.arange(len(left_data))
+        if left_colors is None:
+            # Use colorblind-friendly palette untuk variasi visual
+            palette = sns.color_palette("colorblind", n_colors=len(left_data))
+            left_colors = palette
+
+        ax1.barh(y_pos1, left_data.values,
+                 color=left_colors, edgecolor='#1a1a1a',
+                 linewidth=1.5, alpha=0.88, height=0.75)
+
+        # Labels pada bars
+        annotate_bars(ax1, left_data.values, y_pos1,
+                      [f'{int(count)}' for count in left_data.values],
+                      offset=0.3, ha='left', va='center', fontsize=10, fontweight='900')
+
+        # Styling ax1 (match dengan main charts)
+        ax1.set_yticks(y_pos1)
+        left_labels = [wrap_label(name, left_wrap_width)
+                       for name in left_data.index]
+        ax1.set_yticklabels(left_labels, fontsize=left_ylabel_fontsize, fontweight='600')
+        ax1.set_xlabel(left_xlabel, fontsize=12, fontweight='700')
+        ax1.set_title(left_title, fontsize=13, fontweight='900', pad=15)
+        ax1.xaxis.grid(True, linestyle=':', alpha=0.6, zorder=0, linewidth=0.8)
+        ax1.set_axisbelow(True)
+        ax1.spines['top'].set_visible(False)
+        ax1.spines['right'].set_visible(False)
+        ax1.spines['left'].set_linewidth(1.5)
+        ax1.spines['bottom'].set_linewidth(1.5)
+        ax1.invert_yaxis()
+
+        # RIGHT CHART
+        y_pos2 = np.arange(len(right_data))
+        if right_colors is None:
+            # Use warm palette untuk right chart (berbeda dari left)
+            palette = sns.color_palette("Set2", n_colors=len(right_data))
+            right_colors = palette
+
+        ax2.barh(y_pos2, right_data.values,
+                 color=right_colors, edgecolor='#1a1a1a',
+                 linewidth=1.5, alpha=0.88, height=0.75)
+
+        # Labels pada bars
+        annotate_bars(ax2, right_data.values, y_pos2,
+                      [f'{int(count)}' for count in right_data.values],
+                      offset=0.3, ha='left', va='center', fontsize=10, fontweight='900')
+
+        # Styling ax2 (match dengan main charts)
+        ax2.set_yticks(y_pos2)
+        right_labels = [wrap_label(name, right_wrap_width)
+                        for name in right_data.index]
+        ax2.set_yticklabels(right_labels, fontsize=right_ylabel_fontsize, fontweight='600')
+        ax2.set_xlabel(right_xlabel, fontsize=12, fontweight='700')
+        ax2.set_title(right_title, fontsize=13, fontweight='900', pad=15)
+        ax2.xaxis.grid(True, linestyle=':', alpha=0.6, zorder=0, linewidth=0.8)
+        ax2.set_axisbelow(True)
+        ax2.spines['top'].set_visible(False)
+        ax2.spines['right'].set_visible(False)
+        ax2.spines['left'].set_linewidth(1.5)
+        ax2.spines['bottom'].set_linewidth(1.5)
+        ax2.invert_yaxis()
+
+        # Add legend if requested
+        if add_legend and legend_labels:
+            import matplotlib.patches as mpatches
+
+            # Create legend elements
+            legend_elements = []
+            for label, color in legend_labels.items():
+                legend_elements.append(
+                    mpatches.Patch(facecolor=color, edgecolor='#1a1a1a',
+                                 linewidth=1.5, label=label)
+                )
+
+            # Add legend (vertical, upper right)
+            fig.legend(handles=legend_elements,
+                      loc='upper right',
+                      bbox_to_anchor=(0.98, 0.96),
+                      ncol=1,  # Vertical layout
+                      frameon=True,
+                      framealpha=0.95,
+                      edgecolor='0.2',
+                      fontsize=10,
+                      title=legend_title,
+                      title_fontsize=11)
+
+        # Main title (match dengan main charts)
+        if main_title:
+            fig.suptitle(main_title, fontsize=13, fontweight='900', y=0.96)
+
+        plt.tight_layout(rect=[0, 0.02, 1, 0.92] if main_title else None)
+
+        # Save
+        saved_files = save_figure(fig, filename_base)
 
     return saved_files
@@ -14,13 +14,13 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 import textwrap
 from visualization_config import (
     read_excel_iku, setup_publication_style, save_figure,
     JURUSAN_COLORS, PRODI_TO_JURUSAN, BREAKDOWN_STYLE, JURUSAN_ORDER
 )
+from figures import managed_figure
 from .breakdown_utils import create_annotated_bar_chart, create_dual_bar_chart
 
 
@@ -131,128 +131,127 @@ def create_iku_31_statistik_with_jurusan(df_pembilang, df_penyebut):
 
     # Create figure with GridSpec for custom layout
     from matplotlib.gridspec import GridSpec
-    fig = plt.figure(figsize=(18, fig_height))
-    gs = GridSpec(2, 2, figure=fig, width_ratios=[1.2, 1], height_ratios=[1, 1],
-                  hspace=0.3, wspace=0.3)
-
-    ax1 = fig.add_subplot(gs[:, 0])  # Left: spans both rows
-    ax2_top = fig.add_subplot(gs[0, 1])  # Top right: Penelitian pie
-    ax2_bottom = fig.add_subplot(gs[1, 1])  # Bottom right: Pengabdian pie
-
-    # LEFT CHART - Kegiatan
-    y_pos1 = np.arange(len(kegiatan_df))
-    left_colors = [JURUSAN_COLORS[row['jurusan']]['base'] for _, row in kegiatan_df.iterrows()]
-
-    bars1 = ax1.barh(y_pos1, kegiatan_df['count'].values,
-                     color=left_colors, edgecolor='#1a1a1a',
-                     linewidth=1.5, alpha=0.88, height=0.75)
-
-    for bar, count in zip(bars1, kegiatan_df['count'].values):
-        ax1.text(bar.get_width() + 0.15, bar.get_y() + bar.get_height()/2,
-                f'{int(count)}', ha='left', va='center', fontsize=10, fontweight='900')
-
-    ax1.set_yticks(y_pos1)
-    left_labels = ['\n'.join(textwrap.wrap(name, width=35))
-                   for name in kegiatan_df['name']]
-    ax1.set_yticklabels(left_labels, fontsize=8, fontweight='600')
-    ax1.set_xlabel('Jumlah Kegiatan', fontsize=12, fontweight='700')
-    ax1.set_title('Top 10 Kegiatan Tridharma Spesifik', fontsize=13, fontweight='900', pad=15)
-    ax1.xaxis.grid(True, linestyle=':', alpha=0.6, zorder=0, linewidth=0.8)
-    ax1.set_axisbelow(True)
-    ax1.spines['top'].set_visible(False)
-    ax1.spines['right'].set_visible(False)
-    ax1.spines['left'].set_linewidth(1.5)
-    ax1.spines['bottom'].set_linewidth(1.5)
-    ax1.invert_yaxis()
-
-    # RIGHT CHARTS - Pie charts for Penelitian and Pengabdian
-    def create_pie_chart(ax, jenis_name, jenis_data):
-        """Create pie chart for a specific jenis"""
-        # Get jurusan counts
-        jurusan_counts = []
-        jurusan_labels = []
-        jurusan_colors = []
-
+    with managed_figure(figsize=(18, fig_height)) as fig:
+        gs = GridSpec(2, 2, figure=fig, width_ratios=[1.2, 1], height_ratios=[1, 1],
+                      hspace=0.3, wspace=0.3)
+
+        ax1 = fig.add_subplot(gs[:, 0])  # Left: spans both rows
+        ax2_top = fig.add_subplot(gs[0, 1])  # Top right: Penelitian pie
+        ax2_bottom = fig.add_subplot(gs[1, 1])  # Bottom right: Pengabdian pie
+
+        # LEFT CHART - Kegiatan
+        y_pos1 = np.arange(len(kegiatan_df))
+        left_colors = [JURUSAN_COLORS[row['jurusan']]['base'] for _, row in kegiatan_df.iterrows()]
+
+        bars1 = ax1.barh(y_pos1, kegiatan_df['count'].values,
+                         color=left_colors, edgecolor='#1a1a1a',
+                         linewidth=1.5, alpha=0.88, height=0.75)
+
+        for bar, count in zip(bars1, kegiatan_df['count'].values):
+            ax1.text(bar.get_width() + 0.15, bar.get_y() + bar.get_height()/2,
+                    f'{int(count)}', ha='left', va='center', fontsize=10, fontweight='900')
+
+        ax1.set_yticks(y_pos1)
+        left_labels = ['\n'.join(textwrap.wrap(name, width=35))
+                       for name in kegiatan_df['name']]
+        ax1.set_yticklabels(left_labels, fontsize=8, fontweight='600')
+        ax1.set_xlabel('Jumlah Kegiatan', fontsize=12, fontweight='700')
+        ax1.set_title('Top 10 Kegiatan Tridharma Spesifik', fontsize=13, fontweight='900', pad=15)
+        ax1.xaxis.grid(True, linestyle=':', alpha=0.6, zorder=0, linewidth=0.8)
+        ax1.set_axisbelow(True)
+        ax1.spines['top'].set_visible(False)
+        ax1.spines['right'].set_visible(False)
+        ax1.spines['left'].set_linewidth(1.5)
+        ax1.spines['bottom'].set_linewidth(1.5)
+        ax1.invert_yaxis()
+
+        # RIGHT CHARTS - Pie charts for Penelitian and Pengabdian
+        def create_pie_chart(ax, jenis_name, jenis_data):
+            """Create pie chart for a specific jenis"""
+            # Get jurusan counts
+            jurusan_counts = []
+            jurusan_labels = []
+            jurusan_colors = []
+
+            for jurusan in JURUSAN_ORDER:
+                if jurusan in jenis_data.index and jenis_data[jurusan] > 0:
+                    jurusan_counts.append(jenis_data[jurusan])
+                    jurusan_labels.append(jurusan)
+                    jurusan_colors.append(JURUSAN_COLORS[jurusan]['base'])
+
+            # Create pie chart
+            wedges, texts, autotexts = ax.pie(
+                jurusan_counts,
+                labels=jurusan_labels,
+                colors=jurusan_colors,
+                autopct=lambda pct: f'{pct:.1f}%\n({int(pct/100.*sum(jurusan_counts))})',
+                startangle=90,
+                wedgeprops={'edgecolor': '#1a1a1a', 'linewidth': 1.5, 'alpha': 0.88},
+                textprops={'fontsize': 9, 'fontweight': '600'}
+            )
+
+            # Style autopct text
+            for autotext in autotexts:
+                autotext.set_color('white')
+                autotext.set_fontsize(9)
+                autotext.set_fontweight('900')
+
+            # Title with total count
+            total = sum(jurusan_counts)
+            ax.set_title(f'{jenis_name}\nTotal: {total} kegiatan',
+                        fontsize=12, fontweight='900', pad=10)
+
+        # Top pie: Penelitian
+        if 'Penelitian' in jenis_df.index:
+            create_pie_chart(ax2_top, 'Penelitian', jenis_df.loc['Penelitian'])
+        else:
+            ax2_top.text(0.5, 0.5, 'No Data', ha='center', va='center', fontsize=14)
+            ax2_top.axis('off')
+
+        # Bottom pie: Pengabdian
+        if 'Pengabdian' in jenis_df.index:
+            create_pie_chart(ax2_bottom, 'Pengabdian', jenis_df.loc['Pengabdian'])
+        else:
+            ax2_bottom.text(0.5, 0.5, 'No Data', ha='center', va='center', fontsize=14)
+            ax2_bottom.axis('off')
+
+        # Add JURUSAN legend (combine from kegiatan and jenis)
+        all_jurusan = set(kegiatan_df['jurusan'].unique())
+        # Add jurusan from jenis_df columns that have non-zero values
         for jurusan in JURUSAN_ORDER:
-            if jurusan in jenis_data.index and jenis_data[jurusan] > 0:
-                jurusan_counts.append(jenis_data[jurusan])
-                jurusan_labels.append(jurusan)
-                jurusan_colors.append(JURUSAN_COLORS[jurusan]['base'])
-
-        # Create pie chart
-        wedges, texts, autotexts = ax.pie(
-            jurusan_counts,
-            labels=jurusan_labels,
-            colors=jurusan_colors,
-            autopct=lambda pct: f'{pct:.1f}%\n({int(pct/100.*sum(jurusan_counts))})',
-            startangle=90,
-            wedgeprops={'edgecolor': '#1a1a1a', 'linewidth': 1.5, 'alpha': 0.88},
-            textprops={'fontsize': 9, 'fontweight': '600'}
-        )
-
-        # Style autopct text
-        for autotext in autotexts:
-            autotext.set_color('white')
-            autotext.set_fontsize(9)
-            autotext.set_fontweight('900')
-
-        # Title with total count
-        total = sum(jurusan_counts)
-        ax.set_title(f'{jenis_name}\nTotal: {total} kegiatan',
-                    fontsize=12, fontweight='900', pad=10)
-
-    # Top pie: Penelitian
-    if 'Penelitian' in jenis_df.index:
-        create_pie_chart(ax2_top, 'Penelitian', jenis_df.loc['Penelitian'])
-    else:
-        ax2_top.text(0.5, 0.5, 'No Data', ha='center', va='center', fontsize=14)
-        ax2_top.axis('off')
-
-    # Bottom pie: Pengabdian
-    if 'Pengabdian' in jenis_df.index:
-        create_pie_chart(ax2_bottom, 'Pengabdian', jenis_df.loc['Pengabdian'])
-    else:
-        ax2_bottom.text(0.5, 0.5, 'No Data', ha='center', va='center', fontsize=14)
-        ax2_bottom.axis('off')
-
-    # Add JURUSAN legend (combine from kegiatan and jenis)
-    all_jurusan = set(kegiatan_df['jurusan'].unique())
-    # Add jurusan from jenis_df columns that have non-zero values
-    for jurusan in JURUSAN_ORDER:
-        if jurusan in jenis_df.columns and jenis_df[jurusan].sum() > 0:
-            all_jurusan.add(jurusan)
-
-    legend_jurusan = [j for j in JURUSAN_ORDER if j in all_jurusan]
-
-    legend_elements = [
-        mpatches.Patch(facecolor=JURUSAN_COLORS[j]['base'],
-                      edgecolor='#1a1a1a', linewidth=1.5, label=j)
-        for j in legend_jurusan
-    ]
-
-    fig.legend(handles=legend_elements,
-              loc='upper right',
-              bbox_to_anchor=(0.98, 0.96),
-              ncol=1,
-              frameon=True,
-              framealpha=0.95,
-              edgecolor='0.2',
-              fontsize=10,
-              title='Jurusan',
-              title_fontsize=11)
-
-    # Main title
-    main_title = (f'IKU 31: Statistik Summary - Dosen Aktif Tridharma di PT Lain\n'
-                  f'Total: {total_kegiatan} kegiatan | {total_dosen_aktif} dosen aktif '
-                  f'({persentase_dosen_aktif:.1f}% dari {total_dosen_fst} dosen FST) | '
-                  f'Rata-rata: {rata_rata_per_aktif:.1f} kegiatan/dosen')
-    fig.suptitle(main_title, fontsize=13, fontweight='900', y=0.96)
-
-    # Adjust layout with GridSpec
-    gs.tight_layout(fig, rect=[0, 0, 1, 0.94])
-
-    saved_files = save_figure(fig, 'IKU_31_breakdown_statistik')
-    plt.close()
+            if jurusan in jenis_df.columns and jenis_df[jurusan].sum() > 0:
+                all_jurusan.add(jurusan)
+
+        legend_jurusan = [j for j in JURUSAN_ORDER if j in all_jurusan]
+
+        legend_elements = [
+            mpatches.Patch(facecolor=JURUSAN_COLORS[j]['base'],
+                          edgecolor='#1a1a1a', linewidth=1.5, label=j)
+            for j in legend_jurusan
+        ]
+
+        fig.legend(handles=legend_elements,
+                  loc='upper right',
+                  bbox_to_anchor=(0.98, 0.96),
+                  ncol=1,
+                  frameon=True,
+                  framealpha=0.95,
+                  edgecolor='0.2',
+                  fontsize=10,
+                  title='Jurusan',
+                  title_fontsize=11)
+
+        # Main title
+        main_title = (f'IKU 31: Statistik Summary - Dosen Aktif Tridharma di PT Lain\n'
+                      f'Total: {total_kegiatan} kegiatan | {total_dosen_aktif} dosen aktif '
+                      f'({persentase_dosen_aktif:.1f}% dari {total_dosen_fst} dosen FST) | '
+                      f'Rata-rata: {rata_rata_per_aktif:.1f} kegiatan/dosen')
+        fig.suptitle(main_title, fontsize=13, fontweight='900', y=0.96)
+
+        # Adjust layout with GridSpec
+        gs.tight_layout(fig, rect=[0, 0, 1, 0.94])
+
+        saved_files = save_figure(fig, 'IKU_31_breakdown_statistik')
 
     return saved_files
 
@@ -20,6 +20,7 @@ from visualization_config import (
     read_excel_iku, setup_publication_style, save_figure,
     JURUSAN_COLORS, PRODI_TO_JURUSAN, BREAKDOWN_STYLE, JURUSAN_ORDER
 )
+from figures import managed_subplots
 from .breakdown_utils import create_dual_bar_chart
 
 
@@ -103,115 +104,113 @@ def create_iku_33_statistik_with_jurusan(df_pembilang, df_penyebut):
     max_items = len(paket_df)
     fig_height = max(style['min_fig_height'], max_items * 0.7)
 
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(18, fig_height))
-
-    # LEFT CHART - Program breakdown per jurusan (Pie Chart)
-    # Create detailed breakdown: each program-jurusan combination is a slice
-    program_jurusan_data = []
-
-    for program in df_pembilang_enriched['Nama Program'].unique():
-        program_rows = df_pembilang_enriched[df_pembilang_enriched['Nama Program'] == program]
-        jurusan_dist = program_rows['Jurusan_Short'].value_counts()
-
-        for jurusan, count in jurusan_dist.items():
-            program_jurusan_data.append({
-                'label': f'{program}\n{jurusan}',
-                'program': program,
-                'jurusan': jurusan,
-                'count': count
-            })
-
-    # Sort by program order then by count
-    program_order = ['Magang Dudi', 'Studi Independen', 'Kewirausahaan', 'Riset', 'KKNT']
-    program_jurusan_df = pd.DataFrame(program_jurusan_data)
-    program_jurusan_df['program_order'] = program_jurusan_df['program'].map(
-        {p: i for i, p in enumerate(program_order)}
-    )
-    program_jurusan_df = program_jurusan_df.sort_values(['program_order', 'count'], ascending=[True, False])
-
-    # Prepare data for pie chart
-    pie_labels = program_jurusan_df['label'].values
-    pie_counts = program_jurusan_df['count'].values
-    pie_colors = [JURUSAN_COLORS[row['jurusan']]['base'] for _, row in program_jurusan_df.iterrows()]
-
-    wedges, texts, autotexts = ax1.pie(
-        pie_counts,
-        labels=pie_labels,
-        colors=pie_colors,
-        autopct=lambda pct: f'{pct:.1f}%\n({int(pct/100.*sum(pie_counts))})',
-        startangle=90,
-        wedgeprops={'edgecolor': '#1a1a1a', 'linewidth': 1.5, 'alpha': 0.88},
-        textprops={'fontsize': 8, 'fontweight': '600'}
-    )
-
-    # Style autopct text (percentages and counts)
-    for autotext in autotexts:
-        autotext.set_color('white')
-        autotext.set_fontsize(8)
-        autotext.set_fontweight('900')
-
-    # Title
-    total_mahasiswa = sum(pie_counts)
-    ax1.set_title(f'Kategori Program Bimbingan per Jurusan\nTotal: {total_mahasiswa} mahasiswa',
-                 fontsize=13, fontweight='900', pad=15)
-
-    # RIGHT CHART - Paket
-    y_pos2 = np.arange(len(paket_df))
-    right_colors = [JURUSAN_COLORS[row['jurusan']]['base'] for _, row in paket_df.iterrows()]
-
-    bars2 = ax2.barh(y_pos2, paket_df['count'].values,
-                     color=right_colors, edgecolor='#1a1a1a',
-                     linewidth=1.5, alpha=0.88, height=0.75)
-
-    for bar, count in zip(bars2, paket_df['count'].values):
-        ax2.text(bar.get_width() + 0.3, bar.get_y() + bar.get_height()/2,
-                f'{int(count)}', ha='left', va='center', fontsize=10, fontweight='900')
-
-    ax2.set_yticks(y_pos2)
-    right_labels = ['\n'.join(textwrap.wrap(name, width=45))
-                    for name in paket_df['name']]
-    ax2.set_yticklabels(right_labels, fontsize=10, fontweight='600')
-    ax2.set_xlabel('Jumlah Mahasiswa', fontsize=12, fontweight='700')
-    ax2.set_title('Top 10 Paket\nProgram Spesifik', fontsize=13, fontweight='900', pad=15)
-    ax2.xaxis.grid(True, linestyle=':', alpha=0.6, zorder=0, linewidth=0.8)
-    ax2.set_axisbelow(True)
-    ax2.spines['top'].set_visible(False)
-    ax2.spines['right'].set_visible(False)
-    ax2.spines['left'].set_linewidth(1.5)
-    ax2.spines['bottom'].set_linewidth(1.5)
-    ax2.invert_yaxis()
-
-    # Add JURUSAN legend
-    all_jurusan = set(program_df['jurusan'].unique()) | set(paket_df['jurusan'].unique())
-    legend_jurusan = [j for j in JURUSAN_ORDER if j in all_jurusan]
-
-    legend_elements = [
-        mpatches.Patch(facecolor=JURUSAN_COLORS[j]['base'],
-                      edgecolor='#1a1a1a', linewidth=1.5, label=j)
-        for j in legend_jurusan
-    ]
-
-    fig.legend(handles=legend_elements,
-              loc='upper right',
-              bbox_to_anchor=(0.98, 0.96),
-              ncol=1,
-              frameon=True,
-              framealpha=0.95,
-              edgecolor='0.2',
-              fontsize=10,
-              title='Jurusan',
-              title_fontsize=11)
-
-    # Main title
-    main_title = (f'IKU 33: Statistik Summary - Bimbingan Mahasiswa Luar Prodi\n'
-                  f'Total: {total_mahasiswa} mahasiswa | {total_dosen_aktif} dosen '
-                  f'({persentase_dosen:.1f}% dari {total_dosen_fst} dosen FST)')
-    fig.suptitle(main_title, fontsize=13, fontweight='900', y=0.97)
-
-    plt.tight_layout(rect=[0, 0.02, 1, 0.92])
-
-    saved_files = save_figure(fig, 'IKU_33_breakdown_statistik')
-    plt.close()
+    with managed_subplots(1, 2, figsize=(18, fig_height)) as (fig, (ax1, ax2)):
+        # LEFT CHART - Program breakdown per jurusan (Pie Chart)
+        # Create detailed breakdown: each program-jurusan combination is a slice
+        program_jurusan_data = []
+
+        for program in df_pembilang_enriched['Nama Program'].unique():
+            program_rows = df_pembilang_enriched[df_pembilang_enriched['Nama Program'] == program]
+            jurusan_dist = program_rows['Jurusan_Short'].value_counts()
+
+            for jurusan, count in jurusan_dist.items():
+                program_jurusan_data.append({
+                    'label': f'{program}\n{jurusan}',
+                    'program': program,
+                    'jurusan': jurusan,
+                    'count': count
+                })
+
+        # Sort by program order then by count
+        program_order = ['Magang Dudi', 'Studi Independen', 'Kewirausahaan', 'Riset', 'KKNT']
+        program_jurusan_df = pd.DataFrame(program_jurusan_data)
+        program_jurusan_df['program_order'] = program_jurusan_df['program'].map(
+            {p: i for i, p in enumerate(program_order)}
+        )
+        program_jurusan_df = program_jurusan_df.sort_values(['program_order', 'count'], ascending=[True, False])
+
+        # Prepare data for pie chart
+        pie_labels = program_jurusan_df['label'].values
+        pie_counts = program_jurusan_df['count'].values
+        pie_colors = [JURUSAN_COLORS[row['jurusan']]['base'] for _, row in program_jurusan_df.iterrows()]
+
+        wedges, texts, autotexts = ax1.pie(
+            pie_counts,
+            labels=pie_labels,
+            colors=pie_colors,
+            autopct=lambda pct: f'{pct:.1f}%\n({int(pct/100.*sum(pie_counts))})',
+            startangle=90,
+            wedgeprops={'edgecolor': '#1a1a1a', 'linewidth': 1.5, 'alpha': 0.88},
+            textprops={'fontsize': 8, 'fontweight': '600'}
+        )
+
+        # Style autopct text (percentages and counts)
+        for autotext in autotexts:
+            autotext.set_color('white')
+            autotext.set_fontsize(8)
+            autotext.set_fontweight('900')
+
+        # Title
+        total_mahasiswa = sum(pie_counts)
+        ax1.set_title(f'Kategori Program Bimbingan per Jurusan\nTotal: {total_mahasiswa} mahasiswa',
+                     fontsize=13, fontweight='900', pad=15)
+
+        # RIGHT CHART - Paket
+        y_pos2 = np.arange(len(paket_df))
+        right_colors = [JURUSAN_COLORS[row['jurusan']]['base'] for _, row in paket_df.iterrows()]
+
+        bars2 = ax2.barh(y_pos2, paket_df['count'].values,
+                         color=right_colors, edgecolor='#1a1a1a',
+                         linewidth=1.5, alpha=0.88, height=0.75)
+
+        for bar, count in zip(bars2, paket_df['count'].values):
+            ax2.text(bar.get_width() + 0.3, bar.get_y() + bar.get_height()/2,
+                    f'{int(count)}', ha='left', va='center', fontsize=10, fontweight='900')
+
+        ax2.set_yticks(y_pos2)
+        right_labels = ['\n'.join(textwrap.wrap(name, width=45))
+                        for name in paket_df['name']]
+        ax2.set_yticklabels(right_labels, fontsize=10, fontweight='600')
+        ax2.set_xlabel('Jumlah Mahasiswa', fontsize=12, fontweight='700')
+        ax2.set_title('Top 10 Paket\nProgram Spesifik', fontsize=13, fontweight='900', pad=15)
+        ax2.xaxis.grid(True, linestyle=':', alpha=0.6, zorder=0, linewidth=0.8)
+        ax2.set_axisbelow(True)
+        ax2.spines['top'].set_visible(False)
+        ax2.spines['right'].set_visible(False)
+        ax2.spines['left'].set_linewidth(1.5)
+        ax2.spines['bottom'].set_linewidth(1.5)
+        ax2.invert_yaxis()
+
+        # Add JURUSAN legend
+        all_jurusan = set(program_df['jurusan'].unique()) | set(paket_df['jurusan'].unique())
+        legend_jurusan = [j for j in JURUSAN_ORDER if j in all_jurusan]
+
+        legend_elements = [
+            mpatches.Patch(facecolor=JURUSAN_COLORS[j]['base'],
+                          edgecolor='#1a1a1a', linewidth=1.5, label=j)
+            for j in legend_jurusan
+        ]
+
+        fig.legend(handles=legend_elements,
+                  loc='upper right',
+                  bbox_to_anchor=(0.98, 0.96),
+                  ncol=1,
+                  frameon=True,
+                  framealpha=0.95,
+                  edgecolor='0.2',
+                  fontsize=10,
+                  title='Jurusan',
+                  title_fontsize=11)
+
+        # Main title
+        main_title = (f'IKU 33: Statistik Summary - Bimbingan Mahasiswa Luar Prodi\n'
+                      f'Total: {total_mahasiswa} mahasiswa | {total_dosen_aktif} dosen '
+                      f'({persentase_dosen:.1f}% dari {total_dosen_fst} dosen FST)')
+        fig.suptitle(main_title, fontsize=13, fontweight='900', y=0.97)
+
+        plt.tight_layout(rect=[0, 0.02, 1, 0.92])
+
+        saved_files = save_figure(fig, 'IKU_33_breakdown_statistik')
 
     return saved_files
 
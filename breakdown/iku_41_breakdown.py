@@ -20,6 +20,7 @@ from visualization_config import (
     read_excel_iku, setup_publication_style, save_figure,
     JURUSAN_COLORS, PRODI_TO_JURUSAN, BREAKDOWN_STYLE
 )
+from figures import managed_subplots
 
 
 def get_jurusan_short(row):
@@ -76,124 +77,122 @@ def create_dual_bar_chart_with_jurusan(left_data_with_jurusan, right_data_with_j
     max_items = max(len(left_data_with_jurusan), len(right_data_with_jurusan))
     fig_height = max(style['min_fig_height'], max_items * 0.7)
 
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(18, fig_height))
-
-    # LEFT CHART
-    y_pos1 = np.arange(len(left_data_with_jurusan))
-    left_colors = [JURUSAN_COLORS[row['jurusan']]['base'] for _, row in left_data_with_jurusan.iterrows()]
-
-    bars1 = ax1.barh(y_pos1, left_data_with_jurusan['count'].values,
-                     color=left_colors, edgecolor='#1a1a1a',
-                     linewidth=1.5, alpha=0.88, height=0.75)
-
-    # Labels pada bars
-    for bar, (_, row) in zip(bars1, left_data_with_jurusan.iterrows()):
-        count = row['count']
-        # Count number
-        ax1.text(count + 0.15, bar.get_y() + bar.get_height()/2,
-                f'{int(count)}',
-                ha='left', va='center', fontsize=10, fontweight='900')
-
-        # Jurusan detail if mixed (abbreviated)
-        if row['jurusan_detail']:
-            ax1.text(count + 0.65, bar.get_y() + bar.get_height()/2,
-                    f"{row['jurusan_detail']}",
-                    ha='left', va='center', fontsize=8,
-                    color='#444444', fontweight='600')
-
-    # Styling ax1
-    ax1.set_yticks(y_pos1)
-    left_labels = ['\n'.join(textwrap.wrap(name, width=35))
-                   for name in left_data_with_jurusan['name']]
-    ax1.set_yticklabels(left_labels, fontsize=8, fontweight='600')
-    ax1.set_xlabel('Jumlah Sertifikat', fontsize=12, fontweight='700')
-    ax1.set_title(left_title, fontsize=13, fontweight='900', pad=15)
-    ax1.xaxis.grid(True, linestyle=':', alpha=0.6, zorder=0, linewidth=0.8)
-    ax1.set_axisbelow(True)
-    ax1.spines['top'].set_visible(False)
-    ax1.spines['right'].set_visible(False)
-    ax1.spines['left'].set_linewidth(1.5)
-    ax1.spines['bottom'].set_linewidth(1.5)
-    ax1.invert_yaxis()
-
-    # Expand X-axis to give room for annotations
-    max_count_left = left_data_with_jurusan['count'].max()
-    ax1.set_xlim(0, max_count_left * 1.5)
-
-    # RIGHT CHART
-    y_pos2 = np.arange(len(right_data_with_jurusan))
-    right_colors = [JURUSAN_COLORS[row['jurusan']]['base'] for _, row in right_data_with_jurusan.iterrows()]
-
-    bars2 = ax2.barh(y_pos2, right_data_with_jurusan['count'].values,
-                     color=right_colors, edgecolor='#1a1a1a',
-                     linewidth=1.5, alpha=0.88, height=0.75)
-
-    # Labels pada bars
-    for bar, (_, row) in zip(bars2, right_data_with_jurusan.iterrows()):
-        count = row['count']
-        # Count number
-        ax2.text(count + 0.15, bar.get_y() + bar.get_height()/2,
-                f'{int(count)}',
-                ha='left', va='center', fontsize=10, fontweight='900')
-
-        # Jurusan detail if mixed (abbreviated)
-        if row['jurusan_detail']:
-            ax2.text(count + 0.65, bar.get_y() + bar.get_height()/2,
-                    f"{row['jurusan_detail']}",
-                    ha='left', va='center', fontsize=8,
-                    color='#444444', fontweight='600')
-
-    # Styling ax2
-    ax2.set_yticks(y_pos2)
-    right_labels = ['\n'.join(textwrap.wrap(name, width=35))
-                    for name in right_data_with_jurusan['name']]
-    ax2.set_yticklabels(right_labels, fontsize=8, fontweight='600')
-    ax2.set_xlabel('Jumlah Sertifikat', fontsize=12, fontweight='700')
-    ax2.set_title(right_title, fontsize=13, fontweight='900', pad=15)
-    ax2.xaxis.grid(True, linestyle=':', alpha=0.6, zorder=0, linewidth=0.8)
-    ax2.set_axisbelow(True)
-    ax2.spines['top'].set_visible(False)
-    ax2.spines['right'].set_visible(False)
-    ax2.spines['left'].set_linewidth(1.5)
-    ax2.spines['bottom'].set_linewidth(1.5)
-    ax2.invert_yaxis()
-
-    # Expand X-axis to give room for annotations
-    max_count_right = right_data_with_jurusan['count'].max()
-    ax2.set_xlim(0, max_count_right * 1.5)
-
-    # Add legend (jurusan used in this chart)
-    all_jurusan = set(left_data_with_jurusan['jurusan'].unique()) | set(right_data_with_jurusan['jurusan'].unique())
-    legend_order = ['MIPA', 'Teknik Geologi', 'Teknik Kimia', 'Teknik Sipil', 'Teknik Elektro', 'D3']
-    legend_jurusan = [j for j in legend_order if j in all_jurusan]
-
-    legend_elements = [
-        mpatches.Patch(facecolor=JURUSAN_COLORS[j]['base'],
-                      edgecolor='#1a1a1a', linewidth=1.5,
-                      label=j)
-        for j in legend_jurusan
-    ]
-
-    fig.legend(handles=legend_elements,
-              loc='upper right',
-              bbox_to_anchor=(0.98, 0.98),
-              ncol=1,  # Vertical layout
-              frameon=True,
-              framealpha=0.95,
-              edgecolor='0.2',
-              fontsize=10,
-              title='Jurusan',
-              title_fontsize=11)
-
-    # Main title
-    if main_title:
-        fig.suptitle(main_title, fontsize=13, fontweight='900', y=0.93)
-
-    plt.tight_layout(rect=[0, 0.02, 1, 0.88])
-
-    # Save
-    saved_files = save_figure(fig, filename_base)
-    plt.close()
+    with managed_subplots(1, 2, figsize=(18, fig_height)) as (fig, (ax1, ax2)):
+        # LEFT CHART
+        y_pos1 = np.arange(len(left_data_with_jurusan))
+        left_colors = [JURUSAN_COLORS[row['jurusan']]['base'] for _, row in left_data_with_jurusan.iterrows()]
+
+        bars1 = ax1.barh(y_pos1, left_data_with_jurusan['count'].values,
+                         color=left_colors, edgecolor='#1a1a1a',
+                         linewidth=1.5, alpha=0.88, height=0.75)
+
+        # Labels pada bars
+        for bar, (_, row) in zip(bars1, left_data_with_jurusan.iterrows()):
+            count = row['count']
+            # Count number
+            ax1.text(count + 0.15, bar.get_y() + bar.get_height()/2,
+                    f'{int(count)}',
+                    ha='left', va='center', fontsize=10, fontweight='900')
+
+            # Jurusan detail if mixed (abbreviated)
+            if row['jurusan_detail']:
+                ax1.text(count + 0.65, bar.get_y() + bar.get_height()/2,
+                        f"{row['jurusan_detail']}",
+                        ha='left', va='center', fontsize=8,
+                        color='#444444', fontweight='600')
+
+        # Styling ax1
+        ax1.set_yticks(y_pos1)
+        left_labels = ['\n'.join(textwrap.wrap(name, width=35))
+                       for name in left_data_with_jurusan['name']]
+        ax1.set_yticklabels(left_labels, fontsize=8, fontweight='600')
+        ax1.set_xlabel('Jumlah Sertifikat', fontsize=12, fontweight='700')
+        ax1.set_title(left_title, fontsize=13, fontweight='900', pad=15)
+        ax1.xaxis.grid(True, linestyle=':', alpha=0.6, zorder=0, linewidth=0.8)
+        ax1.set_axisbelow(True)
+        ax1.spines['top'].set_visible(False)
+        ax1.spines['right'].set_visible(False)
+        ax1.spines['left'].set_linewidth(1.5)
+        ax1.spines['bottom'].set_linewidth(1.5)
+        ax1.invert_yaxis()
+
+        # Expand X-axis to give room for annotations
+        max_count_left = left_data_with_jurusan['count'].max()
+        ax1.set_xlim(0, max_count_left * 1.5)
+
+        # RIGHT CHART
+        y_pos2 = np.arange(len(right_data_with_jurusan))
+        right_colors = [JURUSAN_COLORS[row['jurusan']]['base'] for _, row in right_data_with_jurusan.iterrows()]
+
+        bars2 = ax2.barh(y_pos2, right_data_with_jurusan['count'].values,
+                         color=right_colors, edgecolor='#1a1a1a',
+                         linewidth=1.5, alpha=0.88, height=0.75)
+
+        # Labels pada bars
+        for bar, (_, row) in zip(bars2, right_data_with_jurusan.iterrows()):
+            count = row['count']
+            # Count number
+            ax2.text(count + 0.15, bar.get_y() + bar.get_height()/2,
+                    f'{int(count)}',
+                    ha='left', va='center', fontsize=10, fontweight='900')
+
+            # Jurusan detail if mixed (abbreviated)
+            if row['jurusan_detail']:
+                ax2.text(count + 0.65, bar.get_y() + bar.get_height()/2,
+                        f"{row['jurusan_detail']}",
+                        ha='left', va='center', fontsize=8,
+                        color='#444444', fontweight='600')
+
+        # Styling ax2
+        ax2.set_yticks(y_pos2)
+        right_labels = ['\n'.join(textwrap.wrap(name, width=35))
+                        for name in right_data_with_jurusan['name']]
+        ax2.set_yticklabels(right_labels, fontsize=8, fontweight='600')
+        ax2.set_xlabel('Jumlah Sertifikat', fontsize=12, fontweight='700')
+        ax2.set_title(right_title, fontsize=13, fontweight='900', pad=15)
+        ax2.xaxis.grid(True, linestyle=':', alpha=0.6, zorder=0, linewidth=0.8)
+        ax2.set_axisbelow(True)
+        ax2.spines['top'].set_visible(False)
+        ax2.spines['right'].set_visible(False)
+        ax2.spines['left'].set_linewidth(1.5)
+        ax2.spines['bottom'].set_linewidth(1.5)
+        ax2.invert_yaxis()
+
+        # Expand X-axis to give room for annotations
+        max_count_right = right_data_with_jurusan['count'].max()
+        ax2.set_xlim(0, max_count_right * 1.5)
+
+        # Add legend (jurusan used in this chart)
+        all_jurusan = set(left_data_with_jurusan['jurusan'].unique()) | set(right_data_with_jurusan['jurusan'].unique())
+        legend_order = ['MIPA', 'Teknik Geologi', 'Teknik Kimia', 'Teknik Sipil', 'Teknik Elektro', 'D3']
+        legend_jurusan = [j for j in legend_order if j in all_jurusan]
+
+        legend_elements = [
+            mpatches.Patch(facecolor=JURUSAN_COLORS[j]['base'],
+                          edgecolor='#1a1a1a', linewidth=1.5,
+                          label=j)
+            for j in legend_jurusan
+        ]
+
+        fig.legend(handles=legend_elements,
+                  loc='upper right',
+                  bbox_to_anchor=(0.98, 0.98),
+                  ncol=1,  # Vertical layout
+                  frameon=True,
+                  framealpha=0.95,
+                  edgecolor='0.2',
+                  fontsize=10,
+                  title='Jurusan',
+                  title_fontsize=11)
+
+        # Main title
+        if main_title:
+            fig.suptitle(main_title, fontsize=13, fontweight='900', y=0.93)
+
+        plt.tight_layout(rect=[0, 0.02, 1, 0.88])
+
+        # Save
+        saved_files = save_figure(fig, filename_base)
 
     return saved_files
 
@@ -0,0 +1,127 @@
+"""
+============================================================================
+CELL GRID HELPERS - SISTEM VISUALISASI IKU
+============================================================================
+
+Helper untuk visual berbasis grid sel dan kumpulan patch (waffle,
+thermometer, KPI cards).
+
+Setiap visual dibuat sebagai SATU collection artist per axes, bukan
+ratusan Rectangle/FancyBboxPatch terpisah. Hasilnya draw lebih cepat dan
+export SVG lebih kecil karena path yang sama dipakai ulang.
+
+Author: Tim IKU FST
+Version: 2.0 (Modular)
+Last Updated: 2026-10-19
+============================================================================
+"""
+
+import numpy as np
+from matplotlib.collections import PatchCollection, PolyCollection
+
+
+# ============================================================================
+# GRID OF CELLS (WAFFLE)
+# ============================================================================
+
+def cell_grid_vertices(n_rows, n_cols, cell_size, origin=(0, 0), fill_ratio=0.9):
+    """
+    Hitung vertex semua sel grid sekaligus (vectorized)
+
+    Sel diurutkan per baris dari ATAS ke bawah, kiri ke kanan - sama dengan
+    urutan pengisian waffle chart.
+
+    Parameters:
+    -----------
+    n_rows, n_cols : int
+        Ukuran grid
+    cell_size : float
+        Jarak antar sel (dalam koordinat transform yang dipakai)
+    origin : tuple
+        Posisi (x, y) pojok kiri bawah grid
+    fill_ratio : float
+        Proporsi sel yang terisi (sisanya menjadi celah antar sel)
+
+    Returns:
+    --------
+    np.ndarray : Array shape (n_rows * n_cols, 4, 2)
+    """
+    rows, cols = np.divmod(np.arange(n_rows * n_cols), n_cols)
+    x0 = origin[0] + cols * cell_size
+    y0 = origin[1] + (n_rows - 1 - rows) * cell_size
+    side = cell_size * fill_ratio
+
+    corners = np.array([[0, 0], [side, 0], [side, side], [0, side]])
+    return np.stack([x0, y0], axis=1)[:, None, :] + corners[None, :, :]
+
+
+def waffle_facecolors(filled_cells, total_cells, fill_color, empty_color='#e0e0e0'):
+    """
+    Warna setiap sel waffle: `filled_cells` sel pertama berwarna fill_color
+
+    Returns:
+    --------
+    np.ndarray : Array warna (object) dengan panjang total_cells
+    """
+    filled = np.arange(total_cells) < filled_cells
+    return np.where(filled, fill_color, empty_color)
+
+
+def add_cell_grid(ax, facecolors, n_rows, n_cols, cell_size, origin=(0, 0),
+                  fill_ratio=0.9, edgecolor='white', linewidth=0.5,
+                  transform=None, zorder=1):
+    """
+    Tambahkan grid sel ke axes sebagai satu PolyCollection
+
+    Parameters:
+    -----------
+    ax : matplotlib.axes.Axes
+    facecolors : sequence
+        Warna per sel (urutan sesuai cell_grid_vertices)
+    transform : matplotlib.transforms.Transform, optional
+        Default ax.transData
+
+    Returns:
+    --------
+    PolyCollection
+    """
+    verts = cell_grid_vertices(n_rows, n_cols, cell_size, origin, fill_ratio)
+    collection = PolyCollection(verts, facecolors=list(facecolors),
+                                edgecolors=edgecolor, linewidths=linewidth,
+                                transform=transform if transform is not None else ax.transData,
+                                zorder=zorder)
+    ax.add_collection(collection, autolim=False)
+
+    return collection
+
+
+# ============================================================================
+# BATCHED PATCHES (THERMOMETER, CARDS)
+# ============================================================================
+
+def add_patch_batch(ax, patches, transform=None, zorder=1):
+    """
+    Tambahkan beberapa patch sebagai satu PatchCollection
+
+    Patch digambar sesuai urutan list (patch terakhir paling atas), dengan
+    style asli masing-masing (facecolor, edgecolor, linewidth).
+    Patch TIDAK perlu diberi transform - gunakan parameter transform.
+
+    Parameters:
+    -----------
+    ax : matplotlib.axes.Axes
+    patches : list of matplotlib.patches.Patch
+    transform : matplotlib.transforms.Transform, optional
+        Default ax.transData
+    zorder : float
+
+    Returns:
+    --------
+    PatchCollection
+    """
+    collection = PatchCollection(patches, match_original=True,
+                                 transform=transform if transform is not None else ax.transData,
+                                 zorder=zorder)
+    ax.add_collection(collection, autolim=False)
+
+    return collection
@@ -0,0 +1,362 @@
+"""
+============================================================================
+CHART SERVER - SISTEM VISUALISASI IKU
+============================================================================
+
+Service HTTP lokal (stdlib, tanpa koneksi internet) yang menyajikan chart
+IKU sebagai PNG langsung dari memori.
+
+Berbeda dengan menjalankan main_visualize_iku.py berulang kali, server ini
+hanya sekali membayar biaya start interpreter, import matplotlib/seaborn,
+load font cache, dan membaca Excel. Data per IKU disimpan di memori dan
+setiap chart di-render on-demand lalu di-cache.
+
+Setiap response membawa ETag berbasis fingerprint render: nama chart,
+ukuran/mtime file input monitoring-iku-*.xlsx yang dibaca read_excel_iku,
+CONFIG (target, DPI, ...), dan isi source code chart saat server start.
+Request dengan If-None-Match yang cocok dijawab 304 tanpa render. Chart
+di-render ulang jika file input atau CONFIG berubah; ETag lama tidak
+berlaku lagi setelah kode chart di-update dan server di-restart.
+
+Nama category breakdown (IKU_<n>_breakdown_<kategori>) bergantung pada
+data, sehingga baru diketahui setelah breakdown di-render. Daftar nama
+yang dihasilkan disimpan per IKU (selama input sama): nama yang tidak
+ada di daftar itu langsung dijawab 404 tanpa render ulang.
+
+Endpoint:
+    GET /                     Daftar chart (JSON)
+    GET /health               Status service
+    GET /chart/<nama>.png     Chart PNG, contoh: /chart/IKU_31_vertical.png
+
+Usage:
+    python chart_server.py                    # http://127.0.0.1:8765
+    python chart_server.py --port 9000 --warm # pre-load semua data IKU
+
+Author: Tim IKU FST
+Version: 2.0 (Modular)
+Last Updated: 2026-10-19
+============================================================================
+"""
+
+import sys
+import json
+import hashlib
+import argparse
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import matplotlib
+matplotlib.use('Agg')
+
+from pathlib import Path
+
+from config import CONFIG, ALL_IKU
+from readers import input_files
+from utils import setup_publication_style
+from exporters import BytesTarget, render_to
+from visualizations import (
+    create_vertical_bar_chart,
+    create_breakdown_donut_charts,
+    create_main_iku_donut,
+    IKU_BREAKDOWN_CONFIG
+)
+from achievement import OVERALL_IKUS
+import overall
+from main_visualize_iku import process_single_iku, CATEGORY_BREAKDOWN_FUNCTIONS
+
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+# IKU utama (overall dashboard)
+MAIN_IKUS = list(OVERALL_IKUS)
+
+# Nama chart -> nama style overall achievement (modul style dimuat saat diminta)
+OVERALL_STYLES = {spec['filename']: style for style, spec in overall.STYLES.items()}
+
+
+def _code_fingerprint():
+    """SHA-1 isi semua source code (*.py) saat server start"""
+    root = Path(__file__).parent
+    digest = hashlib.sha1()
+    for path in sorted(root.rglob('*.py')):
+        digest.update(f'{path.relative_to(root)}:'.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+# Kode yang sedang berjalan (tidak berubah selama process hidup)
+CODE_FINGERPRINT = _code_fingerprint()
+
+
+def input_fingerprint():
+    """
+    Fingerprint semua yang menentukan isi chart: file input yang dibaca
+    read_excel_iku (nama, ukuran, mtime), CONFIG, dan source code
+
+    Returns:
+    --------
+    str : SHA-1 hex digest
+    """
+    digest = hashlib.sha1(CODE_FINGERPRINT.encode())
+    digest.update(json.dumps(CONFIG, sort_keys=True, default=str).encode())
+    for path in input_files():
+        stat = path.stat()
+        digest.update(f'{path.name}:{stat.st_size}:{stat.st_mtime_ns};'.encode())
+    return digest.hexdigest()
+
+
+def chart_etag(name, fingerprint):
+    """ETag chart: deterministik dari nama chart dan fingerprint render"""
+    digest = hashlib.sha1(f'{name}:{fingerprint}'.encode())
+    return f'"{digest.hexdigest()[:20]}"'
+
+
+def _breakdown_iku(name):
+    """IKU category breakdown untuk nama chart IKU_<n>_breakdown_* (None jika bukan)"""
+    parts = name.split('_')
+    if len(parts) > 3 and parts[0] == 'IKU' and parts[1] in CATEGORY_BREAKDOWN_FUNCTIONS \
+            and parts[2] == 'breakdown':
+        return parts[1]
+    return None
+
+
+class ChartService:
+    """
+    Data IKU + cache chart yang tetap hidup selama server berjalan
+
+    Rendering matplotlib tidak thread-safe, sehingga semua render
+    dijalankan bergantian di bawah satu lock; request yang cache-nya
+    masih valid dijawab tanpa menunggu lock render.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._fingerprint = None
+        self._results = {}   # iku -> {'data', 'stats'}
+        self._charts = {}    # chart name -> (etag, png bytes)
+        self._breakdown_names = {}   # iku -> (fingerprint, set nama chart breakdown)
+        self.renders = 0
+
+    # ------------------------------------------------------------------------
+    # Data
+    # ------------------------------------------------------------------------
+
+    def _check_inputs(self):
+        """Buang data & chart cache jika file input berubah"""
+        fingerprint = input_fingerprint()
+        if fingerprint != self._fingerprint:
+            self._fingerprint = fingerprint
+            self._results.clear()
+            self._charts.clear()
+            self._breakdown_names.clear()
+        return fingerprint
+
+    def _result(self, iku):
+        if iku not in self._results:
+            result = process_single_iku(iku, render=False)
+            if result is None:
+                raise LookupError(f'Data IKU {iku} tidak bisa diproses')
+            self._results[iku] = result
+        return self._results[iku]
+
+    def _stats(self, ikus):
+        stats = {}
+        for iku in ikus:
+            try:
+                stats[iku] = self._result(iku)['stats']
+            except LookupError:
+                continue
+        return stats
+
+    def warm(self):
+        """Pre-load data semua IKU"""
+        with self._lock:
+            self._check_inputs()
+            self._stats(ALL_IKU)
+
+    # ------------------------------------------------------------------------
+    # Charts
+    # ------------------------------------------------------------------------
+
+    def chart_names(self):
+        """Daftar nama chart yang bisa di-request"""
+        names = [f'IKU_{iku}_vertical' for iku in ALL_IKU]
+        names += [f'IKU_{iku}_main_donut' for iku in IKU_BREAKDOWN_CONFIG]
+        names += [f'IKU_{iku}_breakdown_donut' for iku in IKU_BREAKDOWN_CONFIG]
+        names += list(OVERALL_STYLES)
+        names += [f'IKU_{iku}_breakdown_*' for iku in CATEGORY_BREAKDOWN_FUNCTIONS]
+        return names
+
+    def _render_job(self, name, fingerprint):
+        """Fungsi render untuk nama chart (None jika tidak dikenal)"""
+        parts = name.split('_')
+        iku = parts[1] if len(parts) > 2 and parts[0] == 'IKU' else None
+
+        if name in OVERALL_STYLES:
+            return lambda: overall.load_style(OVERALL_STYLES[name])(self._stats(MAIN_IKUS))
+        if iku in ALL_IKU and name == f'IKU_{iku}_vertical':
+            return lambda: create_vertical_bar_chart(
+                self._result(iku)['data'], iku, CONFIG['target_values'].get(iku))
+        if iku in IKU_BREAKDOWN_CONFIG and name == f'IKU_{iku}_main_donut':
+            return lambda: create_main_iku_donut(iku, self._stats([iku])[iku])
+        if iku in IKU_BREAKDOWN_CONFIG and name == f'IKU_{iku}_breakdown_donut':
+            return lambda: create_breakdown_donut_charts(
+                iku, self._stats(IKU_BREAKDOWN_CONFIG[iku]['sub_ikus']))
+        if _breakdown_iku(name) is not None:
+            # Breakdown IKU ini sudah di-render untuk input yang sama:
+            # nama di luar hasilnya tidak akan pernah ada
+            known = self._breakdown_names.get(iku)
+            if known is not None and known[0] == fingerprint and name not in known[1]:
+                return None
+            return CATEGORY_BREAKDOWN_FUNCTIONS[iku]
+        return None
+
+    def current_etag(self, name):
+        """ETag chart untuk input saat ini (tanpa render); None jika tidak dikenal"""
+        fingerprint = input_fingerprint()
+        if self._render_job(name, fingerprint) is None:
+            return None
+        return chart_etag(name, fingerprint)
+
+    def get_chart(self, name):
+        """
+        Ambil chart PNG (render jika belum ada / input berubah)
+
+        Returns:
+        --------
+        tuple : (etag, png bytes) atau None jika chart tidak dikenal
+        """
+        fingerprint = input_fingerprint()
+        cached = self._charts.get(name)
+        if cached and fingerprint == self._fingerprint:
+            return cached
+
+        if self._render_job(name, fingerprint) is None:
+            return None
+
+        with self._lock:
+            fingerprint = self._check_inputs()
+            if name in self._charts:
+                return self._charts[name]
+            job = self._render_job(name, fingerprint)
+            if job is None:
+                return None
+
+            # Render ke memori (tanpa file); satu render bisa menghasilkan
+            # beberapa chart (misalnya breakdown)
+            target = BytesTarget(formats=('png',))
+            with render_to(target):
+                job()
+            self.renders += 1
+
+            for chart_name, rendered in target.outputs.items():
+                self._charts[chart_name] = (chart_etag(chart_name, fingerprint), rendered['png'])
+
+            iku = _breakdown_iku(name)
+            if iku is not None:
+                self._breakdown_names[iku] = (fingerprint, {
+                    chart_name for chart_name in target.outputs
+                    if _breakdown_iku(chart_name) == iku})
+
+            return self._charts.get(name)
+
+
+class ChartRequestHandler(BaseHTTPRequestHandler):
+    """HTTP handler: /, /health, /chart/<nama>.png"""
+
+    service = None  # ChartService, di-set oleh serve()
+
+    def _send(self, status, body=b'', content_type='application/json', headers=None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        if body and self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def _send_json(self, status, payload):
+        self._send(status, json.dumps(payload, indent=2).encode('utf-8'))
+
+    def do_GET(self):
+        path = self.path.split('?', 1)[0]
+
+        if path == '/':
+            return self._send_json(200, {'charts': self.service.chart_names()})
+        if path == '/health':
+            return self._send_json(200, {'status': 'ok', 'renders': self.service.renders})
+        if not (path.startswith('/chart/') and path.endswith('.png')):
+            return self._send_json(404, {'error': f'Path tidak dikenal: {path}'})
+
+        name = path[len('/chart/'):-len('.png')]
+
+        # Client sudah punya versi terbaru: 304 tanpa render
+        etag = self.service.current_etag(name)
+        if etag and etag in self.headers.get('If-None-Match', ''):
+            return self._send(304, headers={'ETag': etag, 'Cache-Control': 'no-cache'})
+
+        try:
+            chart = self.service.get_chart(name)
+        except Exception as e:
+            return self._send_json(500, {'error': str(e), 'chart': name})
+        if chart is None:
+            return self._send_json(404, {'error': f'Chart tidak dikenal: {name}'})
+
+        etag, png_bytes = chart
+        return self._send(200, png_bytes, 'image/png',
+                          {'ETag': etag, 'Cache-Control': 'no-cache'})
+
+    do_HEAD = do_GET
+
+    def log_message(self, format, *args):
+        print(f"  [{self.log_date_time_string()}] {format % args}")
+
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, warm=False):
+    """
+    Jalankan chart server sampai dihentikan (Ctrl+C)
+
+    Parameters:
+    -----------
+    host : str
+        Default 127.0.0.1 (hanya localhost)
+    port : int
+    warm : bool
+        Jika True, load data semua IKU sebelum menerima request
+    """
+    setup_publication_style()
+
+    service = ChartService()
+    if warm:
+        print("Memuat data semua IKU...")
+        service.warm()
+
+    ChartRequestHandler.service = service
+    server = ThreadingHTTPServer((host, port), ChartRequestHandler)
+    print(f"Chart server berjalan di http://{host}:{port}/ (Ctrl+C untuk berhenti)")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nChart server dihentikan")
+    finally:
+        server.server_close()
+
+
+def parse_arguments():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description='Chart server lokal IKU (PNG on-demand + ETag)')
+    parser.add_argument('--host', default=DEFAULT_HOST,
+                        help=f'Alamat bind (default: {DEFAULT_HOST})')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT,
+                        help=f'Port (default: {DEFAULT_PORT})')
+    parser.add_argument('--warm', action='store_true',
+                        help='Load data semua IKU saat start')
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_arguments()
+    sys.exit(serve(args.host, args.port, args.warm))
@@ -37,6 +37,43 @@ CONFIG = {
     'export_png': True,
     'export_svg': False,  # Vector format - set to True when needed for publication
 
+    # Varian resolusi PNG (dibuat dari satu kali render, lihat exporters.py)
+    'export_png_variants': False,  # Aktifkan dengan --png-variants
+    'png_variants': {
+        '150dpi': {'dpi': 150},    # Dokumen/laporan
+        '72dpi': {'dpi': 72},      # Web
+        'thumb': {'width': 480},   # Thumbnail (lebar dalam pixel)
+    },
+
+    # Cetak jumlah figure hidup + RSS setelah setiap chart (lihat figures.py)
+    'report_figures': False,
+
+    # Backend pembaca Excel (lihat readers.py): 'auto' = tercepat per kelas
+    # ukuran file hasil kalibrasi, atau nama backend (openpyxl,
+    # openpyxl-stream, calamine, cache)
+    'reader_backend': 'auto',
+
+    # Style overall achievement yang dirender (registry di overall/):
+    # donut, bullet, cards, bullet4x2, thermometer, waffle, 'all', 'none'.
+    # Di-override dengan --styles donut,bullet4x2
+    'overall_styles': ['donut'],       # Run lengkap
+    'overall_styles_4x2': 'all',       # Mode --4x2-only
+
+    # Pencocokan fuzzy label prodi yang tidak persis sama dengan kunci
+    # PRODI_TO_JURUSAN (lihat prodi_names.py): skor Dice trigram minimum,
+    # dan selisih minimum terhadap kandidat kedua
+    'prodi_match_threshold': 0.75,
+    'prodi_match_margin': 0.1,
+
+    # Skor Dice trigram minimum untuk menggabungkan dua nama dosen/mahasiswa
+    # dalam satu blok (prodi + kode fonetik) di IKU gabungan (identity.py)
+    'identity_match_threshold': 0.8,
+
+    # Validasi data input sebelum render (lihat validation.py). Strict =
+    # batalkan run jika ada temuan level error (juga dengan --strict)
+    'validate_data': True,
+    'validation_strict': False,
+
     # Line widths (publication standard)
     'axes_linewidth': 0.75,
     'grid_linewidth': 0.5,
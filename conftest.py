@@ -0,0 +1,13 @@
+"""
+Konfigurasi pytest: folder repo di sys.path agar tests/ bisa mengimpor
+modul datar (identity, prodi_names, ...).
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+
+def pytest_configure(config):
+    config.addinivalue_line('markers', 'slow: test lama (soak lifecycle figure); lewati dengan -m "not slow"')
@@ -0,0 +1,443 @@
+"""
+============================================================================
+ENGINE - API PROGRAMATIK IKU (LAZY, MEMOIZED, FINGERPRINT-INVALIDATED)
+============================================================================
+
+IKUEngine adalah facade library di atas processor, provenance, dan fungsi
+visualisasi, untuk notebook dan service laporan yang ingin bertanya
+"berapa capaian IKU 31?" tanpa menjalankan main() (print, render semua
+chart, tulis output folder).
+
+Setiap nilai dihitung saat pertama kali diminta, lalu disimpan (memo)
+bersama fingerprint file Excel yang benar-benar dibaca saat menghitungnya
+(ukuran + mtime). Pada akses berikutnya fingerprint dicek ulang (hanya
+stat file): jika salah satu file berubah - atau file yang tadinya tidak
+ada kini muncul - nilai tersebut dihitung ulang, nilai lain tetap dipakai.
+Mengubah file IKU 31 hanya menghitung ulang IKU 31, IKU 3, dan chart yang
+memakainya.
+
+    IKUEngine(data_dir, cache=True)
+        .stats(iku)            {'pembilang', 'penyebut', 'persentase', ...}
+        .per_prodi(iku)        Tabel per prodi (Prodi, Penyebut, Pembilang, ...)
+        .combined(group)       IKU gabungan 1-8: data, stats, entitas, sub-IKU
+        .breakdown_data(iku)   Stats sub-IKU sebuah IKU gabungan (input donut)
+        .frame(iku, type)      DataFrame input seperti read_excel_iku
+        .drilldown(iku, prodi) Baris pembilang di balik angka prodi
+        .render(chart, target) Chart (nama seperti chart server)
+
+Parameter cache:
+    True   memo di memori (default)
+    False  tanpa memo: setiap pemanggilan dihitung ulang dari file
+    DIR    memo di memori + cache Parquet frame input di DIR
+           (readers.ColumnarCacheBackend), bertahan antar process
+
+Engine mengganti sumber data read_excel_iku (utils.set_frame_source)
+hanya selama menghitung/render, dan mengembalikannya setelah selesai.
+
+Usage:
+    from engine import IKUEngine
+
+    engine = IKUEngine('/data/iku-2026')
+    engine.stats('31')['persentase']
+    engine.per_prodi('3')
+    engine.drilldown('31', 'Fisika')
+    png = engine.render('IKU_31_vertical')['IKU_31_vertical']
+
+Author: Tim IKU FST
+Version: 2.0 (Modular)
+Last Updated: 2026-10-19
+============================================================================
+"""
+
+import io
+import hashlib
+import threading
+import contextlib
+from pathlib import Path
+
+from config import CONFIG, ALL_IKU
+from readers import input_files, read_excel, ColumnarCacheBackend, select_backend
+from utils import set_frame_source
+from processors import COMBINED_PROCESSORS, compute_iku_frames
+from provenance import ProvenanceIndex
+from tracing import span
+
+
+# ============================================================================
+# ENGINE
+# ============================================================================
+
+class IKUEngine:
+    """
+    Facade IKU dengan nilai lazy + memo yang di-invalidate fingerprint file
+
+    Parameters:
+    -----------
+    data_dir : str or Path, optional
+        Folder file monitoring-iku-*.xlsx (default CONFIG['base_path'])
+    cache : bool or str or Path
+        True = memo di memori, False = tanpa memo, path = memo + cache
+        Parquet frame input di folder tersebut
+    quiet : bool
+        Sembunyikan print() progress processor/render (default True)
+    """
+
+    def __init__(self, data_dir=None, cache=True, quiet=True):
+        self.data_dir = Path(data_dir or CONFIG['base_path'])
+        self.memoize = cache is not False
+        self.frame_cache = (ColumnarCacheBackend(cache)
+                            if cache not in (True, False, None) else None)
+        self.quiet = quiet
+
+        self._entries = {}    # key -> {'deps': {file: fingerprint}, 'value': ...}
+        self._deps = []       # stack dependency set untuk nilai yang sedang dihitung
+        self._lock = threading.RLock()
+        self._styled = False
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return (f"IKUEngine({str(self.data_dir)!r}, entries={len(self._entries)}, "
+                f"hits={self.hits}, misses={self.misses})")
+
+    # ------------------------------------------------------------------------
+    # Fingerprint & memo
+    # ------------------------------------------------------------------------
+
+    def _path(self, iku_number, file_type):
+        return self.data_dir / f'monitoring-iku-{iku_number}-{file_type}.xlsx'
+
+    @staticmethod
+    def _file_key(path):
+        """(ukuran, mtime) file, None jika tidak ada"""
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        return [stat.st_size, stat.st_mtime_ns]
+
+    def fingerprint(self):
+        """
+        Fingerprint semua file input di data_dir
+
+        Returns:
+        --------
+        str : SHA-1 hex digest (nama, ukuran, mtime)
+        """
+        digest = hashlib.sha1()
+        for path in input_files(self.data_dir):
+            digest.update(f'{path.name}:{self._file_key(path)};'.encode())
+        return digest.hexdigest()
+
+    def _valid(self, deps):
+        return all(self._file_key(self.data_dir / name) == key for name, key in deps.items())
+
+    def _track(self, deps):
+        # Nilai luar yang sedang dihitung ikut bergantung pada file ini
+        for outer in self._deps:
+            outer.update(deps)
+
+    def _memo(self, key, compute):
+        """
+        Nilai untuk key: dari memo jika file dependensinya tidak berubah,
+        selain itu compute() (dependensi dicatat lewat frame yang dibaca)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._valid(entry['deps']):
+                self.hits += 1
+                self._track(entry['deps'])
+                return entry['value']
+
+            self.misses += 1
+            self._deps.append({})
+            try:
+                value = compute()
+            finally:
+                deps = self._deps.pop()
+                self._track(deps)
+            if self.memoize:
+                self._entries[key] = {'deps': deps, 'value': value}
+            else:
+                self._entries.pop(key, None)
+            return value
+
+    def invalidate(self, iku_number=None):
+        """
+        Buang memo (semua, atau yang bergantung pada file IKU tertentu)
+
+        Parameters:
+        -----------
+        iku_number : str, optional
+            Sub-IKU (mis. '31'); None = buang semua
+        """
+        with self._lock:
+            if iku_number is None:
+                self._entries.clear()
+                return
+            prefix = f'monitoring-iku-{iku_number}-'
+            for key in [key for key, entry in self._entries.items()
+                        if any(name.startswith(prefix) for name in entry['deps'])]:
+                del self._entries[key]
+
+    @contextlib.contextmanager
+    def _active(self):
+        """read_excel_iku membaca lewat engine; progress disembunyikan jika quiet"""
+        with self._lock:
+            previous = set_frame_source(self._read_frame)
+            try:
+                if self.quiet:
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        yield
+                else:
+                    yield
+            finally:
+                set_frame_source(previous)
+
+    # ------------------------------------------------------------------------
+    # Frames
+    # ------------------------------------------------------------------------
+
+    def _load_frame(self, iku_number, file_type):
+        path = self._path(iku_number, file_type)
+        # Dicatat sebelum membaca: file yang belum ada pun menjadi
+        # dependensi (nilai dihitung ulang saat file muncul)
+        self._track({path.name: self._file_key(path)})
+        if not path.exists():
+            raise FileNotFoundError(f"File tidak ditemukan: {path}")
+        if self.frame_cache is not None:
+            # Cache miss dibaca dengan backend terpilih (readers.py)
+            backend, source, _ = select_backend(path)
+            return self.frame_cache.read(path, source=source if backend.name == 'cache' else backend)
+        df, _ = read_excel(path)
+        return df
+
+    def _read_frame(self, iku_number, file_type='pembilang'):
+        # Frame source untuk read_excel_iku: selalu copy (read_excel_iku
+        # mengkanonikalisasi kolom prodi in-place)
+        return self._memo(('frame', iku_number, file_type),
+                          lambda: self._load_frame(iku_number, file_type)).copy()
+
+    def frame(self, iku_number, file_type='pembilang'):
+        """
+        DataFrame input (copy) seperti hasil read_excel_iku
+
+        Returns:
+        --------
+        pd.DataFrame
+        """
+        from utils import read_excel_iku
+
+        with self._active():
+            return read_excel_iku(iku_number, file_type)
+
+    # ------------------------------------------------------------------------
+    # Hasil IKU
+    # ------------------------------------------------------------------------
+
+    def _check_iku(self, iku_number):
+        if iku_number not in ALL_IKU:
+            raise ValueError(f"IKU {iku_number} tidak valid. IKU yang tersedia: {', '.join(ALL_IKU)}")
+
+    def _result(self, iku_number):
+        """Tabel per prodi, stats, dan frame pembilang/penyebut yang dihitung processor"""
+        self._check_iku(iku_number)
+
+        def compute():
+            with self._active(), span(f'engine {iku_number}', iku=iku_number):
+                data, stats, df_pembilang, df_penyebut = compute_iku_frames(iku_number)
+            return {'data': data, 'stats': stats,
+                    'pembilang': df_pembilang, 'penyebut': df_penyebut}
+
+        return self._memo(('iku', iku_number), compute)
+
+    def stats(self, iku_number):
+        """
+        Statistik keseluruhan satu IKU (gabungan 1-8 atau sub-IKU)
+
+        Returns:
+        --------
+        dict : {'pembilang', 'penyebut', 'persentase', ...}
+        """
+        return dict(self._result(iku_number)['stats'])
+
+    def per_prodi(self, iku_number):
+        """
+        Tabel per program studi (hasil processor)
+
+        Returns:
+        --------
+        pd.DataFrame : copy, aman diubah pemanggil
+        """
+        return self._result(iku_number)['data'].copy()
+
+    def combined(self, group):
+        """
+        IKU gabungan (1-8)
+
+        Parameters:
+        -----------
+        group : str
+            Nomor IKU gabungan
+
+        Returns:
+        --------
+        dict : {'data', 'stats', 'entity', 'sub_ikus'}
+        """
+        if group not in COMBINED_PROCESSORS:
+            raise ValueError(f"IKU {group} bukan IKU gabungan. "
+                             f"IKU gabungan: {', '.join(COMBINED_PROCESSORS)}")
+        _, entity, sub_ikus = COMBINED_PROCESSORS[group]
+        return {
+            'data': self.per_prodi(group),
+            'stats': self.stats(group),
+            'entity': entity,
+            'sub_ikus': list(sub_ikus),
+        }
+
+    def breakdown_data(self, iku_number):
+        """
+        Statistik sub-IKU sebuah IKU gabungan (input donut breakdown)
+
+        Sub-IKU yang file-nya tidak ada dilewati, seperti di main().
+
+        Returns:
+        --------
+        dict : {sub_iku: stats}
+        """
+        from visualizations import IKU_BREAKDOWN_CONFIG
+
+        if iku_number not in IKU_BREAKDOWN_CONFIG:
+            raise ValueError(f"IKU {iku_number} tidak punya breakdown. "
+                             f"IKU dengan breakdown: {', '.join(IKU_BREAKDOWN_CONFIG)}")
+
+        def compute():
+            return self._collect_stats(IKU_BREAKDOWN_CONFIG[iku_number]['sub_ikus'])
+
+        return {sub: dict(stats) for sub, stats in
+                self._memo(('breakdown', iku_number), compute).items()}
+
+    def _collect_stats(self, iku_list):
+        stats = {}
+        for iku in iku_list:
+            try:
+                stats[iku] = self.stats(iku)
+            except FileNotFoundError:
+                continue
+        return stats
+
+    # ------------------------------------------------------------------------
+    # Provenance
+    # ------------------------------------------------------------------------
+
+    def provenance(self, iku_number):
+        """Indeks provenance (ProvenanceIndex) satu IKU"""
+        def compute():
+            result = self._result(iku_number)
+            return ProvenanceIndex.build(iku_number, result['pembilang'], result['penyebut'])
+
+        return self._memo(('provenance', iku_number), compute)
+
+    def drilldown(self, iku_number, prodi, columns=None):
+        """
+        Baris pembilang di balik angka (IKU, prodi)
+
+        Returns:
+        --------
+        pd.DataFrame
+        """
+        return self.provenance(iku_number).drilldown(prodi, columns)
+
+    # ------------------------------------------------------------------------
+    # Render
+    # ------------------------------------------------------------------------
+
+    def charts(self):
+        """Nama chart yang bisa di-render (pola seperti chart server)"""
+        import overall
+        from visualizations import IKU_BREAKDOWN_CONFIG
+        from main_visualize_iku import CATEGORY_BREAKDOWN_FUNCTIONS
+
+        names = [f'IKU_{iku}_vertical' for iku in ALL_IKU]
+        names += [f'IKU_{iku}_main_donut' for iku in IKU_BREAKDOWN_CONFIG]
+        names += [f'IKU_{iku}_breakdown_donut' for iku in IKU_BREAKDOWN_CONFIG]
+        names += [f'IKU_{iku}_breakdown' for iku in CATEGORY_BREAKDOWN_FUNCTIONS]
+        names += [spec['filename'] for spec in overall.STYLES.values()]
+        names.append('IKU_summary_dashboard')
+        return names
+
+    def _render_job(self, chart):
+        """Fungsi render untuk nama chart (ValueError jika tidak dikenal)"""
+        import overall
+        from achievement import OVERALL_IKUS
+        from main_visualize_iku import CATEGORY_BREAKDOWN_FUNCTIONS
+        from visualizations import (
+            create_vertical_bar_chart,
+            create_summary_dashboard,
+            create_breakdown_donut_charts,
+            create_main_iku_donut,
+            IKU_BREAKDOWN_CONFIG
+        )
+
+        parts = chart.split('_')
+        iku = parts[1] if len(parts) > 2 and parts[0] == 'IKU' else None
+        styles = {spec['filename']: style for style, spec in overall.STYLES.items()}
+
+        if chart in styles:
+            return lambda: overall.load_style(styles[chart])(self._collect_stats(OVERALL_IKUS))
+        if chart == 'IKU_summary_dashboard':
+            def dashboard():
+                stats = self._collect_stats(ALL_IKU)
+                return create_summary_dashboard(stats, {iku: self.per_prodi(iku) for iku in stats})
+            return dashboard
+        if iku in ALL_IKU and chart == f'IKU_{iku}_vertical':
+            return lambda: create_vertical_bar_chart(
+                self.per_prodi(iku), iku, CONFIG['target_values'].get(iku))
+        if iku in IKU_BREAKDOWN_CONFIG and chart == f'IKU_{iku}_main_donut':
+            return lambda: create_main_iku_donut(iku, self.stats(iku))
+        if iku in IKU_BREAKDOWN_CONFIG and chart == f'IKU_{iku}_breakdown_donut':
+            return lambda: create_breakdown_donut_charts(iku, self.breakdown_data(iku))
+        if iku in CATEGORY_BREAKDOWN_FUNCTIONS and chart == f'IKU_{iku}_breakdown':
+            return CATEGORY_BREAKDOWN_FUNCTIONS[iku]
+        raise ValueError(f"Chart '{chart}' tidak dikenal. Lihat IKUEngine.charts()")
+
+    def render(self, chart, target=None):
+        """
+        Render satu chart
+
+        Parameters:
+        -----------
+        chart : str
+            Nama chart (lihat charts()), mis. 'IKU_31_vertical'. Nama
+            'IKU_<n>_breakdown' me-render semua chart breakdown kategori
+            IKU tersebut.
+        target : render target, optional
+            exporters.FileTarget / BytesTarget / CallbackTarget. Jika None,
+            chart di-render ke PNG di memori dan hasilnya di-memo.
+
+        Returns:
+        --------
+        dict : {nama output: png bytes} jika target None, selain itu list
+            hasil save_figure target
+        """
+        from exporters import BytesTarget, render_to
+        from utils import setup_publication_style
+
+        job = self._render_job(chart)
+
+        def draw(render_target):
+            with self._active(), render_to(render_target), span(f'engine render {chart}'):
+                if not self._styled:
+                    setup_publication_style()
+                    self._styled = True
+                return job()
+
+        if target is not None:
+            return draw(target)
+
+        def compute():
+            rendered = BytesTarget(formats=('png',))
+            draw(rendered)
+            return {name: outputs['png'] for name, outputs in rendered.outputs.items()}
+
+        return dict(self._memo(('render', chart, CONFIG['dpi']), compute))
@@ -0,0 +1,388 @@
+"""
+============================================================================
+EXPORTERS - SISTEM VISUALISASI IKU
+============================================================================
+
+Modul ini berisi fungsi ekspor figure ke file, termasuk varian resolusi
+PNG (150 DPI, 72 DPI, thumbnail) yang dibuat dari satu kali render, dan
+render target (file / BytesIO / callback) yang dipakai save_figure.
+
+Figure hanya di-draw sekali oleh matplotlib pada resolusi penuh
+(CONFIG['dpi']). PNG utama dan setiap varian di-encode sekali langsung
+dari buffer RGBA Agg hasil render tersebut; varian di-resample dengan
+Pillow, paralel per varian, sehingga biaya setiap varian hanya sebesar
+resize + encode gambar - bukan draw ulang figure atau decode PNG.
+
+Author: Tim IKU FST
+Version: 2.0 (Modular)
+Last Updated: 2026-10-19
+============================================================================
+"""
+
+import io
+import threading
+from pathlib import Path
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from PIL import Image
+
+from config import CONFIG
+from tracing import span
+
+
+# ============================================================================
+# PNG EXPORT + RESOLUTION VARIANTS
+# ============================================================================
+
+def active_png_variants():
+    """
+    Ambil daftar varian PNG yang aktif dari CONFIG
+
+    Returns:
+    --------
+    dict : {nama_varian: spec} atau dict kosong jika varian dinonaktifkan
+    """
+    if not CONFIG.get('export_png_variants'):
+        return {}
+    return CONFIG.get('png_variants', {})
+
+
+def render_rgba(fig, dpi):
+    """
+    Render figure sekali (Agg, bbox tight) ke buffer RGBA
+
+    Parameters:
+    -----------
+    fig : matplotlib.figure.Figure
+    dpi : int
+        Resolusi penuh untuk render
+
+    Returns:
+    --------
+    PIL.Image.Image : Gambar RGBA resolusi penuh (piksel sama dengan
+        fig.savefig(..., format='png', bbox_inches='tight'))
+    """
+    # Format 'raw' hanya draw() tanpa encode; setelah itu renderer canvas
+    # masih memegang buffer hasil crop bbox tight
+    fig.savefig(io.BytesIO(), dpi=dpi, bbox_inches='tight', format='raw')
+    return Image.fromarray(np.array(fig.canvas.buffer_rgba()), 'RGBA')
+
+
+def encode_png(image, dpi):
+    """Encode gambar ke PNG (in-memory) dengan metadata DPI"""
+    buffer = io.BytesIO()
+    image.save(buffer, format='PNG', dpi=(dpi, dpi))
+    return buffer.getvalue()
+
+
+def render_png_bytes(fig, dpi):
+    """
+    Render figure sekali ke PNG (in-memory)
+
+    Parameters:
+    -----------
+    fig : matplotlib.figure.Figure
+    dpi : int
+        Resolusi penuh untuk render
+
+    Returns:
+    --------
+    bytes : Isi file PNG
+    """
+    return encode_png(render_rgba(fig, dpi), dpi)
+
+
+def _variant_size(image, source_dpi, spec):
+    """Hitung ukuran target (width, height) untuk satu varian"""
+    if 'width' in spec:
+        scale = spec['width'] / image.width
+    else:
+        scale = spec['dpi'] / source_dpi
+
+    scale = min(scale, 1.0)
+    width = max(1, round(image.width * scale))
+    height = max(1, round(image.height * scale))
+
+    return width, height
+
+
+def _write_variant(image, source_dpi, spec, variant_file):
+    """Resample buffer RGBA ke ukuran varian lalu simpan sebagai PNG"""
+    size = _variant_size(image, source_dpi, spec)
+    resized = image.resize(size, Image.LANCZOS)
+
+    variant_dpi = spec.get('dpi', round(source_dpi * size[0] / image.width))
+    variant_file.parent.mkdir(parents=True, exist_ok=True)
+    resized.save(variant_file, format='PNG', dpi=(variant_dpi, variant_dpi))
+
+    return str(variant_file)
+
+
+def save_png_variants(image, png_file, source_dpi, variants):
+    """
+    Buat varian resolusi dari buffer RGBA resolusi penuh
+
+    Varian disimpan di subfolder sesuai namanya, misalnya
+    output/png/150dpi/IKU_1_vertical.png. Setiap varian di-resample
+    langsung dari buffer render dan di-encode sekali.
+
+    Parameters:
+    -----------
+    image : PIL.Image.Image
+        Gambar RGBA resolusi penuh hasil render_rgba()
+    png_file : pathlib.Path
+        Path PNG resolusi penuh
+    source_dpi : int
+        DPI render resolusi penuh
+    variants : dict
+        {nama_varian: {'dpi': int} atau {'width': int}}
+
+    Returns:
+    --------
+    list : List of saved variant file paths
+    """
+    if not variants:
+        return []
+
+    jobs = []
+    with ThreadPoolExecutor(max_workers=len(variants)) as executor:
+        for name, spec in variants.items():
+            variant_file = png_file.parent / name / png_file.name
+            jobs.append(executor.submit(_write_variant, image, source_dpi,
+                                        spec, variant_file))
+
+    return [job.result() for job in jobs]
+
+
+def save_png(fig, png_file, dpi):
+    """
+    Simpan figure sebagai PNG resolusi penuh beserta varian resolusinya
+
+    Parameters:
+    -----------
+    fig : matplotlib.figure.Figure
+    png_file : pathlib.Path
+        Path PNG resolusi penuh
+    dpi : int
+        Resolusi penuh
+
+    Returns:
+    --------
+    list : List of saved file paths (PNG utama di posisi pertama)
+    """
+    image = render_rgba(fig, dpi)
+    png_file.write_bytes(encode_png(image, dpi))
+
+    saved_files = [str(png_file)]
+    saved_files.extend(save_png_variants(image, png_file, dpi,
+                                         active_png_variants()))
+
+    return saved_files
+
+
+# ============================================================================
+# RENDER TARGETS
+# ============================================================================
+
+class FileTarget:
+    """
+    Target default: simpan figure ke output_dir/png dan output_dir/svg
+
+    Parameters:
+    -----------
+    output_dir : pathlib.Path
+    config : dict
+        CONFIG yang berisi 'dpi', 'export_png', 'export_svg'
+    """
+
+    def __init__(self, output_dir, config):
+        self.output_dir = output_dir
+        self.config = config
+
+    def save(self, fig, filename_base):
+        """
+        Returns:
+        --------
+        list : List of saved file paths
+        """
+        saved_files = []
+
+        # Save PNG
+        if self.config['export_png']:
+            png_dir = self.output_dir / 'png'
+            png_dir.mkdir(parents=True, exist_ok=True)
+            png_file = png_dir / f'{filename_base}.png'
+            png_files = save_png(fig, png_file, self.config['dpi'])
+            saved_files.extend(png_files)
+            print(f"    ✓ PNG: {png_file.relative_to(self.output_dir)}")
+            if len(png_files) > 1:
+                print(f"    ✓ PNG variants: {len(png_files) - 1} (resampled)")
+
+        # Save SVG (vector format)
+        if self.config['export_svg']:
+            svg_dir = self.output_dir / 'svg'
+            svg_dir.mkdir(parents=True, exist_ok=True)
+            svg_file = svg_dir / f'{filename_base}.svg'
+            fig.savefig(svg_file, bbox_inches='tight', format='svg')
+            saved_files.append(str(svg_file))
+            print(f"    ✓ SVG: {svg_file.relative_to(self.output_dir)}")
+
+        return saved_files
+
+
+class BytesTarget:
+    """
+    Target in-memory: simpan figure sebagai bytes, tanpa menyentuh disk
+
+    Hasil tersedia di attribute outputs:
+        {filename_base: {'png': bytes, 'svg': bytes}}
+
+    Parameters:
+    -----------
+    formats : tuple
+        Format yang di-render ('png', 'svg')
+    dpi : int, optional
+        DPI PNG (default CONFIG['dpi'])
+    """
+
+    def __init__(self, formats=('png',), dpi=None):
+        self.formats = tuple(formats)
+        self.dpi = dpi or CONFIG['dpi']
+        self.outputs = {}
+
+    def save(self, fig, filename_base):
+        """
+        Returns:
+        --------
+        list : Nama output ('{filename_base}.{format}')
+        """
+        rendered = self.outputs.setdefault(filename_base, {})
+
+        if 'png' in self.formats:
+            rendered['png'] = render_png_bytes(fig, self.dpi)
+        if 'svg' in self.formats:
+            buffer = io.BytesIO()
+            fig.savefig(buffer, bbox_inches='tight', format='svg')
+            rendered['svg'] = buffer.getvalue()
+
+        return [f'{filename_base}.{fmt}' for fmt in self.formats]
+
+    def get(self, filename_base, fmt='png'):
+        """Ambil bytes satu output (None jika belum di-render)"""
+        return self.outputs.get(filename_base, {}).get(fmt)
+
+
+class CallbackTarget:
+    """
+    Target callback: serahkan figure ke callback(fig, filename_base)
+
+    Callback dipanggil sebelum figure di-close; nilai kembaliannya (list)
+    dipakai sebagai hasil save_figure.
+    """
+
+    def __init__(self, callback):
+        self.callback = callback
+
+    def save(self, fig, filename_base):
+        return list(self.callback(fig, filename_base) or [])
+
+
+# Target aktif per thread (stack, untuk render_to bersarang)
+_TARGETS = threading.local()
+
+
+def current_render_target():
+    """Render target aktif di thread ini (None = target default/file)"""
+    stack = getattr(_TARGETS, 'stack', None)
+    return stack[-1] if stack else None
+
+
+@contextmanager
+def render_to(target):
+    """
+    Arahkan semua save_figure di dalam blok ke target tertentu
+
+    Contoh:
+        target = BytesTarget(formats=('png', 'svg'))
+        with render_to(target):
+            create_vertical_bar_chart(data, '31', 25)
+        png_bytes = target.get('IKU_31_vertical')
+    """
+    if not hasattr(_TARGETS, 'stack'):
+        _TARGETS.stack = []
+    _TARGETS.stack.append(target)
+    try:
+        yield target
+    finally:
+        _TARGETS.stack.pop()
+
+
+def save_to_target(fig, filename_base, default_target):
+    """
+    Simpan figure ke target aktif (atau default_target), lalu teruskan
+    ke figure sink
+
+    Returns:
+    --------
+    list : Hasil target.save()
+    """
+    target = current_render_target() or default_target
+    with span(filename_base) as chart_span:
+        saved_files = target.save(fig, filename_base)
+        chart_span.add(bytes=_saved_bytes(target, saved_files, filename_base))
+
+        # Stream ke sink (misalnya laporan PDF)
+        emit_figure(fig, filename_base)
+
+    return saved_files
+
+
+def _saved_bytes(target, saved_files, filename_base):
+    """Total bytes yang ditulis target untuk satu figure (untuk trace)"""
+    if isinstance(target, BytesTarget):
+        return sum(len(data) for data in target.outputs.get(filename_base, {}).values())
+    total = 0
+    for file in saved_files:
+        if isinstance(file, (str, Path)) and Path(file).is_file():
+            total += Path(file).stat().st_size
+    return total
+
+
+# ============================================================================
+# FIGURE SINKS (STREAMING EXPORT)
+# ============================================================================
+
+# Callback sink(fig, filename_base) yang dipanggil setiap kali figure
+# disimpan, sebelum figure di-close (misalnya PdfReport)
+_FIGURE_SINKS = []
+
+
+def add_figure_sink(sink):
+    """
+    Daftarkan sink yang menerima setiap figure yang disimpan
+
+    Parameters:
+    -----------
+    sink : callable
+        sink(fig, filename_base)
+    """
+    _FIGURE_SINKS.append(sink)
+
+
+def remove_figure_sink(sink):
+    """Hapus sink yang sebelumnya didaftarkan (no-op jika tidak ada)"""
+    if sink in _FIGURE_SINKS:
+        _FIGURE_SINKS.remove(sink)
+
+
+def clear_figure_sinks():
+    """Hapus semua sink (dipakai di worker process)"""
+    _FIGURE_SINKS.clear()
+
+
+def emit_figure(fig, filename_base):
+    """Kirim figure ke semua sink yang terdaftar"""
+    for sink in list(_FIGURE_SINKS):
+        sink(fig, filename_base)
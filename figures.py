@@ -0,0 +1,159 @@
+"""
+============================================================================
+FIGURES - SISTEM VISUALISASI IKU
+============================================================================
+
+Factory figure matplotlib dengan lifecycle terjamin untuk semua fungsi
+chart (visualizations.py dan breakdown/*):
+
+    with managed_subplots(figsize=(14, 7)) as (fig, ax):
+        ...
+        saved_files = save_figure(fig, 'IKU_31_vertical')
+
+Saat keluar dari blok - termasuk karena exception - artist figure
+dibersihkan (fig.clf()) lalu figure ditutup lewat plt.close(fig). Berbeda
+dengan plt.close() tanpa argumen yang hanya menutup figure *aktif*,
+figure yang sudah tidak aktif (misalnya karena chart lain dibuat di
+tengah jalan) atau figure yang ditinggal exception tidak ikut bocor.
+
+Setelah setiap chart, jumlah figure yang masih hidup dan RSS proses
+dicatat sebagai attribute span tracing "figure" (lihat --trace) dan di
+figure_stats(); set CONFIG['report_figures'] = True untuk mencetaknya.
+
+Author: Tim IKU FST
+Version: 2.0 (Modular)
+Last Updated: 2026-10-19
+============================================================================
+"""
+
+import os
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import matplotlib.pyplot as plt
+
+from config import CONFIG
+from tracing import span
+
+
+_STATS = {'charts': 0, 'live_figures': 0, 'max_live_figures': 0, 'rss_mb': 0.0}
+
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+# ============================================================================
+# PENGUKURAN
+# ============================================================================
+
+def live_figures():
+    """Jumlah figure pyplot yang masih terdaftar (belum di-close)"""
+    return len(plt.get_fignums())
+
+
+def rss_mb():
+    """
+    Resident set size proses saat ini (MB)
+
+    Dibaca dari /proc/self/statm; di platform tanpa /proc memakai psutil
+    (jika terpasang), lalu peak RSS dari getrusage sebagai pendekatan.
+    NaN jika keduanya tidak tersedia (misalnya Windows tanpa psutil).
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE / 1e6
+    except (OSError, IndexError, ValueError):
+        pass
+    try:
+        import psutil
+    except ImportError:
+        psutil = None
+    if psutil is not None:
+        return psutil.Process().memory_info().rss / 1e6
+    if resource is not None:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1e3
+    return float('nan')
+
+
+def figure_stats():
+    """
+    Statistik lifecycle figure sejak proses dimulai
+
+    Returns:
+    --------
+    dict : charts (jumlah figure yang sudah dilepas), live_figures dan
+        rss_mb setelah chart terakhir, max_live_figures
+    """
+    return dict(_STATS)
+
+
+# ============================================================================
+# FACTORY
+# ============================================================================
+
+def release_figure(fig):
+    """
+    Bersihkan artist dan tutup satu figure, lalu catat statistik
+
+    Returns:
+    --------
+    tuple : (jumlah figure hidup, RSS dalam MB) setelah figure ditutup
+    """
+    fig.clf()
+    plt.close(fig)
+
+    live, rss = live_figures(), rss_mb()
+    _STATS['charts'] += 1
+    _STATS['live_figures'] = live
+    _STATS['max_live_figures'] = max(_STATS['max_live_figures'], live)
+    _STATS['rss_mb'] = rss
+    if CONFIG.get('report_figures'):
+        print(f"   [figure] live={live} rss={rss:.1f} MB")
+    return live, rss
+
+
+@contextmanager
+def _figure_scope(create):
+    with span('figure') as figure_span:
+        created = create()
+        fig = created[0] if isinstance(created, tuple) else created
+        try:
+            yield created
+        finally:
+            live, rss = release_figure(fig)
+            figure_span.set(live_figures=live, rss_mb=round(rss, 1))
+
+
+def managed_subplots(*args, **kwargs):
+    """
+    Context manager pengganti plt.subplots() dengan close terjamin
+
+    Parameters:
+    -----------
+    *args, **kwargs
+        Diteruskan ke plt.subplots (nrows, ncols, figsize, ...)
+
+    Yields:
+    -------
+    tuple : (fig, axes) seperti plt.subplots
+    """
+    return _figure_scope(lambda: plt.subplots(*args, **kwargs))
+
+
+def managed_figure(**kwargs):
+    """
+    Context manager pengganti plt.figure() dengan close terjamin
+
+    Parameters:
+    -----------
+    **kwargs
+        Diteruskan ke plt.figure (figsize, facecolor, ...)
+
+    Yields:
+    -------
+    matplotlib.figure.Figure
+    """
+    return _figure_scope(lambda: plt.figure(**kwargs))
@@ -10,6 +10,7 @@ Script ini akan menjalankan:
 """
 
 import sys
+import argparse
 from pathlib import Path
 
 # Import main visualization
@@ -22,6 +23,9 @@ from breakdown.iku_33_breakdown import create_iku_33_breakdown
 from breakdown.iku_41_breakdown import create_iku_41_breakdown
 from breakdown.iku_42_breakdown import create_iku_42_breakdown
 
+from tracing import span
+from profiling import PROFILE_MODES, profile_session
+
 
 def generate_all():
     """Generate semua visualisasi IKU (main + breakdowns)"""
@@ -44,21 +48,26 @@ def generate_all():
     print("STEP 2: BREAKDOWN VISUALIZATIONS (Detail Charts)")
     print("="*80)
 
-    # IKU 31 breakdown
-    iku31_files = create_iku_31_breakdown()
-    all_files.extend(iku31_files)
+    with span('breakdowns'):
+        # IKU 31 breakdown
+        with span('breakdown 31'):
+            iku31_files = create_iku_31_breakdown()
+        all_files.extend(iku31_files)
 
-    # IKU 33 breakdown
-    iku33_files = create_iku_33_breakdown()
-    all_files.extend(iku33_files)
+        # IKU 33 breakdown
+        with span('breakdown 33'):
+            iku33_files = create_iku_33_breakdown()
+        all_files.extend(iku33_files)
 
-    # IKU 41 breakdown
-    iku41_files = create_iku_41_breakdown()
-    all_files.extend(iku41_files)
+        # IKU 41 breakdown
+        with span('breakdown 41'):
+            iku41_files = create_iku_41_breakdown()
+        all_files.extend(iku41_files)
 
-    # IKU 42 breakdown
-    iku42_files = create_iku_42_breakdown()
-    all_files.extend(iku42_files)
+        # IKU 42 breakdown
+        with span('breakdown 42'):
+            iku42_files = create_iku_42_breakdown()
+        all_files.extend(iku42_files)
 
     # Summary
     print("\n" + "="*80)
@@ -79,4 +88,10 @@ def generate_all():
 
 
 if __name__ == "__main__":
-    generate_all()
+    parser = argparse.ArgumentParser(description='Generate semua visualisasi IKU (main + breakdowns)')
+    parser.add_argument('--profile', choices=PROFILE_MODES,
+                        help='Profile per stage: cProfile (.prof) atau tracemalloc (snapshot) di output/profile/')
+    args = parser.parse_args()
+
+    with profile_session(args.profile):
+        generate_all()
@@ -0,0 +1,171 @@
+"""
+============================================================================
+HTML DASHBOARD EXPORT - SISTEM VISUALISASI IKU
+============================================================================
+
+Export dashboard interaktif (satu file HTML, tanpa koneksi internet).
+
+Semua angka (statistik IKU + tabel per prodi) diserialisasi menjadi satu
+payload JSON kompak yang di-embed ke template templates/dashboard.html.
+Vertical bar chart, donut, dan overall dashboard 4x2 digambar di browser
+(SVG) dari payload tersebut, sehingga regenerate dashboard hanya butuh
+serialisasi JSON - bukan render ulang matplotlib.
+
+Urutan prodi dan warna jurusan dihitung di sini dengan fungsi yang sama
+dengan chart PNG (sort_by_jurusan, assign_colors_by_jurusan), jadi
+tampilan HTML konsisten dengan PNG.
+
+Author: Tim IKU FST
+Version: 2.0 (Modular)
+Last Updated: 2026-10-19
+============================================================================
+"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from config import CONFIG, IKU_METADATA, JURUSAN_COLORS, JURUSAN_ORDER
+from utils import sort_by_jurusan, assign_colors_by_jurusan
+from achievement import OVERALL_IKUS as MAIN_IKUS, NUMBER_BASED, AchievementModel
+
+
+TEMPLATE_FILE = Path(__file__).parent / 'templates' / 'dashboard.html'
+PAYLOAD_PLACEHOLDER = '/*__IKU_PAYLOAD__*/null'
+
+
+# ============================================================================
+# PAYLOAD
+# ============================================================================
+
+def _prodi_table(data):
+    """Tabel per prodi (column-oriented) dalam urutan jurusan + warna"""
+    data_sorted = sort_by_jurusan(data.copy())
+    colors = assign_colors_by_jurusan(data_sorted)
+
+    return {
+        'prodi': data_sorted['Program Studi'].tolist(),
+        'jurusan': data_sorted['Jurusan'].fillna('').tolist(),
+        'color': colors,
+        'pembilang': [int(v) for v in data_sorted['Pembilang']],
+        'penyebut': [int(v) for v in data_sorted['Penyebut']],
+        'persentase': [round(float(v), 2) for v in data_sorted['Persentase']],
+    }
+
+
+def build_dashboard_payload(all_stats, all_data=None):
+    """
+    Susun payload JSON dashboard dari hasil main()
+
+    Parameters:
+    -----------
+    all_stats : dict
+        {iku_number: {'pembilang', 'penyebut', 'persentase'}}
+    all_data : dict, optional
+        {iku_number: DataFrame per prodi (Program Studi, Pembilang,
+        Penyebut, Persentase)}
+
+    Returns:
+    --------
+    dict : Payload siap di-serialize
+    """
+    all_data = all_data or {}
+    required = {'Program Studi', 'Pembilang', 'Penyebut', 'Persentase'}
+
+    iku_payload = {}
+    for iku_number, metadata in IKU_METADATA.items():
+        if iku_number not in all_stats:
+            continue
+
+        stats = all_stats[iku_number]
+        entry = {
+            'title': metadata['title'],
+            'subtitle': metadata['subtitle'],
+            'target': CONFIG['target_values'].get(iku_number),
+            'number_based': iku_number in NUMBER_BASED,
+            'stats': {
+                'pembilang': int(stats['pembilang']),
+                'penyebut': int(stats['penyebut']),
+                'persentase': float(stats['persentase']),
+            },
+        }
+
+        data = all_data.get(iku_number)
+        if data is not None and len(data) and required.issubset(data.columns):
+            entry['table'] = _prodi_table(data)
+
+        iku_payload[iku_number] = entry
+
+    # Status capaian dari AchievementModel (sama dengan overall dashboard PNG)
+    model = AchievementModel(all_stats, ikus=list(iku_payload))
+    for i, entry in enumerate(iku_payload.values()):
+        entry['achievement'] = {
+            'status': model.status_text[i],
+            'ratio': None if np.isnan(model.ratio[i]) else round(float(model.ratio[i]), 4),
+            'gap': None if np.isnan(model.gap[i]) else round(float(model.gap[i]), 2),
+            'diff': model.diff_text[i],
+        }
+
+    return {
+        'generated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'order': list(iku_payload),
+        'main_ikus': MAIN_IKUS,
+        'jurusan': {j: JURUSAN_COLORS[j]['base'] for j in JURUSAN_ORDER},
+        'iku': iku_payload,
+    }
+
+
+def serialize_payload(payload):
+    """Serialize payload ke JSON kompak (aman di-embed dalam <script>)"""
+    text = json.dumps(payload, ensure_ascii=False, separators=(',', ':'))
+    return text.replace('</', '<\\/')
+
+
+# ============================================================================
+# EXPORT
+# ============================================================================
+
+def render_dashboard_html(payload):
+    """
+    Gabungkan payload dengan template HTML
+
+    Returns:
+    --------
+    str : Dokumen HTML self-contained
+    """
+    template = TEMPLATE_FILE.read_text(encoding='utf-8')
+    return template.replace(PAYLOAD_PLACEHOLDER, serialize_payload(payload))
+
+
+def export_html_dashboard(all_stats, all_data=None, filename_base='IKU_dashboard'):
+    """
+    Tulis dashboard HTML (+ payload JSON) ke output folder
+
+    Parameters:
+    -----------
+    all_stats : dict
+    all_data : dict, optional
+    filename_base : str
+        Nama file tanpa extension
+
+    Returns:
+    --------
+    list : List of saved file paths
+    """
+    output_dir = CONFIG['base_path'] / CONFIG['output_dir']
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    payload = build_dashboard_payload(all_stats, all_data)
+
+    json_file = output_dir / f'{filename_base}.json'
+    json_file.write_text(serialize_payload(payload), encoding='utf-8')
+
+    html_file = output_dir / f'{filename_base}.html'
+    html_file.write_text(render_dashboard_html(payload), encoding='utf-8')
+
+    print(f"    ✓ HTML: {html_file.relative_to(output_dir)} "
+          f"({len(payload['iku'])} IKU, payload {json_file.stat().st_size / 1024:.1f} KB)")
+
+    return [str(html_file), str(json_file)]
@@ -0,0 +1,284 @@
+"""
+============================================================================
+IDENTITY - RESOLUSI IDENTITAS DOSEN / MAHASISWA (DEDUP FUZZY)
+============================================================================
+
+IKU gabungan (1, 2, 3, 4) menghitung entitas unik dari beberapa file
+pembilang. Dedup hanya dengan NIM/NIP persis tidak cukup: pengajar
+praktisi IKU 42 memakai kode PR..., sebagian export tidak punya NIP, dan
+nama ditulis dengan gelar/ejaan berbeda ("Dr. Dedy Setiawan S.Kom., M.IT."
+vs "Dedi Setiawan, M.IT").
+
+Resolusi identitas (resolve_identities):
+1. Baris dengan ID sama (setelah dirapikan) = satu identitas.
+2. Nama dinormalisasi: tanpa gelar depan (Prof., Dr., Ir., ...), tanpa
+   gelar belakang (S.Kom., M.T., Ph.D, ...), huruf kecil, tanpa tanda baca.
+3. Blocking: kandidat hanya dibandingkan di dalam blok (prodi, kode
+   fonetik token nama pertama) dan (prodi, kode fonetik token nama
+   terakhir), sehingga jumlah pasangan yang diskor jauh di bawah O(n^2).
+4. Pasangan dalam blok diskor dengan Dice trigram atas nama (token
+   diurutkan); skor >= CONFIG['identity_match_threshold'] digabung.
+5. Dua ID berbeda dengan format yang sama (mis. dua NIM, dua NIP) adalah
+   dua orang, apa pun sumbernya: pasangan seperti ini tidak diskor, dan
+   penggabungan yang akan menyatukan dua cluster yang masing-masing sudah
+   memegang ID berbeda berformat sama ditolak (mencegah rantai
+   "Rizki" (NIM A) - "Rizky" (tanpa NIM) - "Rizki" (NIM B)). Nama hanya
+   menentukan jika salah satu sisi tanpa ID atau format ID-nya berbeda
+   (kode praktisi PR..., NIP terpotong).
+
+Jumlah penggabungan dicetak oleh processor dan dicatat di span tracing
+"identity".
+
+Author: Tim IKU FST
+Version: 2.0 (Modular)
+Last Updated: 2026-10-19
+============================================================================
+"""
+
+import re
+import unicodedata
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+
+from config import CONFIG
+from prodi_names import trigrams
+from tracing import span
+
+
+# Kolom identitas hasil resolve_identities
+IDENTITY_COLUMN = 'Identitas'
+
+# Gelar di depan nama (tanpa titik, huruf kecil)
+NAME_PREFIXES = {'prof', 'dr', 'drs', 'dra', 'ir', 'h', 'hj', 'apt', 'ns', 'drg', 'dt'}
+
+# Gelar belakang tanpa titik yang umum ditulis tanpa tanda baca
+NAME_DEGREES = {
+    'st', 'mt', 'se', 'mm', 'sp', 'sh', 'mh', 'ssi', 'msi', 'msc', 'phd', 'meng',
+    'skom', 'mkom', 'spd', 'mpd', 'amd', 'amkl', 'dipl', 'ms', 'mp', 'ma', 'ba',
+    'bsc', 'mba', 'dea', 'sked', 'stp', 'mcs', 'mit',
+}
+
+_NON_LETTER = re.compile(r'[^a-z ]+')
+
+
+# ============================================================================
+# NORMALISASI NAMA
+# ============================================================================
+
+def normalize_name(name):
+    """
+    Nama tanpa gelar, huruf kecil, tanpa tanda baca
+
+    "Dr. Dedy Setiawan S.Kom., M.IT."          -> "dedy setiawan"
+    "Ir. Rizki Andre Handika ST, MT, Ph.D(Eng.)" -> "rizki andre handika"
+    "Prof. Drs. Damris M M.Sc., Ph.D."          -> "damris m"
+    """
+    if pd.isna(name):
+        return ''
+    text = unicodedata.normalize('NFKD', str(name))
+    text = text.encode('ascii', 'ignore').decode('ascii')
+    # Gelar belakang biasanya setelah koma pertama
+    text = text.split(',')[0]
+
+    tokens = []
+    for token in text.split():
+        key = _NON_LETTER.sub('', token.casefold())
+        if not key:
+            continue
+        if not tokens and key in NAME_PREFIXES:
+            continue
+        # Token bertitik setelah nama (S.Kom., M.T.) atau gelar tanpa
+        # titik menandai awal gelar belakang
+        if tokens and (key in NAME_DEGREES or ('.' in token and len(key) > 1)):
+            break
+        tokens.append(key)
+    return ' '.join(tokens)
+
+
+def phonetic_key(token):
+    """
+    Kode fonetik (Soundex sederhana) satu token nama
+
+    "dedy" / "dedi" -> "d3", "setiawan" / "setyawan" -> "s35"
+    """
+    if not token:
+        return ''
+    groups = ('aeiouyhw', 'bfpv', 'cgjkqsxz', 'dt', 'l', 'mn', 'r')
+    codes = {ch: str(i) for i, group in enumerate(groups) for ch in group}
+    code = token[0]
+    previous = codes.get(token[0], '')
+    for ch in token[1:]:
+        digit = codes.get(ch, '')
+        if digit != previous and digit not in ('', '0'):
+            code += digit
+        previous = digit
+    return code[:4]
+
+
+def _id_key(value):
+    """ID dirapikan sebagai teks (None jika kosong)"""
+    if pd.isna(value):
+        return None
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    text = str(value).strip()
+    return text or None
+
+
+def _id_scheme(text):
+    """Format ID (huruf -> A, angka -> 9): NIM, NIP, dan kode PR berbeda format"""
+    return re.sub(r'[0-9]', '9', re.sub(r'[A-Za-z]', 'A', text))
+
+
+# ============================================================================
+# RESOLUSI
+# ============================================================================
+
+class _UnionFind:
+    """
+    Union-find dengan klaim ID per cluster {format ID: ID}
+
+    Dua cluster dengan ID berbeda untuk format yang sama tidak digabung.
+    """
+
+    def __init__(self, n, claims=None):
+        self.parent = np.arange(n)
+        self.claims = claims if claims is not None else [{} for _ in range(n)]
+
+    def find(self, i):
+        root = i
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[i] != root:
+            self.parent[i], i = root, self.parent[i]
+        return root
+
+    def conflicts(self, i, j):
+        """True jika cluster i dan j memegang ID berbeda berformat sama"""
+        claims_i, claims_j = self.claims[self.find(i)], self.claims[self.find(j)]
+        return any(claims_i.get(scheme, value) != value for scheme, value in claims_j.items())
+
+    def union(self, i, j):
+        root_i, root_j = self.find(i), self.find(j)
+        if root_i == root_j or self.conflicts(root_i, root_j):
+            return False
+        root, child = min(root_i, root_j), max(root_i, root_j)
+        self.parent[child] = root
+        self.claims[root] = {**self.claims[child], **self.claims[root]}
+        return True
+
+
+def resolve_identities(df, id_col, name_col, prodi_col, threshold=None):
+    """
+    Tentukan identitas setiap baris (exact ID + nama fuzzy dalam blok)
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Gabungan pembilang (satu baris per kemunculan)
+    id_col : str
+        Kolom NIM/NIP (boleh tidak ada: resolusi hanya lewat nama)
+    name_col : str
+        Kolom nama
+    prodi_col : str
+        Kolom prodi (bagian dari kunci blok)
+    threshold : float, optional
+        Skor Dice minimum (default CONFIG['identity_match_threshold'])
+
+    Returns:
+    --------
+    tuple : (DataFrame dengan kolom 'Identitas' = posisi baris wakil,
+             dict laporan {'records', 'identities', 'exact_merges',
+             'fuzzy_merges', 'blocks', 'pairs_scored'})
+    """
+    threshold = CONFIG['identity_match_threshold'] if threshold is None else threshold
+    n = len(df)
+
+    # Export tanpa kolom ID (atau tanpa nama) tetap bisa di-resolve
+    ids = [_id_key(value) for value in df[id_col]] if id_col in df else [None] * n
+    names = [normalize_name(value) for value in df[name_col]] if name_col in df else [''] * n
+    prodi = df[prodi_col].fillna('').astype(str).to_numpy() if prodi_col in df else np.full(n, '')
+    schemes = [_id_scheme(value) if value else None for value in ids]
+    uf = _UnionFind(n, [{scheme: value} if value else {} for scheme, value in zip(schemes, ids)])
+
+    # 1. ID sama = identitas sama
+    exact_merges = 0
+    codes, _ = pd.factorize(pd.Series(ids, dtype=object))
+    first = {}
+    for i, code in enumerate(codes):
+        if code < 0:
+            continue
+        if code in first:
+            exact_merges += uf.union(first[code], i)
+        else:
+            first[code] = i
+
+    # 2. Blocking: (prodi, fonetik token pertama) dan (prodi, fonetik token terakhir)
+    tokens = [name.split() for name in names]
+    block_keys = pd.DataFrame({
+        'row': np.arange(n),
+        'first': [f"{p}|{phonetic_key(t[0])}" if t else None for p, t in zip(prodi, tokens)],
+        'last': [f"{p}|{phonetic_key(t[-1])}" if len(t) > 1 else None
+                 for p, t in zip(prodi, tokens)],
+    })
+    blocks = []
+    for column in ('first', 'last'):
+        grouped = block_keys.dropna(subset=[column]).groupby(column)['row']
+        blocks += [rows.to_numpy() for _, rows in grouped if len(rows) > 1]
+
+    # 3. Skor pasangan hanya di dalam blok
+    grams = [trigrams(' '.join(sorted(t))) if t else set() for t in tokens]
+    scored = set()
+    fuzzy_merges = 0
+    for rows in blocks:
+        for i, j in combinations(rows, 2):
+            if (i, j) in scored:
+                continue
+            scored.add((i, j))
+            # ID berbeda dengan format sama = orang berbeda (juga lewat
+            # rantai: cluster yang sudah memegang ID lain ditolak union)
+            if uf.find(i) == uf.find(j) or uf.conflicts(i, j):
+                continue
+            shared = len(grams[i] & grams[j])
+            score = 2.0 * shared / (len(grams[i]) + len(grams[j]))
+            if score >= threshold:
+                fuzzy_merges += uf.union(i, j)
+
+    result = df.copy()
+    result[IDENTITY_COLUMN] = [uf.find(i) for i in range(n)]
+    report = {
+        'records': n,
+        'identities': int(result[IDENTITY_COLUMN].nunique()),
+        'exact_merges': int(exact_merges),
+        'fuzzy_merges': int(fuzzy_merges),
+        'blocks': len(blocks),
+        'pairs_scored': len(scored),
+    }
+    return result, report
+
+
+def dedup_identities(df, id_col, name_col, prodi_col, label=''):
+    """
+    Baris pertama per identitas (pengganti drop_duplicates(subset=[ID]))
+
+    Parameters:
+    -----------
+    label : str
+        Nama IKU untuk span tracing / log
+
+    Returns:
+    --------
+    pd.DataFrame : Satu baris per identitas (tanpa kolom 'Identitas')
+    """
+    with span('identity', iku=label) as identity_span:
+        resolved, report = resolve_identities(df, id_col, name_col, prodi_col)
+        identity_span.add(**report)
+
+    print(f"    - Resolusi identitas: {report['records']} baris -> {report['identities']} "
+          f"identitas ({report['exact_merges']} gabung {id_col}, "
+          f"{report['fuzzy_merges']} gabung nama; {report['pairs_scored']} pasangan diskor)")
+
+    deduped = resolved.drop_duplicates(subset=[IDENTITY_COLUMN], keep='first')
+    return deduped.drop(columns=[IDENTITY_COLUMN])
@@ -31,8 +31,26 @@ Referensi:
 """
 
 import sys
+
+# Mode --summary-only dan subcommand check/drilldown (summary.py,
+# target_check.py, provenance.py) tidak boleh memuat stack plotting:
+# ditangani sebelum import visualisasi/breakdown di bawah
+if __name__ == "__main__" and sys.argv[1:2] == ['check']:
+    from target_check import main as check_main
+    sys.exit(check_main(sys.argv[2:]))
+if __name__ == "__main__" and sys.argv[1:2] == ['drilldown']:
+    from provenance import main as drilldown_main
+    sys.exit(drilldown_main(sys.argv[2:]))
+if __name__ == "__main__" and '--summary-only' in sys.argv[1:]:
+    from summary import main as summary_main
+    sys.exit(summary_main([arg for arg in sys.argv[1:] if arg != '--summary-only'],
+                          ignore_unknown=True))
+
 import argparse
+import contextlib
 from datetime import datetime
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 import warnings
 
 warnings.filterwarnings('ignore')
@@ -42,9 +60,27 @@ from config import CONFIG, ALL_IKU, IKU_METADATA, IKU_EXPANSION
 from utils import (
     setup_publication_style,
     read_excel_iku,
+    set_frame_source,
+    get_frame_source,
     cleanup_output_folder,
     calculate_overall_stats
 )
+from exporters import add_figure_sink, remove_figure_sink, clear_figure_sinks
+from report import PdfReport
+from html_export import export_html_dashboard
+from results_bundle import ResultsBundle
+from tracing import span, traced, trace_file, start_worker_trace, trace_session, print_result
+from profiling import PROFILE_MODES, profile_session
+from readers import BACKENDS
+from validation import (
+    validate,
+    check_report,
+    format_report,
+    ValidatedFrames,
+    DataValidationError,
+    EXIT_INVALID
+)
+from provenance import ProvenanceIndex, register
 from processors import (
     IKU_PROCESSORS,
     COMBINED_PROCESSORS,
@@ -61,14 +97,11 @@ from visualizations import (
     create_vertical_bar_chart,
     create_summary_dashboard,
     create_breakdown_donut_charts,
-    create_main_iku_donut,
-    create_overall_achievement_dashboard,
-    create_overall_achievement_bullet,
-    create_overall_achievement_cards,
-    create_overall_achievement_bullet_4x2,
-    create_overall_achievement_thermometer,
-    create_overall_achievement_waffle
+    create_main_iku_donut
 )
+from achievement import achievement_model
+from summary import iku_label
+import overall
 
 # Import category breakdown functions
 from breakdown.iku_11_breakdown import create_iku_11_breakdown
@@ -100,12 +133,216 @@ CATEGORY_BREAKDOWN_FUNCTIONS = {
     '81': create_iku_81_breakdown,
 }
 
+# File input yang dibaca tiap category breakdown (default: pembilang + penyebut)
+BREAKDOWN_INPUTS = {
+    '42': ('pembilang',),
+}
+
+
+# ============================================================================
+# CATEGORY BREAKDOWN (SERIAL / PARALLEL WORKERS)
+# ============================================================================
+
+def run_category_breakdown(iku_number):
+    """
+    Jalankan category breakdown satu IKU
+
+    Returns:
+    --------
+    list : List of saved file paths (kosong jika error)
+    """
+    with span(f'breakdown {iku_number}', iku=iku_number) as breakdown_span:
+        try:
+            return CATEGORY_BREAKDOWN_FUNCTIONS[iku_number]() or []
+        except Exception as e:
+            breakdown_span.fail(e)
+            print(f"  ⚠️  Error creating breakdown for IKU {iku_number}: {e}")
+            return []
+
+
+def _init_render_worker(frame_source=None, trace_path=None, page_sink=None):
+    """
+    Initializer worker process: tanpa figure sink milik parent, style
+    publikasi, DataFrame input dari shared memory parent (jika ada), span
+    yang ditulis ke file trace parent, dan halaman PDF langsung ke spool
+    laporan parent (jika laporan aktif)
+    """
+    clear_figure_sinks()
+    if page_sink is not None:
+        add_figure_sink(page_sink)
+    start_worker_trace(trace_path)
+    set_frame_source(frame_source)
+    setup_publication_style()
+
+
+def run_category_breakdowns(iku_list, workers=1, report=None):
+    """
+    Jalankan category breakdown untuk semua IKU di iku_list
+
+    Dengan workers > 1, setiap IKU di-render di worker process terpisah.
+    DataFrame input yang dibaca breakdown terpilih (BREAKDOWN_INPUTS)
+    dibaca sekali oleh parent (dari Excel atau results bundle) dan
+    dibagikan ke worker lewat shared memory (shared_frames.py, butuh
+    pyarrow; tanpa pyarrow worker membaca input sendiri).
+    Worker menulis halaman PDF-nya sendiri ke spool laporan parent
+    (report.worker_pages); parent hanya mencatat urutannya.
+
+    Parameters:
+    -----------
+    iku_list : list
+        List IKU (hanya yang punya category breakdown yang diproses)
+    workers : int
+        Jumlah worker process (1 = serial di process ini)
+    report : PdfReport, optional
+        Laporan PDF aktif
+
+    Returns:
+    --------
+    list : List of saved file paths
+    """
+    breakdown_ikus = [iku for iku in iku_list if iku in CATEGORY_BREAKDOWN_FUNCTIONS]
+    all_files = []
+
+    if workers <= 1:
+        for iku in breakdown_ikus:
+            all_files.extend(run_category_breakdown(iku))
+        return all_files
+
+    try:
+        from shared_frames import SharedFrameStore
+    except ImportError:
+        # Tanpa pyarrow: worker membaca input sendiri dari sumber aktif
+        print("  ⚠️  pyarrow tidak terpasang; worker membaca input tanpa shared memory")
+        store = contextlib.nullcontext()
+        frame_source = get_frame_source()
+    else:
+        store = SharedFrameStore.from_current_source(_breakdown_inputs(breakdown_ikus))
+        frame_source = store.source()
+
+    with store, ProcessPoolExecutor(max_workers=workers,
+                                    initializer=_init_render_worker,
+                                    initargs=(frame_source, trace_file(),
+                                              _worker_page_sink(report))) as executor:
+        for files in executor.map(run_category_breakdown, breakdown_ikus):
+            all_files.extend(files)
+            _add_worker_pages(report, files)
+
+    return all_files
+
+
+def _breakdown_inputs(breakdown_ikus):
+    """Key (iku, file_type) input yang dibaca category breakdown terpilih"""
+    return [(iku, file_type) for iku in breakdown_ikus
+            for file_type in BREAKDOWN_INPUTS.get(iku, ('pembilang', 'penyebut'))]
+
+
+def _worker_page_sink(report):
+    """Figure sink halaman PDF untuk worker (None jika laporan tidak aktif)"""
+    return report.worker_pages if report is not None else None
+
+
+def _add_worker_pages(report, files):
+    """Catat halaman PDF yang ditulis worker ke laporan parent (satu per chart)"""
+    if report is None:
+        return
+    for file in files:
+        file = Path(file)
+        if file.suffix == '.png' and file.parent.name == 'png':
+            report.add_worker_page(file.stem)
+
+
+# ============================================================================
+# OVERALL ACHIEVEMENT STYLES (SERIAL / PARALLEL WORKERS)
+# ============================================================================
+
+def run_overall_style(style, model):
+    """
+    Render satu style overall achievement dari AchievementModel
+
+    Returns:
+    --------
+    list : List of saved file paths (kosong jika error)
+    """
+    with span(f'overall {style}', style=style) as style_span:
+        try:
+            return overall.load_style(style)(model) or []
+        except Exception as e:
+            style_span.fail(e)
+            print(f"  ⚠️  Error creating {overall.STYLES[style]['filename']}: {e}")
+            return []
+
+
+def run_overall_styles(model, styles=None, workers=1, report=None):
+    """
+    Render style overall achievement terpilih dari satu AchievementModel
+
+    Model (nilai capaian, status, teks) dihitung sekali oleh parent;
+    dengan workers > 1 setiap style di-render di worker process terpisah
+    (model dikirim ke worker, tanpa shared memory karena hanya 8 baris).
+    Modul style dimuat dari registry overall/ hanya jika dipilih.
+
+    Parameters:
+    -----------
+    model : AchievementModel
+        Capaian 8 IKU utama
+    styles : list, optional
+        Nama style (overall.parse_styles); default semua style terdaftar
+    workers : int
+        Jumlah worker process (1 = serial di process ini)
+    report : PdfReport, optional
+        Laporan PDF aktif
+
+    Returns:
+    --------
+    list : List of saved file paths
+    """
+    styles = overall.available_styles() if styles is None else styles
+    workers = min(workers, len(styles))
+    all_files = []
+
+    def announce(number, style, files):
+        spec = overall.STYLES[style]
+        print(f"\n  [Style {number}] {spec['title']}...")
+        if files:
+            print(f"    ✅ {spec['filename']}.png")
+
+    if workers <= 1:
+        for number, style in enumerate(styles, 1):
+            files = run_overall_style(style, model)
+            announce(number, style, files)
+            all_files.extend(files)
+        return all_files
+
+    with ProcessPoolExecutor(max_workers=workers,
+                             initializer=_init_render_worker,
+                             initargs=(None, trace_file(), _worker_page_sink(report))) as executor:
+        results = executor.map(run_overall_style, styles, [model] * len(styles))
+        for number, (style, files) in enumerate(zip(styles, results), 1):
+            announce(number, style, files)
+            all_files.extend(files)
+            _add_worker_pages(report, files)
+
+    return all_files
+
+
+def _finish_report(report, all_stats, all_data=None):
+    """Tutup laporan PDF (tabel ringkasan + daftar isi) jika aktif"""
+    if report is None:
+        return
+
+    print(f"\n{'='*70}")
+    print("MENYUSUN LAPORAN PDF")
+    print(f"{'='*70}")
+    remove_figure_sink(report)
+    with span('pdf report'):
+        report.close(all_stats, all_data)
+
 
 # ============================================================================
 # MAIN ORCHESTRATION
 # ============================================================================
 
-def process_single_iku(iku_number):
+def process_single_iku(iku_number, render=True, precomputed=None):
     """
     Proses satu IKU lengkap: baca data, proses, visualisasi
 
@@ -113,6 +350,11 @@ def process_single_iku(iku_number):
     -----------
     iku_number : str
         Nomor IKU (1, 11, 12, 13, 21, 22, 23, 31, 33, 41, 42)
+    render : bool
+        Jika False, hanya hitung data & statistik (tanpa chart)
+    precomputed : dict, optional
+        {'data', 'stats'} dari results bundle; jika ada, langkah baca &
+        proses dilewati dan hanya visualisasi yang dibuat
 
     Returns:
     --------
@@ -122,75 +364,116 @@ def process_single_iku(iku_number):
     print(f"IKU {iku_number}: {IKU_METADATA[iku_number]['title']}")
     print(f"{'='*70}")
 
-    try:
-        # Special handling untuk IKU gabungan (1, 2, 3, 4)
-        if iku_number in COMBINED_PROCESSORS:
-            process_func, entity_type, sub_ikus = COMBINED_PROCESSORS[iku_number]
-
-            print(f"  [1/3] Menggabungkan data IKU {sub_ikus}...")
-            data, stats, df_pembilang, df_penyebut = process_func()
-
-            print("  [2/3] Statistik gabungan:")
-            print(f"        Pembilang: {stats['pembilang']} {entity_type}")
-            print(f"        Penyebut: {stats['penyebut']} {entity_type}")
+    with span(f'IKU {iku_number}', iku=iku_number) as iku_span:
+        try:
+            # Data & statistik sudah dihitung di fase compute (results bundle)
+            if precomputed is not None:
+                data, stats = precomputed['data'], precomputed['stats']
+                print(f"  [1/2] Data dari results bundle: {stats['persentase']}% "
+                      f"({stats['pembilang']}/{stats['penyebut']})")
+
+                files = []
+                if render:
+                    print("  [2/2] Membuat visualisasi (vertical only)...")
+                    target = CONFIG['target_values'].get(iku_number)
+                    with span('render'):
+                        files.append(create_vertical_bar_chart(data, iku_number, target))
+
+                print(f"  ✅ IKU {iku_number} selesai (dari bundle)\n")
+
+                return {
+                    'data': data,
+                    'stats': stats,
+                    'files': files,
+                    'provenance': precomputed.get('provenance')
+                }
+
+            # Special handling untuk IKU gabungan (1, 2, 3, 4)
+            if iku_number in COMBINED_PROCESSORS:
+                process_func, entity_type, sub_ikus = COMBINED_PROCESSORS[iku_number]
+
+                print(f"  [1/3] Menggabungkan data IKU {sub_ikus}...")
+                with span('process'):
+                    data, stats, df_pembilang, df_penyebut = process_func()
+                with span('provenance'):
+                    provenance = register(ProvenanceIndex.build(iku_number, df_pembilang, df_penyebut))
+
+                print("  [2/3] Statistik gabungan:")
+                print(f"        Pembilang: {stats['pembilang']} {entity_type}")
+                print(f"        Penyebut: {stats['penyebut']} {entity_type}")
+                print(f"        Persentase: {stats['persentase']}%")
+
+                # Buat visualisasi (hanya vertical untuk IKU gabungan)
+                files = []
+                if render:
+                    print("  [3/3] Membuat visualisasi (vertical only)...")
+                    target = CONFIG['target_values'].get(iku_number)
+                    with span('render'):
+                        files.append(create_vertical_bar_chart(data, iku_number, target))
+
+                print(f"  ✅ IKU {iku_number} (Gabungan) selesai diproses\n")
+
+                return {
+                    'data': data,
+                    'stats': stats,
+                    'files': files,
+                    'provenance': provenance
+                }
+
+            # Standard processing untuk IKU lainnya
+            # 1. Baca data
+            print("  [1/4] Membaca data...")
+            with span('read'):
+                df_pembilang = read_excel_iku(iku_number, 'pembilang')
+                df_penyebut = read_excel_iku(iku_number, 'penyebut')
+
+            # 2. Hitung statistik keseluruhan
+            print("  [2/4] Menghitung statistik...")
+            with span('stats'):
+                stats = calculate_overall_stats(df_pembilang, df_penyebut)
+            print(f"        Pembilang: {stats['pembilang']}")
+            print(f"        Penyebut: {stats['penyebut']}")
             print(f"        Persentase: {stats['persentase']}%")
 
-            # Buat visualisasi (hanya vertical untuk IKU gabungan)
-            print("  [3/3] Membuat visualisasi (vertical only)...")
-            target = CONFIG['target_values'].get(iku_number)
+            # 3. Proses data per prodi
+            print("  [3/4] Memproses data per program studi...")
+            if iku_number in IKU_PROCESSORS:
+                with span('process'):
+                    data = IKU_PROCESSORS[iku_number](df_pembilang, df_penyebut)
+            else:
+                raise ValueError(f"IKU number tidak valid: {iku_number}")
+            with span('provenance'):
+                provenance = register(ProvenanceIndex.build(iku_number, df_pembilang, df_penyebut))
+
+            # 4. Buat visualisasi (vertical only - standardized)
             files = []
-            files.append(create_vertical_bar_chart(data, iku_number, target))
+            if render:
+                print("  [4/4] Membuat visualisasi (vertical only)...")
+                target = CONFIG['target_values'].get(iku_number)
+                with span('render'):
+                    files.append(create_vertical_bar_chart(data, iku_number, target))
 
-            print(f"  ✅ IKU {iku_number} (Gabungan) selesai diproses\n")
+            print(f"  ✅ IKU {iku_number} selesai diproses\n")
 
             return {
                 'data': data,
                 'stats': stats,
-                'files': files
+                'files': files,
+                'provenance': provenance
             }
 
-        # Standard processing untuk IKU lainnya
-        # 1. Baca data
-        print("  [1/4] Membaca data...")
-        df_pembilang = read_excel_iku(iku_number, 'pembilang')
-        df_penyebut = read_excel_iku(iku_number, 'penyebut')
-
-        # 2. Hitung statistik keseluruhan
-        print("  [2/4] Menghitung statistik...")
-        stats = calculate_overall_stats(df_pembilang, df_penyebut)
-        print(f"        Pembilang: {stats['pembilang']}")
-        print(f"        Penyebut: {stats['penyebut']}")
-        print(f"        Persentase: {stats['persentase']}%")
-
-        # 3. Proses data per prodi
-        print("  [3/4] Memproses data per program studi...")
-        if iku_number in IKU_PROCESSORS:
-            data = IKU_PROCESSORS[iku_number](df_pembilang, df_penyebut)
-        else:
-            raise ValueError(f"IKU number tidak valid: {iku_number}")
-
-        # 4. Buat visualisasi (vertical only - standardized)
-        print("  [4/4] Membuat visualisasi (vertical only)...")
-        target = CONFIG['target_values'].get(iku_number)
-        files = []
-        files.append(create_vertical_bar_chart(data, iku_number, target))
-
-        print(f"  ✅ IKU {iku_number} selesai diproses\n")
-
-        return {
-            'data': data,
-            'stats': stats,
-            'files': files
-        }
-
-    except Exception as e:
-        print(f"  ❌ Error: {e}\n")
-        import traceback
-        traceback.print_exc()
-        return None
+        except Exception as e:
+            iku_span.fail(e)
+            print(f"  ❌ Error: {e}\n")
+            import traceback
+            traceback.print_exc()
+            return None
 
 
-def main(iku_list=None, skip_breakdown=False, skip_dashboard=False, skip_cleanup=False, only_4x2=False):
+@traced('run')
+def main(iku_list=None, skip_breakdown=False, skip_dashboard=False, skip_cleanup=False, only_4x2=False,
+         png_variants=False, report=None, workers=1, html=False, html_only=False, bundle=None,
+         reader=None, styles=None, strict=None, validate_data=None):
     """
     Main function - Orchestrate seluruh proses visualisasi
 
@@ -206,7 +489,56 @@ def main(iku_list=None, skip_breakdown=False, skip_dashboard=False, skip_cleanup
         Jika True, tidak menghapus file output sebelumnya
     only_4x2 : bool
         Jika True, hanya generate overall achievement dashboard 4x2
+    png_variants : bool
+        Jika True, buat juga varian PNG (150 DPI, 72 DPI, thumbnail) dari
+        render resolusi penuh yang sama
+    report : str, optional
+        'pdf' untuk menyusun semua figure ke satu laporan PDF (streaming)
+    workers : int
+        Jumlah worker process untuk category breakdown, atau untuk style
+        overall achievement pada mode only_4x2 (default: 1 = serial)
+    html : bool
+        Jika True, export juga dashboard HTML interaktif (output/IKU_dashboard.html)
+    html_only : bool
+        Jika True, hanya hitung data lalu export dashboard HTML (tanpa
+        render matplotlib dan tanpa menghapus output lama)
+    bundle : str or Path, optional
+        Folder results bundle (python results_bundle.py). Jika diisi, fase
+        render memakai data dari bundle - tidak ada file Excel yang dibaca
+    reader : str, optional
+        Backend pembaca Excel (readers.py); default CONFIG['reader_backend']
+    styles : str or list, optional
+        Style overall achievement yang dirender (mis. 'donut,bullet4x2',
+        'all', 'none'); default CONFIG['overall_styles'] atau
+        CONFIG['overall_styles_4x2'] pada mode only_4x2
+    strict : bool, optional
+        Batalkan run (DataValidationError) sebelum render jika validasi
+        data menemukan error; default CONFIG['validation_strict']
+    validate_data : bool, optional
+        Jalankan validasi data input; default CONFIG['validate_data']
     """
+    if html_only:
+        html = True
+        skip_breakdown = skip_dashboard = skip_cleanup = True
+        report = None
+
+    if png_variants:
+        CONFIG['export_png_variants'] = True
+
+    if reader is not None:
+        CONFIG['reader_backend'] = reader
+
+    # Style overall achievement (modul style hanya dimuat jika dipilih)
+    if styles is None:
+        styles = CONFIG['overall_styles_4x2'] if only_4x2 else CONFIG['overall_styles']
+    styles = overall.parse_styles(styles)
+
+    # Render dari results bundle: semua read_excel_iku dilayani bundle
+    results_bundle = None
+    if bundle is not None:
+        results_bundle = ResultsBundle(bundle)
+        set_frame_source(results_bundle)
+
     # Default: proses semua IKU
     if iku_list is None:
         iku_list = ALL_IKU.copy()
@@ -230,12 +562,44 @@ def main(iku_list=None, skip_breakdown=False, skip_dashboard=False, skip_cleanup
     print(f"Waktu: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"Output directory: {CONFIG['base_path'] / CONFIG['output_dir']}")
     print(f"Resolution: {CONFIG['dpi']} DPI")
+    if CONFIG['export_png_variants']:
+        print(f"PNG variants: {', '.join(CONFIG['png_variants'])}")
     print(f"IKU yang diproses: {', '.join(iku_list)}")
+    if workers > 1:
+        print(f"Workers ({'overall styles' if only_4x2 else 'category breakdown'}): {workers}")
+    if results_bundle is None:
+        print(f"Reader backend: {CONFIG['reader_backend']}")
+    print(f"Overall styles: {', '.join(styles) or '-'}")
+    if results_bundle is not None:
+        print(f"Results bundle: {results_bundle.bundle_dir} "
+              f"(dibuat {results_bundle.manifest['created_at']})")
+
+    # Validasi data input sebelum output lama dihapus dan sebelum render
+    if validate_data is None:
+        validate_data = CONFIG['validate_data']
+    if validate_data:
+        validated_frames = {}
+        with span('validation') as validation_span:
+            validation_report = validate(iku_list, validated_frames)
+            validation_span.add(errors=validation_report['errors'],
+                                warnings=validation_report['warnings'])
+        print(f"\n{format_report(validation_report)}")
+        check_report(validation_report,
+                     CONFIG['validation_strict'] if strict is None else strict)
+        # Processor memakai frame yang sudah dibaca validasi
+        set_frame_source(ValidatedFrames(validated_frames, get_frame_source()))
 
     # Clean output folder (opsional)
     if not skip_cleanup:
         cleanup_output_folder()
 
+    # Laporan PDF: setiap figure yang disimpan langsung ditulis ke PDF
+    pdf_report = None
+    if report == 'pdf':
+        pdf_report = PdfReport(CONFIG['base_path'] / CONFIG['output_dir'] / 'IKU_report.pdf')
+        add_figure_sink(pdf_report)
+        print(f"Laporan PDF: {pdf_report.pdf_file}")
+
     # Setup matplotlib style
     setup_publication_style()
 
@@ -261,43 +625,32 @@ def main(iku_list=None, skip_breakdown=False, skip_dashboard=False, skip_cleanup
         }
 
         for iku_num, process_func in combined_ikus.items():
-            try:
-                print(f"  Collecting stats for IKU {iku_num}...")
-                data, stats, df_pembilang, df_penyebut = process_func()
-                all_stats[iku_num] = stats
-            except Exception as e:
-                print(f"  ⚠️  Error collecting IKU {iku_num}: {e}")
-
-        # Create 4x2 dashboards (all 6 styles)
-        print(f"\n{'='*70}")
-        print("MEMBUAT OVERALL ACHIEVEMENT DASHBOARDS (6 STYLES)")
-        print(f"{'='*70}")
-
-        print("\n  [Style 1] Donut/Gauge Chart (4x2 Grid)...")
-        create_overall_achievement_dashboard(all_stats)
-        print("    ✅ IKU_overall_achievement_4x2.png")
-
-        print("\n  [Style 2] Bullet Chart (Vertical List)...")
-        create_overall_achievement_bullet(all_stats)
-        print("    ✅ IKU_overall_achievement_bullet.png")
+            with span(f'IKU {iku_num}', iku=iku_num) as iku_span:
+                try:
+                    print(f"  Collecting stats for IKU {iku_num}...")
+                    data, stats, df_pembilang, df_penyebut = process_func()
+                    all_stats[iku_num] = stats
+                except Exception as e:
+                    iku_span.fail(e)
+                    print(f"  ⚠️  Error collecting IKU {iku_num}: {e}")
 
-        print("\n  [Style 3] KPI Cards (Modern Dashboard)...")
-        create_overall_achievement_cards(all_stats)
-        print("    ✅ IKU_overall_achievement_cards.png")
+        # Create 4x2 dashboards (style terpilih)
+        if styles:
+            print(f"\n{'='*70}")
+            print(f"MEMBUAT OVERALL ACHIEVEMENT DASHBOARDS ({len(styles)} STYLES)")
+            print(f"{'='*70}")
 
-        print("\n  [Style 4] Bullet Chart (4x2 Grid - Compact)...")
-        create_overall_achievement_bullet_4x2(all_stats)
-        print("    ✅ IKU_overall_achievement_bullet_4x2.png")
+            # Capaian dihitung sekali, semua style hanya me-render model yang sama
+            model = achievement_model(all_stats)
+            with span('overall achievement', workers=workers):
+                run_overall_styles(model, styles, workers=workers, report=pdf_report)
 
-        print("\n  [Style 5] Thermometer Chart (4x2 Grid)...")
-        create_overall_achievement_thermometer(all_stats)
-        print("    ✅ IKU_overall_achievement_thermometer.png")
+            print(f"\n  ✅ Overall achievement dashboards selesai dibuat ({len(styles)} styles)")
 
-        print("\n  [Style 6] Waffle Chart (4x2 Grid)...")
-        create_overall_achievement_waffle(all_stats)
-        print("    ✅ IKU_overall_achievement_waffle.png")
+        _finish_report(pdf_report, all_stats)
 
-        print("\n  ✅ Semua overall achievement dashboards selesai dibuat (6 styles)")
+        if html:
+            export_html_dashboard(all_stats)
 
         return {'stats': all_stats}
 
@@ -310,7 +663,8 @@ def main(iku_list=None, skip_breakdown=False, skip_dashboard=False, skip_cleanup
         if iku not in ALL_IKU:
             print(f"\n⚠️  IKU {iku} tidak valid. IKU yang tersedia: {', '.join(ALL_IKU)}")
             continue
-        result = process_single_iku(iku)
+        precomputed = results_bundle.result(iku) if results_bundle is not None else None
+        result = process_single_iku(iku, render=not html_only, precomputed=precomputed)
         if result:
             all_results[iku] = result
             all_stats[iku] = result['stats']
@@ -321,7 +675,8 @@ def main(iku_list=None, skip_breakdown=False, skip_dashboard=False, skip_cleanup
         print(f"\n{'='*70}")
         print("MEMBUAT SUMMARY DASHBOARD")
         print(f"{'='*70}")
-        create_summary_dashboard(all_stats, all_data)
+        with span('summary dashboard'):
+            create_summary_dashboard(all_stats, all_data)
 
     # Buat breakdown donut charts (opsional)
     if not skip_breakdown:
@@ -329,34 +684,35 @@ def main(iku_list=None, skip_breakdown=False, skip_dashboard=False, skip_cleanup
         print("MEMBUAT BREAKDOWN DONUT CHARTS")
         print(f"{'='*70}")
 
-        # Define main IKU groups and their sub-components
-        iku_groups = {
-            '1': ['11', '12', '13'],
-            '2': ['21', '22', '23'],
-            '3': ['31', '33'],
-            '4': ['41', '42'],
-            # IKU 5 and 6 are number-based, use combined stats directly
-            '7': ['71'],
-            '8': ['81']
-        }
+        with span('donut charts'):
+            # Define main IKU groups and their sub-components
+            iku_groups = {
+                '1': ['11', '12', '13'],
+                '2': ['21', '22', '23'],
+                '3': ['31', '33'],
+                '4': ['41', '42'],
+                # IKU 5 and 6 are number-based, use combined stats directly
+                '7': ['71'],
+                '8': ['81']
+            }
 
-        for main_iku, sub_ikus in iku_groups.items():
-            # Check if we have stats for this main IKU's sub-components
-            sub_iku_stats = {s: all_stats[s] for s in sub_ikus if s in all_stats}
+            for main_iku, sub_ikus in iku_groups.items():
+                # Check if we have stats for this main IKU's sub-components
+                sub_iku_stats = {s: all_stats[s] for s in sub_ikus if s in all_stats}
 
-            if sub_iku_stats:
-                print(f"\n  IKU {main_iku} breakdown ({', '.join(sub_iku_stats.keys())})...")
-                create_breakdown_donut_charts(main_iku, sub_iku_stats)
+                if sub_iku_stats:
+                    print(f"\n  IKU {main_iku} breakdown ({', '.join(sub_iku_stats.keys())})...")
+                    create_breakdown_donut_charts(main_iku, sub_iku_stats)
 
-                # Also create main IKU donut if combined stats available
-                if main_iku in all_stats:
-                    create_main_iku_donut(main_iku, all_stats[main_iku])
+                    # Also create main IKU donut if combined stats available
+                    if main_iku in all_stats:
+                        create_main_iku_donut(main_iku, all_stats[main_iku])
 
-        # Special handling for IKU 5 and 6 (number-based, no sub-IKU breakdown)
-        for num_based_iku in ['5', '6']:
-            if num_based_iku in all_stats:
-                print(f"\n  IKU {num_based_iku} (number-based)...")
-                create_main_iku_donut(num_based_iku, all_stats[num_based_iku])
+            # Special handling for IKU 5 and 6 (number-based, no sub-IKU breakdown)
+            for num_based_iku in ['5', '6']:
+                if num_based_iku in all_stats:
+                    print(f"\n  IKU {num_based_iku} (number-based)...")
+                    create_main_iku_donut(num_based_iku, all_stats[num_based_iku])
 
         print("\n  ✅ Breakdown donut charts selesai dibuat")
 
@@ -365,30 +721,39 @@ def main(iku_list=None, skip_breakdown=False, skip_dashboard=False, skip_cleanup
         print("MEMBUAT CATEGORY BREAKDOWN CHARTS")
         print(f"{'='*70}")
 
-        for iku in iku_list:
-            if iku in CATEGORY_BREAKDOWN_FUNCTIONS:
-                try:
-                    CATEGORY_BREAKDOWN_FUNCTIONS[iku]()
-                except Exception as e:
-                    print(f"  ⚠️  Error creating breakdown for IKU {iku}: {e}")
+        with span('category breakdown', workers=workers):
+            run_category_breakdowns(iku_list, workers=workers, report=pdf_report)
 
         print("\n  ✅ Category breakdown charts selesai dibuat")
 
-    # Create overall achievement dashboard (4x2 grid)
-    if all_stats:
+    # Create overall achievement dashboard (style terpilih, default donut 4x2)
+    if all_stats and styles and not html_only:
         print(f"\n{'='*70}")
-        print("MEMBUAT OVERALL ACHIEVEMENT DASHBOARD (4x2)")
+        print("MEMBUAT OVERALL ACHIEVEMENT DASHBOARD")
         print(f"{'='*70}")
-        create_overall_achievement_dashboard(all_stats)
+        with span('overall achievement', workers=workers):
+            run_overall_styles(achievement_model(all_stats), styles,
+                               workers=workers, report=pdf_report)
         print("  ✅ Overall achievement dashboard selesai dibuat")
 
-    # Print summary
-    print(f"\n{'='*70}")
-    print("RINGKASAN HASIL")
-    print(f"{'='*70}")
+    _finish_report(pdf_report, all_stats, all_data)
+
+    # Dashboard HTML (payload JSON, render di browser)
+    if html:
+        print(f"\n{'='*70}")
+        print("MEMBUAT DASHBOARD HTML")
+        print(f"{'='*70}")
+        with span('html dashboard'):
+            export_html_dashboard(all_stats, all_data)
+
+    # Print summary (tetap tampil dengan --quiet)
+    print_result(f"\n{'='*70}")
+    print_result("RINGKASAN HASIL")
+    print_result(f"{'='*70}")
     for iku, stats in all_stats.items():
         iku_title = IKU_METADATA[iku]['title'].split(':')[0] if ':' in IKU_METADATA[iku]['title'] else f"IKU {iku}"
-        print(f"{iku_title}: {stats['persentase']}% ({stats['pembilang']}/{stats['penyebut']})")
+        print_result(f"{iku_label(iku):<5} {iku_title}: {stats['persentase']}% "
+                     f"({stats['pembilang']}/{stats['penyebut']})")
 
     print(f"\n{'='*70}")
     print("VISUALISASI SELESAI ✅")
@@ -407,6 +772,14 @@ def main(iku_list=None, skip_breakdown=False, skip_dashboard=False, skip_cleanup
     return all_results
 
 
+def _styles_arg(value):
+    """Validasi --styles (daftar style dipisah koma)"""
+    try:
+        return overall.parse_styles(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
 def parse_arguments():
     """Parse command line arguments"""
     parser = argparse.ArgumentParser(
@@ -418,6 +791,16 @@ Contoh penggunaan:
   python main_visualize_iku.py --iku 1            # Generate IKU 1 (gabungan 11,12,13)
   python main_visualize_iku.py --iku 31 33        # Generate IKU 31 dan 33 saja
   python main_visualize_iku.py --iku 4 --no-breakdown --no-dashboard  # IKU 4 saja
+  python main_visualize_iku.py --report pdf -j 4  # Laporan PDF, breakdown paralel
+  python main_visualize_iku.py --4x2-only --styles donut,bullet4x2  # 2 style overall saja
+  python main_visualize_iku.py --summary-only --json   # Ringkasan JSON, tanpa chart
+  python main_visualize_iku.py check --junit out.xml   # Gate CI regresi target
+  python main_visualize_iku.py drilldown 31 Fisika     # Baris di balik angka prodi
+  python main_visualize_iku.py --strict           # Batal sebelum render jika data tidak valid
+  python main_visualize_iku.py --html-only        # Dashboard HTML saja (tanpa render PNG)
+  python main_visualize_iku.py --bundle bundle    # Render dari results bundle (tanpa baca Excel)
+  python main_visualize_iku.py --quiet --trace    # Tanpa progress, trace ke output/IKU_trace.jsonl
+  python main_visualize_iku.py --profile cprofile # Hotspot per stage (output/profile/)
 
 IKU yang tersedia: {", ".join(ALL_IKU)}
 
@@ -462,19 +845,137 @@ Mapping IKU (sesuai dokumen resmi):
         help='Hanya generate overall achievement dashboard 4x2'
     )
 
+    parser.add_argument(
+        '--png-variants',
+        action='store_true',
+        help='Buat juga varian PNG 150 DPI, 72 DPI, dan thumbnail (tanpa render ulang)'
+    )
+
+    parser.add_argument(
+        '--report',
+        choices=['pdf'],
+        help='Susun semua figure ke satu laporan (output/IKU_report.pdf) dengan daftar isi'
+    )
+
+    parser.add_argument(
+        '--html',
+        action='store_true',
+        help='Export juga dashboard HTML interaktif (output/IKU_dashboard.html)'
+    )
+
+    parser.add_argument(
+        '--html-only',
+        action='store_true',
+        help='Hanya hitung data dan export dashboard HTML (tanpa render PNG/SVG)'
+    )
+
+    parser.add_argument(
+        '--workers', '-j',
+        type=int,
+        default=1,
+        help='Jumlah worker process untuk category breakdown / style --4x2-only (default: 1)'
+    )
+
+    parser.add_argument(
+        '--bundle',
+        metavar='DIR',
+        help='Render dari results bundle hasil "python results_bundle.py DIR" (tanpa baca Excel)'
+    )
+
+    parser.add_argument(
+        '--reader',
+        choices=['auto'] + list(BACKENDS),
+        help='Backend pembaca Excel (default: auto = tercepat per ukuran file, lihat readers.py)'
+    )
+
+    parser.add_argument(
+        '--summary-only',
+        action='store_true',
+        help='Hanya ringkasan capaian (teks / --json) tanpa matplotlib; exit code 0 = '
+             'semua target terpenuhi, 1 = ada di bawah target, 2 = error (lihat summary.py)'
+    )
+
+    parser.add_argument(
+        '--json',
+        nargs='?',
+        const='-',
+        metavar='PATH',
+        help='Dengan --summary-only: tulis ringkasan JSON ke PATH (default: stdout)'
+    )
+
+    parser.add_argument(
+        '--styles',
+        type=_styles_arg,
+        help=f"Style overall achievement, dipisah koma: {', '.join(overall.available_styles())}, "
+             "all, none (default: CONFIG['overall_styles'], --4x2-only: CONFIG['overall_styles_4x2'])"
+    )
+
+    parser.add_argument(
+        '--strict',
+        action='store_true',
+        default=None,
+        help='Batalkan run sebelum render jika validasi data menemukan error '
+             '(ID ganda, ID tanpa penyebut, kolom hilang; lihat validation.py)'
+    )
+
+    parser.add_argument(
+        '--no-validate',
+        action='store_false',
+        dest='validate_data',
+        default=None,
+        help='Lewati validasi data input'
+    )
+
+    parser.add_argument(
+        '--trace',
+        nargs='?',
+        const=str(CONFIG['base_path'] / CONFIG['output_dir'] / 'IKU_trace.jsonl'),
+        metavar='FILE',
+        help='Tulis span tracing sebagai JSON lines (default: output/IKU_trace.jsonl)'
+    )
+
+    parser.add_argument(
+        '--profile',
+        choices=PROFILE_MODES,
+        help='Profile per stage: cProfile (.prof) atau tracemalloc (snapshot) di output/profile/'
+    )
+
+    parser.add_argument(
+        '--quiet', '-q',
+        action='store_true',
+        help='Sembunyikan output progress; hanya ringkasan hasil dan tabel ringkasan trace yang dicetak'
+    )
+
     return parser.parse_args()
 
 
 if __name__ == "__main__":
     try:
         args = parse_arguments()
-        results = main(
-            iku_list=args.iku,
-            skip_breakdown=args.no_breakdown,
-            skip_dashboard=args.no_dashboard,
-            skip_cleanup=args.no_cleanup,
-            only_4x2=args.only_4x2
-        )
+        # Ringkasan sampai level stage (run > IKU > stage); detail per
+        # chart ada di file --trace
+        with profile_session(args.profile), \
+                trace_session(args.trace, quiet=args.quiet, summary_depth=3):
+            results = main(
+                iku_list=args.iku,
+                skip_breakdown=args.no_breakdown,
+                skip_dashboard=args.no_dashboard,
+                skip_cleanup=args.no_cleanup,
+                only_4x2=args.only_4x2,
+                png_variants=args.png_variants,
+                report=args.report,
+                workers=args.workers,
+                html=args.html,
+                html_only=args.html_only,
+                bundle=args.bundle,
+                reader=args.reader,
+                styles=args.styles,
+                strict=args.strict,
+                validate_data=args.validate_data
+            )
+    except DataValidationError as e:
+        print(f"\n❌ {e} - run dibatalkan sebelum render (--strict)")
+        sys.exit(EXIT_INVALID)
     except KeyboardInterrupt:
         print("\n\n⚠️  Proses dibatalkan oleh user")
         sys.exit(1)
@@ -0,0 +1,150 @@
+"""
+============================================================================
+OVERALL - REGISTRY STYLE OVERALL ACHIEVEMENT DASHBOARD
+============================================================================
+
+Setiap style overall achievement (capaian 8 IKU utama) ada di modulnya
+sendiri di package ini dan didaftarkan dengan nama pendek:
+
+- donut       : Donut/Gauge 4x2       (overall/donut.py)
+- bullet      : Bullet chart vertikal (overall/bullet.py)
+- cards       : KPI cards             (overall/cards.py)
+- bullet4x2   : Bullet chart 4x2      (overall/bullet_4x2.py)
+- thermometer : Thermometer 4x2       (overall/thermometer.py)
+- waffle      : Waffle 4x2            (overall/waffle.py)
+
+Registry hanya menyimpan nama modul & fungsi; modul style (dan
+matplotlib) baru diimpor saat style tersebut dirender, sehingga style
+yang tidak dipilih tidak menambah waktu import maupun render.
+
+Style yang dirender dipilih dengan --styles donut,bullet4x2 atau
+CONFIG['overall_styles'] (run lengkap) / CONFIG['overall_styles_4x2']
+(mode --4x2-only). Style tambahan bisa didaftarkan dengan
+register_style().
+
+Author: Tim IKU FST
+Version: 2.0 (Modular)
+Last Updated: 2026-10-19
+============================================================================
+"""
+
+import importlib
+
+
+# ============================================================================
+# REGISTRY
+# ============================================================================
+
+# Nama style -> spesifikasi (urutan pendaftaran = urutan render)
+STYLES = {}
+
+# Fungsi render yang sudah dimuat {nama style: fungsi}
+_LOADED = {}
+
+
+def register_style(name, module, function, filename, title):
+    """
+    Daftarkan style overall achievement (tanpa mengimpor modulnya)
+
+    Parameters:
+    -----------
+    name : str
+        Nama pendek untuk --styles / CONFIG
+    module : str
+        Nama modul yang berisi fungsi render (mis. 'overall.donut')
+    function : str
+        Nama fungsi render; dipanggil dengan all_stats atau AchievementModel
+    filename : str
+        Nama file output (tanpa ekstensi), juga nama chart di chart server
+    title : str
+        Judul style untuk log
+    """
+    STYLES[name] = {
+        'module': module,
+        'function': function,
+        'filename': filename,
+        'title': title,
+    }
+    _LOADED.pop(name, None)
+
+
+def available_styles():
+    """Nama semua style terdaftar (urutan render)"""
+    return list(STYLES)
+
+
+def load_style(name):
+    """
+    Fungsi render style (modul diimpor saat pertama kali dibutuhkan)
+
+    Raises:
+    -------
+    ValueError : jika style tidak terdaftar
+    """
+    if name not in STYLES:
+        raise ValueError(f"Style '{name}' tidak dikenal. "
+                         f"Style yang tersedia: {', '.join(STYLES)}")
+    if name not in _LOADED:
+        spec = STYLES[name]
+        module = importlib.import_module(spec['module'])
+        _LOADED[name] = getattr(module, spec['function'])
+    return _LOADED[name]
+
+
+def style_for_function(function):
+    """Nama style untuk nama fungsi render (None jika tidak ada)"""
+    for name, spec in STYLES.items():
+        if spec['function'] == function:
+            return name
+    return None
+
+
+def parse_styles(styles):
+    """
+    Normalisasi pilihan style menjadi list nama (urutan registry)
+
+    Parameters:
+    -----------
+    styles : str or list
+        'donut,bullet4x2', list nama, 'all' (semua style), atau
+        'none' / '' (tidak ada)
+
+    Returns:
+    --------
+    list : Nama style terpilih, tanpa duplikat
+
+    Raises:
+    -------
+    ValueError : jika ada nama style yang tidak dikenal
+    """
+    if isinstance(styles, str):
+        styles = [s.strip() for s in styles.split(',')]
+    # 'bullet_4x2' dan 'bullet4x2' sama-sama diterima
+    names = {s.strip().lower().replace('_', '') for s in styles if s and s.strip()}
+    if 'all' in names:
+        return available_styles()
+    names.discard('none')
+
+    unknown = sorted(names - set(STYLES))
+    if unknown:
+        raise ValueError(f"Style tidak dikenal: {', '.join(unknown)}. "
+                         f"Style yang tersedia: {', '.join(STYLES)}, all, none")
+    return [name for name in STYLES if name in names]
+
+
+# ============================================================================
+# STYLE BAWAAN
+# ============================================================================
+
+register_style('donut', 'overall.donut', 'create_overall_achievement_dashboard',
+               'IKU_overall_achievement_4x2', 'Donut/Gauge Chart (4x2 Grid)')
+register_style('bullet', 'overall.bullet', 'create_overall_achievement_bullet',
+               'IKU_overall_achievement_bullet', 'Bullet Chart (Vertical List)')
+register_style('cards', 'overall.cards', 'create_overall_achievement_cards',
+               'IKU_overall_achievement_cards', 'KPI Cards (Modern Dashboard)')
+register_style('bullet4x2', 'overall.bullet_4x2', 'create_overall_achievement_bullet_4x2',
+               'IKU_overall_achievement_bullet_4x2', 'Bullet Chart (4x2 Grid - Compact)')
+register_style('thermometer', 'overall.thermometer', 'create_overall_achievement_thermometer',
+               'IKU_overall_achievement_thermometer', 'Thermometer Chart (4x2 Grid)')
+register_style('waffle', 'overall.waffle', 'create_overall_achievement_waffle',
+               'IKU_overall_achievement_waffle', 'Waffle Chart (4x2 Grid)')
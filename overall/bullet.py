@@ -0,0 +1,141 @@
+"""
+============================================================================
+OVERALL BULLET - BULLET CHART VERTIKAL
+============================================================================
+
+Bullet chart (Stephen Few) 8 IKU dalam satu daftar vertikal.
+
+Author: Tim IKU FST
+Version: 2.0 (Modular)
+Last Updated: 2026-10-19
+============================================================================
+"""
+
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.patches import Patch
+from matplotlib.lines import Line2D
+
+from utils import save_figure
+from figures import managed_subplots
+from achievement import achievement_model, GAP, ON_TRACK, ACHIEVED
+from overall.common import OVERALL_LABELS, STATUS_COLORS
+
+
+def create_overall_achievement_bullet(all_stats):
+    """
+    Membuat dashboard capaian keseluruhan 8 IKU dalam format Bullet Chart
+    Bullet chart invented by Stephen Few as space-efficient alternative to gauges
+
+    Parameters:
+    -----------
+    all_stats : dict or AchievementModel
+        Dictionary berisi statistik semua IKU {iku_number: stats_dict},
+        atau model capaian yang sudah dihitung
+
+    Returns:
+    --------
+    list : List of saved file paths
+    """
+    model = achievement_model(all_stats)
+    iku_labels = OVERALL_LABELS['bullet']
+
+    # Create figure
+    with managed_subplots(figsize=(16, 10)) as (fig, ax):
+        y_positions = np.arange(len(model))[::-1]  # Reverse for top-to-bottom
+        bar_height = 0.6
+
+        # Color scheme for qualitative ranges (light to dark)
+        range_colors = ['#f0f0f0', '#d9d9d9', '#bdbdbd']  # Poor, Satisfactory, Good
+
+        for idx, iku in enumerate(model.ikus):
+            y = y_positions[idx]
+
+            if model.available[idx]:
+                actual_pct = model.actual_pct[idx]
+                target = model.target_pct[idx]
+                bar_color = STATUS_COLORS[model.status[idx]]
+
+                # Draw qualitative range backgrounds (scaled to max 150% for over-achievers)
+                max_range = max(150, actual_pct + 20)
+                range_widths = [max_range * 0.5, max_range * 0.75, max_range]
+
+                for i, width in enumerate(range_widths):
+                    ax.barh(y, width, height=bar_height * 1.5, left=0,
+                           color=range_colors[i], edgecolor='none', zorder=1)
+
+                # Draw actual value bar (thinner, on top)
+                ax.barh(y, min(actual_pct, max_range), height=bar_height * 0.6, left=0,
+                       color=bar_color, edgecolor='#1a1a1a', linewidth=1, zorder=3)
+
+                # Draw target marker (vertical line)
+                ax.plot([target, target], [y - bar_height * 0.75, y + bar_height * 0.75],
+                       color='#1a1a1a', linewidth=3, zorder=4)
+
+                # Add value text at end of bar
+                text_x = min(actual_pct, max_range) + 3
+                ax.text(text_x, y, model.value_text[idx], va='center', ha='left',
+                       fontsize=12, fontweight='bold', color=bar_color)
+
+                # Add status badge
+                badge_x = max_range + 25
+                ax.text(badge_x, y, model.status_text[idx], va='center', ha='left',
+                       fontsize=10, fontweight='bold', color='white',
+                       bbox=dict(boxstyle='round,pad=0.3', facecolor=bar_color,
+                                edgecolor='none', alpha=0.9))
+
+                # Add fraction text (number-based: target)
+                detail = model.detail_text[idx]
+                if not model.number_based[idx]:
+                    detail = f'({detail})'
+                ax.text(badge_x + 60, y, detail,
+                       va='center', ha='left', fontsize=9, color='#666666')
+
+            else:
+                # No data
+                ax.text(50, y, 'No Data', va='center', ha='center',
+                       fontsize=11, color='#999999', style='italic')
+
+        # Y-axis labels
+        ax.set_yticks(y_positions)
+        ax.set_yticklabels([iku_labels[iku] for iku in model.ikus],
+                           fontsize=11, fontweight='600')
+
+        # X-axis
+        ax.set_xlim(0, 220)
+        ax.set_xlabel('Persentase Capaian (%)', fontsize=12, fontweight='600')
+        ax.set_xticks([0, 25, 50, 75, 100, 125, 150])
+        ax.tick_params(axis='x', labelsize=10)
+
+        # Grid
+        ax.xaxis.grid(True, linestyle='--', alpha=0.4, zorder=0)
+        ax.set_axisbelow(True)
+
+        # Spines
+        ax.spines['top'].set_visible(False)
+        ax.spines['right'].set_visible(False)
+        ax.spines['left'].set_linewidth(1.5)
+        ax.spines['bottom'].set_linewidth(1.5)
+
+        # Title
+        ax.set_title('CAPAIAN IKU FAKULTAS SAINS & TEKNOLOGI\nUniversitas Jambi 2025',
+                    fontsize=16, fontweight='bold', pad=20, color='#1a1a1a')
+
+        # Legend
+        legend_elements = [
+            Patch(facecolor='#f0f0f0', edgecolor='#999999', label='Poor (<50%)'),
+            Patch(facecolor='#d9d9d9', edgecolor='#999999', label='Satisfactory (50-75%)'),
+            Patch(facecolor='#bdbdbd', edgecolor='#999999', label='Good (>75%)'),
+            Line2D([0], [0], color='#1a1a1a', linewidth=3, label='Target'),
+            Patch(facecolor=STATUS_COLORS[ACHIEVED], edgecolor='none', label='Achieved'),
+            Patch(facecolor=STATUS_COLORS[ON_TRACK], edgecolor='none', label='On Track'),
+            Patch(facecolor=STATUS_COLORS[GAP], edgecolor='none', label='Gap'),
+        ]
+        ax.legend(handles=legend_elements, loc='lower right', ncol=4,
+                 frameon=True, framealpha=0.95, fontsize=9)
+
+        plt.tight_layout()
+
+        saved_files = save_figure(fig, 'IKU_overall_achievement_bullet')
+
+    return saved_files
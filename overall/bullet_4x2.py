@@ -0,0 +1,118 @@
+"""
+============================================================================
+OVERALL BULLET 4x2 - BULLET CHART COMPACT
+============================================================================
+
+Bullet chart per IKU dalam grid 4x2.
+
+Author: Tim IKU FST
+Version: 2.0 (Modular)
+Last Updated: 2026-10-19
+============================================================================
+"""
+
+import matplotlib.pyplot as plt
+
+from utils import save_figure
+from figures import managed_subplots
+from achievement import achievement_model
+from overall.common import OVERALL_LABELS, STATUS_COLORS
+
+
+def create_overall_achievement_bullet_4x2(all_stats):
+    """
+    Membuat dashboard bullet chart dalam format 4x2 grid (compact)
+    Based on Stephen Few's bullet chart design
+
+    Parameters:
+    -----------
+    all_stats : dict or AchievementModel
+        Dictionary berisi statistik semua IKU {iku_number: stats_dict},
+        atau model capaian yang sudah dihitung
+
+    Returns:
+    --------
+    list : List of saved file paths
+    """
+    model = achievement_model(all_stats)
+    iku_labels = OVERALL_LABELS['compact']
+
+    # Create 4x2 grid
+    with managed_subplots(2, 4, figsize=(18, 8)) as (fig, axes):
+        axes = axes.flatten()
+
+        for idx, iku in enumerate(model.ikus):
+            ax = axes[idx]
+
+            if model.available[idx]:
+                actual_pct = model.actual_pct[idx]
+                target = model.target_pct[idx]
+                bar_color = STATUS_COLORS[model.status[idx]]
+
+                # Qualitative ranges (background)
+                max_val = max(120, actual_pct + 10)
+                range_colors = ['#f5f5f5', '#e0e0e0', '#bdbdbd']
+
+                for i, pct in enumerate([0.4, 0.7, 1.0]):
+                    ax.barh(0, max_val * pct, height=0.7, color=range_colors[i],
+                           edgecolor='none', zorder=1)
+
+                # Actual value bar
+                ax.barh(0, min(actual_pct, max_val), height=0.35, color=bar_color,
+                       edgecolor='#1a1a1a', linewidth=0.5, zorder=3)
+
+                # Target marker
+                ax.plot([target, target], [-0.4, 0.4], color='#1a1a1a',
+                       linewidth=3, zorder=4)
+
+                # IKU badge
+                ax.text(0.02, 0.95, f'IKU {iku}', transform=ax.transAxes,
+                       fontsize=10, fontweight='bold', color='white',
+                       bbox=dict(boxstyle='round,pad=0.3', facecolor='#424242',
+                                edgecolor='none'), va='top')
+
+                # Value and status at right
+                ax.text(max_val + 2, 0, model.value_text[idx], va='center', ha='left',
+                       fontsize=14, fontweight='bold', color=bar_color)
+
+                # Title below
+                ax.set_title(iku_labels[iku], fontsize=11, fontweight='600',
+                            pad=5, color='#333333')
+
+                # Status badge at bottom
+                ax.text(0.5, -0.25, model.status_text[idx], transform=ax.transAxes,
+                       ha='center', va='top', fontsize=9, fontweight='bold',
+                       color='white',
+                       bbox=dict(boxstyle='round,pad=0.3', facecolor=bar_color,
+                                edgecolor='none', alpha=0.9))
+
+                ax.set_xlim(0, max_val + 25)
+                ax.set_ylim(-0.6, 0.6)
+
+            else:
+                ax.text(0.5, 0.5, f'IKU {iku}\nNo Data', transform=ax.transAxes,
+                       ha='center', va='center', fontsize=12, color='#999999')
+
+            ax.set_yticks([])
+            ax.set_xticks([])
+            ax.spines['top'].set_visible(False)
+            ax.spines['right'].set_visible(False)
+            ax.spines['left'].set_visible(False)
+            ax.spines['bottom'].set_visible(False)
+
+        # Title
+        fig.suptitle('CAPAIAN IKU FAKULTAS SAINS & TEKNOLOGI',
+                    fontsize=18, fontweight='bold', y=0.98, color='#1a1a1a')
+        fig.text(0.5, 0.93, 'Universitas Jambi 2025 | Bullet Chart Style',
+                ha='center', fontsize=12, color='#666666', style='italic')
+
+        # Legend
+        fig.text(0.5, 0.02,
+                '█ Achieved   █ On Track   █ Gap   |   ▌Target Line   |   Background: Poor → Satisfactory → Good',
+                ha='center', fontsize=10, color='#666666')
+
+        plt.tight_layout(rect=[0.02, 0.05, 0.98, 0.91])
+
+        saved_files = save_figure(fig, 'IKU_overall_achievement_bullet_4x2')
+
+    return saved_files
@@ -0,0 +1,142 @@
+"""
+============================================================================
+OVERALL CARDS - KPI CARDS
+============================================================================
+
+KPI card per IKU: nilai utama, progress bar, dan indikator status.
+
+Author: Tim IKU FST
+Version: 2.0 (Modular)
+Last Updated: 2026-10-19
+============================================================================
+"""
+
+from matplotlib.patches import FancyBboxPatch
+
+from utils import save_figure
+from figures import managed_figure
+from cell_grid import add_patch_batch
+from achievement import achievement_model
+from overall.common import OVERALL_LABELS, STATUS_COLORS, STATUS_ARROWS
+
+
+def create_overall_achievement_cards(all_stats):
+    """
+    Membuat dashboard capaian keseluruhan 8 IKU dalam format Modern KPI Cards
+    Style: Large metric + progress bar + trend indicator
+
+    Parameters:
+    -----------
+    all_stats : dict or AchievementModel
+        Dictionary berisi statistik semua IKU {iku_number: stats_dict},
+        atau model capaian yang sudah dihitung
+
+    Returns:
+    --------
+    list : List of saved file paths
+    """
+    model = achievement_model(all_stats)
+    iku_labels = OVERALL_LABELS['full']
+
+    # Create figure with 4x2 grid
+    with managed_figure(figsize=(20, 12)) as fig:
+        # Create grid for cards
+        gs = fig.add_gridspec(2, 4, hspace=0.35, wspace=0.25,
+                              left=0.05, right=0.95, top=0.88, bottom=0.08)
+
+        for idx, iku in enumerate(model.ikus):
+            row = idx // 4
+            col = idx % 4
+
+            # Create card subplot
+            ax = fig.add_subplot(gs[row, col])
+
+            # Card background (semua patch card digambar sebagai satu collection)
+            card_patches = [FancyBboxPatch((0, 0), 1, 1,
+                                           boxstyle="round,pad=0.02,rounding_size=0.05",
+                                           facecolor='white', edgecolor='#e0e0e0',
+                                           linewidth=2)]
+
+            if model.available[idx]:
+                status_color = STATUS_COLORS[model.status[idx]]
+
+                # IKU number badge (top-left)
+                ax.text(0.08, 0.92, f'IKU {iku}', transform=ax.transAxes,
+                       fontsize=11, fontweight='bold', color='white',
+                       ha='left', va='top',
+                       bbox=dict(boxstyle='round,pad=0.3', facecolor='#424242',
+                                edgecolor='none'))
+
+                # Main value (large, centered)
+                ax.text(0.5, 0.58, model.value_text[idx], transform=ax.transAxes,
+                       fontsize=36, fontweight='bold', color=status_color,
+                       ha='center', va='center')
+
+                # Fraction/target text below main value
+                ax.text(0.5, 0.38, model.detail_text[idx], transform=ax.transAxes,
+                       fontsize=12, color='#666666',
+                       ha='center', va='center')
+
+                # Progress bar background
+                bar_y = 0.22
+                bar_height = 0.06
+                bar_width = 0.84
+                bar_x = 0.08
+
+                # Background bar
+                card_patches.append(FancyBboxPatch((bar_x, bar_y), bar_width, bar_height,
+                                                   boxstyle="round,pad=0.01,rounding_size=0.02",
+                                                   facecolor='#e0e0e0', edgecolor='none'))
+
+                # Progress bar (filled portion)
+                fill_width = bar_width * min(model.ratio[idx], 1.0)
+                card_patches.append(FancyBboxPatch((bar_x, bar_y), fill_width, bar_height,
+                                                   boxstyle="round,pad=0.01,rounding_size=0.02",
+                                                   facecolor=status_color, edgecolor='none'))
+
+                # Target marker on progress bar
+                if not model.number_based[idx]:
+                    target_x = bar_x + bar_width * (model.target[idx] / 100)
+                    ax.plot([target_x, target_x], [bar_y - 0.02, bar_y + bar_height + 0.02],
+                           color='#1a1a1a', linewidth=2, transform=ax.transAxes, zorder=3)
+
+                # Status badge with arrow (bottom)
+                ax.text(0.5, 0.08,
+                       f'{STATUS_ARROWS[model.status[idx]]} {model.status_text[idx]} {model.diff_text[idx]}',
+                       transform=ax.transAxes,
+                       fontsize=11, fontweight='bold', color=status_color,
+                       ha='center', va='center')
+
+                # IKU label (top, below badge)
+                ax.text(0.5, 0.78, iku_labels[iku], transform=ax.transAxes,
+                       fontsize=10, color='#424242', fontweight='600',
+                       ha='center', va='center', linespacing=1.2)
+
+            else:
+                # No data
+                ax.text(0.5, 0.5, f'IKU {iku}\nNo Data',
+                       transform=ax.transAxes,
+                       fontsize=14, color='#999999',
+                       ha='center', va='center', fontweight='bold')
+
+            add_patch_batch(ax, card_patches, transform=ax.transAxes, zorder=0)
+
+            ax.set_xlim(0, 1)
+            ax.set_ylim(0, 1)
+            ax.axis('off')
+
+        # Main title
+        fig.suptitle('CAPAIAN IKU FAKULTAS SAINS & TEKNOLOGI',
+                    fontsize=20, fontweight='bold', y=0.96, color='#1a1a1a')
+
+        fig.text(0.5, 0.92, 'Universitas Jambi 2025',
+                ha='center', fontsize=14, color='#666666', style='italic')
+
+        # Legend at bottom
+        fig.text(0.5, 0.03,
+                '▲ Achieved (Green)    ▶ On Track (Yellow)    ▼ Gap (Red)    |    Progress bar shows achievement vs target',
+                ha='center', fontsize=11, color='#666666')
+
+        saved_files = save_figure(fig, 'IKU_overall_achievement_cards')
+
+    return saved_files
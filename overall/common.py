@@ -0,0 +1,76 @@
+"""
+============================================================================
+OVERALL COMMON - LABEL & WARNA STATUS
+============================================================================
+
+Label IKU per layout dan palet status yang dipakai bersama oleh semua
+style overall achievement (status dari achievement.py).
+
+Author: Tim IKU FST
+Version: 2.0 (Modular)
+Last Updated: 2026-10-19
+============================================================================
+"""
+
+from achievement import GAP, ON_TRACK, ACHIEVED
+
+
+# Label IKU per layout (beda pemenggalan baris sesuai ruang yang tersedia)
+OVERALL_LABELS = {
+    # Donut 4x2 & KPI cards
+    'full': {
+        '1': 'Lulusan\nBekerja/Studi/Wiraswasta',
+        '2': 'Mahasiswa\nBerkegiatan/Prestasi',
+        '3': 'Dosen Tridharma\ndi PT Lain',
+        '4': 'Dosen Sertifikat\nDUDI/Praktisi',
+        '5': 'Luaran Dosen\nRekognisi Internasional',
+        '6': 'Kerjasama\nper Program Studi',
+        '7': 'Mata Kuliah\nPJBL/Case Method',
+        '8': 'Prodi Akreditasi\nInternasional'
+    },
+    # Bullet chart (label sumbu Y)
+    'bullet': {
+        '1': 'IKU 1: Lulusan Bekerja/\nStudi/Wiraswasta',
+        '2': 'IKU 2: Mahasiswa\nBerkegiatan/Prestasi',
+        '3': 'IKU 3: Dosen Tridharma\ndi PT Lain',
+        '4': 'IKU 4: Dosen Sertifikat\nDUDI/Praktisi',
+        '5': 'IKU 5: Luaran Dosen\nRekognisi Internasional',
+        '6': 'IKU 6: Kerjasama\nper Program Studi',
+        '7': 'IKU 7: Mata Kuliah\nPJBL/Case Method',
+        '8': 'IKU 8: Prodi Akreditasi\nInternasional'
+    },
+    # Bullet 4x2 & waffle (satu baris)
+    'compact': {
+        '1': 'Lulusan Bekerja/Studi',
+        '2': 'Mahasiswa Prestasi',
+        '3': 'Dosen Tridharma',
+        '4': 'Dosen DUDI/Praktisi',
+        '5': 'Luaran Rekognisi',
+        '6': 'Kerjasama/Prodi',
+        '7': 'MK PJBL/Case',
+        '8': 'Akreditasi Intl'
+    },
+    # Thermometer (kolom sempit di kiri)
+    'thermometer': {
+        '1': 'Lulusan\nBekerja/Studi',
+        '2': 'Mahasiswa\nPrestasi',
+        '3': 'Dosen\nTridharma',
+        '4': 'Dosen\nDUDI/Praktisi',
+        '5': 'Luaran\nRekognisi',
+        '6': 'Kerjasama\nper Prodi',
+        '7': 'MK PJBL/\nCase Method',
+        '8': 'Akreditasi\nInternasional'
+    },
+}
+
+# Warna status (bullet, cards, thermometer, waffle)
+STATUS_COLORS = {ACHIEVED: '#2E7D32', ON_TRACK: '#F9A825', GAP: '#C62828'}
+
+# Warna status donut 4x2: (ring, teks badge, background badge)
+DONUT_STATUS_STYLE = {
+    ACHIEVED: ('#28a745', '#28a745', '#d4edda'),
+    ON_TRACK: ('#ffc107', '#856404', '#fff3cd'),
+    GAP: ('#dc3545', '#dc3545', '#f8d7da'),
+}
+
+STATUS_ARROWS = {ACHIEVED: '▲', ON_TRACK: '▶', GAP: '▼'}
@@ -0,0 +1,147 @@
+"""
+============================================================================
+OVERALL DONUT - DONUT/GAUGE 4x2
+============================================================================
+
+Dual-ring donut per IKU (target di ring luar, realisasi di ring dalam).
+
+Author: Tim IKU FST
+Version: 2.0 (Modular)
+Last Updated: 2026-10-19
+============================================================================
+"""
+
+import matplotlib.pyplot as plt
+from matplotlib.patches import Wedge, FancyBboxPatch
+
+from utils import save_figure
+from figures import managed_subplots
+from achievement import achievement_model
+from overall.common import OVERALL_LABELS, DONUT_STATUS_STYLE
+
+
+def create_overall_achievement_dashboard(all_stats):
+    """
+    Membuat dashboard capaian keseluruhan 8 IKU dalam layout 4x2 grid
+    Berdasarkan best practice KPI dashboard design
+
+    Parameters:
+    -----------
+    all_stats : dict or AchievementModel
+        Dictionary berisi statistik untuk IKU 1-8, atau model capaian
+        yang sudah dihitung
+
+    Returns:
+    --------
+    list : List of saved file paths
+    """
+    model = achievement_model(all_stats)
+
+    if not model.available.any():
+        print("  ⚠️  Tidak ada data IKU gabungan untuk dashboard")
+        return []
+
+    titles = OVERALL_LABELS['full']
+
+    # Create 4x2 grid
+    with managed_subplots(2, 4, figsize=(20, 12)) as (fig, axes):
+        axes_flat = axes.flatten()
+
+        for idx, iku in enumerate(model.ikus):
+            ax = axes_flat[idx]
+
+            if model.available[idx]:
+                pct = model.actual_pct[idx]
+                is_number_based = model.number_based[idx]
+                actual_color, status_color, status_bg = DONUT_STATUS_STYLE[model.status[idx]]
+
+                # === DUAL RING DONUT ===
+                # Outer ring - Target (gray)
+                if is_number_based:
+                    target_angle = 360 * min(1, 100 / pct) if pct > 0 else 360
+                else:
+                    target_angle = 360 * (model.target[idx] / 100)
+
+                outer_bg = Wedge((0, 0), 1.15, 0, 360, width=0.12,
+                                facecolor='#E8E8E8', edgecolor='white', linewidth=2)
+                ax.add_patch(outer_bg)
+
+                outer_fill = Wedge((0, 0), 1.15, 90 - target_angle, 90, width=0.12,
+                                  facecolor='#9E9E9E', edgecolor='white', linewidth=2)
+                ax.add_patch(outer_fill)
+
+                # Inner ring - Actual (colored)
+                actual_angle = 360 * min(pct / 100, 1) if not is_number_based else 360
+
+                inner_bg = Wedge((0, 0), 0.98, 0, 360, width=0.18,
+                                facecolor='#F5F5F5', edgecolor='white', linewidth=2)
+                ax.add_patch(inner_bg)
+
+                inner_fill = Wedge((0, 0), 0.98, 90 - actual_angle, 90, width=0.18,
+                                  facecolor=actual_color, edgecolor='white', linewidth=2)
+                ax.add_patch(inner_fill)
+
+                # Center text
+                ax.text(0, 0.08, model.value_text[idx],
+                       ha='center', va='center',
+                       fontsize=28, fontweight='bold', color='#333333')
+
+                ax.text(0, -0.25, model.detail_text[idx],
+                       ha='center', va='center',
+                       fontsize=11, color='#666666', fontweight='600')
+
+                # IKU number badge
+                ax.text(0, 0.75, f'IKU {iku}',
+                       ha='center', va='center',
+                       fontsize=14, fontweight='bold', color='#333333',
+                       bbox=dict(boxstyle='round,pad=0.3', facecolor='white',
+                                edgecolor='#CCCCCC', linewidth=1.5))
+
+                # Title below donut
+                ax.text(0, -1.45, titles.get(iku, f'IKU {iku}'),
+                       ha='center', va='center',
+                       fontsize=11, fontweight='bold', color='#333333',
+                       linespacing=1.2)
+
+                # Status badge
+                badge = FancyBboxPatch((-0.65, -2.05), 1.3, 0.35,
+                                       boxstyle="round,pad=0.02,rounding_size=0.10",
+                                       facecolor=status_bg, edgecolor=status_color,
+                                       linewidth=2, transform=ax.transData)
+                ax.add_patch(badge)
+
+                ax.text(0, -1.88, f'{model.status_text[idx]} {model.diff_text[idx]}',
+                       ha='center', va='center',
+                       fontsize=12, color=status_color, fontweight='bold')
+
+                ax.set_xlim(-1.5, 1.5)
+                ax.set_ylim(-2.3, 1.3)
+
+            else:
+                # No data for this IKU
+                ax.text(0, 0, f'IKU {iku}\nNo Data',
+                       ha='center', va='center',
+                       fontsize=14, color='#999999', fontweight='bold')
+                ax.set_xlim(-1.5, 1.5)
+                ax.set_ylim(-2.3, 1.3)
+
+            ax.set_aspect('equal')
+            ax.axis('off')
+
+        # Main title
+        fig.suptitle('CAPAIAN IKU FAKULTAS SAINS & TEKNOLOGI',
+                    fontsize=20, fontweight='bold', y=0.98, color='#1a1a1a')
+
+        fig.text(0.5, 0.94, 'Universitas Jambi 2025',
+                ha='center', fontsize=14, color='#666666', style='italic')
+
+        # Legend at bottom
+        fig.text(0.5, 0.02,
+                '■ Target (Outer Ring)    ■ Realisasi (Inner Ring)    |    Green = Achieved    Yellow = On Track    Red = Gap',
+                ha='center', fontsize=11, color='#666666')
+
+        plt.tight_layout(rect=[0.02, 0.05, 0.98, 0.92])
+
+        saved_files = save_figure(fig, 'IKU_overall_achievement_4x2')
+
+    return saved_files
@@ -0,0 +1,140 @@
+"""
+============================================================================
+OVERALL THERMOMETER - THERMOMETER 4x2
+============================================================================
+
+Thermometer per IKU: tinggi isi = capaian, garis putus-putus = target.
+
+Author: Tim IKU FST
+Version: 2.0 (Modular)
+Last Updated: 2026-10-19
+============================================================================
+"""
+
+import matplotlib.pyplot as plt
+from matplotlib.patches import FancyBboxPatch
+
+from utils import save_figure
+from figures import managed_subplots
+from cell_grid import add_patch_batch
+from achievement import achievement_model
+from overall.common import OVERALL_LABELS, STATUS_COLORS
+
+
+def create_overall_achievement_thermometer(all_stats):
+    """
+    Membuat dashboard thermometer chart dalam format 4x2 grid
+    Thermometer style showing fill level against target
+
+    Parameters:
+    -----------
+    all_stats : dict or AchievementModel
+        Dictionary berisi statistik semua IKU {iku_number: stats_dict},
+        atau model capaian yang sudah dihitung
+
+    Returns:
+    --------
+    list : List of saved file paths
+    """
+    model = achievement_model(all_stats)
+    iku_labels = OVERALL_LABELS['thermometer']
+
+    # Create 4x2 grid
+    with managed_subplots(2, 4, figsize=(18, 12)) as (fig, axes):
+        axes = axes.flatten()
+
+        for idx, iku in enumerate(model.ikus):
+            ax = axes[idx]
+
+            if model.available[idx]:
+                fill_color = STATUS_COLORS[model.status[idx]]
+
+                # Draw thermometer outline
+                thermo_width = 0.4
+                thermo_height = 0.65
+                bulb_radius = 0.12
+                thermo_x = 0.3
+                thermo_bottom = 0.2
+
+                # Background tube (tube, fill, dan bulb digambar sebagai satu collection)
+                thermo_patches = [FancyBboxPatch(
+                    (thermo_x, thermo_bottom), thermo_width, thermo_height,
+                    boxstyle="round,pad=0.02,rounding_size=0.05",
+                    facecolor='#e8e8e8', edgecolor='#999999', linewidth=2
+                )]
+
+                # Fill level (capped at 100% of tube height for display)
+                fill_height = min(model.actual_pct[idx] / 100, 1.2) * thermo_height * 0.9
+                if fill_height > 0:
+                    thermo_patches.append(FancyBboxPatch(
+                        (thermo_x + 0.02, thermo_bottom + 0.02),
+                        thermo_width - 0.04, fill_height,
+                        boxstyle="round,pad=0.01,rounding_size=0.03",
+                        facecolor=fill_color, edgecolor='none'
+                    ))
+
+                # Bulb at bottom
+                thermo_patches.append(plt.Circle((thermo_x + thermo_width/2, thermo_bottom - 0.02),
+                                                 bulb_radius, facecolor=fill_color,
+                                                 edgecolor='#999999', linewidth=2))
+
+                add_patch_batch(ax, thermo_patches, transform=ax.transAxes, zorder=1)
+
+                # Target line marker
+                target_y = thermo_bottom + (model.target_pct[idx] / 100) * thermo_height * 0.9
+                ax.plot([thermo_x - 0.05, thermo_x + thermo_width + 0.05],
+                       [target_y, target_y], color='#1a1a1a', linewidth=2,
+                       linestyle='--', transform=ax.transAxes, zorder=4)
+                ax.text(thermo_x + thermo_width + 0.08, target_y, f'Target\n{model.target_label(idx)}',
+                       transform=ax.transAxes, fontsize=8, va='center', ha='left',
+                       color='#666666')
+
+                # IKU badge
+                ax.text(0.5, 0.98, f'IKU {iku}', transform=ax.transAxes,
+                       fontsize=12, fontweight='bold', color='white', ha='center',
+                       bbox=dict(boxstyle='round,pad=0.4', facecolor='#424242',
+                                edgecolor='none'), va='top')
+
+                # Main value (right side)
+                ax.text(0.85, 0.55, model.value_text[idx], transform=ax.transAxes,
+                       fontsize=24, fontweight='bold', color=fill_color,
+                       ha='center', va='center')
+
+                ax.text(0.85, 0.45, model.detail_text[idx], transform=ax.transAxes,
+                       fontsize=10, color='#666666', ha='center', va='center')
+
+                # Status badge
+                ax.text(0.5, 0.05, model.status_text[idx], transform=ax.transAxes,
+                       fontsize=11, fontweight='bold', color='white', ha='center',
+                       bbox=dict(boxstyle='round,pad=0.4', facecolor=fill_color,
+                                edgecolor='none', alpha=0.95))
+
+                # Label
+                ax.text(0.15, 0.55, iku_labels[iku], transform=ax.transAxes,
+                       fontsize=10, fontweight='600', color='#333333',
+                       ha='center', va='center', linespacing=1.3)
+
+            else:
+                ax.text(0.5, 0.5, f'IKU {iku}\nNo Data', transform=ax.transAxes,
+                       ha='center', va='center', fontsize=12, color='#999999')
+
+            ax.set_xlim(0, 1)
+            ax.set_ylim(0, 1)
+            ax.axis('off')
+
+        # Title
+        fig.suptitle('CAPAIAN IKU FAKULTAS SAINS & TEKNOLOGI',
+                    fontsize=18, fontweight='bold', y=0.98, color='#1a1a1a')
+        fig.text(0.5, 0.94, 'Universitas Jambi 2025 | Thermometer Style',
+                ha='center', fontsize=12, color='#666666', style='italic')
+
+        # Legend
+        fig.text(0.5, 0.01,
+                '🌡️ Fill level shows achievement   |   -- Target line   |   Green = Achieved   Yellow = On Track   Red = Gap',
+                ha='center', fontsize=10, color='#666666')
+
+        plt.tight_layout(rect=[0.01, 0.03, 0.99, 0.92])
+
+        saved_files = save_figure(fig, 'IKU_overall_achievement_thermometer')
+
+    return saved_files
@@ -0,0 +1,119 @@
+"""
+============================================================================
+OVERALL WAFFLE - WAFFLE 4x2
+============================================================================
+
+Waffle 10x10 per IKU: satu sel = 1% capaian (maks. 100%).
+
+Author: Tim IKU FST
+Version: 2.0 (Modular)
+Last Updated: 2026-10-19
+============================================================================
+"""
+
+import matplotlib.pyplot as plt
+
+from utils import save_figure
+from figures import managed_subplots
+from cell_grid import add_cell_grid, waffle_facecolors
+from achievement import achievement_model
+from overall.common import OVERALL_LABELS, STATUS_COLORS
+
+
+def create_overall_achievement_waffle(all_stats):
+    """
+    Membuat dashboard waffle chart dalam format 4x2 grid
+    Each IKU shows a 10x10 grid representing percentage achievement
+
+    Parameters:
+    -----------
+    all_stats : dict or AchievementModel
+        Dictionary berisi statistik semua IKU {iku_number: stats_dict},
+        atau model capaian yang sudah dihitung
+
+    Returns:
+    --------
+    list : List of saved file paths
+    """
+    model = achievement_model(all_stats)
+    iku_labels = OVERALL_LABELS['compact']
+
+    # Create 4x2 grid
+    with managed_subplots(2, 4, figsize=(18, 10)) as (fig, axes):
+        axes = axes.flatten()
+
+        for idx, iku in enumerate(model.ikus):
+            ax = axes[idx]
+
+            if model.available[idx]:
+                fill_color = STATUS_COLORS[model.status[idx]]
+
+                # Draw 10x10 waffle grid
+                grid_size = 10
+                cell_size = 0.08
+                start_x = 0.1
+                start_y = 0.25
+
+                filled_cells = int(model.capped_pct[idx])  # Number of cells to fill (out of 100)
+
+                # Satu PolyCollection untuk 100 sel (bukan 100 Rectangle)
+                cell_colors = waffle_facecolors(filled_cells, grid_size * grid_size,
+                                                fill_color, '#e0e0e0')
+                add_cell_grid(ax, cell_colors, grid_size, grid_size, cell_size,
+                              origin=(start_x, start_y), fill_ratio=0.9,
+                              edgecolor='white', linewidth=0.5,
+                              transform=ax.transAxes)
+
+                # IKU badge
+                ax.text(0.5, 0.98, f'IKU {iku}', transform=ax.transAxes,
+                       fontsize=11, fontweight='bold', color='white', ha='center',
+                       bbox=dict(boxstyle='round,pad=0.35', facecolor='#424242',
+                                edgecolor='none'), va='top')
+
+                # Title
+                ax.text(0.5, 0.88, iku_labels[iku], transform=ax.transAxes,
+                       fontsize=10, fontweight='600', color='#333333',
+                       ha='center', va='center')
+
+                # Value (right side of waffle)
+                ax.text(0.95, 0.55, model.value_text[idx], transform=ax.transAxes,
+                       fontsize=20, fontweight='bold', color=fill_color,
+                       ha='right', va='center')
+
+                ax.text(0.95, 0.45, model.detail_text[idx], transform=ax.transAxes,
+                       fontsize=9, color='#666666', ha='right', va='center')
+
+                # Status badge at bottom
+                ax.text(0.5, 0.08, model.status_text[idx], transform=ax.transAxes,
+                       fontsize=10, fontweight='bold', color='white', ha='center',
+                       bbox=dict(boxstyle='round,pad=0.35', facecolor=fill_color,
+                                edgecolor='none', alpha=0.95))
+
+                # Target indicator text
+                ax.text(0.5, 0.17, f'Target: {model.target_label(idx)}', transform=ax.transAxes,
+                       fontsize=8, color='#888888', ha='center', va='center')
+
+            else:
+                ax.text(0.5, 0.5, f'IKU {iku}\nNo Data', transform=ax.transAxes,
+                       ha='center', va='center', fontsize=12, color='#999999')
+
+            ax.set_xlim(0, 1)
+            ax.set_ylim(0, 1)
+            ax.axis('off')
+
+        # Title
+        fig.suptitle('CAPAIAN IKU FAKULTAS SAINS & TEKNOLOGI',
+                    fontsize=18, fontweight='bold', y=0.98, color='#1a1a1a')
+        fig.text(0.5, 0.94, 'Universitas Jambi 2025 | Waffle Chart Style',
+                ha='center', fontsize=12, color='#666666', style='italic')
+
+        # Legend
+        fig.text(0.5, 0.01,
+                '■ Each square = 1%   |   Filled squares show achievement   |   Green = Achieved   Yellow = On Track   Red = Gap',
+                ha='center', fontsize=10, color='#666666')
+
+        plt.tight_layout(rect=[0.01, 0.03, 0.99, 0.92])
+
+        saved_files = save_figure(fig, 'IKU_overall_achievement_waffle')
+
+    return saved_files
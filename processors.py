@@ -12,7 +12,9 @@ Last Updated: 2026-01-07
 """
 
 import pandas as pd
-from utils import read_excel_iku
+from utils import read_excel_iku, calculate_overall_stats
+from prodi_names import canonical_prodi_name
+from identity import dedup_identities, resolve_identities
 
 
 # ============================================================================
@@ -100,7 +102,7 @@ def process_iku_1_combined():
     df13_subset['Sumber'] = 'Wiraswasta'
 
     df_combined = pd.concat([df11_subset, df12_subset, df13_subset], ignore_index=True)
-    df_pembilang_combined = df_combined.drop_duplicates(subset=['NIM'], keep='first')
+    df_pembilang_combined = dedup_identities(df_combined, 'NIM', 'Nama', 'Prodi', label='1')
 
     print(f"    - Gabungan unik: {len(df_pembilang_combined)} lulusan")
 
@@ -222,7 +224,7 @@ def process_iku_2_combined():
     df23_subset['Sumber'] = 'HKI'
 
     df_combined = pd.concat([df21_subset, df22_subset, df23_subset], ignore_index=True)
-    df_pembilang_combined = df_combined.drop_duplicates(subset=['NIM'], keep='first')
+    df_pembilang_combined = dedup_identities(df_combined, 'NIM', 'Nama', 'Program Studi', label='2')
 
     print(f"    - Gabungan unik: {len(df_pembilang_combined)} mahasiswa")
 
@@ -275,18 +277,8 @@ def process_iku_31(df_pembilang, df_penyebut):
 
 
 def normalize_prodi_name(name):
-    """Helper function to normalize Program Studi names"""
-    if pd.isna(name):
-        return name
-    name = str(name).strip()
-    if not name.startswith('Program Studi'):
-        if name == 'Analis Kimia':
-            return 'Program Studi Analis Kimia (D3)'
-        elif name == 'Kimia Industri':
-            return 'Program Studi Kimia Industri (D3)'
-        else:
-            return f'Program Studi {name}'
-    return name
+    """Helper function to normalize Program Studi names (lihat prodi_names.py)"""
+    return canonical_prodi_name(name)
 
 
 def process_iku_33(df_pembilang, df_penyebut):
@@ -334,15 +326,13 @@ def process_iku_3_combined():
 
     # IKU 33: SUDAH punya Program Studi, tapi kolom nama dosen adalah 'Dosen Pembimbing'
     df33_pembilang_copy = df33_pembilang.copy()
-    df33_pembilang_copy['Program Studi'] = df33_pembilang_copy['Program Studi'].apply(
-        lambda x: f'Program Studi {x}' if pd.notna(x) and not str(x).startswith('Program Studi') else x
-    )
+    df33_pembilang_copy['Program Studi'] = df33_pembilang_copy['Program Studi'].apply(normalize_prodi_name)
     df33_subset = df33_pembilang_copy[['NIP', 'Dosen Pembimbing', 'Program Studi']].copy()
     df33_subset.columns = ['NIP', 'Nama', 'Program Studi']
     df33_subset['Sumber'] = 'Bimbingan'
 
     df_combined = pd.concat([df31_subset, df33_subset], ignore_index=True)
-    df_pembilang_combined = df_combined.drop_duplicates(subset=['NIP'], keep='first')
+    df_pembilang_combined = dedup_identities(df_combined, 'NIP', 'Nama', 'Program Studi', label='3')
 
     print(f"    - Gabungan unik: {len(df_pembilang_combined)} dosen")
 
@@ -442,7 +432,7 @@ def process_iku_4_combined():
     df42_subset['Sumber'] = 'Praktisi'
 
     df_combined = pd.concat([df41_subset, df42_subset], ignore_index=True)
-    df_pembilang_combined = df_combined.drop_duplicates(subset=['NIP'], keep='first')
+    df_pembilang_combined = dedup_identities(df_combined, 'NIP', 'Nama', 'Program Studi', label='4')
 
     print(f"    - Gabungan unik: {len(df_pembilang_combined)} dosen")
 
@@ -652,7 +642,9 @@ def process_iku_5_combined():
     df_dosen = read_excel_iku('31', 'penyebut')  # Use dosen as reference
 
     total_luaran = len(df51_pembilang)
-    dosen_unik = df51_pembilang['NIP'].nunique() if 'NIP' in df51_pembilang.columns else total_luaran
+    # Dosen unik: NIP, atau nama (fuzzy) untuk export tanpa NIP
+    resolved, _ = resolve_identities(df51_pembilang, 'NIP', 'Nama', 'Program Studi')
+    dosen_unik = resolved['Identitas'].nunique()
 
     print(f"    - IKU 51 (Luaran Rekognisi): {total_luaran} luaran")
     print(f"    - Dosen unik dengan luaran: {dosen_unik} dosen")
@@ -795,3 +787,50 @@ COMBINED_PROCESSORS = {
     '7': (process_iku_7_combined, 'mata kuliah', '71'),
     '8': (process_iku_8_combined, 'prodi', '81'),
 }
+
+
+def compute_iku_frames(iku_number):
+    """
+    Hitung tabel per prodi, statistik, dan frame pembilang/penyebut satu IKU
+
+    Frame yang dikembalikan adalah frame yang dihitung processor (untuk IKU
+    gabungan: setelah penggabungan + resolusi identitas), dipakai untuk
+    indeks provenance (provenance.py).
+
+    Parameters:
+    -----------
+    iku_number : str
+        Nomor IKU (gabungan 1-8 atau sub-IKU seperti 31)
+
+    Returns:
+    --------
+    tuple : (data per prodi, stats, df_pembilang, df_penyebut)
+    """
+    if iku_number in COMBINED_PROCESSORS:
+        return COMBINED_PROCESSORS[iku_number][0]()
+
+    if iku_number not in IKU_PROCESSORS:
+        raise ValueError(f"IKU number tidak valid: {iku_number}")
+
+    df_pembilang = read_excel_iku(iku_number, 'pembilang')
+    df_penyebut = read_excel_iku(iku_number, 'penyebut')
+    stats = calculate_overall_stats(df_pembilang, df_penyebut)
+    data = IKU_PROCESSORS[iku_number](df_pembilang, df_penyebut)
+    return data, stats, df_pembilang, df_penyebut
+
+
+def compute_iku(iku_number):
+    """
+    Hitung tabel per prodi dan statistik satu IKU (tanpa render)
+
+    Parameters:
+    -----------
+    iku_number : str
+        Nomor IKU (gabungan 1-8 atau sub-IKU seperti 31)
+
+    Returns:
+    --------
+    tuple : (data per prodi, stats)
+    """
+    data, stats, _, _ = compute_iku_frames(iku_number)
+    return data, stats
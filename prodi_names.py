@@ -0,0 +1,400 @@
+"""
+============================================================================
+PRODI NAMES - KANONIKALISASI NAMA PROGRAM STUDI
+============================================================================
+
+Label prodi di file export tidak seragam: "Program Studi Kimia", "Kimia",
+"Analis Kimia" vs "Analis Kimia (D3)", "S1 Teknik Sipil", beda huruf
+besar/kecil, salah ketik. Label yang tidak persis sama dengan kunci
+PRODI_TO_JURUSAN jatuh ke warna MIPA (get_prodi_color) dan salah grup
+jurusan, sehingga semua kolom prodi dikanonikalisasi saat data dibaca
+(utils.read_excel_iku).
+
+Cara kerja:
+1. Label dipecah menjadi nama bersih (huruf kecil, tanpa awalan
+   "Program Studi"/"Prodi" dan tanda baca) dan jenjang (D3, D4, S1, S2,
+   S3; dari "(D3)", "S2", "Magister", ...). Kunci tanpa penanda jenjang
+   berjenjang S1.
+2. Jenjang ikut menentukan kecocokan: label tanpa jenjang boleh cocok
+   dengan kunci jenjang apa pun ("Analis Kimia" -> "Analis Kimia (D3)"),
+   label berjenjang hanya dengan kunci berjenjang sama ("Teknik Geologi
+   (D3)" dan "S2 Fisika" tidak cocok dengan kunci S1).
+3. Nama bersih yang sama persis dengan satu kunci (jenjang cocok) langsung
+   dipakai.
+4. Selain itu dicari lewat indeks trigram atas kunci PRODI_TO_JURUSAN
+   (dibangun sekali per process): jumlah trigram bersama dengan semua
+   kunci dihitung sekaligus (np.bincount). Kandidat terbaik hanya dipakai
+   jika skor Dice >= CONFIG['prodi_match_threshold'], unggul dari
+   kandidat kedua minimal CONFIG['prodi_match_margin'], dan token namanya
+   sejajar dengan token kunci (jumlah sama, tiap token beda paling banyak
+   1-2 huruf: salah ketik seperti "teknik sipl"). "Teknik Fisika",
+   "Teknik Elektronika", atau "Matematika Terapan" adalah prodi lain,
+   bukan salah ketik, sehingga tidak dicocokkan.
+5. Label yang tidak cocok dipertahankan (tanpa awalan "Program Studi ")
+   sehingga tetap terdeteksi oleh validasi (validation.py).
+
+Setiap label mentah yang berbeda hanya di-resolve sekali: hasilnya
+disimpan di memori dan di <base_path>/.iku_cache/prodi_names.json
+(di-key dengan daftar kunci + threshold), jadi export universitas dengan
+ribuan label tetap cepat pada run berikutnya.
+
+Usage:
+    python prodi_names.py "S1 Teknik Sipil" "teknik sipl" "Pendidikan Kimia"
+    python prodi_names.py --clear-cache
+
+Author: Tim IKU FST
+Version: 2.0 (Modular)
+Last Updated: 2026-10-19
+============================================================================
+"""
+
+import os
+import re
+import sys
+import json
+import hashlib
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from config import CONFIG, PRODI_TO_JURUSAN
+from readers import cache_dir
+
+
+CACHE_FILE = 'prodi_names.json'
+CACHE_VERSION = 2
+
+# Kolom prodi yang dikanonikalisasi saat data dibaca
+PRODI_COLUMNS = ('Prodi', 'Program Studi')
+
+# Jenjang kunci PRODI_TO_JURUSAN tanpa penanda jenjang
+DEFAULT_LEVEL = 's1'
+
+_PREFIX = re.compile(r'^(program\s+studi|prog\.?\s*studi|prodi|ps)\b\.?\s*')
+# Penanda jenjang (urutan penting: "sarjana terapan" = D4 sebelum "sarjana")
+_LEVELS = (
+    ('d4', re.compile(r'\b(d-?4|d\.4|d-?iv|diploma\s+(iv|4)|sarjana\s+terapan)\b')),
+    ('d3', re.compile(r'\b(d-?3|d\.3|d-?iii|diploma(\s+(iii|3))?)\b')),
+    ('s3', re.compile(r'\b(s-?3|s\.3|doktor(al)?|doctoral)\b')),
+    ('s2', re.compile(r'\b(s-?2|s\.2|magister|master)\b')),
+    ('s1', re.compile(r'\b(s-?1|s\.1|sarjana)\b')),
+)
+_NON_WORD = re.compile(r'[^0-9a-z]+')
+
+
+def parse_label(label):
+    """
+    Nama bersih + jenjang label prodi
+
+    "Program Studi Analis Kimia (D3)" -> ("analis kimia", "d3")
+    "S2 Fisika"                       -> ("fisika", "s2")
+    "Teknik Sipil"                    -> ("teknik sipil", None)
+
+    Returns:
+    --------
+    tuple : (nama bersih, jenjang atau None jika tidak disebut)
+    """
+    text = _PREFIX.sub('', str(label).casefold().strip())
+    level = None
+    for name, pattern in _LEVELS:
+        if pattern.search(text):
+            level = level or name
+            text = pattern.sub(' ', text)
+    return ' '.join(_NON_WORD.sub(' ', text).split()), level
+
+
+def clean_label(label):
+    """Nama bersih label prodi (tanpa awalan, jenjang, tanda baca)"""
+    return parse_label(label)[0]
+
+
+def display_label(label):
+    """Label yang tidak cocok: tanpa awalan 'Program Studi ' dan spasi ganda"""
+    return ' '.join(str(label).replace('Program Studi ', '').split())
+
+
+def trigrams(text):
+    padded = f'  {text} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a, b):
+    """Jarak Damerau-Levenshtein (OSA): sisip/hapus/ganti/tukar huruf"""
+    previous2, previous = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        previous2, previous = previous, current
+    return previous[len(b)]
+
+
+def tokens_align(text, name):
+    """
+    True jika token label dan kunci sejajar sebagai salah ketik
+
+    Jumlah token sama dan tiap token berpasangan beda paling banyak 1 huruf
+    (token <= 5 huruf) atau 2 huruf ("teknik sipl" ~ "teknik sipil", tetapi
+    bukan "teknik fisika" ~ "teknik geofisika").
+    """
+    tokens, name_tokens = text.split(), name.split()
+    if len(tokens) != len(name_tokens):
+        return False
+    return all(edit_distance(token, key) <= (1 if len(key) <= 5 else 2)
+               for token, key in zip(tokens, name_tokens))
+
+
+# ============================================================================
+# INDEKS TRIGRAM
+# ============================================================================
+
+class ProdiIndex:
+    """
+    Indeks trigram atas nama prodi kanonik
+
+    Parameters:
+    -----------
+    names : iterable
+        Nama kanonik (default: kunci PRODI_TO_JURUSAN)
+    threshold : float
+        Skor Dice minimum (0-1) untuk pencocokan fuzzy
+    margin : float
+        Selisih skor minimum kandidat terbaik terhadap kandidat kedua
+    """
+
+    def __init__(self, names=None, threshold=0.75, margin=0.1):
+        self.names = list(PRODI_TO_JURUSAN if names is None else names)
+        self.name_set = set(self.names)
+        self.threshold = threshold
+        self.margin = margin
+
+        parsed = [parse_label(name) for name in self.names]
+        self.cleaned = [text for text, _ in parsed]
+        self.levels = np.array([level or DEFAULT_LEVEL for _, level in parsed])
+        self.exact = {}
+        for i, text in enumerate(self.cleaned):
+            self.exact.setdefault(text, []).append(i)
+
+        postings = {}
+        sizes = []
+        for i, text in enumerate(self.cleaned):
+            grams = trigrams(text)
+            sizes.append(len(grams))
+            for gram in grams:
+                postings.setdefault(gram, []).append(i)
+        self.postings = {gram: np.array(ids, dtype=np.intp) for gram, ids in postings.items()}
+        self.sizes = np.array(sizes, dtype=float)
+
+    @property
+    def fingerprint(self):
+        """Hash daftar kunci + threshold (kunci cache disk)"""
+        text = json.dumps([CACHE_VERSION, sorted(self.names), self.threshold, self.margin])
+        return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+    def scores(self, text):
+        """Skor Dice label bersih terhadap semua nama kanonik (array)"""
+        grams = trigrams(text)
+        hits = [self.postings[gram] for gram in grams if gram in self.postings]
+        if not hits:
+            return np.zeros(len(self.names))
+        shared = np.bincount(np.concatenate(hits), minlength=len(self.names))
+        return 2.0 * shared / (len(grams) + self.sizes)
+
+    def match(self, label):
+        """
+        Nama kanonik untuk satu label mentah
+
+        Returns:
+        --------
+        str or None : Nama kanonik, atau None jika tidak ada yang cukup mirip
+        """
+        if label in self.name_set:
+            return label
+        text, level = parse_label(label)
+        if not text:
+            return None
+        # Label tanpa jenjang cocok dengan jenjang apa pun
+        compatible = np.ones(len(self.names), dtype=bool) if level is None else self.levels == level
+
+        if text in self.exact:
+            # Nama persis sama: hanya cocok jika tepat satu kunci berjenjang
+            # sesuai ("Teknik Geologi (D3)" bukan "Teknik Geologi")
+            matches = [i for i in self.exact[text] if compatible[i]]
+            return self.names[matches[0]] if len(matches) == 1 else None
+
+        scores = np.where(compatible, self.scores(text), 0.0)
+        order = np.argsort(scores)[::-1]
+        best = int(order[0])
+        runner_up = scores[order[1]] if len(order) > 1 else 0.0
+        if (scores[best] < self.threshold or scores[best] - runner_up < self.margin
+                or not tokens_align(text, self.cleaned[best])):
+            return None
+        return self.names[best]
+
+
+# ============================================================================
+# KANONIKALISASI (DENGAN CACHE)
+# ============================================================================
+
+class ProdiCanonicalizer:
+    """
+    Label mentah -> nama kanonik, dengan cache memori + disk
+
+    Parameters:
+    -----------
+    index : ProdiIndex, optional
+        Indeks nama kanonik (default: kunci PRODI_TO_JURUSAN dengan
+        CONFIG['prodi_match_threshold'] / CONFIG['prodi_match_margin'])
+    cache_file : str or Path, optional
+        File cache JSON (default: <base_path>/.iku_cache/prodi_names.json)
+    """
+
+    def __init__(self, index=None, cache_file=None):
+        self.index = index or ProdiIndex(threshold=CONFIG['prodi_match_threshold'],
+                                         margin=CONFIG['prodi_match_margin'])
+        self.cache_file = cache_file
+        self.labels = {}       # label mentah -> nama kanonik / None
+        self.loaded = set()    # file cache yang sudah dimuat
+        self.dirty = False
+
+    def _path(self):
+        return self.cache_file or cache_dir() / CACHE_FILE
+
+    def _load(self):
+        path = str(self._path())
+        if path in self.loaded:
+            return
+        self.loaded.add(path)
+        try:
+            cached = json.loads(Path(path).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return
+        if cached.get('fingerprint') == self.index.fingerprint:
+            for label, name in cached.get('labels', {}).items():
+                self.labels.setdefault(label, name)
+
+    def save(self):
+        """Tulis cache ke disk jika ada label baru (atomic replace)"""
+        if not self.dirty:
+            return
+        path = self._path()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f'{path}.{os.getpid()}.tmp'
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({'fingerprint': self.index.fingerprint, 'labels': self.labels},
+                          f, ensure_ascii=False, indent=1)
+            os.replace(tmp, path)
+            self.dirty = False
+        except OSError:
+            # Cache hanya optimasi; folder data read-only tetap jalan
+            pass
+
+    def resolve(self, label):
+        """Nama kanonik untuk satu label (None jika tidak cocok)"""
+        self._load()
+        if label not in self.labels:
+            self.labels[label] = self.index.match(label)
+            self.dirty = True
+        return self.labels[label]
+
+    def canonical(self, label):
+        """Nama kanonik, atau label yang dirapikan jika tidak cocok"""
+        if pd.isna(label):
+            return label
+        label = str(label)
+        name = self.resolve(label)
+        return display_label(label) if name is None else name
+
+    def canonicalize(self, values):
+        """
+        Kanonikalisasi satu kolom: setiap label berbeda di-resolve sekali
+
+        Parameters:
+        -----------
+        values : pd.Series
+            Kolom prodi mentah
+
+        Returns:
+        --------
+        pd.Series : Kolom dengan nama kanonik (NaN tetap NaN)
+        """
+        codes, uniques = pd.factorize(values)
+        if len(uniques) == 0:
+            return values
+        mapped = np.array([self.canonical(label) for label in uniques] + [np.nan],
+                          dtype=object)
+        self.save()
+        # codes -1 (NaN) menunjuk elemen terakhir (np.nan)
+        return pd.Series(mapped[codes], index=values.index, name=values.name)
+
+
+_CANONICALIZER = None
+
+
+def get_canonicalizer():
+    """Canonicalizer bersama per process (indeks dibangun sekali)"""
+    global _CANONICALIZER
+    settings = (CONFIG['prodi_match_threshold'], CONFIG['prodi_match_margin'])
+    if (_CANONICALIZER is None
+            or (_CANONICALIZER.index.threshold, _CANONICALIZER.index.margin) != settings):
+        _CANONICALIZER = ProdiCanonicalizer()
+    return _CANONICALIZER
+
+
+def canonical_prodi_name(label):
+    """Nama prodi kanonik untuk satu label (lihat ProdiCanonicalizer.canonical)"""
+    return get_canonicalizer().canonical(label)
+
+
+def canonicalize_prodi_columns(df):
+    """
+    Kanonikalisasi kolom prodi (PRODI_COLUMNS) sebuah DataFrame in-place
+
+    Returns:
+    --------
+    pd.DataFrame : DataFrame yang sama
+    """
+    for column in PRODI_COLUMNS:
+        if column in df.columns:
+            df[column] = get_canonicalizer().canonicalize(df[column])
+    return df
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Cek hasil kanonikalisasi label prodi (indeks trigram PRODI_TO_JURUSAN)'
+    )
+    parser.add_argument('labels', nargs='*', help='Label prodi mentah')
+    parser.add_argument('--clear-cache', action='store_true',
+                        help=f'Hapus cache label (<base_path>/.iku_cache/{CACHE_FILE})')
+    args = parser.parse_args(argv)
+
+    if args.clear_cache:
+        path = cache_dir() / CACHE_FILE
+        if path.exists():
+            path.unlink()
+        print(f"Cache dihapus: {path}")
+
+    canonicalizer = get_canonicalizer()
+    for label in args.labels:
+        text = clean_label(label)
+        scores = canonicalizer.index.scores(text)
+        best = int(np.argmax(scores))
+        name = canonicalizer.resolve(label)
+        print(f"{label!r:32} -> {name or '(tidak cocok)'!s:24} "
+              f"[{canonicalizer.index.names[best]}: {scores[best]:.2f}]")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
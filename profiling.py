@@ -0,0 +1,287 @@
+"""
+============================================================================
+PROFILING - SISTEM VISUALISASI IKU
+============================================================================
+
+Switch --profile untuk entry point (main_visualize_iku.py, generate_all.py):
+
+- cprofile : cProfile per stage -> output/profile/cprofile/NN_<stage>.prof,
+             digabung ke output/profile/IKU_run.prof (buka dengan
+             `python -m pstats` atau snakeviz)
+- memory   : tracemalloc, snapshot setelah setiap stage ->
+             output/profile/memory/NN_<stage>.snapshot (baca dengan
+             tracemalloc.Snapshot.load), plus memori current/peak per stage
+
+Stage = span tracing level kedua (run -> stage, misalnya "IKU 31",
+"donut charts", "category breakdown"); batasnya diambil dari tracing.py
+lewat span listener, sehingga tidak ada instrumentasi tambahan di kode
+chart. Di akhir run dicetak hotspot teratas yang dikelompokkan per modul
+kita: processors, visualizations, breakdown.*, utils (modul repo lain
+digabung sebagai "lainnya").
+
+Worker process (-j) tidak ikut di-profile; jalankan tanpa -j untuk
+melihat hotspot category breakdown.
+
+Author: Tim IKU FST
+Version: 2.0 (Modular)
+Last Updated: 2026-10-19
+============================================================================
+"""
+
+import re
+import pstats
+import cProfile
+import tracemalloc
+import contextlib
+from pathlib import Path
+
+import tracing
+from config import CONFIG
+
+
+PROFILE_MODES = ('cprofile', 'memory')
+
+# Level span yang dianggap stage (1 = run, 2 = anak langsung run)
+STAGE_DEPTH = 2
+
+# Kedalaman traceback tracemalloc: cukup untuk mencapai frame repo dari
+# kebanyakan alokasi pandas/matplotlib; 25 frame membuat run ~2x lebih
+# lambat lagi
+TRACEMALLOC_FRAMES = 10
+
+# Kelompok modul untuk ringkasan hotspot (urutan tampil)
+MODULE_GROUPS = ('processors', 'visualizations', 'breakdown.*', 'utils', 'lainnya')
+
+REPO_DIR = Path(__file__).resolve().parent
+
+
+def module_group(filename):
+    """
+    Kelompok modul repo untuk satu file sumber
+
+    Returns:
+    --------
+    str or None : Nama kelompok (MODULE_GROUPS), atau None untuk kode di
+        luar repo (stdlib, pandas, matplotlib, ...)
+    """
+    try:
+        relative = Path(filename).resolve().relative_to(REPO_DIR)
+    except (ValueError, OSError):
+        return None
+    if relative.parts[0] in ('benchmarks',) or relative.suffix != '.py':
+        return None
+    if relative.parts[0] == 'breakdown':
+        return 'breakdown.*'
+    if relative.stem in MODULE_GROUPS:
+        return relative.stem
+    return 'lainnya'
+
+
+def _slug(name):
+    return re.sub(r'[^0-9A-Za-z]+', '_', name).strip('_').lower() or 'stage'
+
+
+# ============================================================================
+# PROFILER
+# ============================================================================
+
+class StageProfiler:
+    """
+    Span listener yang mem-profile setiap stage
+
+    Parameters:
+    -----------
+    mode : str
+        'cprofile' atau 'memory'
+    output_dir : pathlib.Path
+        Folder hasil (dibersihkan dari hasil profile sebelumnya)
+    top : int
+        Jumlah fungsi / baris teratas per kelompok modul
+    """
+
+    def __init__(self, mode, output_dir, top=5):
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Mode profile tidak dikenal: {mode} (pilihan: {', '.join(PROFILE_MODES)})")
+        self.mode = mode
+        self.output_dir = Path(output_dir)
+        self.top = top
+        self.stage_dir = self.output_dir / mode
+        self.files = []
+        self.stages = []          # [(nama stage, dict hasil)]
+        self._active = None       # span stage yang sedang di-profile
+        self._profiler = None
+        self._stats = None
+        self._largest = None      # snapshot dengan traced memory terbesar
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self):
+        self.stage_dir.mkdir(parents=True, exist_ok=True)
+        for old in self.stage_dir.glob('*'):
+            if old.suffix in ('.prof', '.snapshot'):
+                old.unlink()
+        if self.mode == 'memory':
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        tracing.add_span_listener(self)
+
+    def stop(self):
+        tracing.remove_span_listener(self)
+        if self.mode == 'memory':
+            tracemalloc.stop()
+        elif self._stats is not None:
+            run_file = self.output_dir / 'IKU_run.prof'
+            self._stats.dump_stats(run_file)
+            self.files.insert(0, run_file)
+
+    # ------------------------------------------------------------------
+    # Span listener
+    # ------------------------------------------------------------------
+
+    def span_started(self, span):
+        if self._active is not None or len(span.path) != STAGE_DEPTH:
+            return
+        self._active = span
+        if self.mode == 'cprofile':
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        else:
+            tracemalloc.reset_peak()
+
+    def span_finished(self, span, duration):
+        if span is not self._active:
+            return
+        self._active = None
+        name = f'{len(self.stages) + 1:02d}_{_slug(span.name)}'
+
+        if self.mode == 'cprofile':
+            self._profiler.disable()
+            stage_file = self.stage_dir / f'{name}.prof'
+            self._profiler.dump_stats(stage_file)
+            if self._stats is None:
+                self._stats = pstats.Stats(str(stage_file))
+            else:
+                self._stats.add(str(stage_file))
+            self._profiler = None
+            self.stages.append((span.name, {'seconds': duration}))
+        else:
+            current, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+            stage_file = self.stage_dir / f'{name}.snapshot'
+            snapshot.dump(stage_file)
+            if self._largest is None or current > self._largest[0]:
+                self._largest = (current, span.name, snapshot)
+            self.stages.append((span.name, {'seconds': duration, 'current': current, 'peak': peak}))
+        self.files.append(stage_file)
+
+    # ------------------------------------------------------------------
+    # Report
+    # ------------------------------------------------------------------
+
+    def report(self):
+        """Ringkasan hotspot per kelompok modul (str)"""
+        lines = ['=' * 78, f'PROFILE ({self.mode}) - HOTSPOT PER MODUL', '=' * 78]
+        if not self.stages:
+            lines.append('Tidak ada stage yang ter-profile.')
+            return '\n'.join(lines)
+
+        if self.mode == 'cprofile':
+            lines.extend(self._cprofile_report())
+        else:
+            lines.extend(self._memory_report())
+
+        lines.append('')
+        lines.append(f'File profile: {self.output_dir}')
+        return '\n'.join(lines)
+
+    def _cprofile_report(self):
+        groups = {}
+        for (filename, lineno, func), (_, ncalls, tottime, cumtime, _) in self._stats.stats.items():
+            group = module_group(filename)
+            if group is not None:
+                groups.setdefault(group, []).append(
+                    (cumtime, tottime, ncalls, f'{Path(filename).name}:{lineno}({func})'))
+
+        total = max(self._stats.total_tt, 1e-9)
+        lines = [f'Total waktu ter-profile: {total:.2f}s ({len(self.stages)} stage)',
+                 'cum = termasuk pemanggilan pandas/matplotlib; self = di fungsi itu sendiri', '']
+        for group in MODULE_GROUPS:
+            rows = sorted(groups.get(group, []), reverse=True)
+            if not rows:
+                continue
+            group_self = sum(row[1] for row in rows)
+            lines.append(f'{group:<16} self {group_self:>8.2f}s ({group_self / total:>5.1%})')
+            lines.append(f"    {'cum s':>8} {'self s':>8} {'calls':>8}  fungsi")
+            for cumtime, tottime, ncalls, label in rows[:self.top]:
+                lines.append(f'    {cumtime:>8.3f} {tottime:>8.3f} {ncalls:>8}  {label}')
+            lines.append('')
+        return lines
+
+    def _memory_report(self):
+        lines = [f"{'stage':<28}{'waktu':>9}{'current':>12}{'peak':>12}"]
+        for name, result in self.stages:
+            lines.append(f"{name[:27]:<28}{result['seconds']:>8.2f}s"
+                         f"{result['current'] / 1e6:>9.1f} MB{result['peak'] / 1e6:>9.1f} MB")
+
+        # Alokasi yang masih hidup pada titik memori terbesar, diatribusikan
+        # ke frame terdekat di modul repo (alokasi pandas/numpy yang
+        # dipicu kode kita ikut dihitung ke modul pemanggilnya)
+        current, stage_name, snapshot = self._largest
+        groups = {}
+        for stat in snapshot.statistics('traceback'):
+            for frame in stat.traceback:  # urutan: frame terbaru dulu
+                group = module_group(frame.filename)
+                if group is not None:
+                    site = f'{Path(frame.filename).name}:{frame.lineno}'
+                    sites = groups.setdefault(group, {})
+                    sites[site] = sites.get(site, 0) + stat.size
+                    break
+
+        lines.append('')
+        lines.append(f'Alokasi hidup setelah stage "{stage_name}" ({current / 1e6:.1f} MB), per modul:')
+        for group in MODULE_GROUPS:
+            sites = groups.get(group)
+            if not sites:
+                continue
+            lines.append(f'{group:<16} {sum(sites.values()) / 1e6:>8.2f} MB')
+            for site, size in sorted(sites.items(), key=lambda item: -item[1])[:self.top]:
+                lines.append(f'    {size / 1e6:>8.2f} MB  {site}')
+        return lines
+
+
+@contextlib.contextmanager
+def profile_session(mode=None, output_dir=None):
+    """
+    Profile blok per stage (no-op jika mode None)
+
+    Memulai sesi tracing sendiri jika belum ada (batas stage berasal dari
+    span). Ringkasan dicetak ke stdout asli saat keluar dari blok.
+
+    Parameters:
+    -----------
+    mode : str, optional
+        'cprofile', 'memory', atau None
+    output_dir : pathlib.Path, optional
+        Default: output/profile
+    """
+    if mode is None:
+        yield None
+        return
+
+    output_dir = output_dir or CONFIG['base_path'] / CONFIG['output_dir'] / 'profile'
+    profiler = StageProfiler(mode, output_dir)
+
+    previous_session = None
+    own_session = not tracing.active()
+    if own_session:
+        previous_session = tracing.start_trace(keep=False)
+
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+        if own_session:
+            tracing.stop_trace(previous_session)
+        print(profiler.report())
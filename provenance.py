@@ -0,0 +1,344 @@
+"""
+============================================================================
+PROVENANCE - INDEKS ASAL-USUL BARIS PER (IKU, PRODI) & DRILL-DOWN
+============================================================================
+
+Setiap angka "Pembilang" per prodi dari processor membawa indeks asal-usul:
+posisi baris pembilang yang dihitung untuk sel (IKU, prodi) tersebut.
+Indeks disimpan ringkas sebagai offset array (format CSR):
+
+    labels  : nama prodi (urut)                 ['Biologi', 'Fisika', ...]
+    offsets : int64, len(labels) + 1            [0, 12, 19, ...]
+    rows    : int32, posisi baris di frame sumber, dikelompokkan per prodi
+
+Baris prodi ke-i = rows[offsets[i]:offsets[i + 1]], sehingga drill-down
+"dosen mana saja di balik bar Fisika IKU 31" hanya berupa slice + iloc, tanpa
+groupby ulang. Frame sumber adalah frame pembilang yang dihitung
+processor (untuk IKU gabungan: gabungan setelah resolusi identitas).
+
+Prodi per baris mengikuti processor: kolom Prodi/Program Studi, atau
+join NIM/NIP ke penyebut (IKU 22, 31) / data dosen (IKU 5). Baris tanpa
+prodi (tidak cocok saat join) tidak masuk bar mana pun dan dicatat
+sebagai 'unassigned'.
+
+Indeks dibangun saat process_single_iku dan ikut ditulis ke results bundle
+(provenance/iku_<n>.npz + .parquet), sehingga drill-down dari bundle tidak
+membaca Excel maupun menjalankan processor.
+
+Usage:
+    python provenance.py 31 Fisika                 # baris pembilang IKU 31 Fisika
+    python provenance.py 31 --list                 # jumlah baris per prodi
+    python provenance.py 3 "Teknik Sipil" --bundle bundle --columns NIP Nama
+    python provenance.py 2 Kimia --json
+    python main_visualize_iku.py drilldown 31 Fisika
+
+Author: Tim IKU FST
+Version: 2.0 (Modular)
+Last Updated: 2026-10-19
+============================================================================
+"""
+
+import io
+import sys
+import json
+import argparse
+import contextlib
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from config import ALL_IKU
+
+
+# Kolom prodi yang dicek berurutan di frame pembilang
+PRODI_COLUMNS = ('Program Studi', 'Prodi')
+
+# Kunci join ke penyebut untuk frame pembilang tanpa kolom prodi
+JOIN_KEYS = ('NIM', 'NIP')
+
+
+# ============================================================================
+# INDEKS
+# ============================================================================
+
+class ProvenanceIndex:
+    """
+    Indeks asal-usul baris pembilang per prodi untuk satu IKU
+
+    Parameters:
+    -----------
+    iku_number : str
+        Nomor IKU
+    labels : array-like
+        Nama prodi (urut)
+    offsets : np.ndarray
+        Offset awal baris tiap prodi di `rows` (panjang len(labels) + 1)
+    rows : np.ndarray
+        Posisi baris di frame sumber, dikelompokkan per prodi
+    source : pd.DataFrame
+        Frame pembilang yang dihitung processor
+    unassigned : int
+        Jumlah baris pembilang tanpa prodi
+    """
+
+    def __init__(self, iku_number, labels, offsets, rows, source, unassigned=0):
+        self.iku_number = iku_number
+        self.labels = np.asarray(labels, dtype=str)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.rows = np.asarray(rows, dtype=np.int32)
+        self.source = source
+        self.unassigned = int(unassigned)
+        self._positions = {label: i for i, label in enumerate(self.labels)}
+
+    @classmethod
+    def build(cls, iku_number, df_pembilang, df_penyebut=None):
+        """
+        Bangun indeks dari frame pembilang (+ penyebut untuk join prodi)
+
+        Returns:
+        --------
+        ProvenanceIndex
+        """
+        prodi = pembilang_prodi(df_pembilang, df_penyebut)
+        codes, labels = pd.factorize(prodi, sort=True)
+        assigned = codes >= 0
+        # Urutkan posisi baris per kode prodi (stable: urutan asli terjaga)
+        positions = np.flatnonzero(assigned)
+        rows = positions[np.argsort(codes[assigned], kind='stable')]
+        counts = np.bincount(codes[assigned], minlength=len(labels))
+        offsets = np.concatenate([[0], np.cumsum(counts)])
+        return cls(iku_number, list(labels), offsets, rows,
+                   df_pembilang.reset_index(drop=True), unassigned=(~assigned).sum())
+
+    def counts(self):
+        """Jumlah baris pembilang per prodi (pd.Series)"""
+        return pd.Series(np.diff(self.offsets), index=self.labels, name='Pembilang')
+
+    def resolve_label(self, prodi):
+        """Label prodi di indeks (menerima variasi penulisan, lihat prodi_names.py)"""
+        if prodi in self._positions:
+            return prodi
+        from prodi_names import canonical_prodi_name
+        label = canonical_prodi_name(prodi)
+        if label in self._positions:
+            return label
+        raise KeyError(f"Prodi '{prodi}' tidak ada di IKU {self.iku_number}. "
+                       f"Prodi tersedia: {', '.join(self.labels)}")
+
+    def rows_for(self, prodi):
+        """Posisi baris frame sumber untuk satu prodi (view, tanpa copy)"""
+        i = self._positions[self.resolve_label(prodi)]
+        return self.rows[self.offsets[i]:self.offsets[i + 1]]
+
+    def drilldown(self, prodi, columns=None):
+        """
+        Baris pembilang di balik angka satu prodi
+
+        Parameters:
+        -----------
+        prodi : str
+            Nama prodi
+        columns : list, optional
+            Kolom yang ditampilkan (default: semua)
+
+        Returns:
+        --------
+        pd.DataFrame
+        """
+        rows = self.source.iloc[self.rows_for(prodi)]
+        return rows if columns is None else rows[list(columns)]
+
+    # ------------------------------------------------------------------------
+    # Persistensi (results bundle)
+    # ------------------------------------------------------------------------
+
+    def save(self, directory):
+        """
+        Tulis indeks (npz) + frame sumber (parquet) ke folder
+
+        Returns:
+        --------
+        dict : Metadata untuk manifest bundle
+        """
+        from results_bundle import write_frame
+
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        index_file = directory / f'iku_{self.iku_number}.npz'
+        np.savez(index_file, labels=self.labels, offsets=self.offsets, rows=self.rows)
+        return {
+            'index': index_file.name,
+            'source': write_frame(self.source, directory / f'iku_{self.iku_number}.parquet'),
+            'unassigned': self.unassigned,
+        }
+
+    @classmethod
+    def load(cls, iku_number, directory, meta):
+        """Baca indeks hasil save()"""
+        from results_bundle import read_frame
+
+        directory = Path(directory)
+        with np.load(directory / meta['index']) as arrays:
+            labels, offsets, rows = arrays['labels'], arrays['offsets'], arrays['rows']
+        source = read_frame(directory / meta['source']['file'], meta['source']['encoded_columns'])
+        return cls(iku_number, labels, offsets, rows, source, meta.get('unassigned', 0))
+
+
+def pembilang_prodi(df_pembilang, df_penyebut=None):
+    """
+    Prodi untuk setiap baris pembilang (seperti pengelompokan processor)
+
+    Returns:
+    --------
+    pd.Series : Nama prodi per baris (NaN jika tidak diketahui)
+    """
+    for column in PRODI_COLUMNS:
+        if column in df_pembilang.columns:
+            prodi = df_pembilang[column]
+            break
+    else:
+        key = next((k for k in JOIN_KEYS if k in df_pembilang.columns
+                    and df_penyebut is not None and k in df_penyebut.columns), None)
+        reference_col = next((c for c in PRODI_COLUMNS
+                              if df_penyebut is not None and c in df_penyebut.columns), None)
+        if key is None or reference_col is None:
+            return pd.Series(np.nan, index=range(len(df_pembilang)), dtype=object)
+        # Satu prodi per ID (ID ganda di penyebut dilaporkan validation.py)
+        lookup = df_penyebut.drop_duplicates(subset=[key]).set_index(key)[reference_col]
+        prodi = df_pembilang[key].map(lookup)
+
+    prodi = prodi.reset_index(drop=True)
+    return prodi.where(prodi.isna(), prodi.astype(str).str.replace('Program Studi ', '', regex=False))
+
+
+# ============================================================================
+# DRILL-DOWN API
+# ============================================================================
+
+# Indeks yang sudah dibangun/dimuat di process ini {iku: ProvenanceIndex}
+_INDEXES = {}
+
+
+def register(index):
+    """Simpan indeks di cache process (dipakai drilldown tanpa hitung ulang)"""
+    _INDEXES[index.iku_number] = index
+    return index
+
+
+def get_index(iku_number, bundle=None):
+    """
+    Indeks provenance satu IKU
+
+    Urutan sumber: cache process, results bundle (jika diisi), lalu hitung
+    dari file Excel lewat processor.
+
+    Parameters:
+    -----------
+    iku_number : str
+        Nomor IKU
+    bundle : str or Path or ResultsBundle, optional
+        Results bundle dengan data provenance
+
+    Returns:
+    --------
+    ProvenanceIndex
+    """
+    if bundle is None and iku_number in _INDEXES:
+        return _INDEXES[iku_number]
+
+    if bundle is not None:
+        from results_bundle import ResultsBundle
+        if not isinstance(bundle, ResultsBundle):
+            bundle = ResultsBundle(bundle)
+        return bundle.provenance(iku_number)
+
+    from processors import compute_iku_frames
+    # Processor mencetak progress; drill-down hanya menampilkan hasil
+    with contextlib.redirect_stdout(io.StringIO()):
+        _, _, df_pembilang, df_penyebut = compute_iku_frames(iku_number)
+    return register(ProvenanceIndex.build(iku_number, df_pembilang, df_penyebut))
+
+
+def drilldown(iku_number, prodi, bundle=None, columns=None):
+    """
+    Baris pembilang di balik angka (IKU, prodi)
+
+    Parameters:
+    -----------
+    iku_number : str
+        Nomor IKU (gabungan 1-8 atau sub-IKU)
+    prodi : str
+        Nama prodi
+    bundle : str or Path or ResultsBundle, optional
+        Ambil dari results bundle (tanpa Excel/processor)
+    columns : list, optional
+        Kolom yang ditampilkan
+
+    Returns:
+    --------
+    pd.DataFrame
+    """
+    return get_index(iku_number, bundle).drilldown(prodi, columns)
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main(argv=None):
+    """
+    Drill-down dari command line
+
+    Returns:
+    --------
+    int : Exit code (0 = ok, 2 = IKU/prodi/bundle tidak ditemukan)
+    """
+    parser = argparse.ArgumentParser(
+        prog='provenance.py',
+        description='Drill-down: baris pembilang di balik angka per prodi suatu IKU'
+    )
+    parser.add_argument('iku', choices=ALL_IKU, metavar='IKU', help='Nomor IKU')
+    parser.add_argument('prodi', nargs='?', help='Nama prodi (kosong = --list)')
+    parser.add_argument('--list', action='store_true',
+                        help='Tampilkan jumlah baris per prodi')
+    parser.add_argument('--bundle', metavar='DIR',
+                        help='Ambil dari results bundle (python results_bundle.py DIR)')
+    parser.add_argument('--columns', nargs='+', metavar='COL',
+                        help='Kolom yang ditampilkan (default: semua)')
+    parser.add_argument('--json', action='store_true', help='Output JSON (records)')
+    args = parser.parse_args(argv)
+
+    try:
+        index = get_index(args.iku, args.bundle)
+        rows = None
+        if not args.list and args.prodi is not None:
+            rows = index.drilldown(args.prodi, args.columns)
+    except (KeyError, ValueError, OSError) as e:
+        print(f"❌ {e.args[0] if isinstance(e, KeyError) else e}", file=sys.stderr)
+        return 2
+
+    if rows is None:
+        counts = index.counts()
+        if args.json:
+            print(json.dumps({'iku': args.iku, 'counts': counts.to_dict(),
+                              'unassigned': index.unassigned}, indent=2, ensure_ascii=False))
+        else:
+            print(counts.to_string())
+            if index.unassigned:
+                print(f"(tanpa prodi: {index.unassigned} baris)")
+        return 0
+
+    if args.json:
+        print(rows.to_json(orient='records', force_ascii=False, date_format='iso', indent=2))
+    else:
+        label = index.resolve_label(args.prodi)
+        print(f"IKU {args.iku} - {label}: {len(rows)} baris")
+        with pd.option_context('display.max_rows', None, 'display.width', 200,
+                               'display.max_colwidth', 40):
+            print(rows.to_string())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
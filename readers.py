@@ -0,0 +1,584 @@
+"""
+============================================================================
+READERS - BACKEND PEMBACA FILE EXCEL IKU
+============================================================================
+
+read_excel_iku membaca file monitoring lewat salah satu backend berikut
+(semuanya menghasilkan DataFrame yang identik dengan
+pd.read_excel(path, header=1)):
+
+- openpyxl        : pd.read_excel dengan engine openpyxl (referensi)
+- openpyxl-stream : openpyxl read-only, iterasi values_only, lalu parsing
+                    dtype pandas yang sama (TextParser) - tanpa objek cell
+- calamine        : pd.read_excel engine calamine (butuh python-calamine)
+- cache           : cache kolumnar Parquet per file (butuh pyarrow), di-key
+                    dengan ukuran + mtime file; cache miss dibaca dengan
+                    backend sumber tercepat lalu disimpan
+
+CONFIG['reader_backend'] = 'auto' memilih backend tercepat per kelas
+ukuran file (SIZE_CLASSES) dari hasil kalibrasi satu kali di mesin ini
+(<base_path>/.iku_cache/reader_calibration.json). Kalibrasi otomatis
+dijalankan pada pembacaan pertama jika belum ada; backend yang hasilnya
+tidak identik dengan referensi tidak pernah dipilih. Backend dan kelas
+ukuran yang dipakai dicatat di span tracing "read ...".
+
+Backend tambahan bisa didaftarkan dengan register_backend().
+
+Usage:
+    python readers.py calibrate                  # kalibrasi ulang
+    python readers.py calibrate --synthetic-scale 20
+    python readers.py parity                     # cek parity semua file
+
+Author: Tim IKU FST
+Version: 2.0 (Modular)
+Last Updated: 2026-10-19
+============================================================================
+"""
+
+import sys
+import json
+import time
+import platform
+import argparse
+import tempfile
+import importlib.util
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from pandas.io.parsers import TextParser
+
+from config import CONFIG
+from tracing import span
+
+
+# Header kolom ada di baris kedua file export (baris pertama = judul)
+HEADER_ROW = 1
+
+# Kelas ukuran file: (nama, batas atas byte; None = tanpa batas)
+SIZE_CLASSES = (
+    ('small', 64 * 1024),
+    ('medium', 1024 * 1024),
+    ('large', None),
+)
+
+CACHE_DIR = '.iku_cache'
+CALIBRATION_FILE = 'reader_calibration.json'
+CALIBRATION_VERSION = 1
+
+_INPUT_PATTERN = 'monitoring-iku-*-*.xlsx'
+
+
+def size_class(path):
+    """Nama kelas ukuran (SIZE_CLASSES) untuk satu file"""
+    size = Path(path).stat().st_size
+    for name, limit in SIZE_CLASSES:
+        if limit is None or size < limit:
+            return name
+
+
+def input_files(base_path=None):
+    """Semua file Excel monitoring di base_path (default CONFIG['base_path'])"""
+    return sorted(Path(base_path or CONFIG['base_path']).glob(_INPUT_PATTERN))
+
+
+def cache_dir():
+    return CONFIG['base_path'] / CACHE_DIR
+
+
+# ============================================================================
+# BACKENDS
+# ============================================================================
+
+class ReaderBackend:
+    """
+    Interface backend pembaca
+
+    Subclass mengisi `name` dan read(path) yang mengembalikan DataFrame
+    identik dengan pd.read_excel(path, header=1).
+    """
+
+    name = None
+    requires = None  # Nama modul opsional yang dibutuhkan
+
+    def available(self):
+        return self.requires is None or importlib.util.find_spec(self.requires) is not None
+
+    def read(self, path):
+        raise NotImplementedError
+
+
+class OpenpyxlBackend(ReaderBackend):
+    """pd.read_excel engine openpyxl (perilaku asli, referensi parity)"""
+
+    name = 'openpyxl'
+
+    def read(self, path):
+        return pd.read_excel(path, header=HEADER_ROW, engine='openpyxl')
+
+
+class OpenpyxlStreamBackend(ReaderBackend):
+    """
+    openpyxl read-only dengan iterasi values_only
+
+    Konversi nilai mengikuti reader openpyxl pandas (cell kosong -> "",
+    float bulat -> int, kode error -> NaN, baris/kolom kosong di akhir
+    dibuang), lalu dtype ditentukan oleh TextParser yang sama dengan
+    pd.read_excel - hanya overhead objek cell per nilai yang dihilangkan.
+    """
+
+    name = 'openpyxl-stream'
+    requires = 'openpyxl'
+
+    def read(self, path):
+        from openpyxl import load_workbook
+        from openpyxl.cell.cell import ERROR_CODES
+
+        workbook = load_workbook(path, read_only=True, data_only=True, keep_links=False)
+        try:
+            sheet = workbook.worksheets[0]
+            sheet.reset_dimensions()
+
+            data = []
+            last_row_with_data = -1
+            for row_number, row in enumerate(sheet.iter_rows(values_only=True)):
+                converted = [_convert_value(value, ERROR_CODES) for value in row]
+                while converted and converted[-1] == '':
+                    converted.pop()
+                if converted:
+                    last_row_with_data = row_number
+                data.append(converted)
+        finally:
+            workbook.close()
+
+        data = data[:last_row_with_data + 1]
+        if data:
+            width = max(len(row) for row in data)
+            data = [row + [''] * (width - len(row)) for row in data]
+
+        return TextParser(data, header=HEADER_ROW).read()
+
+
+def _convert_value(value, error_codes):
+    if value is None:
+        return ''
+    if isinstance(value, float):
+        return int(value) if value.is_integer() else value
+    if isinstance(value, str) and value in error_codes:
+        return np.nan
+    return value
+
+
+class CalamineBackend(ReaderBackend):
+    """pd.read_excel engine calamine (Rust, butuh python-calamine)"""
+
+    name = 'calamine'
+    requires = 'python_calamine'
+
+    def read(self, path):
+        return pd.read_excel(path, header=HEADER_ROW, engine='calamine')
+
+
+class ColumnarCacheBackend(ReaderBackend):
+    """
+    Cache kolumnar: satu file Parquet per file Excel
+
+    Entry cache valid selama ukuran dan mtime file Excel (serta versi
+    pandas) sama. Kolom tipe campuran di-encode seperti results bundle.
+
+    Parameters:
+    -----------
+    directory : pathlib.Path, optional
+        Folder cache (default <base_path>/.iku_cache/frames)
+    """
+
+    name = 'cache'
+    requires = 'pyarrow'
+
+    def __init__(self, directory=None):
+        self.directory = Path(directory) if directory is not None else None
+
+    def _paths(self, path):
+        directory = self.directory or cache_dir() / 'frames'
+        return directory / f'{path.stem}.parquet', directory / f'{path.stem}.json'
+
+    @staticmethod
+    def _key(path):
+        stat = path.stat()
+        return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'pandas': pd.__version__}
+
+    def lookup(self, path):
+        """DataFrame dari cache, atau None jika belum ada / kedaluwarsa"""
+        from results_bundle import read_frame
+
+        path = Path(path)
+        frame_file, meta_file = self._paths(path)
+        try:
+            meta = json.loads(meta_file.read_text())
+        except (OSError, ValueError):
+            return None
+        if meta.get('key') != self._key(path) or not frame_file.exists():
+            return None
+        return read_frame(frame_file, meta['encoded_columns'])
+
+    def store(self, path, df):
+        from results_bundle import write_frame
+
+        path = Path(path)
+        frame_file, meta_file = self._paths(path)
+        info = write_frame(df, frame_file)
+        meta_file.write_text(json.dumps({'key': self._key(path),
+                                         'encoded_columns': info['encoded_columns']}))
+
+    def read_cached(self, path, source=None):
+        """
+        Baca lewat cache; status hit dikembalikan per pembacaan (instance
+        dipakai bersama oleh thread/worker, tanpa state per baca)
+
+        Parameters:
+        -----------
+        source : ReaderBackend, optional
+            Backend untuk cache miss (default openpyxl)
+
+        Returns:
+        --------
+        tuple : (pd.DataFrame, bool hit)
+        """
+        df = self.lookup(path)
+        if df is not None:
+            return df, True
+        df = (source or OpenpyxlBackend()).read(path)
+        self.store(path, df)
+        return df, False
+
+    def read(self, path, source=None):
+        """
+        Parameters:
+        -----------
+        source : ReaderBackend, optional
+            Backend untuk cache miss (default openpyxl)
+        """
+        return self.read_cached(path, source)[0]
+
+
+# Registry backend, urutan = prioritas saat waktu kalibrasi sama
+BACKENDS = {}
+
+
+def register_backend(backend):
+    """Daftarkan backend (instance ReaderBackend) dengan nama backend.name"""
+    BACKENDS[backend.name] = backend
+    return backend
+
+
+for _backend in (OpenpyxlBackend(), OpenpyxlStreamBackend(), CalamineBackend(), ColumnarCacheBackend()):
+    register_backend(_backend)
+
+
+def available_backends():
+    """Nama backend yang bisa dipakai di environment ini"""
+    return [name for name, backend in BACKENDS.items() if backend.available()]
+
+
+def get_backend(name):
+    """Backend berdasarkan nama (ValueError jika tidak dikenal / tidak terpasang)"""
+    backend = BACKENDS.get(name)
+    if backend is None:
+        raise ValueError(f"Reader backend tidak dikenal: {name} (pilihan: {', '.join(BACKENDS)})")
+    if not backend.available():
+        raise ValueError(f"Reader backend '{name}' butuh modul {backend.requires} (belum terpasang)")
+    return backend
+
+
+# ============================================================================
+# PARITY
+# ============================================================================
+
+def frames_equal(left, right):
+    """True jika dua DataFrame identik (nilai, dtype, kolom, index)"""
+    try:
+        pd.testing.assert_frame_equal(left, right, check_exact=True)
+    except AssertionError:
+        return False
+    return True
+
+
+def check_parity(files=None, backends=None):
+    """
+    Bandingkan hasil setiap backend dengan referensi openpyxl
+
+    Backend cache diuji dua kali: saat miss (menulis cache) dan saat hit
+    (membaca Parquet), dengan folder cache sementara.
+
+    Returns:
+    --------
+    dict : {file name: {backend: True/False}}
+    """
+    files = input_files() if files is None else [Path(f) for f in files]
+    backends = backends or available_backends()
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix='iku_reader_parity_') as tmp:
+        cache = ColumnarCacheBackend(tmp)
+        for path in files:
+            reference = BACKENDS['openpyxl'].read(path)
+            row = {}
+            for name in backends:
+                if name == 'openpyxl':
+                    continue
+                if name == 'cache':
+                    miss = cache.read(path)
+                    hit = cache.read(path)
+                    row[name] = frames_equal(reference, miss) and frames_equal(reference, hit)
+                else:
+                    row[name] = frames_equal(reference, BACKENDS[name].read(path))
+            results[path.name] = row
+    return results
+
+
+# ============================================================================
+# KALIBRASI
+# ============================================================================
+
+def _machine():
+    return {
+        'node': platform.node(),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'backends': available_backends(),
+    }
+
+
+def _best_time(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def calibrate(files=None, repeat=3, synthetic_scale=None, save=True):
+    """
+    Benchmark semua backend yang tersedia dan pilih yang tercepat per
+    kelas ukuran file
+
+    Backend yang hasilnya tidak identik dengan openpyxl pada salah satu
+    file di suatu kelas dikeluarkan dari pilihan kelas tersebut. Kelas
+    tanpa file sampel memakai pilihan kelas terdekat.
+
+    Parameters:
+    -----------
+    files : list, optional
+        File sampel (default: semua file monitoring di base_path)
+    repeat : int
+        Jumlah pengukuran per backend per file (diambil yang tercepat)
+    synthetic_scale : float, optional
+        Tambahkan file sintetis (synthetic_data.py) skala ini sebagai
+        sampel, misalnya untuk mengisi kelas 'large'
+    save : bool
+        Simpan hasil ke <base_path>/.iku_cache/reader_calibration.json
+
+    Returns:
+    --------
+    dict : Hasil kalibrasi ('classes': {kelas: {'backend', 'source', 'seconds', ...}})
+    """
+    files = input_files() if files is None else [Path(f) for f in files]
+    names = available_backends()
+
+    with tempfile.TemporaryDirectory(prefix='iku_reader_calibration_') as tmp, \
+            span('reader calibration', backends=','.join(names)):
+        if synthetic_scale:
+            from synthetic_data import write_dataset
+            files = files + [Path(f) for f in write_dataset(Path(tmp) / 'synthetic', scale=synthetic_scale)]
+
+        cache = ColumnarCacheBackend(Path(tmp) / 'cache')
+        timings = {}   # kelas -> backend -> total detik (None = gagal parity)
+        counts = {}
+        for path in files:
+            klass = size_class(path)
+            counts[klass] = counts.get(klass, 0) + 1
+            class_timings = timings.setdefault(klass, {name: 0.0 for name in names})
+            reference = BACKENDS['openpyxl'].read(path)
+
+            for name in names:
+                if class_timings[name] is None:
+                    continue
+                if name == 'cache':
+                    read = lambda: cache.read(path)
+                    read()  # isi cache; yang diukur pembacaan saat hit
+                else:
+                    read = lambda: BACKENDS[name].read(path)
+                if not frames_equal(reference, read()):
+                    class_timings[name] = None
+                    continue
+                class_timings[name] += _best_time(read, repeat)
+
+    classes = {}
+    for klass, class_timings in timings.items():
+        valid = {name: seconds for name, seconds in class_timings.items() if seconds is not None}
+        sources = {name: seconds for name, seconds in valid.items() if name != 'cache'}
+        classes[klass] = {
+            'backend': min(valid, key=valid.get),
+            'source': min(sources, key=sources.get),
+            'seconds': {name: round(seconds, 5) for name, seconds in valid.items()},
+            'rejected': [name for name, seconds in class_timings.items() if seconds is None],
+            'files': counts[klass],
+        }
+
+    # Kelas tanpa sampel: ikuti kelas terdekat (utamakan yang lebih kecil)
+    order = [name for name, _ in SIZE_CLASSES]
+    for index, klass in enumerate(order):
+        if klass in classes or not timings:
+            continue
+        nearest = min((name for name in order if name in timings),
+                      key=lambda name: (abs(order.index(name) - index), order.index(name)))
+        classes[klass] = dict(classes[nearest], files=0, inferred_from=nearest)
+
+    result = {
+        'version': CALIBRATION_VERSION,
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'machine': _machine(),
+        'classes': classes,
+    }
+    if save:
+        path = cache_dir() / CALIBRATION_FILE
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(result, indent=2))
+    return result
+
+
+def load_calibration():
+    """Hasil kalibrasi tersimpan, atau None jika belum ada / beda mesin"""
+    try:
+        result = json.loads((cache_dir() / CALIBRATION_FILE).read_text())
+    except (OSError, ValueError):
+        return None
+    if result.get('version') != CALIBRATION_VERSION or result.get('machine') != _machine():
+        return None
+    return result
+
+
+_CALIBRATION = {}
+
+
+def _calibration():
+    """Kalibrasi untuk base_path aktif (dimuat / dijalankan sekali per process)"""
+    key = str(cache_dir())
+    if key not in _CALIBRATION:
+        result = load_calibration()
+        if result is None:
+            print("   ⏱  Kalibrasi reader backend (sekali per mesin)...")
+            result = calibrate(repeat=1)
+        _CALIBRATION[key] = result
+    return _CALIBRATION[key]
+
+
+# ============================================================================
+# READ
+# ============================================================================
+
+def select_backend(path):
+    """
+    Backend yang dipakai untuk satu file
+
+    Returns:
+    --------
+    tuple : (backend, backend sumber untuk cache miss atau None, kelas ukuran)
+    """
+    klass = size_class(path)
+    choice = CONFIG.get('reader_backend', 'auto')
+    if choice != 'auto':
+        return get_backend(choice), None, klass
+
+    classes = _calibration()['classes']
+    if klass not in classes:
+        return BACKENDS['openpyxl'], None, klass
+    selected = classes[klass]
+    source = BACKENDS[selected['source']] if selected['backend'] == 'cache' else None
+    return BACKENDS[selected['backend']], source, klass
+
+
+def read_excel(path):
+    """
+    Baca satu file monitoring dengan backend terpilih
+
+    Returns:
+    --------
+    tuple : (pd.DataFrame, dict info untuk trace: reader, size_class,
+        reader_source / cache)
+    """
+    backend, source, klass = select_backend(path)
+    info = {'reader': backend.name, 'size_class': klass}
+    if backend.name == 'cache':
+        df, hit = backend.read_cached(path, source=source)
+        info['cache'] = 'hit' if hit else 'miss'
+        if not hit:
+            info['reader_source'] = (source or BACKENDS['openpyxl']).name
+    else:
+        df = backend.read(path)
+    return df, info
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def _print_calibration(result):
+    print(f"Backend tersedia: {', '.join(result['machine']['backends'])}")
+    for klass, _ in SIZE_CLASSES:
+        if klass not in result['classes']:
+            continue
+        selected = result['classes'][klass]
+        note = (f"mengikuti '{selected['inferred_from']}'" if 'inferred_from' in selected
+                else f"{selected['files']} file")
+        print(f"  {klass:<7} -> {selected['backend']:<16} (sumber miss: {selected['source']}; {note})")
+        for name, seconds in sorted(selected['seconds'].items(), key=lambda item: item[1]):
+            print(f"      {name:<16} {seconds * 1000:>9.1f} ms")
+        if selected['rejected']:
+            print(f"      ditolak (hasil tidak identik): {', '.join(selected['rejected'])}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Reader backend file Excel IKU')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    calibrate_parser = commands.add_parser('calibrate', help='Kalibrasi ulang pilihan backend per kelas ukuran')
+    calibrate_parser.add_argument('--repeat', type=int, default=3,
+                                  help='Pengukuran per backend per file (default: 3)')
+    calibrate_parser.add_argument('--synthetic-scale', type=float,
+                                  help='Tambahkan file sintetis skala ini sebagai sampel (mis. 20 untuk kelas large)')
+
+    parity_parser = commands.add_parser('parity', help='Cek hasil semua backend identik di setiap file monitoring')
+    parity_parser.add_argument('files', nargs='*', type=Path, help='File Excel (default: semua file monitoring)')
+
+    args = parser.parse_args()
+
+    if args.command == 'calibrate':
+        result = calibrate(repeat=args.repeat, synthetic_scale=args.synthetic_scale)
+        _print_calibration(result)
+        print(f"Tersimpan: {cache_dir() / CALIBRATION_FILE}")
+        return
+
+    results = check_parity(args.files or None)
+    if not results:
+        print('Tidak ada file monitoring untuk dicek.')
+        sys.exit(1)
+    names = sorted({name for row in results.values() for name in row})
+    print(f"{'file':<36}" + ''.join(f'{name:>17}' for name in names))
+    failed = False
+    for filename, row in results.items():
+        cells = []
+        for name in names:
+            cells.append(f"{'OK' if row[name] else 'BEDA':>17}")
+            failed = failed or not row[name]
+        print(f'{filename:<36}' + ''.join(cells))
+    print()
+    print('GAGAL: ada backend yang hasilnya tidak identik dengan openpyxl' if failed
+          else f'OK: semua backend identik dengan openpyxl di {len(results)} file')
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
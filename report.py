@@ -0,0 +1,287 @@
+"""
+============================================================================
+PDF REPORT - SISTEM VISUALISASI IKU
+============================================================================
+
+Laporan PDF tunggal berisi semua figure yang dibuat dalam satu run.
+
+Laporan dibuat secara streaming: setiap figure langsung ditulis sebagai
+satu file PDF satu halaman di folder spool (lewat figure sink di
+exporters.py), lalu figure di-close seperti biasa. Setiap file halaman
+ditutup saat itu juga, sehingga memori yang dipakai hanya satu figure
+pada satu waktu, berapa pun jumlah chart.
+
+Saat laporan ditutup, halaman daftar isi dan tabel ringkasan per IKU
+ditambahkan, kemudian file halaman digabung (pypdf) dalam urutan
+struktur IKU_METADATA - figure tidak di-render ulang:
+
+    Daftar Isi
+    Ringkasan Fakultas (summary dashboard, overall achievement)
+    IKU 1   -> tabel ringkasan, chart, breakdown
+    IKU 11  -> ...
+
+Worker process (parallel) menulis halaman PDF-nya sendiri ke folder
+spool yang sama lewat PdfPageWriter (figure sink yang bisa di-pickle);
+parent hanya mencatat halaman tersebut dengan PdfReport.add_worker_page().
+
+Membutuhkan pypdf (pip install pypdf) untuk menggabung halaman.
+
+Author: Tim IKU FST
+Version: 2.0 (Modular)
+Last Updated: 2026-10-19
+============================================================================
+"""
+
+import re
+import shutil
+import importlib.util
+import tempfile
+from pathlib import Path
+
+from config import CONFIG, IKU_METADATA
+from figures import managed_figure
+
+
+# Ukuran halaman teks (A4 landscape, inch)
+PAGE_SIZE = (11.69, 8.27)
+
+# Jumlah baris tabel per halaman
+TOC_ROWS_PER_PAGE = 28
+SUMMARY_ROWS_PER_PAGE = 22
+
+# Section untuk figure yang bukan milik satu IKU
+OVERVIEW_SECTION = 'overview'
+OVERVIEW_TITLE = 'Ringkasan Fakultas'
+
+_IKU_FILENAME = re.compile(r'^IKU_(\d+)_')
+
+
+def section_for(filename_base):
+    """
+    Tentukan section laporan dari nama file figure
+
+    'IKU_31_vertical' -> '31', 'IKU_summary_dashboard' -> 'overview'
+    """
+    match = _IKU_FILENAME.match(filename_base)
+    if match and match.group(1) in IKU_METADATA:
+        return match.group(1)
+    return OVERVIEW_SECTION
+
+
+class PdfPageWriter:
+    """
+    Figure sink: tulis setiap figure sebagai file PDF satu halaman
+
+    Bisa di-pickle (hanya menyimpan path), sehingga dipakai juga oleh
+    worker process untuk menulis halaman langsung ke folder spool laporan.
+
+    Parameters:
+    -----------
+    directory : str or Path
+        Folder spool halaman
+    """
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+
+    def path_for(self, filename_base):
+        return self.directory / f'{filename_base}.pdf'
+
+    def __call__(self, fig, filename_base):
+        # savefig ke file sendiri: PdfFile matplotlib ditutup (dan
+        # melepas data gambar) setelah halaman ini selesai
+        fig.savefig(self.path_for(filename_base), format='pdf', bbox_inches='tight')
+
+
+class PdfReport:
+    """
+    Laporan PDF streaming
+
+    Instance bersifat callable sehingga bisa langsung didaftarkan sebagai
+    figure sink: add_figure_sink(report).
+
+    Parameters:
+    -----------
+    pdf_file : str or Path
+        Path file PDF output
+    """
+
+    def __init__(self, pdf_file):
+        # pypdf baru dipakai saat close(); cek di awal agar run tidak gagal di akhir
+        if importlib.util.find_spec('pypdf') is None:
+            raise ImportError("Laporan PDF butuh pypdf (pip install pypdf)")
+
+        self.pdf_file = Path(pdf_file)
+        self.pdf_file.parent.mkdir(parents=True, exist_ok=True)
+        self.spool_dir = Path(tempfile.mkdtemp(prefix='.iku_report_', dir=self.pdf_file.parent))
+        self.worker_pages = PdfPageWriter(self.spool_dir / 'workers')
+        self.worker_pages.directory.mkdir()
+        self._pages = []  # (section, kind, label, file) per halaman, urutan tulis
+
+    def __call__(self, fig, filename_base):
+        self.add_figure(fig, filename_base)
+
+    def __len__(self):
+        return len(self._pages)
+
+    # ------------------------------------------------------------------------
+    # Streaming pages
+    # ------------------------------------------------------------------------
+
+    def _page_file(self):
+        return self.spool_dir / f'{len(self._pages):04d}.pdf'
+
+    def add_figure(self, fig, filename_base):
+        """Tulis figure sebagai satu halaman PDF (langsung ke disk)"""
+        page_file = self._page_file()
+        fig.savefig(page_file, format='pdf', bbox_inches='tight')
+        self._pages.append((section_for(filename_base), 'figure', filename_base, page_file))
+
+    def add_worker_page(self, filename_base):
+        """
+        Catat halaman yang ditulis worker process lewat self.worker_pages
+
+        Returns:
+        --------
+        bool : False jika worker tidak menulis halaman untuk figure ini
+        """
+        page_file = self.worker_pages.path_for(filename_base)
+        if not page_file.exists():
+            return False
+        self._pages.append((section_for(filename_base), 'figure', filename_base, page_file))
+        return True
+
+    # ------------------------------------------------------------------------
+    # Generated pages (TOC, summary tables)
+    # ------------------------------------------------------------------------
+
+    def _add_table_page(self, title, subtitle, col_labels, rows, section, kind):
+        """Tulis satu halaman berisi judul dan tabel"""
+        page_file = self._page_file()
+        with managed_figure(figsize=PAGE_SIZE) as fig:
+            fig.text(0.05, 0.94, title, fontsize=16, fontweight='bold', va='top')
+            if subtitle:
+                fig.text(0.05, 0.885, subtitle, fontsize=10, color='#555555', va='top')
+
+            if rows:
+                ax = fig.add_axes([0.05, 0.05, 0.9, 0.78])
+                ax.axis('off')
+                table = ax.table(cellText=rows, colLabels=col_labels,
+                                 loc='upper center', cellLoc='left', colLoc='left')
+                table.auto_set_font_size(False)
+                table.set_fontsize(9)
+                table.scale(1, 1.3)
+                for (row, _), cell in table.get_celld().items():
+                    cell.set_edgecolor('#cccccc')
+                    if row == 0:
+                        cell.set_facecolor('#2c3e50')
+                        cell.get_text().set_color('white')
+                        cell.get_text().set_fontweight('bold')
+
+            fig.savefig(page_file, format='pdf')
+        self._pages.append((section, kind, title, page_file))
+
+    def _add_summary_pages(self, iku_number, stats, data):
+        """Tabel ringkasan satu IKU: statistik total + data per prodi"""
+        metadata = IKU_METADATA[iku_number]
+        subtitle = (f"Pembilang: {stats['pembilang']} | Penyebut: {stats['penyebut']} | "
+                    f"Capaian: {stats['persentase']}%")
+        target = CONFIG['target_values'].get(iku_number)
+        if target is not None:
+            status = 'Tercapai' if stats['persentase'] >= target else 'Belum tercapai'
+            subtitle += f" | Target: {target}% ({status})"
+
+        col_labels, rows = ['Keterangan'], [[metadata['description']]]
+        if data is not None and len(data):
+            col_labels = [col for col in ('Program Studi', 'Pembilang', 'Penyebut', 'Persentase')
+                          if col in data.columns] or list(data.columns[:4])
+            rows = data[col_labels].astype(str).values.tolist()
+
+        for start in range(0, len(rows), SUMMARY_ROWS_PER_PAGE):
+            self._add_table_page(metadata['title'], subtitle, col_labels,
+                                 rows[start:start + SUMMARY_ROWS_PER_PAGE],
+                                 iku_number, 'summary')
+
+    def _section_order(self):
+        """Urutan section: overview lalu IKU sesuai IKU_METADATA"""
+        return [OVERVIEW_SECTION] + list(IKU_METADATA)
+
+    def _final_order(self, toc_indices):
+        """Index halaman (urutan tulis) dalam urutan akhir laporan"""
+        order = list(toc_indices)
+        for section in self._section_order():
+            # Di dalam section: tabel ringkasan dulu, lalu figure sesuai urutan render
+            for kind in ('summary', 'figure'):
+                order.extend(i for i, page in enumerate(self._pages)
+                             if page[0] == section and page[1] == kind)
+        return order
+
+    def _add_toc(self):
+        """Tulis halaman daftar isi; return index halaman TOC"""
+        sections = [s for s in self._section_order()
+                    if any(page[0] == s for page in self._pages)]
+        n_toc_pages = max(1, -(-len(sections) // TOC_ROWS_PER_PAGE))
+
+        # Nomor halaman awal tiap section setelah TOC
+        rows = []
+        page_num = n_toc_pages + 1
+        for section in sections:
+            n_pages = sum(1 for page in self._pages if page[0] == section)
+            if section == OVERVIEW_SECTION:
+                rows.append(['-', OVERVIEW_TITLE, str(page_num)])
+            else:
+                rows.append([section, IKU_METADATA[section]['title'], str(page_num)])
+            page_num += n_pages
+
+        first_toc = len(self._pages)
+        for start in range(0, len(rows), TOC_ROWS_PER_PAGE):
+            self._add_table_page('Daftar Isi', 'Laporan Indikator Kinerja Utama',
+                                 ['IKU', 'Bagian', 'Halaman'],
+                                 rows[start:start + TOC_ROWS_PER_PAGE], 'toc', 'toc')
+        return range(first_toc, len(self._pages))
+
+    def _merge_pages(self, order):
+        """
+        Gabung file halaman dalam urutan akhir ke pdf_file (tanpa render ulang)
+        """
+        from pypdf import PdfWriter
+
+        self._pages = [self._pages[i] for i in order]
+        writer = PdfWriter()
+        for _, _, _, page_file in self._pages:
+            writer.append(str(page_file))
+        with open(self.pdf_file, 'wb') as f:
+            writer.write(f)
+        writer.close()
+
+    def close(self, all_stats=None, all_data=None):
+        """
+        Tambahkan tabel ringkasan + daftar isi, susun halaman, tutup PDF
+
+        Parameters:
+        -----------
+        all_stats : dict, optional
+            {iku_number: stats}
+        all_data : dict, optional
+            {iku_number: DataFrame per prodi}
+
+        Returns:
+        --------
+        Path : Path file PDF
+        """
+        all_stats = all_stats or {}
+        all_data = all_data or {}
+
+        for iku_number in IKU_METADATA:
+            if iku_number in all_stats:
+                self._add_summary_pages(iku_number, all_stats[iku_number],
+                                        all_data.get(iku_number))
+
+        toc_indices = self._add_toc()
+        try:
+            self._merge_pages(self._final_order(toc_indices))
+        finally:
+            shutil.rmtree(self.spool_dir, ignore_errors=True)
+
+        print(f"    ✓ PDF: {self.pdf_file.name} ({len(self._pages)} halaman)")
+        return self.pdf_file
@@ -0,0 +1,397 @@
+"""
+============================================================================
+RESULTS BUNDLE - SISTEM VISUALISASI IKU
+============================================================================
+
+Build dua fase: COMPUTE (Excel -> bundle) lalu RENDER (bundle -> chart).
+
+Fase compute membaca semua file Excel sekali, memproses setiap IKU, lalu
+menulis results bundle ke satu folder:
+
+    <bundle>/
+        manifest.json              Versi, fingerprint input, stats per IKU,
+                                   daftar file + skema
+        frames/iku_31_pembilang.parquet
+                                   DataFrame input (persis hasil
+                                   read_excel_iku, sebelum normalisasi)
+        tables/iku_31.parquet      Tabel per prodi (hasil processor)
+        provenance/iku_31.npz      Indeks baris pembilang per prodi
+        provenance/iku_31.parquet  Frame pembilang yang diindeks
+                                   (drill-down, lihat provenance.py)
+
+Fase render memakai ResultsBundle sebagai sumber data read_excel_iku
+(utils.set_frame_source), sehingga breakdown dan combined processor
+membaca DataFrame dari bundle - tanpa I/O Excel sama sekali. Tabel per
+prodi dan stats dipakai langsung oleh main().
+
+Kolom object dengan tipe campuran (misalnya NIP berisi int dan str) tidak
+bisa disimpan apa adanya di Parquet; kolom seperti ini di-encode sebagai
+JSON per nilai dan di-decode kembali saat dibaca, sehingga round-trip
+tetap identik.
+
+Usage:
+    python results_bundle.py                      # compute -> bundle/
+    python main_visualize_iku.py --bundle bundle  # render dari bundle
+
+Membutuhkan pyarrow (pip install pyarrow).
+
+Author: Tim IKU FST
+Version: 2.0 (Modular)
+Last Updated: 2026-10-19
+============================================================================
+"""
+
+import json
+import hashlib
+import argparse
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+from config import CONFIG, ALL_IKU
+from tracing import add as trace_add
+
+
+BUNDLE_VERSION = 1
+MANIFEST_FILE = 'manifest.json'
+
+DEFAULT_BUNDLE_DIR = CONFIG['base_path'] / 'bundle'
+
+_INPUT_PATTERN = 'monitoring-iku-*-*.xlsx'
+
+
+# ============================================================================
+# MIXED-TYPE COLUMN ENCODING
+# ============================================================================
+
+def _mixed_object_columns(df):
+    """Kolom object yang berisi lebih dari satu tipe Python (selain NaN)"""
+    mixed = []
+    for col in df.columns:
+        if df[col].dtype != object:
+            continue
+        types = {type(v) for v in df[col].dropna()}
+        if len(types) > 1:
+            mixed.append(col)
+    return mixed
+
+
+def _json_scalar(value):
+    """numpy scalar -> Python scalar (agar bisa di-serialize ke JSON)"""
+    return value.item() if hasattr(value, 'item') else value
+
+
+def _encode_value(value):
+    if value is None or (isinstance(value, float) and value != value):
+        return None
+    if isinstance(value, (pd.Timestamp, datetime)):
+        return json.dumps({'$datetime': value.isoformat()})
+    return json.dumps(_json_scalar(value))
+
+
+def _decode_value(text):
+    if text is None:
+        return float('nan')
+    value = json.loads(text)
+    if isinstance(value, dict) and '$datetime' in value:
+        return pd.Timestamp(value['$datetime'])
+    return value
+
+
+def encode_frame(df):
+    """
+    Siapkan DataFrame untuk Arrow/Parquet (kolom tipe campuran -> JSON)
+
+    Returns:
+    --------
+    tuple : (DataFrame ter-encode, list nama kolom yang di-encode)
+    """
+    encoded = _mixed_object_columns(df)
+    out = df.copy()
+    for col in encoded:
+        out[col] = out[col].map(_encode_value).astype(object)
+    return out, [str(col) for col in encoded]
+
+
+def decode_frame(df, encoded_columns=()):
+    """Kebalikan encode_frame (in-place, return df)"""
+    for col in encoded_columns:
+        df[col] = df[col].map(_decode_value).astype(object)
+    return df
+
+
+def write_frame(df, path):
+    """
+    Tulis DataFrame ke Parquet (kolom tipe campuran di-encode JSON)
+
+    Returns:
+    --------
+    dict : Metadata file untuk manifest
+    """
+    out, encoded = encode_frame(df)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    out.to_parquet(path, index=False)
+
+    return {
+        'file': path.name,
+        'rows': int(len(df)),
+        'columns': [str(col) for col in df.columns],
+        'encoded_columns': encoded,
+    }
+
+
+def read_frame(path, encoded_columns=()):
+    """Baca DataFrame dari Parquet dan decode kolom tipe campuran"""
+    return decode_frame(pd.read_parquet(path), encoded_columns)
+
+
+# ============================================================================
+# INPUT FINGERPRINT
+# ============================================================================
+
+def input_files():
+    """Daftar file Excel input: {(iku_number, file_type): Path}"""
+    files = {}
+    for path in sorted(CONFIG['base_path'].glob(_INPUT_PATTERN)):
+        _, _, iku_number, file_type = path.stem.split('-', 3)
+        files[(iku_number, file_type)] = path
+    return files
+
+
+def file_sha1(path):
+    """SHA-1 isi file"""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# ============================================================================
+# BUNDLE
+# ============================================================================
+
+class ResultsBundle:
+    """
+    Results bundle hasil fase compute
+
+    Instance bersifat callable dengan signature read_excel_iku, sehingga
+    bisa dipasang langsung: utils.set_frame_source(bundle).
+
+    Parameters:
+    -----------
+    bundle_dir : str or Path
+        Folder bundle (berisi manifest.json)
+    """
+
+    def __init__(self, bundle_dir):
+        self.bundle_dir = Path(bundle_dir)
+        manifest_file = self.bundle_dir / MANIFEST_FILE
+        if not manifest_file.exists():
+            raise FileNotFoundError(f"Manifest bundle tidak ditemukan: {manifest_file}")
+
+        self.manifest = json.loads(manifest_file.read_text(encoding='utf-8'))
+        version = self.manifest.get('bundle_version')
+        if version != BUNDLE_VERSION:
+            raise ValueError(f"Versi bundle {version} tidak didukung "
+                             f"(diharapkan {BUNDLE_VERSION}); jalankan ulang compute")
+
+        self._frames = {}
+        self._tables = {}
+        self._provenance = {}
+
+    def __getstate__(self):
+        # Untuk worker process: kirim path + manifest saja, bukan DataFrame
+        state = self.__dict__.copy()
+        state['_frames'] = {}
+        state['_tables'] = {}
+        state['_provenance'] = {}
+        return state
+
+    def __call__(self, iku_number, file_type='pembilang'):
+        return self.frame(iku_number, file_type)
+
+    def keys(self):
+        """Semua (iku_number, file_type) yang tersedia di bundle"""
+        return [tuple(key.split('_')[1:]) for key in self.manifest['frames']]
+
+    @property
+    def iku_list(self):
+        """IKU yang ada di bundle (urutan ALL_IKU)"""
+        return list(self.manifest['ikus'])
+
+    def frame(self, iku_number, file_type='pembilang'):
+        """
+        DataFrame input (copy) seperti hasil read_excel_iku
+
+        Raises FileNotFoundError jika tidak ada di bundle (sama dengan
+        perilaku read_excel_iku untuk file yang tidak ada).
+        """
+        key = f'iku_{iku_number}_{file_type}'
+        if key in self._frames:
+            trace_add(cache_hits=1)
+        else:
+            meta = self.manifest['frames'].get(key)
+            if meta is None:
+                raise FileNotFoundError(f"Data {key} tidak ada di bundle {self.bundle_dir}")
+            self._frames[key] = read_frame(self.bundle_dir / 'frames' / meta['file'],
+                                           meta['encoded_columns'])
+        return self._frames[key].copy()
+
+    def stats(self, iku_number):
+        """Statistik IKU: {'pembilang', 'penyebut', 'persentase', ...}"""
+        return dict(self.manifest['ikus'][iku_number]['stats'])
+
+    def table(self, iku_number):
+        """Tabel per prodi (copy)"""
+        if iku_number in self._tables:
+            trace_add(cache_hits=1)
+        else:
+            meta = self.manifest['ikus'][iku_number]['table']
+            self._tables[iku_number] = read_frame(self.bundle_dir / 'tables' / meta['file'],
+                                                  meta['encoded_columns'])
+        return self._tables[iku_number].copy()
+
+    def provenance(self, iku_number):
+        """
+        Indeks provenance (drill-down) satu IKU
+
+        Raises KeyError jika IKU tidak punya data provenance di bundle.
+        """
+        from provenance import ProvenanceIndex
+
+        if iku_number in self._provenance:
+            trace_add(cache_hits=1)
+        else:
+            meta = self.manifest['ikus'].get(iku_number, {}).get('provenance')
+            if meta is None:
+                raise KeyError(f"Provenance IKU {iku_number} tidak ada di bundle {self.bundle_dir}")
+            self._provenance[iku_number] = ProvenanceIndex.load(
+                iku_number, self.bundle_dir / 'provenance', meta)
+        return self._provenance[iku_number]
+
+    def result(self, iku_number):
+        """Hasil IKU dalam format process_single_iku: {'data', 'stats'}"""
+        if iku_number not in self.manifest['ikus']:
+            return None
+        return {'data': self.table(iku_number), 'stats': self.stats(iku_number)}
+
+
+class _MemoryFrameSource:
+    """Frame source dari DataFrame yang sudah dibaca (fase compute)"""
+
+    def __init__(self, frames):
+        self.frames = frames
+
+    def keys(self):
+        return list(self.frames)
+
+    def __call__(self, iku_number, file_type='pembilang'):
+        key = (iku_number, file_type)
+        if key not in self.frames:
+            raise FileNotFoundError(f"File tidak ditemukan: monitoring-iku-{iku_number}-{file_type}.xlsx")
+        return self.frames[key].copy()
+
+
+def compute_bundle(bundle_dir, iku_list=None):
+    """
+    Fase compute: baca Excel, proses semua IKU, tulis results bundle
+
+    Parameters:
+    -----------
+    bundle_dir : str or Path
+        Folder output bundle (dibuat jika belum ada)
+    iku_list : list, optional
+        IKU yang diproses (default: semua IKU)
+
+    Returns:
+    --------
+    ResultsBundle
+    """
+    # Import di sini: processors -> utils (matplotlib) tidak dibutuhkan
+    # oleh konsumen bundle yang hanya membaca
+    from utils import read_excel_iku, set_frame_source
+    from main_visualize_iku import process_single_iku
+
+    bundle_dir = Path(bundle_dir)
+    iku_list = iku_list or ALL_IKU
+
+    # 1. Baca semua file Excel sekali
+    print("  [1/3] Membaca file Excel...")
+    previous_source = set_frame_source(None)
+    frames = {}
+    inputs = {}
+    for (iku_number, file_type), path in input_files().items():
+        frames[(iku_number, file_type)] = read_excel_iku(iku_number, file_type)
+        stat = path.stat()
+        inputs[path.name] = {'size': stat.st_size, 'sha1': file_sha1(path)}
+
+    # 2. Proses setiap IKU dari DataFrame di memori
+    print(f"  [2/3] Memproses {len(iku_list)} IKU...")
+    set_frame_source(_MemoryFrameSource(frames))
+    results = {}
+    try:
+        for iku in iku_list:
+            result = process_single_iku(iku, render=False)
+            if result is not None:
+                results[iku] = result
+    finally:
+        set_frame_source(previous_source)
+
+    # 3. Tulis bundle
+    print(f"  [3/3] Menulis bundle ke {bundle_dir}...")
+    manifest = {
+        'bundle_version': BUNDLE_VERSION,
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'inputs': inputs,
+        'target_values': CONFIG['target_values'],
+        'frames': {},
+        'ikus': {},
+    }
+    for (iku_number, file_type), df in frames.items():
+        key = f'iku_{iku_number}_{file_type}'
+        manifest['frames'][key] = write_frame(df, bundle_dir / 'frames' / f'{key}.parquet')
+
+    for iku in ALL_IKU:
+        if iku not in results:
+            continue
+        stats = results[iku]['stats']
+        manifest['ikus'][iku] = {
+            'stats': {key: _json_scalar(value) for key, value in stats.items()},
+            'table': write_frame(results[iku]['data'].reset_index(drop=True),
+                                 bundle_dir / 'tables' / f'iku_{iku}.parquet'),
+        }
+        if results[iku].get('provenance') is not None:
+            manifest['ikus'][iku]['provenance'] = results[iku]['provenance'].save(
+                bundle_dir / 'provenance')
+
+    # Bundle ID: hash isi input + versi, untuk membedakan bundle
+    bundle_id = hashlib.sha1(json.dumps([BUNDLE_VERSION, inputs], sort_keys=True).encode())
+    manifest['bundle_id'] = bundle_id.hexdigest()[:16]
+
+    (bundle_dir / MANIFEST_FILE).write_text(json.dumps(manifest, indent=2, ensure_ascii=False),
+                                            encoding='utf-8')
+    print(f"    ✓ Bundle {manifest['bundle_id']}: {len(manifest['frames'])} frames, "
+          f"{len(manifest['ikus'])} IKU")
+
+    return ResultsBundle(bundle_dir)
+
+
+def parse_arguments():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(
+        description='Fase compute: baca Excel IKU dan tulis results bundle',
+        epilog='Render dari bundle: python main_visualize_iku.py --bundle DIR'
+    )
+    parser.add_argument('bundle_dir', nargs='?', default=str(DEFAULT_BUNDLE_DIR),
+                        help=f'Folder bundle (default: {DEFAULT_BUNDLE_DIR.name}/)')
+    parser.add_argument('--iku', '-i', nargs='+', choices=ALL_IKU, metavar='IKU',
+                        help='IKU yang diproses (default: semua)')
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_arguments()
+    compute_bundle(args.bundle_dir, args.iku)
@@ -0,0 +1,179 @@
+"""
+============================================================================
+SHARED FRAMES - SISTEM VISUALISASI IKU
+============================================================================
+
+Serah-terima DataFrame input ke worker process lewat shared memory.
+
+Parent process membaca setiap DataFrame input sekali, menulisnya sebagai
+Arrow IPC stream ke satu blok multiprocessing.shared_memory per frame,
+lalu hanya mengirim handle kecil (nama blok + ukuran) ke worker. Worker
+meng-attach blok yang sama dan membaca tabel Arrow langsung dari buffer
+shared memory (tanpa copy, tanpa unpickle). Data input tidak lagi
+diduplikasi per worker dan tidak ada biaya pickle yang tumbuh dengan
+ukuran data.
+
+Konversi ke pandas (SharedFrameSource.__call__) tetap membuat DataFrame
+baru, karena kontrak read_excel_iku adalah "caller boleh memodifikasi
+hasilnya". Konsumen yang cukup dengan Arrow bisa memakai .table().
+
+    with SharedFrameStore.from_current_source() as store:
+        with ProcessPoolExecutor(..., initializer=set_frame_source,
+                                 initargs=(store.source(),)):
+            ...
+
+Membutuhkan pyarrow (pip install pyarrow).
+
+Author: Tim IKU FST
+Version: 2.0 (Modular)
+Last Updated: 2026-10-19
+============================================================================
+"""
+
+from multiprocessing import shared_memory
+
+import pyarrow as pa
+
+from results_bundle import encode_frame, decode_frame, input_files
+
+
+# Blok yang sudah di-attach di process ini: {nama blok: SharedMemory}.
+# Disimpan di level modul agar buffer tetap valid selama worker hidup
+# (tabel Arrow mereferensikan memori blok secara langsung).
+_ATTACHED = {}
+
+
+def _frame_key(iku_number, file_type):
+    return f'iku_{iku_number}_{file_type}'
+
+
+# ============================================================================
+# PARENT: PUBLISH
+# ============================================================================
+
+class SharedFrameStore:
+    """
+    Pemilik blok shared memory (dipakai di parent process)
+
+    Blok di-unlink saat close() / keluar dari context manager; pastikan
+    semua worker sudah selesai sebelum itu.
+    """
+
+    def __init__(self):
+        self._blocks = {}
+        self.handles = {}   # key -> (nama blok, ukuran bytes, kolom ter-encode)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def nbytes(self):
+        """Total ukuran data yang dipublikasikan (bytes)"""
+        return sum(size for _, size, _ in self.handles.values())
+
+    def publish(self, iku_number, file_type, df):
+        """Tulis satu DataFrame ke blok shared memory baru"""
+        out, encoded = encode_frame(df)
+        table = pa.Table.from_pandas(out, preserve_index=False)
+
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        payload = sink.getvalue()
+
+        key = _frame_key(iku_number, file_type)
+        block = shared_memory.SharedMemory(create=True, size=max(payload.size, 1))
+        self._blocks[key] = block
+        block.buf[:payload.size] = memoryview(payload).cast('B')
+        self.handles[key] = (block.name, payload.size, encoded)
+
+    def source(self):
+        """Frame source (picklable, kecil) untuk dikirim ke worker"""
+        return SharedFrameSource(self.handles)
+
+    def close(self):
+        """Lepas dan hapus semua blok"""
+        for block in self._blocks.values():
+            block.close()
+            block.unlink()
+        self._blocks.clear()
+        self.handles.clear()
+
+    @classmethod
+    def from_current_source(cls, keys=None):
+        """
+        Publikasikan DataFrame input dari sumber read_excel_iku aktif
+
+        Sumber aktif bisa file Excel (default) atau results bundle; key
+        yang tersedia diambil dari source.keys() jika ada, atau dari file
+        Excel yang ada.
+
+        Parameters:
+        -----------
+        keys : iterable of (iku_number, file_type), optional
+            Hanya frame ini yang dipublikasikan (yang tidak tersedia
+            dilewati; worker mendapat FileNotFoundError seperti biasa).
+            Default: semua frame yang tersedia
+        """
+        from utils import read_excel_iku, get_frame_source
+
+        source = get_frame_source()
+        available = source.keys() if hasattr(source, 'keys') else list(input_files())
+        if keys is not None:
+            wanted = {tuple(key) for key in keys}
+            available = [key for key in available if tuple(key) in wanted]
+        keys = available
+
+        store = cls()
+        try:
+            for iku_number, file_type in keys:
+                store.publish(iku_number, file_type, read_excel_iku(iku_number, file_type))
+        except BaseException:
+            store.close()
+            raise
+        return store
+
+
+# ============================================================================
+# WORKER: ATTACH
+# ============================================================================
+
+class SharedFrameSource:
+    """
+    Frame source untuk utils.set_frame_source di worker process
+
+    Hanya berisi handle (nama blok); pickle-nya berukuran beberapa ratus
+    byte berapa pun ukuran datanya.
+    """
+
+    def __init__(self, handles):
+        self.handles = dict(handles)
+
+    def keys(self):
+        return [tuple(key.split('_')[1:]) for key in self.handles]
+
+    def table(self, iku_number, file_type='pembilang'):
+        """
+        Tabel Arrow yang membaca langsung dari shared memory (tanpa copy)
+
+        Kolom tipe campuran masih dalam bentuk JSON (lihat encode_frame).
+        """
+        key = _frame_key(iku_number, file_type)
+        if key not in self.handles:
+            raise FileNotFoundError(f"File tidak ditemukan: monitoring-iku-{iku_number}-{file_type}.xlsx")
+
+        name, size, _ = self.handles[key]
+        block = _ATTACHED.get(name)
+        if block is None:
+            block = _ATTACHED[name] = shared_memory.SharedMemory(name=name)
+
+        buffer = pa.py_buffer(block.buf)[:size]
+        return pa.ipc.open_stream(buffer).read_all()
+
+    def __call__(self, iku_number, file_type='pembilang'):
+        table = self.table(iku_number, file_type)
+        _, _, encoded = self.handles[_frame_key(iku_number, file_type)]
+        return decode_frame(table.to_pandas(), encoded)
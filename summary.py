@@ -0,0 +1,330 @@
+"""
+============================================================================
+SUMMARY - RINGKASAN CAPAIAN IKU (TANPA PLOTTING)
+============================================================================
+
+Mode ringkasan untuk health check (cron) dan notifikasi: baca data,
+jalankan processor, lalu cetak "RINGKASAN HASIL" per IKU (opsional per
+prodi) atau tulis JSON. Modul ini dan semua yang diimpornya tidak memuat
+matplotlib, seaborn, maupun modul breakdown.
+
+Sumber data:
+- file Excel (backend CONFIG['reader_backend'] / --reader; backend
+  'cache' atau 'auto' yang sudah terkalibrasi membaca cache Parquet)
+- results bundle (--bundle DIR): stats & tabel per prodi langsung dari
+  bundle, tanpa processor
+
+Exit code:
+    0  semua IKU memenuhi target
+    1  ada IKU di bawah target
+    2  ada IKU yang gagal dihitung
+
+Usage:
+    python summary.py                          # ringkasan teks
+    python summary.py --prodi                  # + rincian per prodi
+    python summary.py --json                   # JSON ke stdout
+    python summary.py --json output/summary.json --bundle bundle
+    python main_visualize_iku.py --summary-only [--json]
+    python summary.py check --junit out.xml    # gate regresi (target_check.py)
+
+Author: Tim IKU FST
+Version: 2.0 (Modular)
+Last Updated: 2026-10-19
+============================================================================
+"""
+
+import io
+import sys
+import json
+import argparse
+import contextlib
+from datetime import datetime
+from pathlib import Path
+
+from config import CONFIG, ALL_IKU, IKU_METADATA, IKU_EXPANSION
+from achievement import NUMBER_BASED
+from readers import BACKENDS
+
+
+EXIT_OK = 0
+EXIT_BELOW_TARGET = 1
+EXIT_ERROR = 2
+
+
+# ============================================================================
+# HITUNG RINGKASAN
+# ============================================================================
+
+def target_met(iku_number, stats, target):
+    """
+    Apakah IKU memenuhi target (None jika IKU tidak punya target)
+
+    IKU number-based (5, 6) dibandingkan dengan pembilang (jumlah),
+    IKU lainnya dengan persentase.
+    """
+    if target is None:
+        return None
+    value = stats['pembilang'] if iku_number in NUMBER_BASED else stats['persentase']
+    return bool(value >= target)
+
+
+def _json_value(value):
+    """Nilai numpy/pandas -> tipe Python untuk JSON"""
+    if hasattr(value, 'item'):
+        value = value.item()
+    if isinstance(value, float) and value != value:
+        return None
+    return value
+
+
+def _iku_title(iku_number):
+    title = IKU_METADATA[iku_number]['title']
+    return title.split(':')[0] if ':' in title else f"IKU {iku_number}"
+
+
+def collect_summary(iku_list=None, bundle=None, prodi=True):
+    """
+    Hitung ringkasan capaian per IKU dan per prodi
+
+    Parameters:
+    -----------
+    iku_list : list, optional
+        IKU yang diringkas; IKU gabungan diekspansi seperti main()
+        (default: semua IKU)
+    bundle : str or Path, optional
+        Folder results bundle; jika diisi, file Excel tidak dibaca
+    prodi : bool
+        Jika False, rincian per prodi tidak disertakan (dari bundle hanya
+        stats manifest yang dibaca)
+
+    Returns:
+    --------
+    dict : {'generated_at', 'source', 'ikus': {iku: {...}}, 'errors',
+            'below_target', 'exit_code'}
+    """
+    iku_list = ALL_IKU if iku_list is None else iku_list
+    expanded = []
+    for iku in iku_list:
+        for sub_iku in IKU_EXPANSION.get(iku, [iku]):
+            if sub_iku not in expanded:
+                expanded.append(sub_iku)
+
+    ikus = {}
+    errors = {}
+    results_bundle = None
+    if bundle is not None:
+        from results_bundle import ResultsBundle
+        source = f"bundle ({bundle})"
+        try:
+            results_bundle = ResultsBundle(bundle)
+            source = f"bundle {results_bundle.manifest.get('bundle_id', '')} ({results_bundle.bundle_dir})"
+        except (OSError, ValueError) as e:
+            # Bundle tidak bisa dibuka: semua IKU gagal dihitung
+            errors = {iku: f"{type(e).__name__}: {e}" for iku in expanded}
+            expanded = []
+    else:
+        source = f"excel (reader: {CONFIG['reader_backend']})"
+
+    for iku in expanded:
+        try:
+            if results_bundle is not None:
+                if iku not in results_bundle.iku_list:
+                    raise KeyError(f"IKU {iku} tidak ada di bundle")
+                stats = results_bundle.stats(iku)
+                data = results_bundle.table(iku) if prodi else None
+            else:
+                from processors import compute_iku
+                # Processor mencetak progress; mode ringkasan hanya
+                # menampilkan hasil akhir
+                with contextlib.redirect_stdout(io.StringIO()):
+                    data, stats = compute_iku(iku)
+        except Exception as e:
+            errors[iku] = f"{type(e).__name__}: {e}"
+            continue
+
+        target = CONFIG['target_values'].get(iku)
+        ikus[iku] = {
+            'title': _iku_title(iku),
+            'pembilang': _json_value(stats['pembilang']),
+            'penyebut': _json_value(stats['penyebut']),
+            'persentase': _json_value(stats['persentase']),
+            'number_based': iku in NUMBER_BASED,
+            'target': target,
+            'target_met': target_met(iku, stats, target),
+        }
+        if prodi:
+            ikus[iku]['prodi'] = [{column: _json_value(value) for column, value in row.items()}
+                                  for row in data.to_dict('records')]
+
+    below_target = [iku for iku, item in ikus.items() if item['target_met'] is False]
+    if errors:
+        code = EXIT_ERROR
+    elif below_target:
+        code = EXIT_BELOW_TARGET
+    else:
+        code = EXIT_OK
+
+    return {
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'source': source,
+        'ikus': ikus,
+        'errors': errors,
+        'below_target': below_target,
+        'exit_code': code,
+    }
+
+
+# ============================================================================
+# OUTPUT
+# ============================================================================
+
+def iku_label(iku):
+    """Label kunci IKU internal ('71' -> '[71]'); judul IKU 7 dan 71 sama"""
+    return f'[{iku}]'
+
+
+def format_summary(summary, prodi=False):
+    """
+    Ringkasan sebagai teks (format RINGKASAN HASIL main())
+
+    Setiap baris diawali kunci IKU internal (iku_label), karena judul
+    IKU gabungan dan sub-IKU bisa sama (mis. 7 dan 71); footer memakai
+    label yang sama.
+
+    Parameters:
+    -----------
+    summary : dict
+        Hasil collect_summary()
+    prodi : bool
+        Jika True, sertakan rincian per prodi
+
+    Returns:
+    --------
+    str
+    """
+    lines = ['=' * 70, 'RINGKASAN HASIL', '=' * 70]
+    for iku, item in summary['ikus'].items():
+        if item['target'] is None:
+            status = ''
+        else:
+            unit = '' if item['number_based'] else '%'
+            mark = '✓' if item['target_met'] else '✗'
+            status = f"  [{mark} target {item['target']}{unit}]"
+        lines.append(f"{iku_label(iku):<5} {item['title']}: {item['persentase']}% "
+                     f"({item['pembilang']}/{item['penyebut']}){status}")
+
+        if prodi:
+            for row in item.get('prodi', []):
+                name = row.get('Program Studi', '-')
+                if item['number_based']:
+                    lines.append(f"    {name}: {row.get('Pembilang')}")
+                else:
+                    lines.append(f"    {name}: {row.get('Persentase')}% "
+                                 f"({row.get('Pembilang')}/{row.get('Penyebut')})")
+
+    for iku, message in summary['errors'].items():
+        lines.append(f"{iku_label(iku):<5} ❌ {message}")
+
+    lines.append('-' * 70)
+    if summary['errors']:
+        lines.append(f"GAGAL: {len(summary['errors'])} IKU tidak bisa dihitung")
+    if summary['below_target']:
+        lines.append(f"DI BAWAH TARGET: {', '.join(map(iku_label, summary['below_target']))}")
+    if summary['exit_code'] == EXIT_OK:
+        lines.append("OK: semua IKU memenuhi target")
+    return '\n'.join(lines)
+
+
+def write_json(summary, path):
+    """Tulis ringkasan sebagai JSON ('-' = stdout)"""
+    text = json.dumps(summary, indent=2, ensure_ascii=False)
+    if path == '-':
+        print(text)
+        return
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text + '\n', encoding='utf-8')
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def add_source_arguments(parser):
+    """Argumen sumber data bersama (ringkasan & check)"""
+    parser.add_argument('--iku', '-i', nargs='+', choices=ALL_IKU, metavar='IKU',
+                        help='IKU yang diproses (default: semua)')
+    parser.add_argument('--bundle', metavar='DIR',
+                        help='Baca stats & tabel dari results bundle (tanpa file Excel)')
+    parser.add_argument('--data-dir', metavar='DIR',
+                        help='Folder file Excel monitoring (default: CONFIG[\'base_path\'])')
+    parser.add_argument('--reader', choices=['auto'] + list(BACKENDS),
+                        help='Backend pembaca Excel (default: CONFIG, lihat readers.py)')
+
+
+def apply_source_arguments(args):
+    """Terapkan --data-dir / --reader ke CONFIG"""
+    if args.data_dir is not None:
+        CONFIG['base_path'] = Path(args.data_dir)
+    if args.reader is not None:
+        CONFIG['reader_backend'] = args.reader
+
+
+def build_parser():
+    """Argument parser mode ringkasan"""
+    parser = argparse.ArgumentParser(
+        description='Ringkasan capaian IKU tanpa visualisasi (exit code: '
+                    '0 = target terpenuhi, 1 = di bawah target, 2 = error). '
+                    'Gate regresi target: python summary.py check --help'
+    )
+    add_source_arguments(parser)
+    parser.add_argument('--json', nargs='?', const='-', metavar='PATH',
+                        help='Tulis JSON (ke PATH, atau stdout jika PATH tidak diisi)')
+    parser.add_argument('--prodi', action='store_true',
+                        help='Sertakan rincian per prodi pada ringkasan teks')
+    parser.add_argument('--quiet', '-q', action='store_true',
+                        help='Tanpa output teks; hanya exit code (dan file --json)')
+    return parser
+
+
+def main(argv=None, ignore_unknown=False):
+    """
+    Jalankan mode ringkasan (atau subcommand check, lihat target_check.py)
+
+    Parameters:
+    -----------
+    argv : list, optional
+        Argumen CLI (default: sys.argv[1:])
+    ignore_unknown : bool
+        Abaikan argumen yang tidak dikenal (dipanggil dari
+        main_visualize_iku.py --summary-only)
+
+    Returns:
+    --------
+    int : Exit code
+    """
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv[:1] == ['check']:
+        from target_check import main as check_main
+        return check_main(argv[1:])
+
+    parser = build_parser()
+    if ignore_unknown:
+        args, _ = parser.parse_known_args(argv)
+    else:
+        args = parser.parse_args(argv)
+
+    apply_source_arguments(args)
+
+    summary = collect_summary(args.iku, bundle=args.bundle)
+
+    if args.json is not None:
+        write_json(summary, args.json)
+    if not args.quiet and args.json != '-':
+        print(format_summary(summary, prodi=args.prodi))
+
+    return summary['exit_code']
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,639 @@
+"""
+============================================================================
+SYNTHETIC DATA - SISTEM VISUALISASI IKU
+============================================================================
+
+Generator data IKU sintetis dengan skema yang sama persis dengan file
+monitoring-iku-XX-{pembilang,penyebut}.xlsx asli, tanpa data pribadi
+mahasiswa/dosen. Dipakai untuk benchmark, load test, dan pengujian oleh
+pihak luar.
+
+Yang direproduksi:
+- Urutan & nama kolom, dtype (termasuk kolom NIP campuran int/str di
+  IKU 31 dan nilai 0 di Masa Tunggu IKU 11), baris judul (header=1)
+- Distribusi nilai: proporsi per prodi, angkatan, status lulusan,
+  tingkat prestasi, metode pembelajaran, dll. (diambil dari data 2025)
+- Relasi antar file: pembilang IKU 11/12/13 adalah lulusan di penyebut
+  dengan status yang sesuai; NIM di IKU 21/22/23/33 berasal dari daftar
+  mahasiswa; NIP di IKU 31/33/41/51 berasal dari daftar dosen (IKU 31
+  ~9% dosen luar, seperti data asli); kode mata kuliah IKU 71 pembilang
+  adalah subset penyebut
+
+Skala:
+- scale     : pengali jumlah mahasiswa, lulusan, dosen, mata kuliah, dan
+              kegiatan (1 = ukuran data FST 2025)
+- faculties : jumlah fakultas; setiap fakultas punya 15 prodi dengan nama
+              yang sama (agar chart FST tetap bisa di-render) tetapi NIM,
+              NIP, kode mata kuliah, dan kolom Fakultas berbeda
+
+Hasil deterministik untuk kombinasi (seed, scale, faculties) yang sama.
+
+Usage:
+    python synthetic_data.py data_sintetis                 # 1x, seed 0
+    python synthetic_data.py data_sintetis --scale 10 --faculties 3 --seed 42
+
+    from synthetic_data import SyntheticSource
+    from utils import set_frame_source
+    set_frame_source(SyntheticSource(scale=10))  # tanpa menulis Excel
+
+Author: Tim IKU FST
+Version: 2.0 (Modular)
+Last Updated: 2026-10-19
+============================================================================
+"""
+
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from config import IKU_METADATA
+
+
+# ============================================================================
+# KATALOG & DISTRIBUSI (dari data FST 2025)
+# ============================================================================
+
+MIPA = 'Jurusan Matematika dan Ilmu Pengetahuan Alam'
+KEBUMIAN = 'Jurusan Teknik Kebumian'
+SIPIL_KIMIA = 'Jurusan Teknik Sipil, Kimia dan Lingkungan'
+ELEKTRO = 'Jurusan Teknik Elektro dan Informatika'
+
+# (nama prodi, jenjang, jurusan, kode, bobot mahasiswa, lulusan, dosen, mata kuliah)
+PRODI_CATALOG = [
+    ('Matematika', 'S1', MIPA, 'MAT', 301, 33, 11, 62),
+    ('Biologi', 'S1', MIPA, 'BIO', 360, 33, 17, 71),
+    ('Fisika', 'S1', MIPA, 'FIS', 177, 23, 16, 59),
+    ('Kimia', 'S1', MIPA, 'KIM', 277, 43, 18, 68),
+    ('Analis Kimia (D3)', 'D3', MIPA, 'DAK', 99, 5, 8, 61),
+    ('Kimia Industri (D3)', 'D3', MIPA, 'DKI', 71, 6, 5, 57),
+    ('Teknik Geofisika', 'S1', KEBUMIAN, 'TGF', 245, 24, 9, 52),
+    ('Teknik Geologi', 'S1', KEBUMIAN, 'TGL', 345, 39, 12, 66),
+    ('Teknik Pertambangan', 'S1', KEBUMIAN, 'TPT', 432, 51, 14, 47),
+    ('Teknik Kimia', 'S1', SIPIL_KIMIA, 'TKM', 338, 26, 15, 67),
+    ('Teknik Lingkungan', 'S1', SIPIL_KIMIA, 'TLK', 361, 44, 13, 54),
+    ('Teknik Sipil', 'S1', SIPIL_KIMIA, 'TSP', 411, 24, 17, 62),
+    ('Teknik Elektro', 'S1', ELEKTRO, 'TEL', 288, 34, 20, 66),
+    ('Sistem Informasi', 'S1', ELEKTRO, 'SIF', 769, 75, 24, 62),
+    ('Informatika', 'S1', ELEKTRO, 'INF', 102, 0, 7, 19),
+]
+
+FACULTY_NAMES = ['Sains dan Teknologi', 'Ekonomi dan Bisnis', 'Pertanian', 'Kedokteran',
+                 'Hukum', 'Peternakan', 'Kehutanan', 'Ilmu Sosial dan Ilmu Politik']
+
+# Jumlah baris per file untuk scale=1 (satu fakultas)
+BASE_COUNTS = {
+    'mahasiswa': 4576, 'lulusan': 460, 'dosen': 206, 'matakuliah': 873,
+    '21': 188, '22': 148, '22_mahasiswa': 98, '23': 2, '31': 123, '33': 56,
+    '41': 42, '42': 64, '51': 15, '51_dosen': 11, '62': 41,
+}
+
+ANGKATAN = {2017: 4, 2018: 33, 2019: 161, 2020: 216, 2021: 841, 2022: 916,
+            2023: 652, 2024: 743, 2025: 1010}
+STATUS_LULUSAN = {'Bekerja': 256, 'Tidak Kerja tetapi sedang mencari kerja': 130,
+                  'Wiraswasta': 43, 'Melanjutkan Pendidikan': 19,
+                  'Belum memungkinkan bekerja': 10}
+TAHUN_MASUK_LULUSAN = {2016: 1, 2017: 16, 2018: 21, 2019: 122, 2020: 94, 2021: 2}
+SEMESTER_LULUS = {20231: 104, 20232: 245, 20241: 111}
+TAHUN_LULUS = {2023: 1, 2024: 452, 2025: 4}
+MASA_TUNGGU = {
+    '11': {'< 6 Bulan': 148, '> 6 Bulan': 83, 0: 25},
+    '12': {'< 12 Bulan': 17, '> 12 Bulan': 2},
+    '13': {'< 6 Bulan': 17, '> 6 Bulan': 14, None: 12},
+}
+PENCAPAIAN = {'Peserta': 68, 'Juara 3': 24, 'Juara 1': 23, 'Juara 2': 17,
+              'Harapan 1': 14, 'Harapan 2': 2}
+TINGKAT = {'Tingkat Nasional': 70, 'Tingkat Universitas': 68,
+           'Tingkat Internasional': 8, 'Tingkat Provinsi': 2}
+PENYELENGGARA = {'Penyelenggara Umum': 121,
+                 'Penyelenggara Pusat Prestasi Mahasiswa / Belmawa': 27}
+JENIS_HKI = ['Karya Teknologi Tepat Guna, Produk, Karya Seni, Rekayasa Sosial',
+             'Hak Karya Intelektual (Hak Cipta, Desain Produk, Policy Brief, Desain Inovasi dll)']
+NAMA_PROGRAM_33 = {'Magang Dudi': 20, 'Studi Independen': 15, 'Kewirausahaan': 9,
+                   'Riset': 6, 'KKNT': 6}
+STATUS_KEAKTIFAN = {1: 186, 3: 17, 4: 2, 12: 1}
+STATUS_KEPEGAWAIAN = {1: 136, 16: 45, 3: 25}
+SERTIFIKASI = [
+    ('Google Analytics Certification', 'Google Skillshop', '-'),
+    ('Microsoft Office Specialist - Excel 2019 Associate', 'Microsoft', 'MOS'),
+    ('Insinyur Profesional Pratama', 'Persatuan Insinyur Indonesia', 'IPP'),
+    ('Insinyur Profesional Madya', 'Persatuan Insinyur Indonesia', 'IPM'),
+    ('Certified International Quality Auditor', 'Lembaga Sertifikasi Profesi', 'CIIQA'),
+    ('Ahli K3 Umum', 'Kementerian Ketenagakerjaan', '-'),
+    ('Certified Data Scientist', 'BNSP', '-'),
+    ('Ahli Geologi Muda', 'Ikatan Ahli Geologi Indonesia', '-'),
+]
+METODE_71 = {'Project Base Learning (PJBL) |': 554, 'Problem Base Learning/Case Methods |': 152}
+PERSENTASE_71 = {'70 %': 373, '60 %': 180, '50 %': 58, '55 %': 34, '75 %': 22, '65 %': 14,
+                 '80 %': 11, '140 %': 6, '120 %': 4, '100 %': 3, '90 %': 1}
+SKS = {1: 60, 2: 350, 3: 285, 4: 11}
+
+# Bahan nama (tanpa nama orang asli)
+FIRST_NAMES = ['Ahmad', 'Budi', 'Citra', 'Dewi', 'Eka', 'Fajar', 'Gita', 'Hadi', 'Indah', 'Joko',
+               'Kartika', 'Lestari', 'Maya', 'Nanda', 'Oki', 'Putri', 'Rizki', 'Sari', 'Tri',
+               'Utami', 'Wahyu', 'Yogi', 'Zahra', 'Rahmat', 'Nurul', 'Siti', 'Agus', 'Dian',
+               'Fitri', 'Hendra', 'Ilham', 'Lukman', 'Mega', 'Novi', 'Reza', 'Sinta', 'Teguh']
+LAST_NAMES = ['Pratama', 'Saputra', 'Wulandari', 'Hidayat', 'Lestari', 'Kurniawan', 'Anggraini',
+              'Siregar', 'Nasution', 'Harahap', 'Simanjuntak', 'Rahmawati', 'Putra', 'Sari',
+              'Wijaya', 'Susanto', 'Permana', 'Ramadhan', 'Fauziah', 'Maharani', 'Setiawan']
+TITLES_FRONT = {'': 60, 'Dr. ': 25, 'Prof. Dr. ': 5, 'Ir. ': 10}
+TITLES_BACK = ['S.Si., M.Si.', 'S.T., M.T.', 'S.Kom., M.Kom.', 'S.Pd., M.Sc.', 'S.T., M.Eng.',
+               'S.Si., M.Sc.', 'M.Si.', 'S.Kom., M.Cs.', 'S.T., M.Sc., Ph.D.']
+KEGIATAN_WORDS = ['Pemberdayaan', 'Inovasi', 'Pengembangan', 'Analisis', 'Pemetaan', 'Pelatihan',
+                  'Digitalisasi', 'Pengolahan', 'Konservasi', 'Monitoring', 'Optimasi',
+                  'Masyarakat', 'Desa', 'UMKM', 'Limbah', 'Air Bersih', 'Energi Terbarukan',
+                  'Lahan Gambut', 'Sistem Informasi', 'Sekolah', 'Pertanian', 'Kesehatan']
+MATAKULIAH = ['Kalkulus', 'Fisika Dasar', 'Kimia Dasar', 'Biologi Umum', 'Statistika',
+              'Bahasa Inggris', 'Bahasa Indonesia', 'Pancasila', 'Metodologi Penelitian',
+              'Pemrograman', 'Basis Data', 'Mekanika Tanah', 'Geologi Struktur',
+              'Termodinamika', 'Rekayasa Lingkungan', 'Sistem Kendali', 'Kimia Analitik',
+              'Ekologi', 'Aljabar Linear', 'Kecerdasan Buatan', 'Struktur Beton', 'Praktikum']
+
+
+def _weighted(rng, table, n):
+    """Sampel n nilai dari {nilai: bobot}"""
+    values = list(table)
+    weights = np.array(list(table.values()), dtype=float)
+    index = rng.choice(len(values), size=n, p=weights / weights.sum())
+    return [values[i] for i in index]
+
+
+def _count(key, scale):
+    return max(1, int(round(BASE_COUNTS[key] * scale)))
+
+
+def _dates(rng, start, end, n):
+    """n tanggal ISO (str) acak di antara start dan end"""
+    start, end = np.datetime64(start), np.datetime64(end)
+    offsets = rng.integers(0, (end - start).astype(int) + 1, size=n)
+    return np.datetime_as_string(start + offsets, unit='D').tolist()
+
+
+def _student_names(rng, n):
+    first = rng.choice(FIRST_NAMES, size=n)
+    middle = rng.choice(FIRST_NAMES + [''] * 20, size=n)
+    last = rng.choice(LAST_NAMES, size=n)
+    upper = rng.random(n) < 0.6  # data asli: sebagian besar nama mahasiswa kapital
+    names = [' '.join(part for part in parts if part) for parts in zip(first, middle, last)]
+    return [name.upper() if up else name for name, up in zip(names, upper)]
+
+
+def _lecturer_names(rng, n):
+    front = _weighted(rng, TITLES_FRONT, n)
+    first = rng.choice(FIRST_NAMES, size=n)
+    last = rng.choice(LAST_NAMES, size=n)
+    back = rng.choice(TITLES_BACK, size=n)
+    return [f'{f}{a} {b} {c}' for f, a, b, c in zip(front, first, last, back)]
+
+
+def _nips(rng, n, used):
+    """NIP 18 digit (tgl lahir, TMT, jenis kelamin, urut), unik terhadap `used`"""
+    birth = np.datetime64('1960-01-01') + rng.integers(0, 38 * 365, size=n)
+    nips = []
+    for b, years, month, sex in zip(np.datetime_as_string(birth, unit='D'),
+                                    rng.integers(25, 36, size=n), rng.integers(1, 13, size=n),
+                                    rng.integers(1, 3, size=n)):
+        yyyy, mm, dd = b.split('-')
+        seq = 1
+        while True:
+            nip = int(f'{yyyy}{mm}{dd}{int(yyyy) + years}{month:02d}{sex}{seq:03d}')
+            if nip not in used:
+                break
+            seq += 1
+        used.add(nip)
+        nips.append(nip)
+    return nips
+
+
+# ============================================================================
+# GENERATOR PER FAKULTAS
+# ============================================================================
+
+def _generate_faculty(faculty_index, scale, seed):
+    """Semua frame IKU untuk satu fakultas"""
+    rng = np.random.default_rng([seed, faculty_index])
+    fakultas = FACULTY_NAMES[faculty_index % len(FACULTY_NAMES)]
+    if faculty_index >= len(FACULTY_NAMES):
+        fakultas = f'{fakultas} {faculty_index // len(FACULTY_NAMES) + 1}'
+    nim_prefix = chr(ord('F') + faculty_index % 20) + str(1 + faculty_index // 20)
+
+    catalog = pd.DataFrame(PRODI_CATALOG, columns=['prodi', 'jenjang', 'jurusan', 'kode',
+                                                   'w_mhs', 'w_lulusan', 'w_dosen', 'w_mk'])
+    catalog['plain'] = catalog['prodi'].str.replace(' (D3)', '', regex=False)
+    catalog['letter'] = [chr(ord('A') + i) for i in range(len(catalog))]
+
+    def pick_prodi(weight_col, n):
+        weights = catalog[weight_col].to_numpy(dtype=float)
+        return catalog.iloc[rng.choice(len(catalog), size=n, p=weights / weights.sum())].reset_index(drop=True)
+
+    def nims(prodi_rows, angkatan, start=0):
+        # Nomor urut global (start) agar NIM mahasiswa dan lulusan tidak bentrok
+        seq_width = max(4, len(str(start + len(prodi_rows))))
+        return [f'{nim_prefix}{letter}{1 if jenjang == "S1" else 3}{year % 100:02d}{i:0{seq_width}d}'
+                for i, (letter, jenjang, year) in enumerate(zip(prodi_rows['letter'],
+                                                                prodi_rows['jenjang'], angkatan), start)]
+
+    frames = {}
+
+    # ------------------------------------------------------------------------
+    # Mahasiswa aktif (penyebut IKU 21/22/23)
+    # ------------------------------------------------------------------------
+    n = _count('mahasiswa', scale)
+    prodi = pick_prodi('w_mhs', n)
+    angkatan = _weighted(rng, ANGKATAN, n)
+    mahasiswa = pd.DataFrame({
+        'NIM': nims(prodi, angkatan),
+        'Nama': _student_names(rng, n),
+        'Jenis Kelamin': rng.choice(['P', 'L'], size=n, p=[0.52, 0.48]),
+        'Program Studi': prodi['plain'],
+        'Fakultas': fakultas,
+        'Angkatan': np.array(angkatan, dtype='int64'),
+        'Status Reg Mhs': _weighted(rng, {'A': 4389, 'N': 182, 'C': 5}, n),
+        'Semester': rng.choice([20242, 20251], size=n, p=[0.78, 0.22]),
+    })
+    mahasiswa_jenjang = prodi['jenjang'].to_numpy()
+    for iku in ('21', '22', '23'):
+        frames[(iku, 'penyebut')] = mahasiswa
+
+    # ------------------------------------------------------------------------
+    # Lulusan (penyebut IKU 11/12/13, pembilang = filter status)
+    # ------------------------------------------------------------------------
+    n = _count('lulusan', scale)
+    prodi = pick_prodi('w_lulusan', n)
+    tahun_masuk = np.array(_weighted(rng, TAHUN_MASUK_LULUSAN, n), dtype='int64')
+    status = np.array(_weighted(rng, STATUS_LULUSAN, n), dtype=object)
+    lulusan = pd.DataFrame({
+        'NIM': nims(prodi, tahun_masuk, start=len(mahasiswa)),
+        'Nama': _student_names(rng, n),
+        'Jenis Kelamin': rng.choice(['P', 'L'], size=n, p=[0.52, 0.48]).astype(object),
+        'Prodi': prodi['plain'],
+        'Fakultas': fakultas,
+        'Tahun Masuk': tahun_masuk,
+        'Tahun Lulus': np.array(_weighted(rng, TAHUN_LULUS, n), dtype='int64'),
+        'Tanggal Lulus': _dates(rng, '2024-01-03', '2024-12-13', n),
+        'Semester Lulus': np.array(_weighted(rng, SEMESTER_LULUS, n), dtype='int64'),
+        'Status Lulusan': status,
+        'Jenjang Pendidikan': prodi['jenjang'],
+    })
+
+    # Masa Tunggu per kelompok pembilang (11 = bekerja, 12 = studi, 13 = wiraswasta)
+    for iku, status_name in (('11', 'Bekerja'), ('12', 'Melanjutkan Pendidikan'), ('13', 'Wiraswasta')):
+        pembilang = lulusan[lulusan['Status Lulusan'] == status_name].reset_index(drop=True)
+        masa_tunggu = _weighted(rng, MASA_TUNGGU[iku], len(pembilang))
+        pembilang['Masa Tunggu'] = pd.Series(
+            [np.nan if value is None else value for value in masa_tunggu], dtype=object)
+        if iku != '11':
+            pembilang['Masa Tunggu'] = pembilang['Masa Tunggu'].astype(str).replace('nan', np.nan)
+        frames[(iku, 'pembilang')] = pembilang
+
+    # Penyebut seperti export asli: sedikit nilai kosong (hanya di baris
+    # yang bukan pembilang, supaya relasi NIM tetap konsisten)
+    penyebut = lulusan.copy()
+    others = penyebut.index[penyebut['Status Lulusan'] == 'Tidak Kerja tetapi sedang mencari kerja']
+    penyebut['Tahun Masuk'] = penyebut['Tahun Masuk'].astype(float)
+    penyebut['Tahun Lulus'] = penyebut['Tahun Lulus'].astype(float)
+    for col, rate in (('Jenis Kelamin', 0.015), ('Tahun Masuk', 0.005), ('Tahun Lulus', 0.006),
+                      ('Status Lulusan', 0.004)):
+        blank = others[rng.random(len(others)) < rate * len(penyebut) / max(len(others), 1)]
+        penyebut.loc[blank, col] = np.nan
+    for iku in ('11', '12', '13'):
+        frames[(iku, 'penyebut')] = penyebut
+
+    # ------------------------------------------------------------------------
+    # IKU 21/22/23 pembilang (dari daftar mahasiswa)
+    # ------------------------------------------------------------------------
+    kegiatan_pool = [' '.join(rng.choice(KEGIATAN_WORDS, size=rng.integers(3, 7), replace=False))
+                     for _ in range(max(20, _count('21', scale) // 2))]
+
+    n = _count('21', scale)
+    eligible = np.flatnonzero(np.isin(mahasiswa['Angkatan'], [2020, 2021, 2022, 2023, 2024]))
+    idx = rng.choice(eligible, size=n, replace=n > len(eligible))
+    frames[('21', 'pembilang')] = pd.DataFrame({
+        'NIM': mahasiswa['NIM'].to_numpy()[idx],
+        'Nama': mahasiswa['Nama'].to_numpy()[idx],
+        'Angkatan': mahasiswa['Angkatan'].to_numpy()[idx],
+        'Program Studi': mahasiswa['Program Studi'].to_numpy()[idx],
+        'Jenjang Pendidikan': mahasiswa_jenjang[idx],
+        'Fakultas': fakultas,
+        'Nama Kegiatan': [f'Kewirausahaan {k.upper()}' for k in rng.choice(kegiatan_pool, size=n)],
+        'Jenis': 'MBKM',
+        'Semester': rng.choice([20251, 20242], size=n, p=[0.89, 0.11]),
+        'Total SKS': np.clip(np.rint(rng.normal(11.2, 4.6, size=n)), 2, 22).astype('int64'),
+    })
+
+    n = _count('22', scale)
+    achievers = rng.choice(len(mahasiswa), size=_count('22_mahasiswa', scale), replace=False)
+    idx = rng.choice(achievers, size=n)
+    nim_22 = mahasiswa['NIM'].to_numpy()[idx].astype(object)
+    unlinked = rng.random(n) < 0.007  # data asli: ~0.7% NIM tidak ada di daftar mahasiswa
+    nim_22[unlinked] = [f'{nim_prefix}Z1{i:05d}' for i in range(unlinked.sum())]
+    frames[('22', 'pembilang')] = pd.DataFrame({
+        'NIM': nim_22,
+        'Nama': mahasiswa['Nama'].to_numpy()[idx],
+        'Tanggal Kegiatan': _dates(rng, '2025-01-01', '2025-08-31', n),
+        'Kegiatan': [f'Kompetisi {k}' for k in rng.choice(kegiatan_pool, size=n)],
+        'Pencapaian': _weighted(rng, PENCAPAIAN, n),
+        'Tingkat': _weighted(rng, TINGKAT, n),
+        'Penyelenggara': _weighted(rng, PENYELENGGARA, n),
+    })
+
+    n = _count('23', scale)
+    idx = rng.choice(len(mahasiswa), size=n, replace=False)
+    frames[('23', 'pembilang')] = pd.DataFrame({
+        'NIM': mahasiswa['NIM'].to_numpy()[idx],
+        'Nama': mahasiswa['Nama'].to_numpy()[idx],
+        'Program Studi': mahasiswa['Program Studi'].to_numpy()[idx],
+        'Fakultas': fakultas,
+        'Nama HKI': [f'Program Inovasi {k}' for k in rng.choice(kegiatan_pool, size=n)],
+        'Tingkat': 'Tingkat Nasional',
+        'Jenis HKI': rng.choice(JENIS_HKI, size=n),
+        'Nomor Sertifikat': [f'{i + 1}/HKI-FST/V/2025' if keep else np.nan
+                             for i, keep in enumerate(rng.random(n) < 0.5)],
+        'Tanggal Mulai Berlaku': _dates(rng, '2025-01-01', '2025-06-30', n),
+        'Tanggal Berakhir': '2095-01-01',
+    })
+
+    # ------------------------------------------------------------------------
+    # Dosen (penyebut IKU 31/33/41/42)
+    # ------------------------------------------------------------------------
+    used_nips = set()
+    n = _count('dosen', scale)
+    prodi = pick_prodi('w_dosen', n)
+    dosen = pd.DataFrame({
+        'Nama': _lecturer_names(rng, n),
+        'NIP': np.array(_nips(rng, n, used_nips), dtype='int64'),
+        'Program Studi': 'Program Studi ' + prodi['prodi'],
+        'Jurusan': prodi['jurusan'],
+        'Fakultas': f'Fakultas {fakultas}',
+        'Status Keaktifan Pegawai': np.array(_weighted(rng, STATUS_KEAKTIFAN, n), dtype='int64'),
+        'Status Kepegawaian': np.array(_weighted(rng, STATUS_KEPEGAWAIAN, n), dtype='int64'),
+    })
+    for iku in ('31', '33', '41', '42'):
+        frames[(iku, 'penyebut')] = dosen
+
+    # IKU 31: ~91% dosen sendiri, sisanya dosen luar; NIP bertipe campuran
+    n = _count('31', scale)
+    n_internal = min(int(round(n * 0.91)), len(dosen))
+    idx = rng.choice(len(dosen), size=n_internal, replace=False)
+    nip_31 = dosen['NIP'].to_numpy()[idx].tolist() + _nips(rng, n - n_internal, used_nips)
+    nama_31 = dosen['Nama'].to_numpy()[idx].tolist() + _lecturer_names(rng, n - n_internal)
+    order = rng.permutation(n)
+    nip_31 = pd.Series([nip_31[i] for i in order], dtype=object)
+    dirty = rng.choice(n, size=max(1, n // 120), replace=False)
+    nip_31[dirty] = [f'{nip}x' for nip in nip_31[dirty]]
+    frames[('31', 'pembilang')] = pd.DataFrame({
+        'Nama': [nama_31[i] for i in order],
+        'NIP': nip_31,
+        'Jenis': rng.choice(['Penelitian', 'Pengabdian'], size=n, p=[0.58, 0.42]),
+        'Kegiatan': [k.upper() for k in rng.choice(kegiatan_pool, size=n)],
+        'Tanggal Selesai': _dates(rng, '2021-09-30', '2023-12-31', n),
+        'Lokasi': np.full(n, np.nan),
+        'Jumlah Anggota': np.array(_weighted(rng, {1: 15, 2: 55, 3: 20, 4: 33}, n), dtype='int64'),
+    })
+
+    # IKU 33: dosen pembimbing + mahasiswa (sebagian kecil dari fakultas lain)
+    n = min(_count('33', scale), len(dosen))
+    idx = rng.choice(len(dosen), size=n, replace=False)
+    students = rng.choice(len(mahasiswa), size=n)
+    other_faculty = rng.random(n) < 0.02
+    frames[('33', 'pembilang')] = pd.DataFrame({
+        'NIP': dosen['NIP'].to_numpy()[idx],
+        'Dosen Pembimbing': dosen['Nama'].to_numpy()[idx],
+        'NIM': mahasiswa['NIM'].to_numpy()[students],
+        'Nama': mahasiswa['Nama'].to_numpy()[students],
+        'Angkatan': rng.choice([2021, 2022, 2023, 2024], size=n, p=[0.3, 0.4, 0.2, 0.1]),
+        'Program Studi': np.where(other_faculty, 'Pendidikan Kimia',
+                                  mahasiswa['Program Studi'].to_numpy()[students]),
+        'Jenjang Pendidikan': mahasiswa_jenjang[students],
+        'Fakultas': np.where(other_faculty, 'Keguruan dan Ilmu Pendidikan', fakultas),
+        'Nama Program': _weighted(rng, NAMA_PROGRAM_33, n),
+        'Paket Program': [k.upper() for k in rng.choice(kegiatan_pool, size=n)],
+        'Semester': rng.choice([20242, 20251], size=n),
+    })
+
+    # IKU 41: dosen bersertifikat DUDI
+    n = min(_count('41', scale), len(dosen))
+    idx = rng.choice(len(dosen), size=n, replace=False)
+    sertifikat = [SERTIFIKASI[i] for i in rng.choice(len(SERTIFIKASI), size=n)]
+    pembilang_41 = dosen.iloc[idx].reset_index(drop=True)
+    pembilang_41['Bidang Sertifikasi'] = [s[0] for s in sertifikat]
+    pembilang_41['Lembaga Sertifikasi'] = [s[1] for s in sertifikat]
+    pembilang_41['Tanggal Mulai'] = _dates(rng, '2025-01-01', '2025-07-31', n)
+    pembilang_41['Gelar'] = [s[2] for s in sertifikat]
+    frames[('41', 'pembilang')] = pembilang_41
+
+    # IKU 42: praktisi (NIP non-ASN 'PR...', tidak ada di daftar dosen)
+    n = _count('42', scale)
+    prodi = pick_prodi('w_dosen', n)
+    frames[('42', 'pembilang')] = pd.DataFrame({
+        'Nama': _lecturer_names(rng, n),
+        'NIP': [f'PR{faculty_index:02d}07{i + 1:04d}' for i in range(n)],
+        'Program Studi': 'Program Studi ' + prodi['prodi'],
+        'Jurusan': prodi['jurusan'],
+        'Fakultas': f'Fakultas {fakultas}',
+        'Status Keaktifan Pegawai': np.ones(n, dtype='int64'),
+        'Status Kepegawaian': np.full(n, 10, dtype='int64'),
+    })
+
+    # IKU 51: luaran dosen (beberapa luaran per dosen)
+    n = _count('51', scale)
+    authors = rng.choice(len(dosen), size=min(_count('51_dosen', scale), len(dosen)), replace=False)
+    idx = rng.choice(authors, size=n)
+    frames[('51', 'pembilang')] = pd.DataFrame({
+        'Nama': dosen['Nama'].to_numpy()[idx],
+        'NIP': dosen['NIP'].to_numpy()[idx],
+        'Luaran': [f'{k} dkk' for k in rng.choice(kegiatan_pool, size=n)],
+        'Jenis Luaran': rng.choice(['hki', 'publikasi'], size=n, p=[0.87, 0.13]),
+        'Tanggal': _dates(rng, '2025-01-01', '2025-07-31', n),
+    })
+
+    # ------------------------------------------------------------------------
+    # Prodi (penyebut IKU 81, referensi IKU 6) + kerjasama IKU 62
+    # ------------------------------------------------------------------------
+    frames[('81', 'penyebut')] = pd.DataFrame({
+        'Program Studi': catalog['plain'],
+        'Jenjang Pendidikan': catalog['jenjang'],
+    })
+    accredited = rng.choice(len(catalog), size=1, replace=False)
+    frames[('81', 'pembilang')] = pd.DataFrame({
+        'Program Studi': catalog['plain'].to_numpy()[accredited],
+        'Jenjang Pendidikan': catalog['jenjang'].to_numpy()[accredited],
+        'Peringkat Akreditasi': 'Internasional',
+        'Tanggal SK': '2022-12-13',
+        'Tanggal Kadaluarsa': '2027-12-13',
+        'Lembaga Akreditasi': 'Royal Society of Chemistry',
+    })
+
+    n = _count('62', scale)
+    prodi = catalog.iloc[rng.choice(len(catalog), size=n)].reset_index(drop=True)
+    frames[('62', 'pembilang')] = pd.DataFrame({
+        'Nomor Dokumen': [f'{i + 1}/UN21.{faculty_index + 9}/HK.07.00/2025' for i in range(n)],
+        'Judul Kerjasama': [f'RANCANGAN PELAKSANAAN KEGIATAN {k.upper()}'
+                            for k in rng.choice(kegiatan_pool, size=n)],
+        'Jenis Dokumen': 'Implementation Arrangement',
+        'Tanggal Awal': _dates(rng, '2025-01-01', '2025-08-31', n),
+        'Tanggal Berakhir': rng.choice(['2025-12-31', '2026-12-07', '2026-12-08'], size=n),
+        'Program Studi': prodi['plain'],
+        'Link Dokumen': [f'https://kerjasama.example.ac.id/document/{faculty_index}-{i}.pdf'
+                         for i in range(n)],
+        'Link Laporan': [f'https://kerjasama.example.ac.id/laporan/{faculty_index}-{i}.pdf'
+                         for i in range(n)],
+    })
+
+    # ------------------------------------------------------------------------
+    # Mata kuliah (IKU 71)
+    # ------------------------------------------------------------------------
+    n = _count('matakuliah', scale)
+    prodi = pick_prodi('w_mk', n)
+    code_suffix = '' if faculty_index == 0 else f'-{faculty_index}'
+    seq_width = max(3, len(str(n)))
+    link = [f'https://drive.example.com/rps/{faculty_index}/{i}' for i in range(n)]
+    no_link = rng.random(n) < 0.27
+    matakuliah = pd.DataFrame({
+        'Kode Matakuliah': [f'{code}{i:0{seq_width}d}{code_suffix}'
+                            for i, code in enumerate(prodi['kode'])],
+        'Nama Matakuliah': [f'{name} {roman}' for name, roman in
+                            zip(rng.choice(MATAKULIAH, size=n), rng.choice(['I', 'II', 'III', ''], size=n))],
+        'SKS Total': np.array(_weighted(rng, SKS, n), dtype='int64'),
+        'Metode Pembelajaran': ['[' + ','.join(f'"{m}"' for m in sorted(rng.choice(
+            np.arange(1, 11), size=rng.integers(1, 6), replace=False))) + ']' for _ in range(n)],
+        'Program Studi': prodi['plain'],
+        'Fakultas': fakultas,
+        'Semester': rng.choice([20251, 20242], size=n, p=[0.56, 0.44]),
+        'Link RPS': [np.nan if skip else url for url, skip in zip(link, no_link)],
+    })
+    frames[('71', 'penyebut')] = matakuliah
+
+    selected = np.sort(rng.choice(n, size=int(round(n * 0.81)), replace=False))
+    m = len(selected)
+    frames[('71', 'pembilang')] = pd.DataFrame({
+        'NO': (selected + 1).astype('int64'),
+        'Program Studi': matakuliah['Program Studi'].to_numpy()[selected],
+        'Fakultas': fakultas,
+        'Kode Matakuliah': matakuliah['Kode Matakuliah'].to_numpy()[selected],
+        'Nama Matakuliah': matakuliah['Nama Matakuliah'].to_numpy()[selected],
+        'SKS': matakuliah['SKS Total'].to_numpy()[selected],
+        'Metode Pembelajaran': _weighted(rng, METODE_71, m),
+        'Persentase Aktivitas Partisipatif + Hasil Proyek': _weighted(rng, PERSENTASE_71, m),
+        'Kesimpulan': 'Memenuhi Kriteria PJBL/Case Method',
+        'Link': matakuliah['Link RPS'].to_numpy()[selected],
+    })
+
+    return frames
+
+
+# ============================================================================
+# PUBLIC API
+# ============================================================================
+
+def generate_dataset(scale=1.0, faculties=1, seed=0):
+    """
+    Generate semua frame IKU sintetis
+
+    Parameters:
+    -----------
+    scale : float
+        Pengali ukuran data per fakultas (1 = ukuran FST 2025)
+    faculties : int
+        Jumlah fakultas
+    seed : int
+        Seed (hasil identik untuk seed/scale/faculties yang sama)
+
+    Returns:
+    --------
+    dict : {(iku_number, file_type): pd.DataFrame}, key sama dengan
+        nama file monitoring-iku-{iku_number}-{file_type}.xlsx
+    """
+    per_faculty = [_generate_faculty(i, scale, seed) for i in range(faculties)]
+
+    dataset = {}
+    for key in sorted(per_faculty[0]):
+        parts = [frames[key] for frames in per_faculty]
+        dataset[key] = pd.concat(parts, ignore_index=True) if len(parts) > 1 else parts[0].copy()
+    return dataset
+
+
+class SyntheticSource:
+    """
+    Frame source untuk utils.set_frame_source (data sintetis di memori)
+
+    Dataset di-generate sekali saat pertama dipakai.
+    """
+
+    def __init__(self, scale=1.0, faculties=1, seed=0):
+        self.scale = scale
+        self.faculties = faculties
+        self.seed = seed
+        self._frames = None
+
+    def __getstate__(self):
+        # Worker cukup generate ulang (deterministik) dari parameter
+        state = self.__dict__.copy()
+        state['_frames'] = None
+        return state
+
+    @property
+    def frames(self):
+        if self._frames is None:
+            self._frames = generate_dataset(self.scale, self.faculties, self.seed)
+        return self._frames
+
+    def keys(self):
+        return list(self.frames)
+
+    def __call__(self, iku_number, file_type='pembilang'):
+        key = (iku_number, file_type)
+        if key not in self.frames:
+            raise FileNotFoundError(f"File tidak ditemukan: monitoring-iku-{iku_number}-{file_type}.xlsx")
+        return self.frames[key].copy()
+
+
+def write_dataset(output_dir, scale=1.0, faculties=1, seed=0):
+    """
+    Tulis dataset sintetis sebagai file Excel dengan layout export asli
+
+    Baris 1 berisi judul indikator (merged), baris 2 header kolom, data
+    mulai baris 3 - sehingga dibaca dengan pd.read_excel(..., header=1)
+    seperti file asli.
+
+    Returns:
+    --------
+    list : List of saved file paths
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    files = []
+    for (iku_number, file_type), df in generate_dataset(scale, faculties, seed).items():
+        path = output_dir / f'monitoring-iku-{iku_number}-{file_type}.xlsx'
+        title = IKU_METADATA.get(iku_number, {}).get('description', f'Data IKU {iku_number}')
+
+        with pd.ExcelWriter(path, engine='openpyxl') as writer:
+            df.to_excel(writer, sheet_name='Export Data MONITORING IKU', startrow=1, index=False)
+            sheet = writer.sheets['Export Data MONITORING IKU']
+            sheet['A1'] = title
+            sheet.merge_cells('A1:H1')
+
+        files.append(str(path))
+        print(f"    ✓ {path.name}: {len(df):,} baris")
+
+    return files
+
+
+def parse_arguments():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description='Generate data IKU sintetis (skema file Excel asli)')
+    parser.add_argument('output_dir', help='Folder output file Excel')
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help='Pengali ukuran data per fakultas (default: 1)')
+    parser.add_argument('--faculties', type=int, default=1,
+                        help='Jumlah fakultas (default: 1)')
+    parser.add_argument('--seed', type=int, default=0, help='Seed (default: 0)')
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_arguments()
+    print(f"Generate data sintetis: scale {args.scale}x, {args.faculties} fakultas, seed {args.seed}")
+    write_dataset(args.output_dir, args.scale, args.faculties, args.seed)
@@ -0,0 +1,352 @@
+"""
+============================================================================
+TARGET CHECK - GATE REGRESI CAPAIAN IKU (CI)
+============================================================================
+
+Subcommand `check`: bandingkan capaian setiap IKU dengan
+CONFIG['target_values'] dan dengan run tersimpan sebelumnya, lalu tulis
+hasil dalam format JUnit-XML dan/atau JSON untuk CI.
+
+Nilai yang dibandingkan: persentase, kecuali IKU number-based (5, 6) yang
+memakai pembilang (jumlah). Stats diambil lewat jalur ringkasan
+(summary.collect_summary, tanpa matplotlib): cache reader atau results
+bundle, tanpa tabel per prodi. Perbandingan dilakukan sekaligus sebagai
+array numpy.
+
+Regresi terhadap run tersimpan:
+- target : IKU yang sebelumnya memenuhi target sekarang di bawah target
+- value  : nilai turun lebih dari --tolerance (default 0)
+
+Run tersimpan (--state, default <base_path>/.iku_cache/check_state.json)
+hanya diperbarui jika tidak ada regresi/error, sehingga gate tetap merah
+sampai data pulih atau hasil baru diterima dengan --accept. State digabung
+per IKU: run parsial (--iku 5) hanya mengganti acuan IKU yang dicek, acuan
+IKU lain tetap dipakai run berikutnya.
+
+Exit code:
+    0  tidak ada regresi (IKU di bawah target tetap lolos, kecuali
+       dengan --fail-below-target)
+    1  ada regresi (atau IKU di bawah target dengan --fail-below-target)
+    2  ada IKU yang gagal dihitung
+
+Usage:
+    python summary.py check
+    python summary.py check --junit output/iku-check.xml --json output/iku-check.json
+    python summary.py check --data-dir /srv/drop --reader cache
+    python summary.py check --bundle bundle --accept
+    python main_visualize_iku.py check ...
+
+Author: Tim IKU FST
+Version: 2.0 (Modular)
+Last Updated: 2026-10-19
+============================================================================
+"""
+
+import json
+import time
+import argparse
+from pathlib import Path
+from xml.etree import ElementTree
+
+import numpy as np
+
+from config import ALL_IKU
+from summary import (
+    collect_summary, add_source_arguments, apply_source_arguments,
+    EXIT_OK, EXIT_ERROR
+)
+from readers import cache_dir
+
+
+EXIT_REGRESSION = 1
+
+STATE_FILE = 'check_state.json'
+
+
+# ============================================================================
+# PERBANDINGAN
+# ============================================================================
+
+def _column(values):
+    return np.array([np.nan if value is None else value for value in values], dtype=float)
+
+
+def compare(summary, previous=None, tolerance=0.0):
+    """
+    Bandingkan capaian dengan target dan dengan run sebelumnya
+
+    Parameters:
+    -----------
+    summary : dict
+        Hasil summary.collect_summary()
+    previous : dict, optional
+        Hasil check sebelumnya (state tersimpan)
+    tolerance : float
+        Penurunan nilai yang masih diterima (poin persen / jumlah)
+
+    Returns:
+    --------
+    list : Satu dict per IKU {'iku', 'title', 'value', 'unit', 'target',
+        'met', 'gap', 'previous', 'delta', 'regression'}
+    """
+    items = summary['ikus']
+    ikus = list(items)
+    previous_results = {row['iku']: row for row in (previous or {}).get('results', [])}
+
+    value = _column(item['pembilang'] if item['number_based'] else item['persentase']
+                    for item in items.values())
+    target = _column(item['target'] for item in items.values())
+    previous_value = _column(previous_results.get(iku, {}).get('value') for iku in ikus)
+    previous_met = np.array([previous_results.get(iku, {}).get('met') is True for iku in ikus],
+                            dtype=bool)
+
+    has_target = ~np.isnan(target)
+    met = has_target & (value >= target)
+    gap = value - target
+    delta = value - previous_value
+    target_regression = previous_met & has_target & ~met
+    value_regression = ~np.isnan(delta) & (delta < -tolerance)
+
+    results = []
+    for i, iku in enumerate(ikus):
+        item = items[iku]
+        if target_regression[i]:
+            regression = 'target'
+        elif value_regression[i]:
+            regression = 'value'
+        else:
+            regression = None
+        results.append({
+            'iku': iku,
+            'title': item['title'],
+            'value': float(value[i]),
+            'unit': '' if item['number_based'] else '%',
+            'target': item['target'],
+            'met': bool(met[i]) if has_target[i] else None,
+            'gap': round(float(gap[i]), 2) if has_target[i] else None,
+            'previous': None if np.isnan(previous_value[i]) else float(previous_value[i]),
+            'delta': None if np.isnan(delta[i]) else round(float(delta[i]), 2),
+            'regression': regression,
+        })
+    return results
+
+
+def merge_state(previous, check):
+    """
+    State baru: hasil check ini + acuan lama untuk IKU yang tidak dicek
+
+    Returns:
+    --------
+    dict : Isi state (results urut ALL_IKU)
+    """
+    rows = {row['iku']: row for row in (previous or {}).get('results', [])}
+    for row in check['results']:
+        rows[row['iku']] = dict(row, checked_at=check['generated_at'])
+    order = {iku: i for i, iku in enumerate(ALL_IKU)}
+    merged = sorted(rows.values(), key=lambda row: order.get(row['iku'], len(order)))
+    return dict(check, results=merged)
+
+
+def run_check(iku_list=None, bundle=None, state=None, tolerance=0.0,
+              fail_below_target=False, accept=False, update=True):
+    """
+    Jalankan check target + regresi
+
+    Parameters:
+    -----------
+    iku_list : list, optional
+        IKU yang dicek (default: semua)
+    bundle : str or Path, optional
+        Folder results bundle
+    state : str or Path, optional
+        File run tersimpan (default: <cache_dir>/check_state.json)
+    tolerance : float
+        Penurunan nilai yang masih diterima
+    fail_below_target : bool
+        Jika True, IKU di bawah target juga dihitung gagal
+    accept : bool
+        Simpan hasil sebagai run acuan walaupun ada regresi
+    update : bool
+        Jika False, state tidak ditulis sama sekali
+
+    Returns:
+    --------
+    dict : Hasil check (juga isi state & JSON)
+    """
+    start = time.perf_counter()
+    state = Path(state) if state is not None else cache_dir() / STATE_FILE
+    previous = json.loads(state.read_text(encoding='utf-8')) if state.exists() else None
+
+    summary = collect_summary(iku_list, bundle=bundle, prodi=False)
+    results = compare(summary, previous, tolerance)
+
+    regressions = [row['iku'] for row in results if row['regression']]
+    below_target = [row['iku'] for row in results if row['met'] is False]
+    if summary['errors']:
+        code = EXIT_ERROR
+    elif regressions or (fail_below_target and below_target):
+        code = EXIT_REGRESSION
+    else:
+        code = EXIT_OK
+
+    check = {
+        'generated_at': summary['generated_at'],
+        'source': summary['source'],
+        'tolerance': tolerance,
+        'fail_below_target': fail_below_target,
+        'previous_run': previous.get('generated_at') if previous else None,
+        'results': results,
+        'errors': summary['errors'],
+        'regressions': regressions,
+        'below_target': below_target,
+        'exit_code': code,
+        'duration_s': round(time.perf_counter() - start, 3),
+    }
+
+    # Acuan berikutnya = run terakhir yang bersih (atau yang di-accept)
+    if update and (accept or (not regressions and not summary['errors'])):
+        state.parent.mkdir(parents=True, exist_ok=True)
+        state.write_text(json.dumps(merge_state(previous, check), indent=2, ensure_ascii=False),
+                         encoding='utf-8')
+        check['state_updated'] = str(state)
+    else:
+        check['state_updated'] = None
+
+    return check
+
+
+# ============================================================================
+# OUTPUT
+# ============================================================================
+
+def write_junit(check, path):
+    """Tulis hasil check sebagai JUnit-XML (satu testcase per IKU)"""
+    results = check['results']
+    failed = {row['iku']: f"regression-{row['regression']}"
+              for row in results if row['regression']}
+    if check['fail_below_target']:
+        for iku in check['below_target']:
+            failed.setdefault(iku, 'below-target')
+    suite = ElementTree.Element('testsuite', {
+        'name': 'iku-targets',
+        'tests': str(len(results) + len(check['errors'])),
+        'failures': str(len(failed)),
+        'errors': str(len(check['errors'])),
+        'time': f"{check['duration_s']:.3f}",
+        'timestamp': check['generated_at'],
+    })
+
+    for row in results:
+        case = ElementTree.SubElement(suite, 'testcase', {
+            'classname': 'iku.target',
+            'name': f"IKU {row['iku']} ({row['title']})",
+        })
+        text = _result_text(row)
+        if row['iku'] in failed:
+            failure = ElementTree.SubElement(case, 'failure', {
+                'type': failed[row['iku']],
+                'message': text,
+            })
+            failure.text = text
+        else:
+            ElementTree.SubElement(case, 'system-out').text = text
+
+    for iku, message in check['errors'].items():
+        case = ElementTree.SubElement(suite, 'testcase', {
+            'classname': 'iku.target', 'name': f"IKU {iku}",
+        })
+        ElementTree.SubElement(case, 'error', {'message': message}).text = message
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    ElementTree.ElementTree(suite).write(path, encoding='utf-8', xml_declaration=True)
+
+
+def _result_text(row):
+    text = f"{row['value']:g}{row['unit']}"
+    if row['target'] is not None:
+        text += f" (target {row['target']}{row['unit']}, gap {row['gap']:+g})"
+    if row['delta'] is not None:
+        text += f", sebelumnya {row['previous']:g}{row['unit']} ({row['delta']:+g})"
+    if row['regression'] == 'target':
+        text += " - REGRESI: target tidak lagi terpenuhi"
+    elif row['regression'] == 'value':
+        text += " - REGRESI: nilai turun"
+    return text
+
+
+def format_check(check):
+    """Hasil check sebagai teks"""
+    lines = ['=' * 70, 'CHECK TARGET IKU', '=' * 70]
+    for row in check['results']:
+        if row['regression']:
+            mark = '✗'
+        elif row['met'] is False:
+            mark = '!'
+        else:
+            mark = '✓'
+        lines.append(f"{mark} IKU {row['iku']:<3} {_result_text(row)}")
+    for iku, message in check['errors'].items():
+        lines.append(f"❌ IKU {iku:<3} {message}")
+
+    lines.append('-' * 70)
+    lines.append(f"Acuan: {check['previous_run'] or '- (run pertama)'}   "
+                 f"Durasi: {check['duration_s']:.2f}s")
+    if check['regressions']:
+        lines.append(f"REGRESI: IKU {', '.join(check['regressions'])}")
+    if check['below_target']:
+        lines.append(f"Di bawah target: IKU {', '.join(check['below_target'])}")
+    if check['state_updated']:
+        lines.append(f"State diperbarui: {check['state_updated']}")
+    return '\n'.join(lines)
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main(argv=None):
+    """
+    Subcommand check
+
+    Returns:
+    --------
+    int : Exit code (0 = lolos, 1 = regresi, 2 = error)
+    """
+    parser = argparse.ArgumentParser(
+        prog='summary.py check',
+        description='Gate CI: capaian IKU vs target dan vs run tersimpan sebelumnya'
+    )
+    add_source_arguments(parser)
+    parser.add_argument('--junit', metavar='PATH', help='Tulis hasil JUnit-XML')
+    parser.add_argument('--json', metavar='PATH', help='Tulis hasil JSON')
+    parser.add_argument('--state', metavar='PATH',
+                        help=f'File run acuan (default: <base_path>/.iku_cache/{STATE_FILE})')
+    parser.add_argument('--tolerance', type=float, default=0.0,
+                        help='Penurunan nilai yang masih diterima (default: 0)')
+    parser.add_argument('--fail-below-target', action='store_true',
+                        help='IKU di bawah target juga membuat exit code 1')
+    parser.add_argument('--accept', action='store_true',
+                        help='Simpan hasil sebagai acuan walaupun ada regresi')
+    parser.add_argument('--no-update', action='store_true',
+                        help='Jangan tulis state (hanya bandingkan)')
+    parser.add_argument('--quiet', '-q', action='store_true',
+                        help='Tanpa output teks; hanya exit code (dan file hasil)')
+    args = parser.parse_args(argv)
+
+    apply_source_arguments(args)
+
+    check = run_check(args.iku, bundle=args.bundle, state=args.state,
+                      tolerance=args.tolerance, fail_below_target=args.fail_below_target,
+                      accept=args.accept, update=not args.no_update)
+
+    if args.junit:
+        write_junit(check, args.junit)
+    if args.json:
+        path = Path(args.json)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(check, indent=2, ensure_ascii=False) + '\n', encoding='utf-8')
+    if not args.quiet:
+        print(format_check(check))
+
+    return check['exit_code']
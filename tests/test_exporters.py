@@ -0,0 +1,50 @@
+"""
+Tests ekspor PNG (exporters.py): buffer RGBA sama dengan savefig PNG dan
+varian di-resample dari buffer tersebut
+"""
+
+import io
+
+import matplotlib
+matplotlib.use('Agg')
+
+import numpy as np
+from PIL import Image
+
+from exporters import render_png_bytes, render_rgba, save_png_variants
+from figures import managed_subplots
+
+
+DPI = 120
+
+
+def _draw(ax):
+    ax.bar(range(5), [3, 1, 4, 1, 5])
+    ax.set_title('ekspor')
+
+
+def test_render_matches_savefig_png():
+    with managed_subplots(figsize=(4, 3)) as (fig, ax):
+        _draw(ax)
+        buffer = io.BytesIO()
+        fig.savefig(buffer, dpi=DPI, bbox_inches='tight', format='png')
+        png_bytes = render_png_bytes(fig, DPI)
+
+    expected = np.asarray(Image.open(buffer).convert('RGBA'))
+    actual = np.asarray(Image.open(io.BytesIO(png_bytes)))
+    np.testing.assert_array_equal(actual, expected)
+
+
+def test_variants_resampled_from_buffer(tmp_path):
+    with managed_subplots(figsize=(4, 3)) as (fig, ax):
+        _draw(ax)
+        image = render_rgba(fig, DPI)
+
+    variants = {'half': {'dpi': DPI // 2}, 'thumb': {'width': 100}}
+    saved = save_png_variants(image, tmp_path / 'chart.png', DPI, variants)
+
+    assert saved == [str(tmp_path / 'half' / 'chart.png'),
+                     str(tmp_path / 'thumb' / 'chart.png')]
+    half = Image.open(saved[0])
+    assert half.size == (round(image.width / 2), round(image.height / 2))
+    assert Image.open(saved[1]).width == 100
@@ -0,0 +1,55 @@
+"""
+Tests lifecycle figure (figures.py): tidak ada figure tertinggal dan RSS
+tidak terus naik setelah banyak siklus managed_subplots
+"""
+
+import gc
+import math
+
+import matplotlib
+matplotlib.use('Agg')
+
+import numpy as np
+import pytest
+
+from figures import live_figures, managed_subplots, rss_mb
+
+
+CYCLES = 150
+WARMUP = 30
+SAMPLE_EVERY = 5
+# Pertumbuhan RSS maksimum setelah warmup (MB per 100 siklus)
+MAX_GROWTH_PER_100 = 2.0
+
+
+def _chart_cycle(i):
+    with managed_subplots(figsize=(6, 4)) as (fig, ax):
+        ax.bar(range(20), np.arange(20) + i % 7)
+        ax.set_title(f'siklus {i}')
+        # Render Agg penuh (buffer RGBA), tanpa encode PNG
+        fig.canvas.draw()
+
+
+def test_figure_closed_on_exception():
+    before = live_figures()
+    with pytest.raises(RuntimeError):
+        with managed_subplots() as (fig, ax):
+            raise RuntimeError('chart gagal')
+    assert live_figures() == before
+
+
+@pytest.mark.slow
+def test_no_figure_leak_over_repeated_cycles():
+    rss = []
+    for i in range(CYCLES):
+        _chart_cycle(i)
+        if i >= WARMUP and i % SAMPLE_EVERY == 0:
+            gc.collect()
+            rss.append(rss_mb())
+
+    assert live_figures() == 0
+    if any(math.isnan(value) for value in rss):
+        pytest.skip('RSS tidak tersedia di platform ini')
+    # Kemiringan regresi linear RSS per titik sampel (SAMPLE_EVERY siklus)
+    growth = np.polyfit(np.arange(len(rss)), rss, 1)[0] * 100 / SAMPLE_EVERY
+    assert growth < MAX_GROWTH_PER_100, f'RSS naik {growth:.2f} MB / 100 siklus'
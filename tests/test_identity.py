@@ -0,0 +1,64 @@
+"""
+Tests resolusi identitas (identity.py)
+"""
+
+import pandas as pd
+
+from identity import resolve_identities
+
+
+def _resolve(rows, id_col='NIM'):
+    df = pd.DataFrame(rows, columns=[id_col, 'Nama', 'Prodi', 'Sumber'])
+    return resolve_identities(df, id_col, 'Nama', 'Prodi', threshold=0.8)
+
+
+def test_different_ids_same_format_never_merge_across_sources():
+    resolved, report = _resolve([
+        ('F1E121001', 'Muhammad Rizki', 'Informatika', 'MBKM'),
+        ('F1E121077', 'Muhammad Rizky', 'Informatika', 'Prestasi'),
+    ])
+    assert report['fuzzy_merges'] == 0
+    assert resolved['Identitas'].nunique() == 2
+
+
+def test_union_chain_does_not_join_clusters_with_different_ids():
+    resolved, report = _resolve([
+        ('F1E121001', 'Muhammad Rizki', 'Informatika', 'MBKM'),
+        ('F1E121077', 'Muhammad Rizki', 'Informatika', 'MBKM'),
+        ('F1E121050', 'Muhammad Rizky', 'Informatika', 'Prestasi'),
+    ])
+    assert report['identities'] == 3
+    assert report['fuzzy_merges'] == 0
+
+
+def test_chain_through_row_without_id_stops_at_second_id():
+    # "Rizki" (NIM A) - "Rizky" (tanpa NIM) - "Rizki" (NIM B): baris tanpa
+    # NIM hanya boleh bergabung dengan salah satu NIM
+    resolved, report = _resolve([
+        ('F1E121001', 'Muhammad Rizki', 'Informatika', 'MBKM'),
+        (None, 'Muhammad Rizky', 'Informatika', 'Prestasi'),
+        ('F1E121077', 'Muhammad Rizki', 'Informatika', 'Prestasi'),
+    ])
+    assert report['identities'] == 2
+    identities = resolved['Identitas'].tolist()
+    assert identities[0] != identities[2]
+    assert identities[1] in (identities[0], identities[2])
+
+
+def test_name_merges_when_id_missing_or_other_format():
+    resolved, report = _resolve([
+        ('198602062024062001', 'Dr. Ir. Fetty Febriasti Bahar S.T., M.T.', 'Teknik Sipil', 'Tridharma'),
+        ('1986020620240620', 'Fetty Febriasti Bahar, M.T.', 'Teknik Sipil', 'Membimbing'),
+        (None, 'Ir. Fety Febriasti Bahar', 'Teknik Sipil', 'Membimbing'),
+    ], id_col='NIP')
+    assert report['identities'] == 1
+    assert report['fuzzy_merges'] == 2
+
+
+def test_same_id_merges_exactly():
+    resolved, report = _resolve([
+        ('F1E121001', 'Muhammad Rizki', 'Informatika', 'MBKM'),
+        ('F1E121001', 'M. Rizki', 'Informatika', 'Prestasi'),
+    ])
+    assert report['exact_merges'] == 1
+    assert report['identities'] == 1
@@ -0,0 +1,51 @@
+"""
+Tests kanonikalisasi nama prodi (prodi_names.py)
+"""
+
+import pytest
+
+from prodi_names import ProdiIndex, parse_label
+
+
+@pytest.fixture(scope='module')
+def index():
+    return ProdiIndex(threshold=0.75, margin=0.1)
+
+
+@pytest.mark.parametrize('label', [
+    'Teknik Fisika',
+    'Teknik Geomatika',
+    'Teknik Elektronika',
+    'Matematika Terapan',
+    'S2 Fisika',
+    'Magister Kimia',
+    'Teknik Geologi (D3)',
+    'Pendidikan Kimia',
+])
+def test_distinct_programs_stay_unresolved(index, label):
+    assert index.match(label) is None
+
+
+@pytest.mark.parametrize('label, expected', [
+    ('Program Studi Teknik Sipil', 'Teknik Sipil'),
+    ('S1 Teknik Sipil', 'Teknik Sipil'),
+    ('teknik sipl', 'Teknik Sipil'),
+    ('Sistem Informsi', 'Sistem Informasi'),
+    ('teknik lingkungn', 'Teknik Lingkungan'),
+    ('Analis Kimia', 'Analis Kimia (D3)'),
+    ('Program Studi Kimia Industri (D3)', 'Kimia Industri (D3)'),
+    ('kimia industri d3', 'Kimia Industri (D3)'),
+])
+def test_variants_and_typos_resolve(index, label, expected):
+    assert index.match(label) == expected
+
+
+def test_parse_label_keeps_level():
+    assert parse_label('Program Studi Analis Kimia (D3)') == ('analis kimia', 'd3')
+    assert parse_label('S2 Fisika') == ('fisika', 's2')
+    assert parse_label('Teknik Sipil') == ('teknik sipil', None)
+
+
+def test_runner_up_margin_rejects_ambiguous_match():
+    ambiguous = ProdiIndex(['Teknik Sipil', 'Teknik Sipal'], threshold=0.5, margin=0.1)
+    assert ambiguous.match('teknik sipl') is None
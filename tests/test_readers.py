@@ -0,0 +1,46 @@
+"""
+Tests parity reader backend (readers.py): setiap backend harus
+menghasilkan DataFrame identik dengan referensi openpyxl untuk setiap
+file monitoring
+"""
+
+import pandas as pd
+import pytest
+
+from readers import BACKENDS, ColumnarCacheBackend, input_files
+
+
+FILES = input_files()
+OTHER_BACKENDS = [name for name in BACKENDS if name != 'openpyxl']
+
+_REFERENCE = {}
+
+
+def _reference(path):
+    if path not in _REFERENCE:
+        _REFERENCE[path] = BACKENDS['openpyxl'].read(path)
+    return _REFERENCE[path]
+
+
+def _require(name):
+    backend = BACKENDS[name]
+    if not backend.available():
+        pytest.skip(f"backend {name} butuh {backend.requires}")
+    return backend
+
+
+@pytest.mark.skipif(not FILES, reason='tidak ada file monitoring-iku-*.xlsx')
+@pytest.mark.parametrize('name', OTHER_BACKENDS)
+@pytest.mark.parametrize('path', FILES, ids=[path.stem for path in FILES])
+def test_backend_matches_openpyxl(path, name, tmp_path):
+    backend = _require(name)
+    reference = _reference(path)
+    if name == 'cache':
+        cache = ColumnarCacheBackend(tmp_path)
+        miss, miss_hit = cache.read_cached(path)
+        hit, hit_hit = cache.read_cached(path)
+        assert (miss_hit, hit_hit) == (False, True)
+        pd.testing.assert_frame_equal(miss, reference, check_exact=True)
+        pd.testing.assert_frame_equal(hit, reference, check_exact=True)
+    else:
+        pd.testing.assert_frame_equal(backend.read(path), reference, check_exact=True)
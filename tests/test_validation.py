@@ -0,0 +1,96 @@
+"""
+Tests validasi data input (validation.py)
+"""
+
+import pandas as pd
+import pytest
+
+from tracing import span, trace_session
+from utils import set_frame_source
+from validation import validate, ValidatedFrames, SEVERITY_ERROR
+
+
+def _frames_source(frames):
+    def source(iku_number, file_type='pembilang'):
+        key = (iku_number, file_type)
+        if key not in frames:
+            raise FileNotFoundError(f'monitoring-iku-{iku_number}-{file_type}.xlsx')
+        return frames[key].copy()
+    return source
+
+
+@pytest.fixture
+def fixture_frames():
+    frames = {
+        ('31', 'penyebut'): pd.DataFrame({
+            'NIP': ['1001', '1002'],
+            'Program Studi': ['Fisika', 'Kimia'],
+        }),
+        # Luaran dosen: 9999 tidak ada di daftar dosen (31-penyebut)
+        ('51', 'pembilang'): pd.DataFrame({
+            'NIP': ['1001', '1001', '9999'],
+        }),
+        # Kerjasama: dokumen yang sama tercatat dua kali untuk Fisika
+        ('62', 'pembilang'): pd.DataFrame({
+            'Nomor Dokumen': ['K/01', 'K/01', 'K/02'],
+            'Program Studi': ['Fisika', 'Fisika', 'Kimia'],
+        }),
+    }
+    previous = set_frame_source(_frames_source(frames))
+    yield frames
+    set_frame_source(previous)
+
+
+def _rules(report, iku):
+    return {(f['rule'], f['severity']) for f in report['findings'] if f['iku'] == iku}
+
+
+def test_validate_expands_iku_5_and_6(fixture_frames):
+    report = validate(['5', '6'])
+    assert report['ikus'] == ['5', '6']
+    assert report['errors'] == 2
+
+
+def test_iku_5_orphan_nip_against_dosen(fixture_frames):
+    report = validate(['5'])
+    # Satu dosen boleh punya beberapa luaran: NIP ganda bukan temuan
+    assert _rules(report, '5') == {('orphan_id', SEVERITY_ERROR)}
+    assert report['findings'][0]['examples'] == ['9999']
+
+
+def test_iku_6_duplicate_document(fixture_frames):
+    report = validate(['6'])
+    assert _rules(report, '6') == {('duplicate_id', SEVERITY_ERROR)}
+    assert report['findings'][0]['examples'] == ['K/01 / Fisika']
+
+
+def test_validated_frames_are_reused(fixture_frames):
+    frames = {}
+    validate(['6'], frames)
+    assert list(frames) == [('62', 'pembilang')]
+
+    calls = []
+
+    def fallback(iku_number, file_type='pembilang'):
+        calls.append((iku_number, file_type))
+        return fixture_frames[(iku_number, file_type)].copy()
+
+    source = ValidatedFrames(frames, fallback)
+    df = source('62', 'pembilang')
+    df.loc[0, 'Nomor Dokumen'] = 'diubah'
+    assert frames[('62', 'pembilang')].loc[0, 'Nomor Dokumen'] == 'K/01'
+    assert calls == []
+
+    source('31', 'penyebut')
+    assert calls == [('31', 'penyebut')]
+
+
+def test_validated_frames_count_cache_hits(fixture_frames):
+    frames = {}
+    validate(['6'], frames)
+    source = ValidatedFrames(frames, _frames_source(fixture_frames))
+    with trace_session(summary=False) as session:
+        with span('read'):
+            source('62', 'pembilang')
+            source('31', 'penyebut')
+    assert session.records[0]['counters'] == {'cache_hits': 1}
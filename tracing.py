@@ -0,0 +1,439 @@
+"""
+============================================================================
+TRACING - SISTEM VISUALISASI IKU
+============================================================================
+
+Span bertingkat (run -> IKU -> stage -> chart) untuk mengukur pipeline:
+durasi, baris yang diproses, bytes yang ditulis, dan cache hit.
+
+    with trace_session('output/IKU_trace.jsonl'):
+        with span('IKU 31', iku='31'):
+            with span('read') as s:
+                df = ...
+                s.add(rows=len(df))
+
+Setiap span yang selesai ditulis sebagai satu baris JSON (JSON lines,
+child sebelum parent) dan dirangkum di akhir sesi sebagai tabel
+flame-style (pohon span, waktu total/self, counter per subtree).
+
+Tanpa sesi aktif, span() dan add() hampir gratis dan tidak menyimpan
+apa pun (misalnya di chart server atau saat modul dipakai sebagai
+library). Worker process (-j) menulis span-nya sendiri ke file trace
+yang sama (pid berbeda) lewat start_worker_trace(); tabel ringkasan
+parent hanya berisi span parent.
+
+Modul ini hanya memakai stdlib (aman untuk mode tanpa matplotlib).
+
+Author: Tim IKU FST
+Version: 2.0 (Modular)
+Last Updated: 2026-10-19
+============================================================================
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import threading
+import functools
+import contextlib
+from pathlib import Path
+
+
+# Counter yang dijumlahkan per subtree di tabel ringkasan
+COUNTERS = ('rows', 'bytes', 'cache_hits')
+
+_SESSION = None
+_LOCAL = threading.local()
+
+# Listener dengan span_started(span) / span_finished(span, duration),
+# dipanggil di thread yang menjalankan span (misalnya profiling.py)
+_LISTENERS = []
+
+
+# ============================================================================
+# SPAN
+# ============================================================================
+
+class Span:
+    """Satu span aktif (dibuat oleh span(), jangan dibuat langsung)"""
+
+    __slots__ = ('name', 'path', 'attrs', 'counters', 'start', 'status')
+
+    def __init__(self, name, path, attrs):
+        self.name = name
+        self.path = path
+        self.attrs = attrs
+        self.counters = {}
+        self.start = time.time()
+        self.status = 'ok'
+
+    def add(self, **counters):
+        """Tambahkan counter (rows, bytes, cache_hits, ...)"""
+        for key, value in counters.items():
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def set(self, **attrs):
+        """Set attribute bebas (misalnya error=...)"""
+        self.attrs.update(attrs)
+
+    def fail(self, error):
+        """Tandai span gagal (error ditampilkan di ringkasan)"""
+        self.status = 'error'
+        self.attrs['error'] = str(error)
+
+
+class _NullSpan:
+    """Span pengganti saat tidak ada sesi aktif"""
+
+    def add(self, **counters):
+        pass
+
+    def set(self, **attrs):
+        pass
+
+    def fail(self, error):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def _stack():
+    stack = getattr(_LOCAL, 'stack', None)
+    if stack is None:
+        stack = _LOCAL.stack = []
+    return stack
+
+
+@contextlib.contextmanager
+def span(name, **attrs):
+    """
+    Context manager satu span
+
+    Parameters:
+    -----------
+    name : str
+        Nama span (menjadi node di pohon ringkasan)
+    **attrs
+        Attribute tambahan (iku, file_type, ...)
+
+    Yields:
+    -------
+    Span : Objek span (add() / set() / fail()), atau no-op tanpa sesi aktif
+    """
+    session = _SESSION
+    if session is None:
+        yield _NULL_SPAN
+        return
+
+    stack = _stack()
+    parent_path = stack[-1].path if stack else ()
+    current = Span(name, parent_path + (name,), attrs)
+    stack.append(current)
+    for listener in _LISTENERS:
+        listener.span_started(current)
+    perf_start = time.perf_counter()
+    try:
+        yield current
+    except BaseException as e:
+        current.fail(e)
+        raise
+    finally:
+        duration = time.perf_counter() - perf_start
+        stack.pop()
+        for listener in _LISTENERS:
+            listener.span_finished(current, duration)
+        session.emit(current, duration)
+
+
+def current_span():
+    """Span aktif di thread ini (no-op span jika tidak ada)"""
+    stack = _stack() if _SESSION is not None else None
+    return stack[-1] if stack else _NULL_SPAN
+
+
+def add(**counters):
+    """Tambahkan counter ke span aktif (no-op tanpa sesi)"""
+    current_span().add(**counters)
+
+
+def add_span_listener(listener):
+    """Daftarkan listener span_started(span) / span_finished(span, duration)"""
+    _LISTENERS.append(listener)
+
+
+def remove_span_listener(listener):
+    """Hapus listener (no-op jika tidak terdaftar)"""
+    if listener in _LISTENERS:
+        _LISTENERS.remove(listener)
+
+
+def active():
+    """True jika ada sesi tracing aktif"""
+    return _SESSION is not None
+
+
+def traced(name):
+    """Decorator: jalankan fungsi di dalam span `name`"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# ============================================================================
+# SESSION
+# ============================================================================
+
+class TraceSession:
+    """
+    Kumpulan span dari satu run
+
+    Parameters:
+    -----------
+    trace_file : str or Path, optional
+        File JSON lines (di-append; dibuka saat span pertama selesai,
+        sehingga aman terhadap cleanup_output_folder)
+    keep : bool
+        Simpan span di memori untuk ringkasan (False di worker)
+    """
+
+    def __init__(self, trace_file=None, keep=True):
+        self.trace_file = Path(trace_file) if trace_file else None
+        self.keep = keep
+        self.records = []
+        self.stdout = None   # stdout asli saat progress disembunyikan (quiet)
+        self._file = None
+        self._lock = threading.Lock()
+
+    def emit(self, current, duration):
+        record = {
+            'name': current.name,
+            'path': list(current.path),
+            'depth': len(current.path) - 1,
+            'start': round(current.start, 6),
+            'duration_ms': round(duration * 1000, 3),
+            'pid': os.getpid(),
+            'status': current.status,
+            **({'attrs': current.attrs} if current.attrs else {}),
+            **({'counters': current.counters} if current.counters else {}),
+        }
+        with self._lock:
+            if self.keep:
+                self.records.append(record)
+            if self.trace_file is not None:
+                if self._file is None:
+                    self.trace_file.parent.mkdir(parents=True, exist_ok=True)
+                    self._file = open(self.trace_file, 'a', encoding='utf-8', buffering=1)
+                self._file.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def start_trace(trace_file=None, keep=True):
+    """Aktifkan sesi global baru; return sesi sebelumnya"""
+    global _SESSION
+    previous = _SESSION
+    _SESSION = TraceSession(trace_file, keep=keep)
+    return previous
+
+
+def stop_trace(previous=None):
+    """Tutup sesi aktif dan pulihkan sesi sebelumnya; return sesi yang ditutup"""
+    global _SESSION
+    session = _SESSION
+    if session is not None:
+        session.close()
+    _SESSION = previous
+    return session
+
+
+def print_result(*args, **kwargs):
+    """
+    print() untuk hasil akhir run: tetap ke stdout asli walaupun progress
+    disembunyikan (trace_session quiet)
+    """
+    stdout = _SESSION.stdout if _SESSION is not None else None
+    print(*args, file=stdout or sys.stdout, **kwargs)
+
+
+def trace_file():
+    """File trace sesi aktif (untuk diteruskan ke worker), atau None"""
+    return _SESSION.trace_file if _SESSION is not None else None
+
+
+def start_worker_trace(trace_file):
+    """Initializer worker: tulis span ke file trace parent (tanpa ringkasan)"""
+    global _SESSION
+    # Sesi parent ikut tersalin saat fork; worker memulai sesinya sendiri
+    _SESSION = None
+    _LOCAL.stack = []
+    if trace_file is not None:
+        start_trace(trace_file, keep=False)
+
+
+@contextlib.contextmanager
+def trace_session(trace_file=None, quiet=False, summary=True, summary_depth=None):
+    """
+    Jalankan blok di bawah sesi tracing
+
+    Parameters:
+    -----------
+    trace_file : str or Path, optional
+        File JSON lines untuk semua span
+    quiet : bool
+        Sembunyikan print() progress di dalam blok (stdout); trace,
+        ringkasan, print_result() (hasil akhir), dan stderr (traceback)
+        tetap tampil
+    summary : bool
+        Cetak tabel ringkasan flame-style di akhir
+    summary_depth : int, optional
+        Kedalaman maksimum pohon di ringkasan (file trace tetap lengkap)
+
+    Yields:
+    -------
+    TraceSession
+    """
+    # File trace lama diganti (worker tetap append ke file baru)
+    if trace_file is not None and Path(trace_file).exists():
+        Path(trace_file).unlink()
+    previous = start_trace(trace_file)
+    session = _SESSION
+    stdout = session.stdout = sys.stdout
+    try:
+        if quiet:
+            with contextlib.redirect_stdout(io.StringIO()):
+                yield session
+        else:
+            yield session
+    finally:
+        stop_trace(previous)
+        if summary:
+            print(format_summary(session.records, max_depth=summary_depth), file=stdout)
+            if session.trace_file is not None:
+                print(f"Trace: {session.trace_file}", file=stdout)
+
+
+# ============================================================================
+# FLAME-STYLE SUMMARY
+# ============================================================================
+
+def _fmt_count(value):
+    if not value:
+        return ''
+    for unit, size in (('G', 1e9), ('M', 1e6), ('k', 1e3)):
+        if value >= size:
+            return f'{value / size:.1f}{unit}'
+    return f'{value:g}'
+
+
+def format_summary(records, bar_width=24, max_depth=None):
+    """
+    Tabel ringkasan flame-style dari span records
+
+    Span dengan path yang sama digabung (n = jumlah kemunculan). Kolom
+    total = waktu inklusif, self = total dikurangi child; counter
+    dijumlahkan per subtree. Bar sebanding dengan waktu total terhadap
+    root terlama.
+
+    Returns:
+    --------
+    str
+    """
+    if not records:
+        return 'Trace: tidak ada span.'
+
+    nodes = {}
+    order = []
+    for record in records:
+        path = tuple(record['path'])
+        node = nodes.get(path)
+        if node is None:
+            node = nodes[path] = {'total': 0.0, 'child': 0.0, 'n': 0, 'first': record['start'],
+                                  'counters': dict.fromkeys(COUNTERS, 0), 'errors': []}
+            order.append(path)
+        node['total'] += record['duration_ms']
+        node['n'] += 1
+        node['first'] = min(node['first'], record['start'])
+        if record['status'] == 'error':
+            node['errors'].append(record.get('attrs', {}).get('error', ''))
+
+    # Child selesai (dan tercatat) sebelum parent-nya, sehingga waktu
+    # child dan counter subtree baru dijumlahkan setelah semua node ada
+    for record in records:
+        path = tuple(record['path'])
+        if path[:-1] in nodes:
+            nodes[path[:-1]]['child'] += record['duration_ms']
+        for key, value in record.get('counters', {}).items():
+            if key not in COUNTERS:
+                continue
+            for depth in range(1, len(path) + 1):
+                ancestor = nodes.get(path[:depth])
+                if ancestor is not None:
+                    ancestor['counters'][key] += value
+
+    # Urutan pohon: depth-first, saudara diurutkan menurut waktu mulai
+    children = {}
+    for path in order:
+        children.setdefault(path[:-1], []).append(path)
+    tree = []
+
+    def walk(parent):
+        for path in sorted(children.get(parent, []), key=lambda p: nodes[p]['first']):
+            if max_depth is None or len(path) <= max_depth:
+                tree.append(path)
+                walk(path)
+
+    walk(())
+    scale = max(nodes[path]['total'] for path in children.get((), [])) or 1.0
+
+    header = (f"{'total ms':>10} {'self ms':>9} {'n':>4} {'rows':>7} {'bytes':>7} {'hits':>5}  "
+              f"{'':<{bar_width}}  span")
+    lines = ['=' * len(header), 'TRACE SUMMARY', '=' * len(header), header, '-' * len(header)]
+    for path in tree:
+        node = nodes[path]
+        self_ms = max(node['total'] - node['child'], 0.0)
+        bar = '█' * max(1, int(round(node['total'] / scale * bar_width)))
+        counters = node['counters']
+        lines.append(f"{node['total']:>10.1f} {self_ms:>9.1f} {node['n']:>4} "
+                     f"{_fmt_count(counters['rows']):>7} {_fmt_count(counters['bytes']):>7} "
+                     f"{_fmt_count(counters['cache_hits']):>5}  {bar:<{bar_width}}  "
+                     f"{'  ' * (len(path) - 1)}{path[-1]}")
+
+    # Error dari semua span, termasuk yang lebih dalam dari max_depth
+    errors = [f"{' > '.join(path)}: {error}" for path in order for error in nodes[path]['errors']]
+    if errors:
+        lines.append('-' * len(header))
+        lines.append(f'{len(errors)} span error:')
+        lines.extend(f'  ❌ {error}' for error in errors)
+    return '\n'.join(lines)
+
+
+def read_trace(trace_file):
+    """Baca file JSON lines hasil trace (list of dict)"""
+    with open(trace_file, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+if __name__ == "__main__":
+    # python tracing.py output/IKU_trace.jsonl [--pid PID] -> ringkasan dari file
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Ringkasan flame-style dari file trace JSON lines')
+    parser.add_argument('trace_file')
+    parser.add_argument('--pid', type=int, help='Hanya span dari process ini')
+    parser.add_argument('--depth', type=int, help='Kedalaman maksimum pohon')
+    args = parser.parse_args()
+
+    records = read_trace(args.trace_file)
+    if args.pid is not None:
+        records = [r for r in records if r['pid'] == args.pid]
+    print(format_summary(records, max_depth=args.depth))
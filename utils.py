@@ -11,11 +11,11 @@ Last Updated: 2026-01-07
 ============================================================================
 """
 
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-
 from config import CONFIG, PRODI_TO_JURUSAN, JURUSAN_ORDER, JURUSAN_COLORS
+from exporters import FileTarget, save_to_target
+from tracing import span, add as trace_add
+from readers import read_excel
+from prodi_names import canonicalize_prodi_columns
 
 
 # ============================================================================
@@ -24,6 +24,11 @@ from config import CONFIG, PRODI_TO_JURUSAN, JURUSAN_ORDER, JURUSAN_COLORS
 
 def setup_publication_style():
     """Setup style matplotlib sesuai standar publikasi internasional"""
+    # Import di sini: modul ini juga dipakai mode ringkasan (summary.py)
+    # yang tidak boleh memuat matplotlib/seaborn
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
     plt.rcParams.update({
         'figure.dpi': CONFIG['dpi'],
         'savefig.dpi': CONFIG['dpi'],
@@ -58,6 +63,59 @@ def setup_publication_style():
 # FILE I/O FUNCTIONS
 # ============================================================================
 
+# Sumber DataFrame alternatif untuk read_excel_iku, callable
+# source(iku_number, file_type) -> DataFrame (misalnya results bundle).
+# None = baca langsung dari file Excel.
+_FRAME_SOURCE = None
+
+
+def set_frame_source(source):
+    """
+    Ganti sumber data read_excel_iku (None = kembali ke file Excel)
+
+    Parameters:
+    -----------
+    source : callable or None
+        source(iku_number, file_type) -> pd.DataFrame. Harus
+        mengembalikan DataFrame baru (copy) di setiap pemanggilan.
+
+    Returns:
+    --------
+    callable or None : Sumber sebelumnya
+    """
+    global _FRAME_SOURCE
+    previous = _FRAME_SOURCE
+    _FRAME_SOURCE = source
+    return previous
+
+
+def get_frame_source():
+    """Sumber data read_excel_iku yang aktif (None = file Excel)"""
+    return _FRAME_SOURCE
+
+
+def read_excel_file(iku_number, file_type='pembilang'):
+    """
+    Baca file Excel input langsung (tanpa frame source dan tanpa
+    kanonikalisasi prodi)
+
+    Returns:
+    --------
+    tuple : (pd.DataFrame, dict info reader untuk span)
+    """
+    file_path = CONFIG['base_path'] / f'monitoring-iku-{iku_number}-{file_type}.xlsx'
+
+    if not file_path.exists():
+        raise FileNotFoundError(f"File tidak ditemukan: {file_path}")
+
+    # Baca dengan header di baris 1 (index 1); backend dipilih per
+    # ukuran file (lihat readers.py, CONFIG['reader_backend'])
+    df, reader_info = read_excel(file_path)
+    if reader_info.get('cache') == 'hit':
+        trace_add(cache_hits=1)
+    return df, reader_info
+
+
 def read_excel_iku(iku_number, file_type='pembilang'):
     """
     Membaca file Excel IKU
@@ -69,19 +127,24 @@ def read_excel_iku(iku_number, file_type='pembilang'):
     file_type : str
         'pembilang' atau 'penyebut'
 
+    Kolom prodi ('Prodi' / 'Program Studi') dikanonikalisasi ke kunci
+    PRODI_TO_JURUSAN (lihat prodi_names.py).
+
     Returns:
     --------
     pd.DataFrame
     """
-    file_path = CONFIG['base_path'] / f'monitoring-iku-{iku_number}-{file_type}.xlsx'
+    with span(f'read {iku_number}-{file_type}') as read_span:
+        if _FRAME_SOURCE is not None:
+            df = _FRAME_SOURCE(iku_number, file_type)
+            read_span.add(rows=len(df))
+            return canonicalize_prodi_columns(df)
 
-    if not file_path.exists():
-        raise FileNotFoundError(f"File tidak ditemukan: {file_path}")
+        df, reader_info = read_excel_file(iku_number, file_type)
+        read_span.set(**reader_info)
+        read_span.add(rows=len(df))
 
-    # Baca dengan header di baris 1 (index 1)
-    df = pd.read_excel(file_path, header=1)
-
-    return df
+        return canonicalize_prodi_columns(df)
 
 
 def save_figure(fig, filename_base, subdir=''):
@@ -97,32 +160,16 @@ def save_figure(fig, filename_base, subdir=''):
     subdir : str, optional
         Subdirectory name (e.g., 'horizontal', 'vertical')
 
+    Figure disimpan ke render target aktif (lihat exporters.render_to);
+    default-nya file PNG/SVG di output folder.
+
     Returns:
     --------
     list : List of saved file paths
     """
     output_dir = CONFIG['base_path'] / CONFIG['output_dir']
-    saved_files = []
 
-    # Save PNG
-    if CONFIG['export_png']:
-        png_dir = output_dir / 'png'
-        png_dir.mkdir(parents=True, exist_ok=True)
-        png_file = png_dir / f'{filename_base}.png'
-        fig.savefig(png_file, dpi=CONFIG['dpi'], bbox_inches='tight', format='png')
-        saved_files.append(str(png_file))
-        print(f"    ✓ PNG: {png_file.relative_to(output_dir)}")
-
-    # Save SVG (vector format)
-    if CONFIG['export_svg']:
-        svg_dir = output_dir / 'svg'
-        svg_dir.mkdir(parents=True, exist_ok=True)
-        svg_file = svg_dir / f'{filename_base}.svg'
-        fig.savefig(svg_file, bbox_inches='tight', format='svg')
-        saved_files.append(str(svg_file))
-        print(f"    ✓ SVG: {svg_file.relative_to(output_dir)}")
-
-    return saved_files
+    return save_to_target(fig, filename_base, FileTarget(output_dir, CONFIG))
 
 
 def cleanup_output_folder():
@@ -134,12 +181,14 @@ def cleanup_output_folder():
     if output_dir.exists():
         print("\n🧹 Cleaning output folder...")
 
-        # Hapus semua file PNG
+        # Hapus semua file PNG (termasuk varian resolusi di subfolder)
         png_dir = output_dir / 'png'
         if png_dir.exists():
             for file in png_dir.glob('*.png'):
                 file.unlink()
                 print(f"  ✓ Deleted: {file.name}")
+            for file in png_dir.glob('*/*.png'):
+                file.unlink()
 
         # Hapus semua file SVG
         svg_dir = output_dir / 'svg'
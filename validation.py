@@ -0,0 +1,479 @@
+"""
+============================================================================
+VALIDATION - VALIDASI KUALITAS DATA INPUT IKU
+============================================================================
+
+Tahap validasi yang dijalankan tepat setelah data dibaca, sebelum
+processor dan render. Setiap IKU punya spesifikasi (VALIDATION_SPECS):
+kolom ID entitas yang dihitung, kolom prodi, dan file acuan untuk join.
+Semua aturan dihitung per kolom sekaligus (pandas/numpy, tanpa loop per
+baris):
+
+- missing_column : kolom yang dipakai processor tidak ada      (error)
+- null_id        : ID kosong                                   (warning)
+- duplicate_id   : ID ganda di pembilang; processor menghitung
+                   baris, bukan ID unik, sehingga capaian
+                   terhitung lebih                             (error)
+- orphan_id      : ID pembilang tidak ada di penyebut/acuan;
+                   baris hilang saat join atau capaian melebihi
+                   populasi                                    (error)
+- duplicate_ref  : ID ganda di file acuan join (baris pembilang
+                   ikut terduplikasi saat merge)               (warning)
+- unknown_prodi  : nama prodi tidak cocok dengan PRODI_TO_JURUSAN
+                   (juga setelah kanonikalisasi prodi_names.py);
+                   get_prodi_color diam-diam memakai warna MIPA
+                   dan sort_by_jurusan tidak bisa mengurutkan  (warning)
+
+Hasil validasi berupa laporan ringkas (satu baris per temuan). Dengan
+--strict (atau CONFIG['validation_strict']) run dibatalkan sebelum render
+jika ada temuan level error.
+
+Frame yang dibaca validasi tidak dibuang: main() memasangnya sebagai
+frame source (ValidatedFrames), sehingga processor memakai frame yang
+sama tanpa membaca Excel kedua kali.
+
+Usage:
+    python validation.py                     # validasi semua IKU
+    python validation.py --iku 2 31 --json   # JSON ke stdout
+    python validation.py --strict            # exit code 2 jika ada error
+    python main_visualize_iku.py --strict    # batal sebelum render
+
+Author: Tim IKU FST
+Version: 2.0 (Modular)
+Last Updated: 2026-10-19
+============================================================================
+"""
+
+import io
+import sys
+import json
+import time
+import argparse
+import contextlib
+
+import pandas as pd
+
+from config import ALL_IKU, IKU_EXPANSION, PRODI_TO_JURUSAN
+from utils import read_excel_iku, read_excel_file
+from tracing import span, add as trace_add
+
+
+SEVERITY_ERROR = 'error'
+SEVERITY_WARNING = 'warning'
+
+# Exit code validasi strict gagal (sama dengan main_visualize_iku.py)
+EXIT_INVALID = 2
+
+# Jumlah contoh nilai yang dicantumkan per temuan
+MAX_EXAMPLES = 3
+
+
+class DataValidationError(ValueError):
+    """Validasi strict gagal: ada temuan level error"""
+
+    def __init__(self, report):
+        self.report = report
+        super().__init__(f"Validasi data gagal: {report['errors']} error, "
+                         f"{report['warnings']} warning")
+
+
+# ============================================================================
+# SPESIFIKASI PER IKU
+# ============================================================================
+
+def _spec(key, prodi='Program Studi', pembilang_prodi=True, penyebut=True,
+          reference='penyebut', unique=True, source=None):
+    """
+    Spesifikasi validasi satu IKU
+
+    Parameters:
+    -----------
+    key : str or tuple
+        Kolom ID entitas di pembilang (tuple = kunci gabungan)
+    prodi : str
+        Nama kolom prodi ('Prodi' atau 'Program Studi')
+    pembilang_prodi : bool
+        Apakah file pembilang punya (dan butuh) kolom prodi
+    penyebut : bool
+        Apakah IKU punya file penyebut
+    reference : str or tuple or None
+        File acuan untuk cek orphan: 'penyebut', (iku_number, file_type),
+        atau None (tidak dicek)
+    unique : bool
+        Apakah ID pembilang wajib unik (entitas dihitung sekali)
+    source : str, optional
+        Nomor IKU pada nama file input jika berbeda dari kunci spec
+        (IKU 5 dan 6 dibaca dari file 51 dan 62)
+    """
+    return {
+        'key': (key,) if isinstance(key, str) else tuple(key),
+        'prodi': prodi,
+        'pembilang_prodi': pembilang_prodi,
+        'penyebut': penyebut,
+        'reference': reference,
+        'unique': unique,
+        'source': source,
+    }
+
+
+VALIDATION_SPECS = {
+    '11': _spec('NIM', prodi='Prodi'),
+    '12': _spec('NIM', prodi='Prodi'),
+    '13': _spec('NIM', prodi='Prodi'),
+    '21': _spec('NIM'),
+    '22': _spec('NIM', pembilang_prodi=False),     # prodi dari join NIM
+    '23': _spec('NIM'),
+    '31': _spec('NIP', pembilang_prodi=False),     # prodi dari join NIP
+    '33': _spec('NIP'),
+    '41': _spec('NIP'),
+    # Pengajar praktisi: NIP pembilang memang bukan dosen di penyebut
+    '42': _spec('NIP', reference=None),
+    # Luaran per dosen: satu dosen boleh punya beberapa luaran
+    '5': _spec('NIP', pembilang_prodi=False, penyebut=False,
+               reference=('31', 'penyebut'), unique=False, source='51'),
+    '6': _spec(('Nomor Dokumen', 'Program Studi'), penyebut=False, reference=None,
+               source='62'),
+    '71': _spec(('Kode Matakuliah', 'Program Studi')),
+    '81': _spec('Program Studi'),
+}
+
+
+# ============================================================================
+# ATURAN (VEKTORISASI)
+# ============================================================================
+
+def _finding(iku_number, file_type, rule, severity, count, total, message, examples=()):
+    return {
+        'iku': iku_number,
+        'file': file_type,
+        'rule': rule,
+        'severity': severity,
+        'count': int(count),
+        'rows': int(total),
+        'message': message,
+        'examples': [str(value) for value in list(examples)[:MAX_EXAMPLES]],
+    }
+
+
+def _key_index(df, key):
+    """ID sebagai Index (MultiIndex untuk kunci gabungan)"""
+    if len(key) == 1:
+        return pd.Index(df[key[0]])
+    return pd.MultiIndex.from_frame(df[list(key)])
+
+
+def _key_text(values):
+    return [' / '.join(map(str, value)) if isinstance(value, tuple) else value
+            for value in values]
+
+
+def check_columns(iku_number, file_type, df, columns):
+    """Kolom wajib yang tidak ada"""
+    missing = [column for column in dict.fromkeys(columns) if column not in df.columns]
+    if not missing:
+        return []
+    return [_finding(iku_number, file_type, 'missing_column', SEVERITY_ERROR,
+                     len(missing), len(df),
+                     f"kolom tidak ada: {', '.join(missing)}", missing)]
+
+
+def check_ids(iku_number, file_type, df, key, unique):
+    """ID kosong dan ID ganda"""
+    findings = []
+    null = df[list(key)].isna().any(axis=1).to_numpy()
+    if null.any():
+        findings.append(_finding(iku_number, file_type, 'null_id', SEVERITY_WARNING,
+                                 null.sum(), len(df), f"{'/'.join(key)} kosong"))
+
+    if unique:
+        ids = _key_index(df[~null], key)
+        duplicated = ids.duplicated(keep='first')
+        if duplicated.any():
+            values = ids[duplicated].unique()
+            findings.append(_finding(
+                iku_number, file_type, 'duplicate_id', SEVERITY_ERROR,
+                duplicated.sum(), len(df),
+                f"{duplicated.sum()} baris {'/'.join(key)} ganda ({len(values)} ID); "
+                f"capaian terhitung lebih", _key_text(values)))
+    return findings
+
+
+def check_orphans(iku_number, reference_name, df, df_reference, key):
+    """ID pembilang yang tidak ada di file acuan"""
+    findings = []
+    ids = _key_index(df.dropna(subset=list(key)), key)
+    reference_ids = _key_index(df_reference.dropna(subset=list(key)), key)
+
+    orphan = ~ids.isin(reference_ids)
+    if orphan.any():
+        values = ids[orphan].unique()
+        findings.append(_finding(
+            iku_number, 'pembilang', 'orphan_id', SEVERITY_ERROR,
+            orphan.sum(), len(df),
+            f"{orphan.sum()} baris {'/'.join(key)} tidak ada di {reference_name}",
+            _key_text(values)))
+
+    duplicated = reference_ids.duplicated(keep='first')
+    if duplicated.any() and reference_name != 'penyebut':
+        values = reference_ids[duplicated].unique()
+        findings.append(_finding(
+            iku_number, reference_name, 'duplicate_ref', SEVERITY_WARNING,
+            duplicated.sum(), len(df_reference),
+            f"{'/'.join(key)} ganda di file acuan join", _key_text(values)))
+    return findings
+
+
+def check_prodi(iku_number, file_type, df, column):
+    """Nama prodi yang tidak ada di PRODI_TO_JURUSAN"""
+    # read_excel_iku sudah mengkanonikalisasi kolom prodi; yang tersisa
+    # adalah label yang tidak cocok dengan kunci mana pun
+    names = df[column]
+    unknown = (names.notna() & ~names.isin(list(PRODI_TO_JURUSAN))).to_numpy()
+    if not unknown.any():
+        return []
+    values = sorted(names[unknown].unique())
+    return [_finding(iku_number, file_type, 'unknown_prodi', SEVERITY_WARNING,
+                     unknown.sum(), len(df),
+                     f"{len(values)} prodi tidak ada di PRODI_TO_JURUSAN "
+                     f"(warna/urutan jatuh ke MIPA)", values)]
+
+
+# ============================================================================
+# VALIDASI
+# ============================================================================
+
+def _read(frames, iku_number, file_type):
+    """Baca frame sekali per validasi (read_excel_iku / frame source aktif)"""
+    if (iku_number, file_type) not in frames:
+        # read_excel_iku tidak mencetak apa pun; processor yang mencetak
+        # progress tidak dipanggil di sini
+        frames[(iku_number, file_type)] = read_excel_iku(iku_number, file_type)
+    return frames[(iku_number, file_type)]
+
+
+def validate_iku(iku_number, frames=None):
+    """
+    Validasi data input satu IKU
+
+    Parameters:
+    -----------
+    iku_number : str
+        Nomor IKU (11, 12, ..., 81; 5 dan 6 untuk file 51 dan 62)
+    frames : dict, optional
+        Cache frame {(iku_number, file_type): DataFrame} yang dipakai
+        bersama antar IKU dalam satu validasi
+
+    Returns:
+    --------
+    list : Temuan (dict) untuk IKU ini
+    """
+    spec = VALIDATION_SPECS.get(iku_number)
+    if spec is None:
+        return []
+    frames = {} if frames is None else frames
+    key = spec['key']
+    source = spec['source'] or iku_number
+    findings = []
+
+    try:
+        df_pembilang = _read(frames, source, 'pembilang')
+        df_penyebut = _read(frames, source, 'penyebut') if spec['penyebut'] else None
+        if spec['reference'] is None:
+            df_reference, reference_name = None, None
+        elif spec['reference'] == 'penyebut':
+            df_reference, reference_name = df_penyebut, 'penyebut'
+        else:
+            df_reference = _read(frames, *spec['reference'])
+            reference_name = '{}-{}'.format(*spec['reference'])
+    except (OSError, KeyError, ValueError) as e:
+        return [_finding(iku_number, '-', 'read_error', SEVERITY_ERROR, 1, 0,
+                         f"{type(e).__name__}: {e}")]
+
+    # Kolom wajib: tanpa kolom ini aturan lain tidak bisa dicek
+    pembilang_columns = list(key) + ([spec['prodi']] if spec['pembilang_prodi'] else [])
+    missing = check_columns(iku_number, 'pembilang', df_pembilang,
+                            pembilang_columns)
+    if df_penyebut is not None:
+        penyebut_columns = ([spec['prodi']]
+                            + (list(key) if spec['reference'] == 'penyebut' else []))
+        missing += check_columns(iku_number, 'penyebut', df_penyebut, penyebut_columns)
+    if df_reference is not None and reference_name != 'penyebut':
+        missing += check_columns(iku_number, reference_name, df_reference, key)
+    if missing:
+        return missing
+
+    findings += check_ids(iku_number, 'pembilang', df_pembilang, key, spec['unique'])
+    if df_reference is not None:
+        findings += check_orphans(iku_number, reference_name, df_pembilang, df_reference, key)
+    if spec['pembilang_prodi']:
+        findings += check_prodi(iku_number, 'pembilang', df_pembilang, spec['prodi'])
+    if df_penyebut is not None:
+        findings += check_prodi(iku_number, 'penyebut', df_penyebut, spec['prodi'])
+    return findings
+
+
+def validate(iku_list=None, frames=None):
+    """
+    Validasi data input beberapa IKU (IKU gabungan diekspansi)
+
+    Parameters:
+    -----------
+    iku_list : list, optional
+        IKU yang divalidasi (default: semua)
+    frames : dict, optional
+        Diisi dengan frame yang dibaca {(iku_number, file_type): DataFrame},
+        untuk dipakai ulang processor lewat ValidatedFrames
+
+    Returns:
+    --------
+    dict : {'findings', 'errors', 'warnings', 'ikus', 'duration_s'}
+    """
+    start = time.perf_counter()
+    iku_list = ALL_IKU if iku_list is None else iku_list
+    expanded = []
+    for iku in iku_list:
+        for sub_iku in IKU_EXPANSION.get(iku, [iku]):
+            if sub_iku in VALIDATION_SPECS and sub_iku not in expanded:
+                expanded.append(sub_iku)
+
+    frames = {} if frames is None else frames
+    findings = []
+    for iku in expanded:
+        with span(f'validate {iku}', iku=iku) as validate_span:
+            iku_findings = validate_iku(iku, frames)
+            validate_span.add(findings=len(iku_findings))
+        findings += iku_findings
+
+    return {
+        'ikus': expanded,
+        'findings': findings,
+        'errors': sum(f['severity'] == SEVERITY_ERROR for f in findings),
+        'warnings': sum(f['severity'] == SEVERITY_WARNING for f in findings),
+        'duration_s': round(time.perf_counter() - start, 3),
+    }
+
+
+class ValidatedFrames:
+    """
+    Frame source untuk utils.set_frame_source dari frame hasil validate()
+
+    Frame yang tidak ikut divalidasi dibaca dari sumber sebelumnya
+    (frame source lain, misalnya results bundle, atau file Excel).
+
+    Parameters:
+    -----------
+    frames : dict
+        {(iku_number, file_type): DataFrame} dari validate(frames=...)
+    fallback : callable, optional
+        Frame source sebelumnya (None = file Excel)
+    """
+
+    def __init__(self, frames, fallback=None):
+        self.frames = frames
+        self.fallback = fallback
+
+    def keys(self):
+        if hasattr(self.fallback, 'keys'):
+            available = self.fallback.keys()
+        else:
+            from results_bundle import input_files
+            available = input_files()
+        return list(dict.fromkeys([*self.frames, *available]))
+
+    def __call__(self, iku_number, file_type='pembilang'):
+        key = (iku_number, file_type)
+        if key in self.frames:
+            trace_add(cache_hits=1)
+            return self.frames[key].copy()
+        if self.fallback is not None:
+            return self.fallback(iku_number, file_type)
+        return read_excel_file(iku_number, file_type)[0]
+
+
+def check_report(report, strict=False):
+    """
+    Terapkan mode strict pada laporan validasi
+
+    Raises:
+    -------
+    DataValidationError : jika strict dan ada temuan level error
+    """
+    if strict and report['errors']:
+        raise DataValidationError(report)
+
+
+# ============================================================================
+# OUTPUT
+# ============================================================================
+
+def format_report(report):
+    """Laporan validasi ringkas (satu baris per temuan)"""
+    header = (f"Validasi data: {len(report['ikus'])} IKU, {report['errors']} error, "
+              f"{report['warnings']} warning ({report['duration_s']:.2f}s)")
+    if not report['findings']:
+        return f"✓ {header}"
+
+    lines = [f"{'❌' if report['errors'] else '⚠️ '} {header}"]
+    for f in report['findings']:
+        mark = 'E' if f['severity'] == SEVERITY_ERROR else 'W'
+        examples = f" [{', '.join(f['examples'])}]" if f['examples'] else ''
+        lines.append(f"  {mark} IKU {f['iku']:<3} {f['file']:<10} {f['rule']:<15} "
+                     f"{f['message']}{examples}")
+    return '\n'.join(lines)
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main(argv=None):
+    """
+    Validasi data input dari command line
+
+    Returns:
+    --------
+    int : Exit code (0 = lolos, EXIT_INVALID = ada error dengan --strict)
+    """
+    from summary import add_source_arguments, apply_source_arguments
+
+    parser = argparse.ArgumentParser(
+        description='Validasi kualitas data input IKU (ID ganda, ID tanpa penyebut, '
+                    'prodi tidak dikenal)'
+    )
+    add_source_arguments(parser)
+    parser.add_argument('--json', nargs='?', const='-', metavar='PATH',
+                        help='Tulis laporan JSON (ke PATH, atau stdout jika PATH tidak diisi)')
+    parser.add_argument('--strict', action='store_true',
+                        help=f'Exit code {EXIT_INVALID} jika ada temuan level error')
+    args = parser.parse_args(argv)
+
+    apply_source_arguments(args)
+
+    frame_source = None
+    if args.bundle is not None:
+        from results_bundle import ResultsBundle
+        from utils import set_frame_source
+        frame_source = set_frame_source(ResultsBundle(args.bundle))
+    try:
+        # Reader backend mencetak info cache/kalibrasi; laporan tetap ringkas
+        with contextlib.redirect_stdout(io.StringIO()):
+            report = validate(args.iku)
+    finally:
+        if args.bundle is not None:
+            set_frame_source(frame_source)
+
+    if args.json is not None:
+        text = json.dumps(report, indent=2, ensure_ascii=False)
+        if args.json == '-':
+            print(text)
+        else:
+            with open(args.json, 'w', encoding='utf-8') as f:
+                f.write(text + '\n')
+    if args.json != '-':
+        print(format_report(report))
+
+    return EXIT_INVALID if args.strict and report['errors'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,13 +8,16 @@ oleh semua script visualisasi dan breakdown.
 ============================================================================
 """
 
-import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 from pathlib import Path
 import warnings
 
+import utils
+from prodi_names import canonical_prodi_name
+from exporters import FileTarget, save_to_target
+
 warnings.filterwarnings('ignore')
 
 # ============================================================================
@@ -59,6 +62,7 @@ BREAKDOWN_STYLE = {
     'x_axis_multiplier': 1.3,      # X-axis expansion for annotations
     'fig_height_per_item': 0.8,    # Figure height multiplier
     'min_fig_height': 10,          # Minimum figure height
+    'max_figure_pixels': 50_000_000,  # Pixel budget per figure (w*h*dpi^2) sebelum dipecah per halaman
 
     # Positioning
     'annotation_offset_x': 0.5,    # Horizontal offset for annotations
@@ -196,31 +200,14 @@ def save_figure(fig, filename_base):
     fig : matplotlib.figure.Figure
     filename_base : str (tanpa extension)
 
+    Figure disimpan ke render target aktif (lihat exporters.render_to);
+    default-nya file PNG/SVG di OUTPUT_DIR.
+
     Returns:
     --------
     list : List of saved file paths
     """
-    saved_files = []
-
-    # Save PNG
-    if CONFIG['export_png']:
-        png_dir = OUTPUT_DIR / 'png'
-        png_dir.mkdir(parents=True, exist_ok=True)
-        png_file = png_dir / f'{filename_base}.png'
-        fig.savefig(png_file, dpi=CONFIG['dpi'], bbox_inches='tight', format='png')
-        saved_files.append(str(png_file))
-        print(f"    ✓ PNG: {png_file.relative_to(OUTPUT_DIR)}")
-
-    # Save SVG
-    if CONFIG['export_svg']:
-        svg_dir = OUTPUT_DIR / 'svg'
-        svg_dir.mkdir(parents=True, exist_ok=True)
-        svg_file = svg_dir / f'{filename_base}.svg'
-        fig.savefig(svg_file, bbox_inches='tight', format='svg')
-        saved_files.append(str(svg_file))
-        print(f"    ✓ SVG: {svg_file.relative_to(OUTPUT_DIR)}")
-
-    return saved_files
+    return save_to_target(fig, filename_base, FileTarget(OUTPUT_DIR, CONFIG))
 
 def get_prodi_color(prodi_name, index_in_jurusan=0, total_in_jurusan=1):
     """Generate warna untuk prodi berdasarkan jurusan"""
@@ -241,8 +228,8 @@ def normalize_prodi_name(prodi_name):
     """
     Normalisasi nama Program Studi untuk konsistensi
 
-    Menghapus prefix "Program Studi " dan mempertahankan format standar
-    dengan suffix (D3) jika ada.
+    Menghapus prefix "Program Studi " dan mencocokkan label ke kunci
+    PRODI_TO_JURUSAN (lihat prodi_names.py).
 
     Examples:
     ---------
@@ -250,22 +237,9 @@ def normalize_prodi_name(prodi_name):
     "Kimia" -> "Kimia"
     "Program Studi Analis Kimia (D3)" -> "Analis Kimia (D3)"
     "Analis Kimia" -> "Analis Kimia (D3)"
+    "S1 Teknik Sipil" -> "Teknik Sipil"
     """
-    if pd.isna(prodi_name):
-        return prodi_name
-
-    # Remove "Program Studi " prefix
-    normalized = str(prodi_name).replace('Program Studi ', '')
-
-    # Ensure D3 programs have (D3) suffix
-    d3_programs = ['Analis Kimia', 'Kimia Industri']
-    for d3_prog in d3_programs:
-        if normalized == d3_prog or normalized.startswith(d3_prog + ' '):
-            if '(D3)' not in normalized:
-                normalized = d3_prog + ' (D3)'
-            break
-
-    return normalized
+    return canonical_prodi_name(prodi_name)
 
 def read_excel_iku(iku_number, file_type='pembilang'):
     """
@@ -280,15 +254,6 @@ def read_excel_iku(iku_number, file_type='pembilang'):
     --------
     pd.DataFrame
     """
-    file_path = BASE_PATH / f'monitoring-iku-{iku_number}-{file_type}.xlsx'
-
-    if not file_path.exists():
-        raise FileNotFoundError(f"File tidak ditemukan: {file_path}")
-
-    df = pd.read_excel(file_path, header=1)
-
-    # Normalisasi kolom Program Studi jika ada
-    if 'Program Studi' in df.columns:
-        df['Program Studi'] = df['Program Studi'].apply(normalize_prodi_name)
-
-    return df
+    # Baca lewat utils agar sumber data alternatif (results bundle) ikut
+    # dipakai; kolom Program Studi sudah dinormalisasi di sana
+    return utils.read_excel_iku(iku_number, file_type)